@@ -5,6 +5,7 @@ RunContext[TeamDependencies]として使用されます。
 
 """
 
+import asyncio
 from dataclasses import dataclass, field
 
 from mixseek.agents.leader.models import MemberSubmission
@@ -15,6 +16,9 @@ class TeamDependencies:
     """Leader Agent実行時の依存関係
 
     Agent Delegationで各Member Agentに共有される依存関係オブジェクト。
+    1ターン内のMember Agent呼び出しは並列実行されるため、submissionsへの記録は
+    begin_member_call()/complete_member_call()を通じて呼び出し順に行います
+    （いずれも同一イベントループ上でawaitを挟まずに実行されるため、ロック不要）。
 
     Attributes:
         execution_id: 実行セッション全体の一意識別子
@@ -22,6 +26,7 @@ class TeamDependencies:
         team_name: チーム名
         round_number: ラウンド番号
         submissions: Member Agent応答を記録するリスト（mutable、初期空リスト）
+        member_deadline: Member Agent呼び出しの期限（イベントループ時刻、Noneの場合は期限なし）
     """
 
     execution_id: str
@@ -29,3 +34,47 @@ class TeamDependencies:
     team_name: str
     round_number: int
     submissions: list[MemberSubmission] = field(default_factory=list)
+    member_deadline: float | None = None
+    _member_semaphore: asyncio.Semaphore | None = field(default=None, init=False, repr=False)
+    _issued_calls: int = field(default=0, init=False, repr=False)
+    _recorded_calls: int = field(default=0, init=False, repr=False)
+    _completed_calls: dict[int, MemberSubmission | None] = field(default_factory=dict, init=False, repr=False)
+
+    def member_slot(self, max_concurrent: int) -> asyncio.Semaphore:
+        """Member Agent同時実行数を制限するセマフォを取得
+
+        Args:
+            max_concurrent: 最大同時実行数（初回呼び出し時の値を使用）
+
+        Returns:
+            実行中のLeader Agent（このdeps）で共有されるセマフォ
+        """
+        if self._member_semaphore is None:
+            self._member_semaphore = asyncio.Semaphore(max_concurrent)
+        return self._member_semaphore
+
+    def begin_member_call(self) -> int:
+        """Member Agent呼び出しの順序番号を払い出す（Tool呼び出し開始時、最初のawait前に呼ぶこと）
+
+        Returns:
+            呼び出し順序番号
+        """
+        call_index = self._issued_calls
+        self._issued_calls += 1
+        return call_index
+
+    def complete_member_call(self, call_index: int, submission: MemberSubmission | None) -> None:
+        """Member Agent呼び出しの完了を記録
+
+        先行する呼び出しがすべて完了するまでsubmissionsへの追加を保留し、呼び出し順を保ちます。
+
+        Args:
+            call_index: begin_member_call()で払い出した順序番号
+            submission: Member応答（失敗して記録しない場合はNone）
+        """
+        self._completed_calls[call_index] = submission
+        while self._recorded_calls in self._completed_calls:
+            completed = self._completed_calls.pop(self._recorded_calls)
+            self._recorded_calls += 1
+            if completed is not None:
+                self.submissions.append(completed)
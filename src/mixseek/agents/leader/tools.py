@@ -5,11 +5,13 @@ Pydantic AIのAgent Delegationパターンに準拠。
 
 """
 
+import asyncio
 from collections.abc import Callable, Coroutine, Mapping
 from datetime import UTC, datetime
 from typing import Any
 
 from pydantic_ai import Agent, RunContext, RunUsage
+from pydantic_ai.messages import ModelMessage
 
 from mixseek.agents.leader.config import TeamConfig, TeamMemberAgentConfig
 from mixseek.agents.leader.dependencies import TeamDependencies
@@ -17,6 +19,53 @@ from mixseek.agents.leader.models import MemberSubmission
 from mixseek.agents.member.base import BaseMemberAgent
 
 
+async def _run_member_agent(
+    ma: Any,  # Agent | BaseMemberAgent
+    ctx: RunContext[TeamDependencies],
+    task: str,
+) -> tuple[str, list[ModelMessage] | None, str, str | None, RunUsage]:
+    """Member Agentを実行
+
+    Args:
+        ma: Member Agentインスタンス
+        ctx: RunContext（deps, usage含む）
+        task: Member Agentに渡すタスク
+
+    Returns:
+        (応答テキスト, メッセージ履歴, ステータス, エラーメッセージ, 使用量)
+    """
+    # Member Agent実行（BaseMemberAgentまたはPydantic AI Agent）
+    if isinstance(ma, BaseMemberAgent):
+        # BaseMemberAgent（WebSearchTool等が初期化済み）
+        # Context injection: execution_id, team_id, round_numberを渡す
+        context = {
+            "execution_id": ctx.deps.execution_id,
+            "team_id": ctx.deps.team_id,
+            "round_number": ctx.deps.round_number,
+        }
+        result_obj = await ma.execute(task, context=context)
+        content = result_obj.content
+        all_messages = result_obj.all_messages
+        # Issue #59: MemberAgentResult.status を MemberSubmission に伝播
+        status = result_obj.status.value.upper()  # "SUCCESS", "ERROR", or "WARNING"
+        error_message = result_obj.error_message
+        usage = RunUsage(
+            input_tokens=result_obj.usage_info.get("input_tokens", 0) if result_obj.usage_info else 0,
+            output_tokens=result_obj.usage_info.get("output_tokens", 0) if result_obj.usage_info else 0,
+            requests=1,
+        )
+    else:
+        # Pydantic AI Agent（ctx.usage統合）
+        result_obj = await ma.run(task, deps=ctx.deps, usage=ctx.usage)
+        content = str(result_obj.output)
+        all_messages = result_obj.all_messages()
+        # Pydantic AI Agent にはエラー概念がないため常に SUCCESS
+        status = "SUCCESS"
+        error_message = None
+        usage = result_obj.usage()
+    return content, all_messages, status, error_message, usage
+
+
 def register_member_tools(
     leader_agent: Agent[TeamDependencies, str],
     team_config: TeamConfig,
@@ -27,6 +76,10 @@ def register_member_tools(
     各Member AgentをLeader AgentのToolとして動的に登録します。
     Pydantic AIのAgent Delegationパターンに準拠し、ctx.usageを統合します。
 
+    Leader Agentが1ターンで複数のToolを呼び出した場合、Pydantic AIはそれらを並列に実行します。
+    同時実行数は team_config.max_concurrent_members で制限し、
+    Member応答（TeamDependencies.submissions）は完了順ではなく呼び出し順に記録します。
+
     Args:
         leader_agent: Leader Agentインスタンス
         team_config: チーム設定
@@ -35,6 +88,8 @@ def register_member_tools(
     Raises:
         KeyError: member_agentsにagent_nameが存在しない
     """
+    max_concurrent_members = team_config.max_concurrent_members
+
     for member_config in team_config.members:
         tool_name = member_config.get_tool_name()
         member_agent = member_agents[member_config.agent_name]
@@ -70,54 +125,48 @@ def register_member_tools(
                 if not task.strip():
                     raise ValueError("Task cannot be empty")
 
+                # 呼び出し順の番号を払い出す（Leaderが1ターンで発行した呼び出しは並列実行されるため、
+                # submissionsは完了順ではなく呼び出し順に記録する）
+                call_index = ctx.deps.begin_member_call()
+                submission: MemberSubmission | None = None
+                # タイムアウト時は呼び出し開始（実行中なら実行開始）からの経過時間を記録する
                 start_time = datetime.now(UTC)
-
-                # Member Agent実行（BaseMemberAgentまたはPydantic AI Agent）
-                if isinstance(ma, BaseMemberAgent):
-                    # BaseMemberAgent（WebSearchTool等が初期化済み）
-                    # Context injection: execution_id, team_id, round_numberを渡す
-                    context = {
-                        "execution_id": ctx.deps.execution_id,
-                        "team_id": ctx.deps.team_id,
-                        "round_number": ctx.deps.round_number,
-                    }
-                    result_obj = await ma.execute(task, context=context)
-                    content = result_obj.content
-                    all_messages = result_obj.all_messages
-                    # Issue #59: MemberAgentResult.status を MemberSubmission に伝播
-                    status = result_obj.status.value.upper()  # "SUCCESS", "ERROR", or "WARNING"
-                    error_message = result_obj.error_message
-                    usage = RunUsage(
-                        input_tokens=result_obj.usage_info.get("input_tokens", 0) if result_obj.usage_info else 0,
-                        output_tokens=result_obj.usage_info.get("output_tokens", 0) if result_obj.usage_info else 0,
-                        requests=1,
+                try:
+                    try:
+                        # 提出フェーズの期限を超えないよう、Member Agent呼び出しを打ち切る（実行枠の待機を含む）
+                        async with asyncio.timeout_at(ctx.deps.member_deadline):
+                            # max_concurrent_members を上限に並列実行
+                            async with ctx.deps.member_slot(max_concurrent_members):
+                                start_time = datetime.now(UTC)
+                                content, all_messages, status, error_message, usage = await _run_member_agent(
+                                    ma, ctx, task
+                                )
+                    except TimeoutError:
+                        # Leader Agentが他のMember応答で提出を続行できるよう、エラー応答として返す
+                        error_message = f"Member agent '{mc.agent_name}' timed out (submission phase deadline reached)"
+                        content = f"Error: {error_message}"
+                        all_messages = None
+                        status = "ERROR"
+                        usage = RunUsage()
+
+                    end_time = datetime.now(UTC)
+                    execution_time_ms = (end_time - start_time).total_seconds() * 1000
+
+                    # MemberSubmission記録
+                    submission = MemberSubmission(
+                        agent_name=mc.agent_name,
+                        agent_type=mc.agent_type,
+                        content=content,
+                        status=status,  # Issue #59: result_obj.status から取得
+                        error_message=error_message,  # Issue #59: エラーメッセージを伝播
+                        usage=usage,
+                        execution_time_ms=execution_time_ms,
+                        timestamp=end_time,
+                        all_messages=all_messages,
                     )
-                else:
-                    # Pydantic AI Agent（ctx.usage統合）
-                    result_obj = await ma.run(task, deps=ctx.deps, usage=ctx.usage)
-                    content = str(result_obj.output)
-                    all_messages = result_obj.all_messages()
-                    # Pydantic AI Agent にはエラー概念がないため常に SUCCESS
-                    status = "SUCCESS"
-                    error_message = None
-                    usage = result_obj.usage()
-
-                end_time = datetime.now(UTC)
-                execution_time_ms = (end_time - start_time).total_seconds() * 1000
-
-                # MemberSubmission記録
-                submission = MemberSubmission(
-                    agent_name=mc.agent_name,
-                    agent_type=mc.agent_type,
-                    content=content,
-                    status=status,  # Issue #59: result_obj.status から取得
-                    error_message=error_message,  # Issue #59: エラーメッセージを伝播
-                    usage=usage,
-                    execution_time_ms=execution_time_ms,
-                    timestamp=end_time,
-                    all_messages=all_messages,
-                )
-                ctx.deps.submissions.append(submission)
+                finally:
+                    # 例外時も番号を消化し、後続の呼び出しの記録を妨げない
+                    ctx.deps.complete_member_call(call_index, submission)
 
                 return content
 
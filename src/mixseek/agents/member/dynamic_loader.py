@@ -10,14 +10,25 @@ Loading Methods:
 Priority:
     1. agent_module is tried first if specified
     2. path is used as fallback if agent_module fails or is not specified
+
+Module Cache (path):
+    Members are recreated every round, so a plugin file is executed only on
+    first use and the resulting module is reused afterwards. Entries are keyed
+    by the resolved path and validated against the file's mtime/size; when
+    those change, the content hash decides whether the file is re-executed.
+    Modules loaded via agent_module are already cached by ``sys.modules``.
 """
 
 import hashlib
 import importlib
 import importlib.util
 import logging
+import os
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 
 from mixseek.agents.member.base import BaseMemberAgent
 from mixseek.models.member_agent import MemberAgentConfig
@@ -25,6 +36,107 @@ from mixseek.models.member_agent import MemberAgentConfig
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PluginModuleCacheStats:
+    """Hit/miss/reload counters for the path plugin module cache."""
+
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+
+
+@dataclass
+class _CachedPluginModule:
+    mtime_ns: int
+    size: int
+    content_hash: str
+    module: ModuleType
+
+
+_plugin_modules: dict[Path, _CachedPluginModule] = {}
+_plugin_modules_lock = threading.Lock()
+plugin_module_cache_stats = PluginModuleCacheStats()
+
+
+def clear_plugin_module_cache() -> None:
+    """Drop cached plugin modules so the next load re-executes each file."""
+    with _plugin_modules_lock:
+        for resolved in _plugin_modules:
+            sys.modules.pop(_plugin_module_name(resolved), None)
+        _plugin_modules.clear()
+        plugin_module_cache_stats.hits = 0
+        plugin_module_cache_stats.misses = 0
+        plugin_module_cache_stats.reloads = 0
+
+
+def _plugin_module_name(resolved: Path) -> str:
+    # Generate unique module name to avoid collision when loading multiple agents
+    # Uses SHA256 hash of absolute path for stability across executions
+    path_hash = hashlib.sha256(str(resolved).encode()).hexdigest()[:16]
+    return f"custom_agent_{path_hash}"
+
+
+def _exec_plugin_module(path: str, resolved: Path) -> ModuleType:
+    module_name = _plugin_module_name(resolved)
+
+    # Create module spec from file path
+    spec = importlib.util.spec_from_file_location(module_name, resolved)
+    if spec is None or spec.loader is None:
+        # Detailed error for spec creation failure
+        error_msg = f"Error: Failed to create module spec from path '{path}'."
+        raise ImportError(error_msg)
+
+    # Load module from spec
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+
+    # SECURITY WARNING: Executing Python code from file
+    # This executes all module-level code in the specified file.
+    # Only use files from trusted sources to avoid code injection vulnerabilities.
+    # For production environments, prefer 'agent_module' method with pip-installed packages.
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+def _load_plugin_module(path: str, path_obj: Path) -> ModuleType:
+    """Return the executed module for a plugin file, reusing the cached one when unchanged."""
+    resolved = path_obj.resolve()
+    stat = os.stat(resolved)
+
+    with _plugin_modules_lock:
+        cached = _plugin_modules.get(resolved)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            plugin_module_cache_stats.hits += 1
+            return cached.module
+
+        content_hash = hashlib.sha256(resolved.read_bytes()).hexdigest()
+        if cached is not None and cached.content_hash == content_hash:
+            # Touched but not modified: keep the module, refresh the stat key
+            cached.mtime_ns = stat.st_mtime_ns
+            cached.size = stat.st_size
+            plugin_module_cache_stats.hits += 1
+            return cached.module
+
+        if cached is None:
+            plugin_module_cache_stats.misses += 1
+        else:
+            plugin_module_cache_stats.reloads += 1
+            logger.info("Custom agent file changed, reloading: %s", resolved)
+
+        module = _exec_plugin_module(path, resolved)
+        _plugin_modules[resolved] = _CachedPluginModule(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+            module=module,
+        )
+        return module
+
+
 def load_agent_from_module(
     agent_module: str,
     agent_class: str,
@@ -97,7 +209,8 @@ def load_agent_from_path(
     """Load custom agent class from file path.
 
     This is the alternative method for development/prototyping where the custom
-    agent is in a standalone Python file.
+    agent is in a standalone Python file. The file is executed once per process
+    and re-executed only when its content changes.
 
     Args:
         path: File path (e.g., "/path/to/custom_agent.py")
@@ -132,27 +245,8 @@ def load_agent_from_path(
         )
         raise FileNotFoundError(error_msg)
 
-    # Generate unique module name to avoid collision when loading multiple agents
-    # Uses SHA256 hash of absolute path for stability across executions
-    path_hash = hashlib.sha256(str(path_obj.resolve()).encode()).hexdigest()[:16]
-    module_name = f"custom_agent_{path_hash}"
-
-    # Create module spec from file path
-    spec = importlib.util.spec_from_file_location(module_name, path_obj)
-    if spec is None or spec.loader is None:
-        # Detailed error for spec creation failure
-        error_msg = f"Error: Failed to create module spec from path '{path}'."
-        raise ImportError(error_msg)
-
-    # Load module from spec
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-
-    # SECURITY WARNING: Executing Python code from file
-    # This executes all module-level code in the specified file.
-    # Only use files from trusted sources to avoid code injection vulnerabilities.
-    # For production environments, prefer 'agent_module' method with pip-installed packages.
-    spec.loader.exec_module(module)
+    # Execute the file on first use (or after it changed); reuse the cached module otherwise
+    module = _load_plugin_module(path, path_obj)
 
     # Attempt class retrieval
     try:
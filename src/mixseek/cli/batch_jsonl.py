@@ -0,0 +1,110 @@
+"""Append-only JSONL result files shared by the CLI batch modes.
+
+`mixseek exec --batch` and `mixseek evaluate --input` write one JSON record
+per input line as soon as it finishes. Each record is flushed and fsynced, so
+a crash loses at most the line being written. On the next run, ids that
+already have a successful record are skipped.
+"""
+
+import json
+import os
+from collections.abc import Collection
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+BATCH_RESULTS_SUFFIX = ".results.jsonl"
+
+
+def default_batch_output_path(batch_file: Path) -> Path:
+    """Return the default result file for a batch input file (`<stem>.results.jsonl`)."""
+    return batch_file.with_name(batch_file.stem + BATCH_RESULTS_SUFFIX)
+
+
+def load_completed_records(
+    output_file: Path,
+    result_field: str,
+    completed_statuses: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Collect records whose `result_field` is set.
+
+    Truncated lines (from a crash) and error records count as not completed.
+
+    Args:
+        output_file: Result JSONL file
+        result_field: Field that is present only on successful records
+        completed_statuses: If given, only records whose `status` is in this set count as completed
+
+    Returns:
+        Completed records with an `id` (empty if the file does not exist)
+    """
+    if not output_file.exists():
+        return []
+
+    completed: list[dict[str, Any]] = []
+    with open(output_file, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict) or record.get(result_field) is None or "id" not in record:
+                continue
+            if completed_statuses is not None and record.get("status") not in completed_statuses:
+                continue
+            completed.append(record)
+    return completed
+
+
+def load_completed_ids(
+    output_file: Path,
+    result_field: str,
+    completed_statuses: Collection[str] | None = None,
+) -> set[str]:
+    """Collect ids of records whose `result_field` is set (see `load_completed_records`)."""
+    return {str(record["id"]) for record in load_completed_records(output_file, result_field, completed_statuses)}
+
+
+def _ends_with_partial_line(output_file: Path) -> bool:
+    """Whether the file ends without a newline (a partially written line)."""
+    with open(output_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+class JsonlAppender:
+    """Durable line-by-line appender for a result JSONL file.
+
+    Records are written from a single event loop, so lines are never interleaved.
+    """
+
+    def __init__(self, output_file: Path) -> None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(output_file, "a", encoding="utf-8")
+        if _ends_with_partial_line(output_file):
+            # Keep the next record off the truncated last line
+            self._file.write("\n")
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append one record and fsync it."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
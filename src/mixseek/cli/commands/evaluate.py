@@ -4,10 +4,18 @@ import asyncio
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 import typer
 
-from mixseek.cli.commands.evaluate_helper import display_evaluation_text, evaluate_content
+from mixseek.cli.batch_jsonl import default_batch_output_path
+from mixseek.cli.commands.evaluate_batch import (
+    EvaluationInput,
+    create_result_writer,
+    load_evaluation_inputs,
+    run_evaluation_batch,
+)
+from mixseek.cli.commands.evaluate_helper import create_evaluator, display_evaluation_text, evaluate_content
 from mixseek.cli.common_options import (
     LOG_FORMAT_OPTION,
     LOG_LEVEL_OPTION,
@@ -20,18 +28,48 @@ from mixseek.cli.common_options import (
     WORKSPACE_OPTION,
 )
 from mixseek.cli.utils import initialize_observability, validate_logfire_flags
+from mixseek.core.auth import close_all_auth_clients
+from mixseek.core.response_cache import ResponseCacheSettings, configure_response_cache
+from mixseek.evaluator import EvaluationBatchResult
 from mixseek.utils.env import get_workspace_path
 
 
 def evaluate(
-    user_query: str = typer.Argument(..., help="User query string"),
-    submission: str = typer.Argument(..., help="AI agent submission text"),
+    user_query: str | None = typer.Argument(None, help="User query string (omit with --input)"),
+    submission: str | None = typer.Argument(None, help="AI agent submission text (omit with --input)"),
+    input_file: Path | None = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="JSONL file of pairs to evaluate in bulk, one {id, user_query, submission, ...} object per line",
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Bulk results: JSONL file, or DuckDB file (.db/.duckdb). Default: <input>.results.jsonl",
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", min=1, help="Pairs evaluated at the same time (--input)"),
+    max_concurrent_metrics: int | None = typer.Option(
+        None,
+        "--max-concurrent-metrics",
+        min=1,
+        help="Metric evaluations in flight across all pairs (--input). Default: concurrency x config value",
+    ),
     workspace: Path | None = WORKSPACE_OPTION,
     config: Path | None = typer.Option(
         None, "--config", "-c", help="Custom evaluator config file (overrides workspace)"
     ),
     verbose: bool = VERBOSE_OPTION,
     output_format: str = typer.Option("structured", "--output-format", "-f", help="Output format: structured, json"),
+    response_cache: bool = typer.Option(
+        False,
+        "--response-cache",
+        help="Reuse deterministic LLM responses cached in $MIXSEEK_WORKSPACE/cache (temperature 0 or seed)",
+    ),
     log_level: str = LOG_LEVEL_OPTION,
     no_log_console: bool = NO_LOG_CONSOLE_OPTION,
     no_log_file: bool = NO_LOG_FILE_OPTION,
@@ -50,6 +88,11 @@ def evaluate(
     Configuration is loaded from $MIXSEEK_WORKSPACE/configs/evaluator.toml
     or specified via --evaluate-config option.
 
+    With --input, every (user_query, submission) pair in a JSONL file is evaluated
+    by one shared Evaluator. Results are written as each pair finishes, and pairs
+    that already have a result are skipped on re-run. When the batch ends, the
+    throughput (pairs/min, tokens/min) is reported.
+
     Examples:
         mixseek evaluate "Pythonとは?" "Pythonは言語です"
 
@@ -59,6 +102,12 @@ def evaluate(
 
         mixseek evaluate "質問" "回答" --output-format json --verbose
 
+        mixseek evaluate "質問" "回答" --response-cache
+
+        mixseek evaluate --input submissions.jsonl --concurrency 8
+
+        mixseek evaluate --input submissions.jsonl --output rescored.duckdb
+
         mixseek evaluate "質問" "回答" --logfire
 
         mixseek evaluate "質問" "回答" --logfire-metadata
@@ -68,6 +117,14 @@ def evaluate(
     # Logfireフラグの排他的チェック（workspace解決より先に実行）
     validate_logfire_flags(logfire, logfire_metadata, logfire_http)
 
+    # 単一評価（user_query + submission）と一括評価（--input）は排他
+    if input_file is None and (user_query is None or submission is None):
+        typer.echo("Error: USER_QUERY and SUBMISSION are required unless --input is given", err=True)
+        raise typer.Exit(2)
+    if input_file is not None and (user_query is not None or submission is not None):
+        typer.echo("Error: USER_QUERY/SUBMISSION cannot be combined with --input", err=True)
+        raise typer.Exit(2)
+
     # Workspace解決（ログ出力先のため）
     workspace_resolved = get_workspace_path(workspace)
 
@@ -84,6 +141,39 @@ def evaluate(
         workspace=workspace_resolved,
     )
 
+    # LLM応答キャッシュ（同一Submissionの再評価でAPI呼び出しを省略）
+    if response_cache:
+        configure_response_cache(ResponseCacheSettings(enabled=True), workspace_resolved)
+
+    if input_file is not None:
+        try:
+            inputs = load_evaluation_inputs(input_file)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(2)
+        output_path = output if output is not None else default_batch_output_path(input_file)
+        try:
+            batch = asyncio.run(
+                _evaluate_batch(
+                    inputs=inputs,
+                    output=output_path,
+                    workspace=workspace,
+                    evaluate_config=config,
+                    concurrency=concurrency,
+                    max_concurrent_metrics=max_concurrent_metrics,
+                    output_format=output_format,
+                    verbose=verbose,
+                )
+            )
+        except KeyboardInterrupt:
+            typer.echo("\n⚠️  Interrupted by user (completed pairs are kept; re-run to resume)", err=True)
+            sys.exit(130)
+        if batch is None or batch.failed:
+            raise typer.Exit(1)
+        return
+
+    assert user_query is not None and submission is not None
+
     try:
         # 評価を実行（共通ヘルパー関数を使用）
         # Note: cleanup (close_all_auth_clients) は evaluate_content 内の finally で処理される
@@ -112,3 +202,64 @@ def evaluate(
     except KeyboardInterrupt:
         typer.echo("\n⚠️  Interrupted by user", err=True)
         sys.exit(130)
+
+
+async def _evaluate_batch(
+    inputs: list[EvaluationInput],
+    output: Path,
+    workspace: Path | None,
+    evaluate_config: Path | None,
+    concurrency: int,
+    max_concurrent_metrics: int | None,
+    output_format: str,
+    verbose: bool,
+) -> EvaluationBatchResult | None:
+    """Evaluate pairs from --input and report progress and throughput.
+
+    Returns:
+        Result of this run, or None if the evaluator could not be created
+    """
+    try:
+        evaluator = create_evaluator(workspace, evaluate_config, verbose)
+    except Exception as e:
+        typer.secho(f"⚠️  Failed to initialize evaluator: {e}", fg=typer.colors.YELLOW, err=True)
+        await close_all_auth_clients()
+        return None
+
+    def report(record: dict[str, Any]) -> None:
+        if output_format == "json":
+            print(json.dumps(record, ensure_ascii=False), flush=True)
+        elif record["status"] == "ok":
+            typer.echo(f"✅ {record['id']}: {record['result']['overall_score']}", err=True)
+        else:
+            typer.secho(f"❌ {record['id']}: {record['error']}", fg=typer.colors.RED, err=True)
+
+    writer = create_result_writer(output)
+    try:
+        batch = await run_evaluation_batch(
+            evaluator,
+            inputs,
+            writer,
+            max_concurrent_requests=concurrency,
+            max_concurrent_metrics=max_concurrent_metrics,
+            on_record=report,
+        )
+    finally:
+        writer.close()
+        await close_all_auth_clients()
+
+    skipped = len(inputs) - len(batch.outcomes)
+    typer.secho(
+        f"\n=== Evaluated {len(batch.outcomes)} pairs ({batch.succeeded} ok, {batch.failed} failed, "
+        f"{skipped} skipped) in {batch.elapsed_seconds:.1f}s ===",
+        bold=True,
+        fg=typer.colors.CYAN,
+        err=True,
+    )
+    typer.echo(
+        f"Throughput: {batch.pairs_per_minute:.1f} pairs/min, {batch.tokens_per_minute:.0f} tokens/min "
+        f"({batch.usage.input_tokens} input, {batch.usage.output_tokens} output tokens)",
+        err=True,
+    )
+    typer.echo(f"Results: {output}", err=True)
+    return batch
@@ -0,0 +1,237 @@
+"""Bulk evaluation for `mixseek evaluate --input`.
+
+Input JSONL (one pair per line):
+    {"id": "q1", "user_query": "...", "submission": "...", "team_id": "...",
+     "execution_id": "...", "round_number": 1}
+
+`id` defaults to `line-<n>`. `team_id`, `execution_id` and `round_number` are
+optional, so rows exported from the leader_board table can be re-scored as they are.
+
+Results are written as each pair finishes, in completion order. They go either to
+a JSONL file (one record per line) or, when the output path ends in `.db`/`.duckdb`,
+to that DuckDB file's `evaluation_results` table. Pairs that already have a
+successful result are skipped on the next run.
+
+Results are keyed by `id` together with a hash of the pair's query and submission,
+so re-scoring a second export whose `line-<n>` ids collide with an earlier file
+neither skips nor overwrites the earlier rows.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import ValidationError
+
+from mixseek.cli.batch_jsonl import JsonlAppender, load_completed_records
+from mixseek.evaluator import EvaluationBatchResult, EvaluationOutcome, Evaluator
+from mixseek.models.evaluation_request import EvaluationRequest
+
+DUCKDB_SUFFIXES = {".db", ".duckdb"}
+
+_REQUEST_FIELDS = ("user_query", "submission", "execution_id", "team_id", "round_number")
+
+
+@dataclass(frozen=True)
+class EvaluationInput:
+    """One (query, submission) pair from the input file."""
+
+    input_id: str
+    line_number: int
+    request: EvaluationRequest
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of the (query, submission) pair."""
+        return pair_content_hash(self.request.user_query, self.request.submission)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Resume key: (id, content hash)."""
+        return self.input_id, self.content_hash
+
+
+def pair_content_hash(user_query: str, submission: str) -> str:
+    """SHA-256 of a (query, submission) pair, used to tell pairs with the same id apart."""
+    return hashlib.sha256(json.dumps([user_query, submission], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def load_evaluation_inputs(input_file: Path) -> list[EvaluationInput]:
+    """Load evaluation pairs from a JSONL file.
+
+    Blank lines are ignored.
+
+    Args:
+        input_file: Input JSONL file
+
+    Returns:
+        Pairs in file order
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: On invalid JSON, an invalid pair, or a duplicate id
+    """
+    inputs: list[EvaluationInput] = []
+    seen_ids: set[str] = set()
+    with open(input_file, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{input_file}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"{input_file}:{line_number}: each line must be a JSON object")
+
+            try:
+                request = EvaluationRequest(**{key: record[key] for key in _REQUEST_FIELDS if key in record})
+            except ValidationError as e:
+                raise ValueError(f"{input_file}:{line_number}: invalid evaluation pair ({e})") from e
+
+            input_id = str(record.get("id") or f"line-{line_number}")
+            if input_id in seen_ids:
+                raise ValueError(f"{input_file}:{line_number}: duplicate id '{input_id}'")
+            seen_ids.add(input_id)
+            inputs.append(EvaluationInput(input_id=input_id, line_number=line_number, request=request))
+    return inputs
+
+
+def outcome_record(item: EvaluationInput, outcome: EvaluationOutcome) -> dict[str, Any]:
+    """Build the JSON record written for one evaluated pair."""
+    record: dict[str, Any] = {
+        "id": item.input_id,
+        "content_hash": item.content_hash,
+        "line": item.line_number,
+        "team_id": item.request.team_id,
+        "execution_id": item.request.execution_id,
+        "round_number": item.request.round_number,
+        "status": "ok" if outcome.succeeded else "error",
+        "usage": outcome.usage.to_dict(),
+    }
+    if outcome.result is not None:
+        record["result"] = outcome.result.model_dump(mode="json")
+    else:
+        record["error"] = f"{type(outcome.error).__name__}: {outcome.error}"
+    return record
+
+
+class EvaluationResultWriter(Protocol):
+    """Destination for bulk evaluation results."""
+
+    async def completed_keys(self) -> set[tuple[str, str]]:
+        """(id, content hash) keys that already have a successful result."""
+        ...
+
+    async def write(self, item: EvaluationInput, outcome: EvaluationOutcome) -> None:
+        """Persist one evaluated pair."""
+        ...
+
+    def close(self) -> None:
+        """Release the destination."""
+        ...
+
+
+class JsonlResultWriter:
+    """Append results to a JSONL file."""
+
+    def __init__(self, output_file: Path) -> None:
+        self.output_file = output_file
+        self._appender: JsonlAppender | None = None
+
+    async def completed_keys(self) -> set[tuple[str, str]]:
+        return {
+            (str(record["id"]), str(record.get("content_hash")))
+            for record in load_completed_records(self.output_file, "result")
+        }
+
+    async def write(self, item: EvaluationInput, outcome: EvaluationOutcome) -> None:
+        if self._appender is None:
+            self._appender = JsonlAppender(self.output_file)
+        self._appender.write(outcome_record(item, outcome))
+
+    def close(self) -> None:
+        if self._appender is not None:
+            self._appender.close()
+
+
+class DuckDBResultWriter:
+    """Upsert results into the `evaluation_results` table of a DuckDB file."""
+
+    def __init__(self, db_path: Path) -> None:
+        # Imported lazily: DuckDB (and pandas) are only needed for this output
+        from mixseek.storage.aggregation_store import AggregationStore
+
+        self.store = AggregationStore(db_path=db_path)
+
+    async def completed_keys(self) -> set[tuple[str, str]]:
+        return await self.store.get_evaluated_input_keys()
+
+    async def write(self, item: EvaluationInput, outcome: EvaluationOutcome) -> None:
+        request = item.request
+        result = outcome.result
+        await self.store.save_evaluation_result(
+            input_id=item.input_id,
+            content_hash=item.content_hash,
+            user_query=request.user_query,
+            submission=request.submission,
+            execution_id=request.execution_id,
+            team_id=request.team_id,
+            round_number=request.round_number,
+            overall_score=result.overall_score if result is not None else None,
+            metrics=[metric.model_dump(mode="json") for metric in result.metrics] if result is not None else None,
+            error=None if result is not None else f"{type(outcome.error).__name__}: {outcome.error}",
+            input_tokens=outcome.usage.input_tokens,
+            output_tokens=outcome.usage.output_tokens,
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def create_result_writer(output: Path) -> EvaluationResultWriter:
+    """Pick the result writer for an output path (DuckDB for `.db`/`.duckdb`, JSONL otherwise)."""
+    if output.suffix.lower() in DUCKDB_SUFFIXES:
+        return DuckDBResultWriter(output)
+    return JsonlResultWriter(output)
+
+
+async def run_evaluation_batch(
+    evaluator: Evaluator,
+    inputs: list[EvaluationInput],
+    writer: EvaluationResultWriter,
+    max_concurrent_requests: int = 4,
+    max_concurrent_metrics: int | None = None,
+    on_record: Callable[[dict[str, Any]], None] | None = None,
+) -> EvaluationBatchResult:
+    """Evaluate every pair that has no successful result in `writer` yet.
+
+    Args:
+        evaluator: Evaluator shared by all pairs
+        inputs: Pairs to evaluate
+        writer: Result destination. Pairs it already holds are skipped
+        max_concurrent_requests: Pairs evaluated at the same time
+        max_concurrent_metrics: Metric evaluations in flight across the whole batch
+        on_record: Called with each written record (for progress output)
+
+    Returns:
+        Result of the pairs evaluated in this run (skipped pairs are not included)
+    """
+    completed = await writer.completed_keys()
+    pending = [item for item in inputs if item.key not in completed]
+
+    async def write_outcome(outcome: EvaluationOutcome) -> None:
+        item = pending[outcome.index]
+        await writer.write(item, outcome)
+        if on_record is not None:
+            on_record(outcome_record(item, outcome))
+
+    return await evaluator.evaluate_many(
+        [item.request for item in pending],
+        max_concurrent_requests=max_concurrent_requests,
+        max_concurrent_metrics=max_concurrent_metrics,
+        on_outcome=write_outcome,
+    )
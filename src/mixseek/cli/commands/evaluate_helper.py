@@ -11,20 +11,15 @@ import typer
 from mixseek.config.manager import ConfigurationManager
 from mixseek.core.auth import close_all_auth_clients
 from mixseek.evaluator import Evaluator
-from mixseek.models.evaluation_config import EvaluationConfig  # noqa: F401
 from mixseek.models.evaluation_request import EvaluationRequest
 from mixseek.models.evaluation_result import EvaluationResult
 from mixseek.utils.env import get_workspace_for_config
 
-# Rebuild EvaluationRequest model after EvaluationConfig is imported
-# This is required because EvaluationRequest uses TYPE_CHECKING for forward reference
-EvaluationRequest.model_rebuild()
-
 # Constants for display formatting
 COMMENT_TRUNCATE_LENGTH = 500
 
 
-def _create_evaluator(
+def create_evaluator(
     workspace: Path | None = None,
     evaluate_config: Path | None = None,
     verbose: bool = False,
@@ -101,7 +96,7 @@ async def evaluate_content(
             typer.echo(f"Submission: {submission}", err=True)
 
         # Evaluator の初期化（共通ヘルパー関数を使用）
-        evaluator = _create_evaluator(workspace, evaluate_config, verbose)
+        evaluator = create_evaluator(workspace, evaluate_config, verbose)
 
         # 評価リクエストを作成（明示的にNoneを指定）
         # team_id が None の場合はデフォルト値を使用
@@ -1,14 +1,18 @@
 """mixseek exec コマンド実装"""
 
 import asyncio
+import json
 import logging
 import os
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from mixseek.cli.batch_jsonl import default_batch_output_path
+from mixseek.cli.commands.exec_batch import BatchPrompt, BatchResult, load_batch_prompts, run_batch
 from mixseek.cli.common_options import (
     LOG_FORMAT_OPTION,
     LOG_LEVEL_OPTION,
@@ -25,6 +29,7 @@ from mixseek.config import ConfigurationManager, OrchestratorSettings
 from mixseek.config.constants import WORKSPACE_ENV_VAR
 from mixseek.config.preflight import PreflightResult, run_preflight_check
 from mixseek.core.auth import close_all_auth_clients
+from mixseek.core.progress import ProgressEvent, get_progress_bus
 from mixseek.orchestrator import Orchestrator
 from mixseek.orchestrator.models import ExecutionSummary
 
@@ -53,6 +58,44 @@ DRY_RUN_OPTION = typer.Option(
     "--dry-run",
     help="設定検証のみ実行し、オーケストレーションは実行しない",
 )
+BATCH_OPTION = typer.Option(
+    None,
+    "--batch",
+    help='プロンプトJSONLファイル(1行1プロンプト: {"id": "...", "prompt": "..."})',
+)
+BATCH_OUTPUT_OPTION = typer.Option(
+    None,
+    "--batch-output",
+    help="バッチ結果JSONLファイル(既定: <batch>.results.jsonl、記録済みのidは再実行時にスキップ)",
+)
+CONCURRENCY_OPTION = typer.Option(
+    1,
+    "--concurrency",
+    min=1,
+    help="バッチ実行時に同時実行するプロンプト数",
+)
+
+
+class _ProgressPrinter:
+    """進捗イベントを購読し、チームのラウンド遷移・完了を表示"""
+
+    def __init__(self) -> None:
+        self._last: dict[tuple[str, str], tuple[str, int]] = {}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        # Leader/Evaluatorの切り替えは表示しない（ラウンド・ステータスの変化のみ）
+        key = (event.execution_id, event.team_id)
+        state = (event.status, event.current_round)
+        if self._last.get(key) == state:
+            return
+        self._last[key] = state
+
+        if event.status == "completed":
+            typer.echo(f"  ✅ {event.team_name}: completed")
+        elif event.status == "failed":
+            typer.echo(f"  ❌ {event.team_name}: failed ({event.error_message or 'Unknown error'})")
+        else:
+            typer.echo(f"  ⏳ {event.team_name}: Round {event.current_round}/{event.total_rounds}")
 
 
 async def _execute_orchestration(
@@ -80,10 +123,81 @@ async def _execute_orchestration(
         typer.echo(f"\n📝 Task: {user_prompt}\n")
         typer.echo(f"🔄 Running {team_count} teams in parallel...\n")
 
-    return await orchestrator.execute(
-        user_prompt=user_prompt,
-        timeout_seconds=timeout,
-    )
+    # チーム進捗を表示（JSON出力を汚さないようtext形式のみ）
+    unsubscribe = get_progress_bus().subscribe(_ProgressPrinter()) if output_format == "text" else None
+    try:
+        return await orchestrator.execute(
+            user_prompt=user_prompt,
+            timeout_seconds=timeout,
+        )
+    finally:
+        if unsubscribe is not None:
+            unsubscribe()
+
+
+async def _execute_batch(
+    orchestrators: list[Orchestrator],
+    prompts: list[BatchPrompt],
+    output_file: Path,
+    timeout: int | None,
+    output_format: str,
+) -> BatchResult:
+    """バッチ実行と進捗表示
+
+    Args:
+        orchestrators: ワーカーごとのOrchestrator
+        prompts: 入力プロンプト
+        output_file: 結果JSONLファイルパス
+        timeout: タイムアウト(秒)
+        output_format: 出力フォーマット(text: 1プロンプト1行、json: 結果レコードをJSONLで出力)
+
+    Returns:
+        BatchResult: 実行結果の集計
+    """
+    if output_format == "text":
+        typer.echo("🚀 MixSeek Orchestrator (batch)")
+        typer.echo("━" * 60)
+        typer.echo(f"\n📝 Prompts: {len(prompts)} (concurrency: {len(orchestrators)})")
+        typer.echo(f"📄 Results: {output_file}\n")
+
+    def on_record(record: dict[str, Any]) -> None:
+        if output_format == "json":
+            print(json.dumps(record, ensure_ascii=False), flush=True)
+            return
+        summary = record.get("summary")
+        if summary is None:
+            typer.echo(f"  ❌ {record['id']}: {record.get('error', 'Unknown error')}")
+            return
+        icon = {"completed": "✅", "partial_failure": "⚠️ "}.get(record["status"], "❌")
+        best = "no result"
+        if summary["best_team_id"]:
+            best = f"best {summary['best_team_id']} ({summary['best_score']:.2f})"
+        typer.echo(f"  {icon} {record['id']}: {best}, {summary['total_execution_time_seconds']:.1f}s")
+
+    result = await run_batch(orchestrators, prompts, output_file, timeout=timeout, on_record=on_record)
+
+    if output_format == "text":
+        typer.echo("\n" + "━" * 60)
+        typer.echo("📊 Batch Summary")
+        typer.echo("━" * 60)
+        typer.echo(f"\nTotal Prompts:    {result.total}")
+        typer.echo(f"Skipped (done):   {result.skipped}")
+        typer.echo(f"Completed:        {result.completed}")
+        if result.partial > 0:
+            typer.echo(f"Partial:          {result.partial}")
+        typer.echo(f"Failed:           {result.failed + result.errors}")
+        typer.echo(f"\n💾 Results appended to {output_file}")
+    return result
+
+
+def _batch_exit_code(result: BatchResult) -> int:
+    """バッチ実行の終了コード
+
+    0: 全プロンプト成功（スキップのみの場合を含む）、1: 一部失敗、2: 実行した全プロンプトが結果なし
+    """
+    if not (result.partial or result.failed or result.errors):
+        return 0
+    return 1 if result.completed or result.partial else 2
 
 
 def _output_results(summary: ExecutionSummary, output_format: str) -> None:
@@ -102,12 +216,15 @@ def _output_results(summary: ExecutionSummary, output_format: str) -> None:
 
 
 def exec_command(
-    user_prompt: str = typer.Argument(..., help="ユーザプロンプト"),
+    user_prompt: str | None = typer.Argument(None, help="ユーザプロンプト(--batch 指定時は省略)"),
     config: Path = CONFIG_OPTION,
     timeout: int | None = TIMEOUT_OPTION,
     workspace: Path | None = WORKSPACE_OPTION,
     output_format: str = OUTPUT_FORMAT_OPTION,
     dry_run: bool = DRY_RUN_OPTION,
+    batch: Path | None = BATCH_OPTION,
+    batch_output: Path | None = BATCH_OUTPUT_OPTION,
+    concurrency: int = CONCURRENCY_OPTION,
     verbose: bool = VERBOSE_OPTION,
     logfire: bool = LOGFIRE_OPTION,
     logfire_metadata: bool = LOGFIRE_METADATA_OPTION,
@@ -121,6 +238,16 @@ def exec_command(
 
     Note: exec コマンドではリーダーボード機能のため、常に DuckDB に保存されます。
 
+    --batch を指定すると、JSONLファイルの各プロンプトを1回の設定読み込み・
+    プリフライトチェック・接続プールで実行し、ExecutionSummaryを完了順に
+    --batch-output へJSONLで追記します（json形式では標準出力にも出力）。
+    クラッシュ後に同じコマンドを再実行すると、記録済みのプロンプトはスキップされます。
+
+    Examples:
+        mixseek exec "質問" --config orchestrator.toml
+
+        mixseek exec --batch prompts.jsonl --config orchestrator.toml --concurrency 4
+
     Args:
         user_prompt: ユーザプロンプト
         config: 設定ファイルパス
@@ -128,6 +255,9 @@ def exec_command(
         workspace: ワークスペースパス
         output_format: 出力フォーマット
         dry_run: プリフライトチェックのみ実行
+        batch: プロンプトJSONLファイル
+        batch_output: バッチ結果JSONLファイル
+        concurrency: バッチ実行時のプロンプト並列度
         verbose: 詳細ログ表示
         logfire: Logfire完全モード
         logfire_metadata: Logfireメタデータモード
@@ -175,6 +305,12 @@ def exec_command(
                 typer.echo("Error: --config オプションは必須です", err=True)
                 raise typer.Exit(code=2)
 
+            # ユーザプロンプトとバッチ入力はどちらか一方のみ指定
+            if (batch is None) == (user_prompt is None):
+                typer.echo("Error: ユーザプロンプトか --batch のどちらか一方を指定してください", err=True)
+                raise typer.Exit(code=2)
+            batch_prompts = load_batch_prompts(batch) if batch is not None else []
+
             # 5. プリフライトチェック（dry-run/通常で共通、1回のみ実行）
             preflight_result = run_preflight_check(config, workspace)
 
@@ -193,7 +329,22 @@ def exec_command(
             # Note: exec コマンドではリーダーボード機能のため常に DB 保存
             orchestrator = Orchestrator(settings=orchestrator_settings, save_db=True)
 
+            # バッチ実行: 設定・プリフライト・接続プールを全プロンプトで共有
+            if batch is not None:
+                orchestrators = [orchestrator] + [
+                    Orchestrator(settings=orchestrator_settings, save_db=True) for _ in range(concurrency - 1)
+                ]
+                batch_result = await _execute_batch(
+                    orchestrators,
+                    batch_prompts,
+                    batch_output or default_batch_output_path(batch),
+                    timeout,
+                    output_format,
+                )
+                raise typer.Exit(code=_batch_exit_code(batch_result))
+
             # 8. 実行
+            assert user_prompt is not None
             summary = await _execute_orchestration(
                 orchestrator,
                 user_prompt,
@@ -0,0 +1,195 @@
+"""mixseek exec --batch 実装
+
+JSONLファイルの各行のプロンプトを、1回の設定読み込み・プリフライトチェック・
+接続プールで順に（またはプロンプト単位の並列度で）実行します。
+
+入力（1行1プロンプト）:
+    {"id": "q1", "prompt": "..."}
+    {"prompt": "..."}          # idを省略した場合は "line-{行番号}"
+
+出力（完了順に1行ずつ追記、既定: {入力ファイル名}.results.jsonl）:
+    {"id": "q1", "line": 1, "status": "completed", "summary": {...ExecutionSummary...}}
+    {"id": "q2", "line": 2, "status": "error", "error": "..."}
+
+出力ファイルにstatusがcompleted/partial_failureで記録済みのidは再実行時にスキップされるため、
+クラッシュ後は同じコマンドを再実行するだけで未完了のプロンプトから再開できます。
+全チームが失敗したプロンプト（status: "failed"）とエラー記録は再実行の対象です。
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mixseek.cli.batch_jsonl import JsonlAppender, load_completed_ids
+from mixseek.orchestrator import Orchestrator
+from mixseek.orchestrator.models import ExecutionSummary
+
+logger = logging.getLogger(__name__)
+
+# 再実行時にスキップする（完了済みとみなす）ステータス
+COMPLETED_STATUSES = frozenset({"completed", "partial_failure"})
+
+
+@dataclass(frozen=True)
+class BatchPrompt:
+    """バッチ入力の1プロンプト"""
+
+    prompt_id: str
+    user_prompt: str
+    line_number: int
+
+
+@dataclass
+class BatchResult:
+    """バッチ実行結果の集計"""
+
+    total: int = 0
+    skipped: int = 0
+    completed: int = 0
+    partial: int = 0
+    failed: int = 0
+    errors: int = 0
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def executed(self) -> int:
+        """今回実行したプロンプト数"""
+        return self.completed + self.partial + self.failed + self.errors
+
+
+def load_batch_prompts(batch_file: Path) -> list[BatchPrompt]:
+    """バッチ入力JSONLを読み込む
+
+    空行は無視します。
+
+    Args:
+        batch_file: 入力JSONLファイルパス
+
+    Returns:
+        プロンプトのリスト（ファイル内の順序）
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+        ValueError: JSONとして不正な行、promptが空の行、idが重複している場合
+    """
+    prompts: list[BatchPrompt] = []
+    seen_ids: set[str] = set()
+    with open(batch_file, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{batch_file}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"{batch_file}:{line_number}: each line must be a JSON object")
+
+            user_prompt = record.get("prompt")
+            if not isinstance(user_prompt, str) or not user_prompt.strip():
+                raise ValueError(f"{batch_file}:{line_number}: 'prompt' must be a non-empty string")
+
+            prompt_id = str(record.get("id") or f"line-{line_number}")
+            if prompt_id in seen_ids:
+                raise ValueError(f"{batch_file}:{line_number}: duplicate id '{prompt_id}'")
+            seen_ids.add(prompt_id)
+            prompts.append(BatchPrompt(prompt_id=prompt_id, user_prompt=user_prompt, line_number=line_number))
+    return prompts
+
+
+def load_completed_prompt_ids(output_file: Path) -> set[str]:
+    """結果ファイルから完了済み（completed/partial_failure）のプロンプトidを取得
+
+    クラッシュ時に書きかけとなった末尾行、エラー記録、全チーム失敗（failed）の記録は
+    未完了として扱います（プロバイダー障害後の再実行で再試行されます）。
+
+    Args:
+        output_file: 結果JSONLファイルパス
+
+    Returns:
+        完了済みプロンプトidの集合（ファイルが存在しない場合は空）
+    """
+    return load_completed_ids(output_file, "summary", COMPLETED_STATUSES)
+
+
+def summary_status(summary: ExecutionSummary) -> str:
+    """ExecutionSummaryの実行ステータス（completed / partial_failure / failed）"""
+    if not summary.failed_teams_info:
+        return "completed"
+    if not summary.team_results:
+        return "failed"
+    return "partial_failure"
+
+
+async def run_batch(
+    orchestrators: list[Orchestrator],
+    prompts: list[BatchPrompt],
+    output_file: Path,
+    timeout: int | None = None,
+    on_record: Callable[[dict[str, Any]], None] | None = None,
+) -> BatchResult:
+    """バッチ実行
+
+    Orchestratorごとに1つのワーカーが未完了のプロンプトを順に取り出して実行し、
+    結果を完了順に output_file へ追記します（1行ごとにflush・fsync）。
+    並列度は orchestrators の数です。プロバイダーの接続プール・レート制限・
+    設定キャッシュはプロセス全体で共有されます。
+
+    Args:
+        orchestrators: ワーカーごとのOrchestrator（同一設定）
+        prompts: 入力プロンプト
+        output_file: 結果JSONLファイルパス（既存の完了済みidはスキップ）
+        timeout: チーム単位タイムアウト(秒)
+        on_record: 結果1件ごとのコールバック（出力表示用）
+
+    Returns:
+        BatchResult: 実行結果の集計
+    """
+    completed_ids = load_completed_prompt_ids(output_file)
+    pending = [prompt for prompt in prompts if prompt.prompt_id not in completed_ids]
+    result = BatchResult(total=len(prompts), skipped=len(prompts) - len(pending))
+
+    queue: asyncio.Queue[BatchPrompt] = asyncio.Queue()
+    for prompt in pending:
+        queue.put_nowait(prompt)
+
+    with JsonlAppender(output_file) as out:
+
+        def write_record(record: dict[str, Any]) -> None:
+            out.write(record)
+            result.records.append(record)
+            if on_record is not None:
+                on_record(record)
+
+        async def worker(orchestrator: Orchestrator) -> None:
+            while True:
+                try:
+                    prompt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                record: dict[str, Any] = {"id": prompt.prompt_id, "line": prompt.line_number}
+                try:
+                    summary = await orchestrator.execute(user_prompt=prompt.user_prompt, timeout_seconds=timeout)
+                except Exception as e:
+                    logger.error(f"Batch prompt {prompt.prompt_id} failed: {e}", exc_info=True)
+                    record.update(status="error", error=f"{type(e).__name__}: {e}")
+                    result.errors += 1
+                else:
+                    status = summary_status(summary)
+                    record.update(status=status, summary=summary.model_dump(mode="json"))
+                    if status == "completed":
+                        result.completed += 1
+                    elif status == "partial_failure":
+                        result.partial += 1
+                    else:
+                        result.failed += 1
+                write_record(record)
+
+        await asyncio.gather(*(worker(orchestrator) for orchestrator in orchestrators))
+
+    return result
@@ -1,33 +1,72 @@
-"""Main CLI application entry point for MixSeek."""
+"""Main CLI application entry point for MixSeek.
 
+Command modules are imported on demand: ``mixseek --version`` or
+``mixseek member`` does not import Streamlit, the orchestrator, DuckDB/pandas
+or the provider SDKs needed only by other commands.
+"""
+
+import importlib
+
+import click
 import typer
+from typer.core import TyperGroup
+from typer.models import CommandInfo
 
 from mixseek import __version__
-from mixseek.cli.commands import config as config_module
-from mixseek.cli.commands import evaluate as evaluate_module
-from mixseek.cli.commands import exec as exec_module
-from mixseek.cli.commands import init as init_module
-from mixseek.cli.commands import member as member_module
-from mixseek.cli.commands import team as team_module
-from mixseek.cli.commands import ui as ui_module
+
+# コマンド名 -> "モジュール:属性"（登録順がヘルプの表示順）
+LAZY_COMMANDS: dict[str, str] = {
+    "init": "mixseek.cli.commands.init:init",
+    "member": "mixseek.cli.commands.member:member",
+    "team": "mixseek.cli.commands.team:team",
+    "evaluate": "mixseek.cli.commands.evaluate:evaluate",
+    "exec": "mixseek.cli.commands.exec:exec_command",
+    "ui": "mixseek.cli.commands.ui:ui",
+    "config": "mixseek.cli.commands.config:app",
+}
+
+
+def load_command(name: str) -> click.Command:
+    """Import a command module and build its click command.
+
+    Args:
+        name: Command name (key of LAZY_COMMANDS)
+
+    Returns:
+        click command (a group for Typer sub-apps such as ``config``)
+    """
+    module_name, attr = LAZY_COMMANDS[name].split(":")
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        group = typer.main.get_group(target)
+        group.name = name
+        return group
+    return typer.main.get_command_from_info(
+        CommandInfo(name=name, callback=target),
+        pretty_exceptions_short=True,
+        rich_markup_mode=typer.core.DEFAULT_MARKUP_MODE,
+    )
+
+
+class LazyCommandGroup(TyperGroup):
+    """TyperGroup that imports command modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in LAZY_COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            self.add_command(load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
     name="mixseek",
     help="MixSeek: Multi-agent framework CLI",
     add_completion=False,
+    cls=LazyCommandGroup,
 )
 
-# Register commands
-app.command(name="init")(init_module.init)
-app.command(name="member")(member_module.member)
-app.command(name="team")(team_module.team)
-app.command(name="evaluate")(evaluate_module.evaluate)
-app.command(name="exec")(exec_module.exec_command)
-app.command(name="ui")(ui_module.ui)
-
-# Register config subcommands
-app.add_typer(config_module.app, name="config")
-
 
 def version_callback(value: bool) -> None:
     """Display version information."""
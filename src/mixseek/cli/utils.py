@@ -141,9 +141,15 @@ def setup_logfire_from_cli(
     logfire_config = None
 
     if logfire or logfire_metadata or logfire_http:
-        # 環境変数から基本設定を読み取る（project_name/send_to_logfire の継承用）
+        # 環境変数から基本設定を読み取る（project_name/send_to_logfire/span_* の継承用）
         base_config = None
-        if os.getenv("LOGFIRE_PROJECT") or os.getenv("LOGFIRE_SEND_TO_LOGFIRE"):
+        if (
+            os.getenv("LOGFIRE_PROJECT")
+            or os.getenv("LOGFIRE_SEND_TO_LOGFIRE")
+            or os.getenv("LOGFIRE_SPAN_SAMPLE_RATE")
+            or os.getenv("LOGFIRE_SPAN_SLOW_THRESHOLD_MS")
+            or os.getenv("LOGFIRE_SPAN_MAX_ATTRIBUTE_LENGTH")
+        ):
             base_config = LogfireConfig.from_env()
 
         # CLIフラグでプライバシーモードとHTTPキャプチャを決定
@@ -169,6 +175,14 @@ def setup_logfire_from_cli(
             send_to_logfire=base_config.send_to_logfire if base_config else True,
             console_output=console_enabled,
         )
+        if base_config:
+            logfire_config = logfire_config.model_copy(
+                update={
+                    "span_sample_rate": base_config.span_sample_rate,
+                    "span_slow_threshold_ms": base_config.span_slow_threshold_ms,
+                    "span_max_attribute_length": base_config.span_max_attribute_length,
+                }
+            )
     elif os.getenv("LOGFIRE_ENABLED") == "1":
         # CLI値で console_output を上書き（CLI > env の優先度）
         logfire_config = LogfireConfig.from_env().model_copy(update={"console_output": console_enabled})
@@ -221,6 +235,7 @@ def setup_logging_from_cli(
             file_enabled=not no_log_file,
             log_level=cast(LevelName, log_level),
             log_format=cast(LogFormatType, log_format),
+            queue_enabled=os.getenv("MIXSEEK_LOG_QUEUE", "true").lower() in ("true", "1"),
         )
     except ValidationError as e:
         typer.echo(f"Error: ログ設定が不正です: {e}", err=True)
@@ -16,6 +16,7 @@ from mixseek.config.schema import (
     PromptBuilderSettings,
     UISettings,
 )
+from mixseek.config.settings_cache import clear_settings_cache
 from mixseek.config.sources.tracing_source import SourceTrace, TracingSourceWrapper
 
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
     "WORKSPACE_ENV_VAR",
     "agents",
     "ConfigurationManager",
+    "clear_settings_cache",
     "MixSeekBaseSettings",
     "LeaderAgentSettings",
     "MemberAgentSettings",
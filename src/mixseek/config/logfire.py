@@ -34,6 +34,9 @@ class LogfireConfig(BaseModel):
         project_name: Logfireプロジェクト名（オプション）
         send_to_logfire: Logfireクラウドへの送信有効化
         console_output: Logfireスパンのコンソール出力有効化（text モードの ConsoleOptions 制御）
+        span_sample_rate: json モードのスパン出力サンプリング率（trace_id 単位のヘッドサンプリング）
+        span_slow_threshold_ms: この時間以上かかったスパンはサンプリング対象外でも出力（テールサンプリング）
+        span_max_attribute_length: json モードで出力するスパン属性値（文字列）の最大長
     """
 
     enabled: bool
@@ -42,6 +45,9 @@ class LogfireConfig(BaseModel):
     project_name: str | None
     send_to_logfire: bool
     console_output: bool = Field(default=True)
+    span_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    span_slow_threshold_ms: float | None = Field(default=None, ge=0.0)
+    span_max_attribute_length: int = Field(default=8192, gt=0)
 
     @classmethod
     def from_env(cls) -> "LogfireConfig":
@@ -54,6 +60,9 @@ class LogfireConfig(BaseModel):
             LOGFIRE_PROJECT: プロジェクト名
             LOGFIRE_SEND_TO_LOGFIRE: "1"で有効化（デフォルト: "1"）
             MIXSEEK_LOG_CONSOLE: コンソール出力有効化（true/false/1/0）
+            LOGFIRE_SPAN_SAMPLE_RATE: スパン出力サンプリング率（0.0〜1.0、デフォルト: 1.0）
+            LOGFIRE_SPAN_SLOW_THRESHOLD_MS: 常に出力する遅いスパンの閾値（ミリ秒）
+            LOGFIRE_SPAN_MAX_ATTRIBUTE_LENGTH: スパン属性値の最大長（デフォルト: 8192）
         """
         enabled = os.getenv("LOGFIRE_ENABLED") == "1"
         privacy_str = os.getenv("LOGFIRE_PRIVACY_MODE", "metadata_only")
@@ -67,6 +76,12 @@ class LogfireConfig(BaseModel):
         console_str = os.getenv("MIXSEEK_LOG_CONSOLE", "true").lower()
         console_output = console_str in ("true", "1")
 
+        # json モードのスパン出力（サンプリング・属性サイズ上限）
+        span_sample_rate = float(os.getenv("LOGFIRE_SPAN_SAMPLE_RATE", "1.0"))
+        slow_threshold_str = os.getenv("LOGFIRE_SPAN_SLOW_THRESHOLD_MS")
+        span_slow_threshold_ms = float(slow_threshold_str) if slow_threshold_str else None
+        span_max_attribute_length = int(os.getenv("LOGFIRE_SPAN_MAX_ATTRIBUTE_LENGTH", "8192"))
+
         return cls(
             enabled=enabled,
             privacy_mode=privacy_mode,
@@ -74,4 +89,7 @@ class LogfireConfig(BaseModel):
             project_name=project_name,
             send_to_logfire=send_to_logfire,
             console_output=console_output,
+            span_sample_rate=span_sample_rate,
+            span_slow_threshold_ms=span_slow_threshold_ms,
+            span_max_attribute_length=span_max_attribute_length,
         )
@@ -35,6 +35,10 @@ class LoggingConfig(BaseModel):
         file_enabled: Enable file output ($MIXSEEK_WORKSPACE/logs/mixseek.log)
         log_level: Global log level for all destinations (debug/info/warning/error/critical)
         log_format: Log output format (text/json)
+        queue_enabled: Write console/file output from a dedicated writer thread
+        queue_max_size: Maximum number of records buffered for the writer thread
+        file_max_bytes: Rotate logs/mixseek.log when it reaches this size (0 disables rotation)
+        file_backup_count: Number of rotated log files to keep
 
     Note:
         Default values are safe defaults (console/file enabled, cloud disabled).
@@ -46,6 +50,10 @@ class LoggingConfig(BaseModel):
     file_enabled: bool = Field(default=True)
     log_level: LevelName = Field(default="info")
     log_format: LogFormatType = Field(default="text")
+    queue_enabled: bool = Field(default=True)
+    queue_max_size: int = Field(default=10_000, gt=0)
+    file_max_bytes: int = Field(default=10 * 1024 * 1024, ge=0)
+    file_backup_count: int = Field(default=5, ge=0)
 
     @field_validator("log_level")
     @classmethod
@@ -72,6 +80,7 @@ class LoggingConfig(BaseModel):
             MIXSEEK_LOG_CONSOLE: Enable console output (true/false/1/0, default: true)
             MIXSEEK_LOG_FILE: Enable file output (true/false/1/0, default: true)
             MIXSEEK_LOG_FORMAT: Log output format (text/json, default: text)
+            MIXSEEK_LOG_QUEUE: Write output from a background thread (true/false/1/0, default: true)
 
         Returns:
             LoggingConfig: Configuration instance
@@ -96,6 +105,9 @@ class LoggingConfig(BaseModel):
         file_str = os.getenv("MIXSEEK_LOG_FILE", "true").lower()
         file_enabled = file_str in ("true", "1")
 
+        queue_str = os.getenv("MIXSEEK_LOG_QUEUE", "true").lower()
+        queue_enabled = queue_str in ("true", "1")
+
         # Read log output format
         log_format_str = os.getenv("MIXSEEK_LOG_FORMAT", "text").lower()
         valid_formats = ("text", "json")
@@ -109,4 +121,5 @@ class LoggingConfig(BaseModel):
             file_enabled=file_enabled,
             log_level=log_level,
             log_format=log_format,
+            queue_enabled=queue_enabled,
         )
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from pydantic_settings import BaseSettings
 from pydantic_settings.sources import EnvSettingsSource
 
+from .settings_cache import FileFingerprint, file_fingerprint, get_settings_cache, settings_cache_key
 from .sources.tracing_source import SourceTrace
 
 logger = logging.getLogger(__name__)
@@ -221,6 +222,9 @@ class ConfigurationManager:
         DRY原則準拠：4つのload_*_settingsメソッドの共通処理を統合。
         Refactoring Policy準拠：既存クラスを直接改善（V2クラス作成なし）。
 
+        読み込み結果はプロセス全体の設定キャッシュ（settings_cache）に保存され、
+        同一ファイル・同一環境変数での再読み込みではTOML解析とバリデーションを省略します。
+
         Args:
             settings_cls: 設定クラス（TeamSettings, MemberAgentSettings等）
             toml_source_cls: TOMLソースクラス（TeamTomlSource等）
@@ -240,6 +244,34 @@ class ConfigurationManager:
         # CLI引数から None 値をフィルタリング
         filtered_cli_args = {k: v for k, v in self.cli_args.items() if v is not None}
 
+        # プロセス全体の設定キャッシュを参照（ファイルパスを解決できる場合のみ）
+        # workspace未指定の相対パスはTOMLソース側でworkspaceを自動取得するため対象外
+        cache = get_settings_cache()
+        cache_key: str | None = None
+        dependencies: list[FileFingerprint] = []
+        if toml_file.is_absolute() or self.workspace is not None:
+            cache_key = settings_cache_key(
+                settings_cls,
+                toml_source_cls,
+                toml_file,
+                self.workspace,
+                self.environment,
+                filtered_cli_args,
+                extra_kwargs,
+            )
+            cached = cache.get(cache_key, settings_cls)
+            if cached is not None:
+                return cached
+
+            # 読み込み前にフィンガープリントを取得（読み込み中の変更は次回の参照で検出される）
+            resolved_toml_file = toml_file
+            if not resolved_toml_file.is_absolute() and self.workspace is not None:
+                resolved_toml_file = self.workspace / resolved_toml_file
+            env_file = settings_cls.model_config.get("env_file", ".env")
+            dependencies.append(file_fingerprint(resolved_toml_file))
+            if env_file is not None:
+                dependencies.append(file_fingerprint(Path(str(env_file))))
+
         # カスタムTOMLソースを作成（workspace対応）
         toml_source = toml_source_cls(
             settings_cls=settings_cls,
@@ -342,6 +374,11 @@ class ConfigurationManager:
         if not hasattr(settings_instance, "__source_traces__"):
             object.__setattr__(settings_instance, "__source_traces__", trace_storage)
 
+        if cache_key is not None:
+            # 参照先ファイル（team.tomlのmember参照等）もキャッシュの依存ファイルとする
+            dependencies.extend(getattr(toml_source, "file_fingerprints", []))
+            cache.put(cache_key, settings_instance, dependencies)
+
         return settings_instance
 
     def load_team_settings(
@@ -12,6 +12,9 @@ from pydantic_settings import (
 )
 from pydantic_settings.sources import DotEnvSettingsSource, EnvSettingsSource
 
+from mixseek.core.http_clients import HttpClientSettings
+from mixseek.core.rate_limit import RateLimitRule
+from mixseek.core.response_cache import ResponseCacheSettings
 from mixseek.models.member_agent import PluginMetadata, ToolSettings
 
 from .mixins import WorkspaceValidatorMixin
@@ -698,6 +701,19 @@ class EvaluatorSettings(MixSeekBaseSettings):
         description="カスタムメトリクス設定（EvaluationConfig.custom_metrics互換）",
     )
 
+    # メトリクス並列評価
+    max_concurrent_metrics: int = Field(
+        default=4,
+        ge=1,
+        description="同時に評価するメトリクスの最大数（1で順次評価）",
+    )
+
+    metric_error_mode: Literal["fail_fast", "collect_all"] = Field(
+        default="fail_fast",
+        description="メトリクス失敗時の動作（fail_fast: 最初の失敗で残りをキャンセル、"
+        "collect_all: 全メトリクスを評価してから失敗をまとめて報告）",
+    )
+
     @field_validator("default_model")
     @classmethod
     def validate_default_model(cls, v: str) -> str:
@@ -873,6 +889,24 @@ class OrchestratorSettings(WorkspaceValidatorMixin, MixSeekBaseSettings):
         description="Team configuration file paths (from orchestrator.toml)",
     )
 
+    rate_limits: list[RateLimitRule] = Field(
+        default_factory=list,
+        description=(
+            "LLM rate limit rules shared by leader, member, evaluator and judgment calls "
+            "(from [[orchestrator.rate_limits]], first matching model pattern wins)"
+        ),
+    )
+
+    http_client: HttpClientSettings = Field(
+        default_factory=HttpClientSettings,
+        description="Connection pool settings for shared LLM provider HTTP clients (from [orchestrator.http_client])",
+    )
+
+    response_cache: ResponseCacheSettings = Field(
+        default_factory=ResponseCacheSettings,
+        description="On-disk cache of evaluator and judgment LLM responses (from [orchestrator.response_cache])",
+    )
+
     evaluator_config: str | None = Field(
         default=None,
         description="Evaluator configuration file path (relative to workspace or absolute)",
@@ -1017,6 +1051,9 @@ def _load_prompt_builder_defaults() -> dict[str, str]:
 _PROMPT_BUILDER_DEFAULTS = _load_prompt_builder_defaults()
 
 
+SubmissionHistoryStrategy = Literal["all", "last_k", "best", "token_budget", "diff"]
+
+
 class PromptBuilderSettings(MixSeekBaseSettings):
     """PromptBuilder用の設定スキーマ。
 
@@ -1027,6 +1064,7 @@ class PromptBuilderSettings(MixSeekBaseSettings):
     - Team用プロンプトテンプレート（Jinja2形式）
     - Evaluator用プロンプトテンプレート（Jinja2形式）
     - Judgment用プロンプトテンプレート（Jinja2形式）
+    - 過去Submission履歴（{{ submission_history }}）の整形戦略
 
     Note:
         デフォルト値は prompt_builder_default.toml から読み込まれます。
@@ -1058,6 +1096,29 @@ class PromptBuilderSettings(MixSeekBaseSettings):
         description="Jinja2 template string for JudgementClient user prompts",
     )
 
+    # Submission history formatting (bounds prompt growth across rounds)
+    submission_history_strategy: SubmissionHistoryStrategy = Field(
+        default="all",
+        description=(
+            "How past rounds are rendered into submission_history: "
+            "'all' (every round verbatim), 'last_k' (most recent rounds), 'best' (highest-scoring round), "
+            "'token_budget' (most recent rounds within submission_history_max_tokens), "
+            "'diff' (later rounds as diffs against the previous round)"
+        ),
+    )
+
+    submission_history_last_k: int = Field(
+        default=3,
+        ge=1,
+        description="Number of recent rounds kept by the 'last_k' strategy",
+    )
+
+    submission_history_max_tokens: int = Field(
+        default=8000,
+        ge=1,
+        description="Estimated token budget for submission_history with the 'token_budget' strategy",
+    )
+
     @field_validator("team_user_prompt", "evaluator_user_prompt", "judgment_user_prompt")
     @classmethod
     def validate_not_empty(cls, v: str, info: ValidationInfo) -> str:
@@ -0,0 +1,191 @@
+"""プロセス全体の設定読み込みキャッシュ
+
+Orchestratorは実行開始時にチームごとのteam.tomlを読み込み、各RoundControllerも
+ConfigurationManager.load_team_settings() で同じファイルを再度読み込みます。
+そのたびにTOML解析（member参照の解決を含む）、環境変数・.envの走査、
+TracingSourceWrapper経由のバリデーションが実行されていました。
+
+SettingsCacheは ConfigurationManager._load_settings_with_tracing() の結果を保持し、
+同一ファイルの読み込みをプロセス全体で1回に抑えます。
+
+- キー: 設定クラス、TOMLソースクラス、TOMLファイルパス、workspace、environment、
+  カレントディレクトリ、CLI引数・追加引数、MIXSEEK_* 環境変数のスナップショット
+- 検証: 読み込んだファイル（TOML本体、member参照先TOML、.env）のmtime・サイズが
+  保存時から変化していればミスとして再読み込み
+- 返却値: ディープコピー（呼び出し側での変更がキャッシュに影響しない）
+- 明示的な無効化: clear_settings_cache()
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic_settings import BaseSettings
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+# 環境変数スナップショットの対象（全設定クラスのenv_prefixの共通部分）
+ENV_SNAPSHOT_PREFIX = "MIXSEEK_"
+
+DEFAULT_MAX_ENTRIES = 256
+
+# (絶対パス, mtime_ns, サイズ)。ファイルが存在しない場合はmtime_ns・サイズがNone
+FileFingerprint = tuple[str, int | None, int | None]
+
+
+@dataclass
+class SettingsCacheStats:
+    """SettingsCacheのヒット/ミス数"""
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    settings: BaseSettings
+    dependencies: tuple[FileFingerprint, ...]
+
+
+def file_fingerprint(path: Path) -> FileFingerprint:
+    """ファイルの変更検出用フィンガープリントを取得
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        (絶対パス, mtime_ns, サイズ)。存在しない場合は(絶対パス, None, None)
+    """
+    resolved = path.absolute()
+    try:
+        stat = resolved.stat()
+    except OSError:
+        return (str(resolved), None, None)
+    return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+def settings_cache_key(
+    settings_cls: type[BaseSettings],
+    toml_source_cls: type,
+    toml_file: Path,
+    workspace: Path | None,
+    environment: str,
+    cli_args: dict[str, Any],
+    extra_kwargs: dict[str, Any],
+) -> str:
+    """設定読み込みのキャッシュキーを作成
+
+    設定値に影響しうる入力（MIXSEEK_* 環境変数、カレントディレクトリを含む）を
+    すべて含めます。ファイル内容の変化はキーではなくエントリの検証で検出します。
+
+    Returns:
+        キャッシュキー（JSON文字列）
+    """
+    env_snapshot = sorted((k, v) for k, v in os.environ.items() if k.upper().startswith(ENV_SNAPSHOT_PREFIX))
+    return json.dumps(
+        [
+            f"{settings_cls.__module__}.{settings_cls.__qualname__}",
+            f"{toml_source_cls.__module__}.{toml_source_cls.__qualname__}",
+            str(toml_file),
+            str(workspace) if workspace is not None else None,
+            environment,
+            os.getcwd(),
+            cli_args,
+            extra_kwargs,
+            env_snapshot,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+
+
+class SettingsCache:
+    """検証済み設定インスタンスのキャッシュ（スレッドセーフ、LRU）"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """初期化
+
+        Args:
+            max_entries: 保持する最大エントリ数（超過時は最も古く参照されたエントリを削除）
+        """
+        self.max_entries = max_entries
+        self.stats = SettingsCacheStats()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, settings_cls: type[SettingsT]) -> SettingsT | None:
+        """キャッシュ済みの設定を取得
+
+        依存ファイルのいずれかが保存時から変更・作成・削除されている場合はミスとし、
+        エントリを破棄します。
+
+        Args:
+            key: settings_cache_key() で作成したキー
+            settings_cls: 期待する設定クラス
+
+        Returns:
+            設定インスタンスのディープコピー。ミスの場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if any(file_fingerprint(Path(path)) != (path, mtime, size) for path, mtime, size in entry.dependencies):
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            settings = entry.settings
+
+        if not isinstance(settings, settings_cls):
+            return None
+        return settings.model_copy(deep=True)
+
+    def put(self, key: str, settings: BaseSettings, dependencies: Iterable[FileFingerprint]) -> None:
+        """設定をキャッシュに保存
+
+        Args:
+            key: settings_cache_key() で作成したキー
+            settings: 読み込み済みの設定インスタンス（ディープコピーを保存）
+            dependencies: 読み込み前に取得した依存ファイルのフィンガープリント
+        """
+        entry = _CacheEntry(settings=settings.model_copy(deep=True), dependencies=tuple(dependencies))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_settings_cache = SettingsCache()
+
+
+def get_settings_cache() -> SettingsCache:
+    """プロセス全体の設定キャッシュを取得"""
+    return _settings_cache
+
+
+def clear_settings_cache() -> None:
+    """プロセス全体の設定キャッシュを無効化
+
+    設定ファイルの変更はmtime・サイズで自動検出されるため、通常は呼び出し不要です。
+    同一サイズのファイルをmtimeを保ったまま書き換えた場合などに使用します。
+    """
+    _settings_cache.clear()
@@ -108,6 +108,8 @@ class EvaluationTomlSource(PydanticBaseSettingsSource):
             # 動的配列をそのまま格納（TeamSettingsパターン）
             "metrics": data.get("metrics", []),
             "custom_metrics": data.get("custom_metrics", {}),
+            "max_concurrent_metrics": data.get("max_concurrent_metrics"),
+            "metric_error_mode": data.get("metric_error_mode"),
         }
 
         # Noneの値を除去（デフォルト値を使用）
@@ -21,6 +21,9 @@ class PromptBuilderTomlSource(PydanticBaseSettingsSource):
         team_user_prompt = "..."
         evaluator_user_prompt = "..."
         judgment_user_prompt = "..."
+        submission_history_strategy = "last_k"
+        submission_history_last_k = 3
+        submission_history_max_tokens = 8000
     """
 
     def __init__(
@@ -79,6 +82,9 @@ class PromptBuilderTomlSource(PydanticBaseSettingsSource):
             "team_user_prompt": prompt_builder.get("team_user_prompt"),
             "evaluator_user_prompt": prompt_builder.get("evaluator_user_prompt"),
             "judgment_user_prompt": prompt_builder.get("judgment_user_prompt"),
+            "submission_history_strategy": prompt_builder.get("submission_history_strategy"),
+            "submission_history_last_k": prompt_builder.get("submission_history_last_k"),
+            "submission_history_max_tokens": prompt_builder.get("submission_history_max_tokens"),
         }
 
         # Noneの値を除去（デフォルト値を使用）
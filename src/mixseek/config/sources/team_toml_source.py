@@ -7,6 +7,7 @@ from typing import Any
 from pydantic.fields import FieldInfo
 from pydantic_settings import PydanticBaseSettingsSource
 
+from ..settings_cache import FileFingerprint, file_fingerprint
 from .field_mapper import merge_member_agent_fields, normalize_member_agent_fields
 
 
@@ -40,6 +41,8 @@ class TeamTomlSource(PydanticBaseSettingsSource):
         self.toml_file = toml_file
         self.workspace = workspace
         self.toml_data: dict[str, Any] = {}
+        # 読み込んだファイルのフィンガープリント（設定キャッシュの変更検出用）
+        self.file_fingerprints: list[FileFingerprint] = []
         self._load_and_resolve()
 
     def _load_toml_file(self, toml_path: Path, context: str = "TOML file") -> dict[str, Any]:
@@ -67,6 +70,7 @@ class TeamTomlSource(PydanticBaseSettingsSource):
         if not resolved_path.exists():
             raise FileNotFoundError(f"{context} not found: {resolved_path}")
 
+        self.file_fingerprints.append(file_fingerprint(resolved_path))
         try:
             with resolved_path.open("rb") as f:
                 return tomllib.load(f)
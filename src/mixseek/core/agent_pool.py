@@ -0,0 +1,118 @@
+"""Agent instance pooling for MixSeek-Core.
+
+Building a pydantic-ai ``Agent`` creates the authenticated model (and its
+provider HTTP client) and registers tools every time. Agents are stateless
+between runs, so callers that repeatedly build agents with identical
+parameters can share one instance through an ``AgentPool``:
+
+- ``RoundController`` owns a pool per team and reuses the Leader Agent and
+  Member Agents across rounds.
+- ``Evaluator`` owns a pool and makes it current while evaluating, so
+  ``evaluate_with_llm`` reuses one Agent per (model, settings, instructions,
+  output type, retries) combination across metrics and rounds.
+
+The current pool is tracked with a ``ContextVar`` so it propagates to tasks
+created with ``asyncio.gather``/``asyncio.create_task``.
+"""
+
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class AgentPoolStats:
+    """Cache hit/miss counters for an AgentPool."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+def agent_cache_key(*parts: Any) -> tuple[Hashable, ...]:
+    """Build a hashable cache key from agent construction parameters.
+
+    Dicts (e.g. ModelSettings) and lists (e.g. stop_sequences) are converted
+    recursively into sorted tuples / tuples.
+
+    Args:
+        *parts: Construction parameters (model ID, settings, instructions, ...)
+
+    Returns:
+        Hashable tuple usable as an AgentPool key
+    """
+    return tuple(_freeze(part) for part in parts)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple | set | frozenset):
+        frozen = tuple(_freeze(v) for v in value)
+        return tuple(sorted(frozen, key=repr)) if isinstance(value, set | frozenset) else frozen
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
+
+
+class AgentPool:
+    """Cache of agent instances keyed by their construction parameters."""
+
+    def __init__(self) -> None:
+        self._agents: dict[Hashable, Any] = {}
+        self.stats = AgentPoolStats()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the cached agent for ``key``, creating it with ``factory`` on first use.
+
+        Args:
+            key: Cache key (see ``agent_cache_key``)
+            factory: Zero-argument callable that builds the agent
+
+        Returns:
+            Cached or newly created agent
+        """
+        if key in self._agents:
+            self.stats.hits += 1
+            agent: T = self._agents[key]
+            return agent
+
+        self.stats.misses += 1
+        agent = factory()
+        self._agents[key] = agent
+        return agent
+
+    def clear(self) -> None:
+        """Drop every cached agent."""
+        self._agents.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+
+_current_agent_pool: ContextVar[AgentPool | None] = ContextVar("mixseek_agent_pool", default=None)
+
+
+def get_agent_pool() -> AgentPool | None:
+    """Get the agent pool for the current context (None if no pool is active)."""
+    return _current_agent_pool.get()
+
+
+@contextmanager
+def use_agent_pool(pool: AgentPool) -> Iterator[AgentPool]:
+    """Make ``pool`` the current agent pool within the ``with`` block.
+
+    Args:
+        pool: Agent pool to activate
+
+    Yields:
+        The activated pool
+    """
+    token = _current_agent_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _current_agent_pool.reset(token)
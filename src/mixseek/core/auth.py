@@ -13,19 +13,94 @@ import os
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import httpx
 from pydantic_ai.models.anthropic import AnthropicModel
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.models.openai import OpenAIChatModel, OpenAIResponsesModel
 from pydantic_ai.models.test import TestModel
+from pydantic_ai.providers.anthropic import AnthropicProvider
 from pydantic_ai.providers.google import GoogleProvider
 from pydantic_ai.providers.grok import GrokProvider
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from mixseek.core.http_clients import HttpClientSettings, create_pooled_http_client
+from mixseek.core.rate_limit import (
+    RateLimitedModel,
+    RateLimitRule,
+    RateLimitStats,
+    configure_rate_limits,
+    get_rate_limit_stats,
+    get_rate_limiter,
+)
+
+__all__ = [
+    "AuthProvider",
+    "AuthenticationError",
+    "HttpClientSettings",
+    "RateLimitRule",
+    "RateLimitStats",
+    "RateLimitedModel",
+    "clear_auth_caches",
+    "close_all_auth_clients",
+    "configure_http_clients",
+    "configure_rate_limits",
+    "create_authenticated_model",
+    "detect_auth_provider",
+    "get_auth_info",
+    "get_rate_limit_stats",
+]
 
 # Managed HTTP clients for cleanup
 _managed_http_clients: list[httpx.AsyncClient] = []
 
+# Shared pooled HTTP client per provider (e.g. "openai", "google-gla")
+_http_client_settings = HttpClientSettings()
+_shared_http_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def configure_http_clients(settings: HttpClientSettings | dict[str, Any] | None) -> None:
+    """Replace the connection pool settings of the shared provider HTTP clients.
+
+    When the settings change, clients created afterwards use the new settings.
+    Existing clients stay open for models that already hold them and are closed
+    by close_all_auth_clients().
+
+    Args:
+        settings: Connection pool settings (HttpClientSettings, dict from TOML, or None for defaults)
+    """
+    global _http_client_settings
+    if settings is None:
+        parsed = HttpClientSettings()
+    elif isinstance(settings, HttpClientSettings):
+        parsed = settings
+    else:
+        parsed = HttpClientSettings.model_validate(settings)
+
+    if parsed != _http_client_settings:
+        _http_client_settings = parsed
+        _shared_http_clients.clear()
+        _create_google_model_cached.cache_clear()
+
+
+def _get_http_client(provider: str) -> httpx.AsyncClient:
+    """Get the shared pooled HTTP client for a provider, creating it on first use.
+
+    Args:
+        provider: Provider key (e.g. "google-gla", "google-vertex", "openai", "anthropic", "grok")
+
+    Returns:
+        Shared httpx.AsyncClient with a per-event-loop connection pool
+    """
+    client = _shared_http_clients.get(provider)
+    if client is None or client.is_closed:
+        client = create_pooled_http_client(_http_client_settings)
+        _shared_http_clients[provider] = client
+        # Add to managed clients for cleanup
+        _managed_http_clients.append(client)
+    return client
+
 
 class AuthProvider(Enum):
     """Supported authentication providers."""
@@ -210,11 +285,11 @@ def validate_vertex_ai_credentials() -> None:
 
 @lru_cache(maxsize=32)
 def _create_google_model_cached(model_name: str, provider_type: Literal["google-gla", "google-vertex"]) -> GoogleModel:
-    """Create a cached GoogleModel instance with dedicated HTTP client.
+    """Create a cached GoogleModel instance using the provider's pooled HTTP client.
 
     This function solves the HTTPClient sharing issue when multiple GoogleModel
     instances are created with the same model name. By caching the model instance
-    and providing a dedicated HTTP client, we prevent premature client closure
+    and providing a managed HTTP client, we prevent premature client closure
     that can occur in concurrent async operations.
 
     Args:
@@ -222,7 +297,7 @@ def _create_google_model_cached(model_name: str, provider_type: Literal["google-
         provider_type: Provider type ("google-gla" for Google AI, "google-vertex" for Vertex AI)
 
     Returns:
-        GoogleModel: Cached model instance with dedicated HTTP client
+        GoogleModel: Cached model instance with pooled HTTP client
 
     Note:
         This caching strategy is essential for RoundController where multiple agents
@@ -230,19 +305,10 @@ def _create_google_model_cached(model_name: str, provider_type: Literal["google-
         Without caching, each agent would create a new GoogleModel instance, leading
         to HTTPClient conflicts in async execution.
     """
-    # Create dedicated HTTP client with appropriate timeouts
-    http_client = httpx.AsyncClient(
-        timeout=httpx.Timeout(timeout=600, connect=5),
-        headers={"User-Agent": "mixseek-core/1.0"},
-    )
-
-    # Add to managed clients for cleanup
-    _managed_http_clients.append(http_client)
-
-    # Create GoogleProvider with dedicated HTTP client
+    # Create GoogleProvider with the shared pooled HTTP client
     google_provider = GoogleProvider(
         vertexai=(provider_type == "google-vertex"),
-        http_client=http_client,
+        http_client=_get_http_client(provider_type),
     )
 
     # Create GoogleModel with dedicated provider
@@ -344,7 +410,7 @@ def validate_grok_credentials() -> None:
 
 def create_authenticated_model(
     model_id: str,
-) -> GoogleModel | OpenAIChatModel | OpenAIResponsesModel | AnthropicModel | TestModel:
+) -> GoogleModel | OpenAIChatModel | OpenAIResponsesModel | AnthropicModel | TestModel | RateLimitedModel:
     """Create an authenticated model instance.
 
     This function enforces the following requirements:
@@ -352,10 +418,35 @@ def create_authenticated_model(
     - Explicit error handling for all authentication failures
     - Clear separation between test and production environments
 
+    When a rate limit rule configured via configure_rate_limits() matches the model ID,
+    the model is wrapped in RateLimitedModel so that all callers share the same limiter.
+
     Args:
         model_id: Model identifier (e.g., "google-gla:gemini-2.5-flash-lite",
                   "google-vertex:gemini-2.5-flash-lite", "openai:gpt-4o", "anthropic:claude-sonnet-4-5-20250929")
 
+    Returns:
+        Union[GoogleModel, OpenAIModel, AnthropicModel, TestModel, RateLimitedModel]: Authenticated model instance
+
+    Raises:
+        AuthenticationError: If authentication validation fails
+    """
+    model = _create_provider_model(model_id)
+
+    limiter = get_rate_limiter(model_id)
+    if limiter is not None:
+        return RateLimitedModel(model, limiter)
+    return model
+
+
+def _create_provider_model(
+    model_id: str,
+) -> GoogleModel | OpenAIChatModel | OpenAIResponsesModel | AnthropicModel | TestModel:
+    """Create the provider-specific model instance after validating credentials.
+
+    Args:
+        model_id: Model identifier
+
     Returns:
         Union[GoogleModel, OpenAIModel, AnthropicModel, TestModel]: Authenticated model instance
 
@@ -390,13 +481,13 @@ def create_authenticated_model(
         validate_openai_credentials()
         # Extract base model name (remove 'openai:' prefix)
         base_model_name = model_id.replace("openai:", "")
-        return OpenAIChatModel(base_model_name)
+        return OpenAIChatModel(base_model_name, provider=OpenAIProvider(http_client=_get_http_client("openai")))
 
     elif auth_provider == AuthProvider.ANTHROPIC:
         validate_anthropic_credentials()
         # Extract base model name (remove 'anthropic:' prefix)
         base_model_name = model_id.replace("anthropic:", "")
-        return AnthropicModel(base_model_name)
+        return AnthropicModel(base_model_name, provider=AnthropicProvider(http_client=_get_http_client("anthropic")))
 
     elif auth_provider == AuthProvider.GROK:
         validate_grok_credentials()
@@ -406,7 +497,7 @@ def create_authenticated_model(
         # validate_grok_credentials() ensures GROK_API_KEY is set
         grok_api_key = os.getenv("GROK_API_KEY")
         assert grok_api_key is not None  # Guaranteed by validate_grok_credentials()
-        grok_provider = GrokProvider(api_key=grok_api_key)
+        grok_provider = GrokProvider(api_key=grok_api_key, http_client=_get_http_client("grok"))
         return OpenAIChatModel(base_model_name, provider=grok_provider)
 
     elif auth_provider == AuthProvider.GROK_RESPONSES:
@@ -414,8 +505,11 @@ def create_authenticated_model(
         # Extract base model name (remove 'grok-responses:' prefix)
         base_model_name = model_id.replace("grok-responses:", "")
         # Grok Responses API supports web_search and x_search tools
-        # Uses OpenAIResponsesModel with provider='grok'
-        return OpenAIResponsesModel(base_model_name, provider="grok")
+        # Uses OpenAIResponsesModel with GrokProvider
+        grok_api_key = os.getenv("GROK_API_KEY")
+        assert grok_api_key is not None  # Guaranteed by validate_grok_credentials()
+        grok_provider = GrokProvider(api_key=grok_api_key, http_client=_get_http_client("grok"))
+        return OpenAIResponsesModel(base_model_name, provider=grok_provider)
 
     else:
         # This should never be reached due to detect_auth_provider validation
@@ -507,8 +601,8 @@ async def close_all_auth_clients() -> None:
     """Close all managed HTTP clients created by the auth module.
 
     This should be called during application shutdown to prevent resource leaks.
-    Closes all httpx.AsyncClient instances that were created by _create_google_model_cached
-    and clears the management list.
+    Closes all shared provider httpx.AsyncClient instances (pooled connections
+    for Google, OpenAI, Anthropic and Grok) and clears the management list.
 
     Note:
         This function is idempotent - it's safe to call multiple times.
@@ -527,6 +621,9 @@ async def close_all_auth_clients() -> None:
         if not client.is_closed:
             await client.aclose()
     _managed_http_clients.clear()
+    _shared_http_clients.clear()
+    # Cached GoogleModels hold the closed clients
+    _create_google_model_cached.cache_clear()
 
 
 def clear_auth_caches() -> None:
@@ -539,7 +636,7 @@ def clear_auth_caches() -> None:
 
     The function clears:
     - _create_google_model_cached LRU cache (GoogleModel instances)
-    - _managed_http_clients list (httpx.AsyncClient references)
+    - _managed_http_clients list and shared provider clients (httpx.AsyncClient references)
     - pydantic_ai's internal _cached_async_http_client
 
     Note:
@@ -559,6 +656,7 @@ def clear_auth_caches() -> None:
     # Clear this repository's caches
     _create_google_model_cached.cache_clear()
     _managed_http_clients.clear()
+    _shared_http_clients.clear()
 
     # Clear pydantic_ai's cached HTTP client (also holds event loop references)
     try:
@@ -0,0 +1,166 @@
+"""Pooled HTTP clients for LLM providers.
+
+``create_authenticated_model`` attaches one shared ``httpx.AsyncClient`` per
+provider (Google AI, Vertex AI, OpenAI, Anthropic, Grok) so that connections
+and TLS sessions are reused across every Agent in an execution.
+
+httpx connection pools are bound to the event loop they were first used in.
+The shared clients therefore use ``LoopLocalTransport``, which keeps one
+connection pool per running event loop. A client created outside a loop (or
+reused after ``asyncio.run()`` returns, e.g. in the Streamlit UI) never
+touches connections that belong to a closed loop.
+
+httpx only applies ``HTTP(S)_PROXY`` / ``ALL_PROXY`` / ``NO_PROXY`` when no
+custom transport is given, so the environment proxies are mounted explicitly
+(one ``LoopLocalTransport`` per proxy URL).
+"""
+
+import asyncio
+import importlib.util
+import ipaddress
+import weakref
+from urllib.request import getproxies
+
+import httpx
+from pydantic import BaseModel, Field, model_validator
+
+USER_AGENT = "mixseek-core/1.0"
+
+
+class HttpClientSettings(BaseModel):
+    """Connection pool settings for the shared provider HTTP clients.
+
+    Example (orchestrator.toml):
+        ```toml
+        [orchestrator.http_client]
+        max_connections = 100
+        max_keepalive_connections = 20
+        keepalive_expiry_seconds = 30.0
+        http2 = false
+        ```
+    """
+
+    max_connections: int = Field(default=100, gt=0, description="Maximum concurrent connections per provider")
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum idle keep-alive connections per provider"
+    )
+    keepalive_expiry_seconds: float = Field(default=30.0, ge=0, description="Idle keep-alive connection expiry")
+    http2: bool = Field(default=False, description="Enable HTTP/2 (requires the 'h2' package)")
+    timeout_seconds: float = Field(default=600.0, gt=0, description="Default request timeout")
+    connect_timeout_seconds: float = Field(default=5.0, gt=0, description="Connection establishment timeout")
+
+    @model_validator(mode="after")
+    def validate_http2_available(self) -> "HttpClientSettings":
+        """Validate that the h2 package is installed when HTTP/2 is enabled."""
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ValueError("http2 = true requires the 'h2' package. Install it with: pip install 'httpx[http2]'")
+        return self
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """httpx transport that keeps a separate connection pool per event loop."""
+
+    def __init__(self, settings: HttpClientSettings, proxy: str | None = None) -> None:
+        self.settings = settings
+        self.proxy = proxy
+        self._transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.settings.max_connections,
+                    max_keepalive_connections=self.settings.max_keepalive_connections,
+                    keepalive_expiry=self.settings.keepalive_expiry_seconds,
+                ),
+                http2=self.settings.http2,
+                proxy=self.proxy,
+            )
+            self._transports[loop] = transport
+        return transport
+
+    @property
+    def pool_count(self) -> int:
+        """Number of event loops that currently own a connection pool."""
+        return len(self._transports)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the pool of the running loop and drop pools of other loops.
+
+        Pools bound to other (typically already closed) loops cannot be awaited
+        from here; their connections are released when the loop is collected.
+        """
+        loop = asyncio.get_running_loop()
+        transport = self._transports.pop(loop, None)
+        self._transports.clear()
+        if transport is not None:
+            await transport.aclose()
+
+
+def get_environment_proxy_mounts() -> dict[str, str | None]:
+    """Read proxy settings from the environment as httpx mount patterns.
+
+    Mirrors what httpx does for clients without a custom transport:
+    ``HTTP_PROXY`` / ``HTTPS_PROXY`` / ``ALL_PROXY`` map to ``"<scheme>://"``
+    patterns and each ``NO_PROXY`` entry maps to ``None`` (no proxy).
+
+    Returns:
+        Mapping of URL pattern to proxy URL (None = connect directly)
+    """
+    proxy_info = getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        proxy_url = proxy_info.get(scheme)
+        if proxy_url:
+            mounts[f"{scheme}://"] = proxy_url if "://" in proxy_url else f"http://{proxy_url}"
+
+    for hostname in (host.strip() for host in proxy_info.get("no", "").split(",")):
+        if hostname == "*":
+            return {}
+        if not hostname:
+            continue
+        if "://" in hostname:
+            mounts[hostname] = None
+            continue
+        try:
+            address = ipaddress.ip_address(hostname)
+        except ValueError:
+            address = None
+        if address is not None and address.version == 6:
+            mounts[f"all://[{hostname}]"] = None
+        elif address is not None or hostname.lower() == "localhost":
+            mounts[f"all://{hostname}"] = None
+        else:
+            mounts[f"all://*{hostname.lstrip('.')}"] = None
+    return mounts
+
+
+def create_pooled_http_client(settings: HttpClientSettings) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient backed by a per-event-loop connection pool.
+
+    Environment proxies (``HTTP(S)_PROXY``, ``ALL_PROXY``, ``NO_PROXY``) are
+    honored as with a default httpx client.
+
+    Args:
+        settings: Connection pool settings
+
+    Returns:
+        httpx.AsyncClient to share between provider instances
+    """
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {
+        pattern: None if proxy is None else LoopLocalTransport(settings, proxy=proxy)
+        for pattern, proxy in get_environment_proxy_mounts().items()
+    }
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout=settings.timeout_seconds, connect=settings.connect_timeout_seconds),
+        headers={"User-Agent": USER_AGENT},
+        transport=LoopLocalTransport(settings),
+        mounts=mounts,
+    )
@@ -0,0 +1,267 @@
+"""Push-based team progress channel for MixSeek-Core.
+
+``RoundController`` used to rewrite ``logs/{execution_id}.{team_id}.progress.json``
+several times per round, and the Streamlit UI globbed the logs directory and
+re-parsed every file from a polling thread. Progress is now published as
+``ProgressEvent`` objects through a process-wide ``ProgressBus``:
+
+- In-process consumers (the Streamlit UI runs the Orchestrator in a background
+  thread, the CLI runs it on its own event loop) read the latest snapshot per
+  team, block on ``wait_for_update`` or iterate ``stream()`` on an event loop.
+  No file I/O is involved.
+- Every event is also appended as one JSON line to
+  ``logs/{execution_id}.progress.jsonl``. Consumers in another process use
+  ``ProgressLogReader``, which only parses bytes appended since its last read.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_LOG_SUFFIX = ".progress.jsonl"
+
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Progress of one team at a point in time."""
+
+    execution_id: str
+    team_id: str
+    team_name: str
+    status: str
+    current_round: int
+    total_rounds: int
+    updated_at: str
+    current_agent: str | None = None
+    error_message: str | None = None
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the team has finished (completed or failed)."""
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the progress record format (``error_message`` only when set)."""
+        data = asdict(self)
+        if data["error_message"] is None:
+            del data["error_message"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProgressEvent":
+        """Deserialize a progress record.
+
+        Raises:
+            KeyError: If a required field is missing
+        """
+        return cls(
+            execution_id=data["execution_id"],
+            team_id=data["team_id"],
+            team_name=data["team_name"],
+            status=data["status"],
+            current_round=data["current_round"],
+            total_rounds=data["total_rounds"],
+            updated_at=data["updated_at"],
+            current_agent=data.get("current_agent"),
+            error_message=data.get("error_message"),
+        )
+
+
+def progress_log_path(workspace: Path, execution_id: str) -> Path:
+    """Path of the append-only progress event log for an execution."""
+    return workspace / "logs" / f"{execution_id}{PROGRESS_LOG_SUFFIX}"
+
+
+class ProgressBus:
+    """Process-wide publish/subscribe channel for team progress.
+
+    ``publish`` may be called from any thread. Subscribers are called
+    synchronously in the publishing thread, so they must be cheap;
+    ``stream()`` hands events over to the consuming event loop instead.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._latest: dict[str, dict[str, ProgressEvent]] = {}
+        self._versions: dict[str, int] = {}
+        self._subscribers: list[Callable[[ProgressEvent], None]] = []
+
+    def publish(self, event: ProgressEvent, log_path: Path | None = None) -> None:
+        """Publish a progress event.
+
+        Args:
+            event: Progress event
+            log_path: Event log to append to (cross-process consumers). Write
+                failures are logged and never propagate to the publisher.
+        """
+        with self._condition:
+            self._latest.setdefault(event.execution_id, {})[event.team_id] = event
+            self._versions[event.execution_id] = self._versions.get(event.execution_id, 0) + 1
+            subscribers = list(self._subscribers)
+            self._condition.notify_all()
+
+        # File I/O outside the lock, so snapshot/wait_for_update readers never wait on the disk
+        if log_path is not None:
+            self._append(log_path, event)
+
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"Progress subscriber failed: {e}")
+
+    def subscribe(self, callback: Callable[[ProgressEvent], None]) -> Callable[[], None]:
+        """Register a callback for every published event.
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._condition:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._condition:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def stream(self, execution_id: str | None = None) -> AsyncIterator[ProgressEvent]:
+        """Iterate published events on the current event loop.
+
+        Args:
+            execution_id: Only yield events of this execution (all when None)
+
+        Yields:
+            Progress events in publish order, until the consumer stops iterating
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[ProgressEvent] = asyncio.Queue()
+
+        def enqueue(event: ProgressEvent) -> None:
+            if execution_id is None or event.execution_id == execution_id:
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+                except RuntimeError:
+                    # Consumer loop already closed
+                    pass
+
+        unsubscribe = self.subscribe(enqueue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def snapshot(self, execution_id: str) -> list[ProgressEvent]:
+        """Latest event of every team that published progress for an execution."""
+        with self._condition:
+            return list(self._latest.get(execution_id, {}).values())
+
+    def version(self, execution_id: str) -> int:
+        """Number of events published for an execution so far."""
+        with self._condition:
+            return self._versions.get(execution_id, 0)
+
+    def wait_for_update(self, execution_id: str, since_version: int, timeout: float) -> int:
+        """Block until an event newer than ``since_version`` is published.
+
+        Args:
+            execution_id: Execution identifier
+            since_version: Version already seen by the caller
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Current version (equal to ``since_version`` on timeout)
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._versions.get(execution_id, 0) != since_version, timeout)
+            return self._versions.get(execution_id, 0)
+
+    def clear(self, execution_id: str) -> None:
+        """Forget the snapshot of an execution once it has finished.
+
+        Waiters of ``wait_for_update`` are woken up (the version goes back to 0).
+        """
+        with self._condition:
+            self._latest.pop(execution_id, None)
+            self._versions.pop(execution_id, None)
+            self._condition.notify_all()
+
+    @staticmethod
+    def _append(log_path: Path, event: ProgressEvent) -> None:
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+            # One write() per line in append mode, so concurrent readers never see a torn record
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            logger.debug(f"Failed to append progress event to {log_path}: {e}")
+
+
+class ProgressLogReader:
+    """Incremental reader of a progress event log written by another process."""
+
+    def __init__(self, log_path: Path) -> None:
+        """Initialize.
+
+        Args:
+            log_path: Event log path (see ``progress_log_path``)
+        """
+        self.log_path = log_path
+        self._offset = 0
+        self._latest: dict[str, ProgressEvent] = {}
+
+    def read_new(self) -> list[ProgressEvent]:
+        """Parse events appended since the previous call.
+
+        A trailing line without newline (being written) is left for the next call.
+        Invalid lines are skipped.
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []
+        self._offset += end + 1
+
+        events: list[ProgressEvent] = []
+        for line in chunk[: end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                event = ProgressEvent.from_dict(json.loads(line))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Invalid progress event in {self.log_path.name}: {e}")
+                continue
+            self._latest[event.team_id] = event
+            events.append(event)
+        return events
+
+    def snapshot(self) -> list[ProgressEvent]:
+        """Latest event of every team, after reading newly appended events."""
+        self.read_new()
+        return list(self._latest.values())
+
+
+_progress_bus = ProgressBus()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Get the process-wide progress bus."""
+    return _progress_bus
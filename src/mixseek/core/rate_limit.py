@@ -0,0 +1,285 @@
+"""Process-wide LLM rate limiting for MixSeek-Core.
+
+All LLM call paths (Leader Agent, Member Agents, Evaluator metrics and
+JudgmentClient) obtain their model through ``create_authenticated_model``.
+When a rate limit rule matches the model ID, the model is wrapped in
+``RateLimitedModel`` so that every request shares the same limiter state:
+
+- ``max_in_flight``: maximum number of concurrent requests
+- ``requests_per_minute``: token bucket for request count
+- ``tokens_per_minute``: token bucket charged with the actual usage reported
+  by each response (requests wait while the bucket is in debt)
+
+HTTP 429 responses put the whole limiter into a backoff window that grows
+exponentially with consecutive 429s, so that every caller pauses together
+instead of retrying independently.
+"""
+
+import asyncio
+import fnmatch
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, Field, model_validator
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitRule(BaseModel):
+    """Rate limit rule for models matching a model ID pattern.
+
+    Example (orchestrator.toml):
+        ```toml
+        [[orchestrator.rate_limits]]
+        model = "google-gla:*"
+        requests_per_minute = 60
+        tokens_per_minute = 200000
+        max_in_flight = 8
+        ```
+    """
+
+    model: str = Field(
+        description="Model ID pattern (fnmatch, e.g. 'openai:gpt-4o', 'google-gla:*', '*')",
+    )
+    requests_per_minute: int | None = Field(default=None, gt=0, description="Maximum requests per minute")
+    tokens_per_minute: int | None = Field(default=None, gt=0, description="Maximum total tokens per minute")
+    max_in_flight: int | None = Field(default=None, gt=0, description="Maximum concurrent requests")
+    max_retries_on_429: int = Field(default=3, ge=0, description="Retries after HTTP 429 (with backoff)")
+    backoff_initial_seconds: float = Field(default=1.0, gt=0, description="Initial backoff after HTTP 429")
+    backoff_max_seconds: float = Field(default=60.0, gt=0, description="Maximum backoff after HTTP 429")
+
+    @model_validator(mode="after")
+    def validate_backoff_range(self) -> "RateLimitRule":
+        """Validate backoff_initial_seconds <= backoff_max_seconds."""
+        if self.backoff_initial_seconds > self.backoff_max_seconds:
+            raise ValueError(
+                f"backoff_initial_seconds ({self.backoff_initial_seconds}) must be <= "
+                f"backoff_max_seconds ({self.backoff_max_seconds})"
+            )
+        return self
+
+    def matches(self, model_id: str) -> bool:
+        """Check whether this rule applies to the given model ID."""
+        return fnmatch.fnmatchcase(model_id, self.model)
+
+
+@dataclass
+class RateLimitStats:
+    """Counters describing time spent waiting on a rate limiter."""
+
+    requests: int = 0
+    throttled_requests: int = 0
+    rate_limited_responses: int = 0
+    tokens_used: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Average wait time per request (seconds)."""
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class _TokenBucket:
+    """Continuously refilling token bucket that may go into debt."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay_until(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        return 0.0 if missing <= 0 else missing / self.rate
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= amount
+
+
+class LLMRateLimiter:
+    """Limiter shared by every request to models matching one rule."""
+
+    def __init__(self, rule: RateLimitRule) -> None:
+        self.rule = rule
+        self.stats = RateLimitStats()
+        self._request_bucket = _TokenBucket(rule.requests_per_minute) if rule.requests_per_minute else None
+        self._token_bucket = _TokenBucket(rule.tokens_per_minute) if rule.tokens_per_minute else None
+        self._blocked_until = 0.0
+        self._consecutive_429 = 0
+        # asyncio primitives are bound to an event loop; keep one semaphore per loop
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore | None:
+        if self.rule.max_in_flight is None:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.rule.max_in_flight)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _next_delay(self, now: float) -> float:
+        delays = [self._blocked_until - now]
+        if self._request_bucket is not None:
+            delays.append(self._request_bucket.delay_until(1, now))
+        if self._token_bucket is not None:
+            # Token usage is only known after the response; wait while the bucket is in debt
+            delays.append(self._token_bucket.delay_until(0, now))
+        return max(delays)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait for permission to send one request and hold an in-flight slot."""
+        started_at = time.monotonic()
+        semaphore = self._semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            while (delay := self._next_delay(time.monotonic())) > 0:
+                await asyncio.sleep(delay)
+            now = time.monotonic()
+            if self._request_bucket is not None:
+                self._request_bucket.consume(1, now)
+
+            waited = now - started_at
+            self.stats.requests += 1
+            self.stats.total_wait_seconds += waited
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+            if waited > 0.001:
+                self.stats.throttled_requests += 1
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def record_usage(self, total_tokens: int) -> None:
+        """Charge the token bucket with the tokens used by a completed request."""
+        self._consecutive_429 = 0
+        self.stats.tokens_used += total_tokens
+        if self._token_bucket is not None and total_tokens > 0:
+            self._token_bucket.consume(total_tokens, time.monotonic())
+
+    def record_rate_limited(self) -> float:
+        """Enter an exponential backoff window after an HTTP 429 response.
+
+        Returns:
+            Backoff duration in seconds
+        """
+        self._consecutive_429 += 1
+        self.stats.rate_limited_responses += 1
+        backoff = min(
+            self.rule.backoff_initial_seconds * 2.0 ** (self._consecutive_429 - 1),
+            self.rule.backoff_max_seconds,
+        )
+        self._blocked_until = max(self._blocked_until, time.monotonic() + backoff)
+        return backoff
+
+
+class RateLimitedModel(WrapperModel):
+    """pydantic-ai model wrapper that routes every request through an LLMRateLimiter."""
+
+    def __init__(self, wrapped: Model, limiter: LLMRateLimiter) -> None:
+        super().__init__(wrapped)
+        self.limiter = limiter
+
+    async def request(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        attempt = 0
+        while True:
+            try:
+                async with self.limiter.acquire():
+                    response = await self.wrapped.request(*args, **kwargs)
+            except ModelHTTPError as e:
+                if e.status_code != 429:
+                    raise
+                backoff = self.limiter.record_rate_limited()
+                if attempt >= self.limiter.rule.max_retries_on_429:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"Rate limited by {self.wrapped.system} ({self.model_name}); "
+                    f"backing off {backoff:.1f}s (attempt {attempt}/{self.limiter.rule.max_retries_on_429})"
+                )
+                continue
+            self.limiter.record_usage(response.usage.total_tokens)
+            return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: Any | None = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        async with self.limiter.acquire():
+            try:
+                async with self.wrapped.request_stream(
+                    messages, model_settings, model_request_parameters, run_context
+                ) as response_stream:
+                    yield response_stream
+            except ModelHTTPError as e:
+                if e.status_code == 429:
+                    self.limiter.record_rate_limited()
+                raise
+        self.limiter.record_usage(response_stream.usage().total_tokens)
+
+
+_rate_limit_rules: list[RateLimitRule] = []
+_rate_limiters: dict[str, LLMRateLimiter] = {}
+
+
+def configure_rate_limits(rules: Sequence[RateLimitRule | dict[str, Any]]) -> None:
+    """Replace the process-wide rate limit rules.
+
+    Rules are evaluated in order and the first matching rule applies.
+    Limiter state is kept for rules whose pattern is unchanged.
+
+    Args:
+        rules: Rate limit rules (RateLimitRule or dict from TOML)
+    """
+    global _rate_limit_rules
+    parsed = [rule if isinstance(rule, RateLimitRule) else RateLimitRule.model_validate(rule) for rule in rules]
+    _rate_limit_rules = parsed
+
+    patterns = {rule.model for rule in parsed}
+    for pattern in list(_rate_limiters):
+        if pattern not in patterns:
+            del _rate_limiters[pattern]
+    for rule in parsed:
+        limiter = _rate_limiters.get(rule.model)
+        if limiter is None or limiter.rule != rule:
+            _rate_limiters[rule.model] = LLMRateLimiter(rule)
+
+
+def get_rate_limiter(model_id: str) -> LLMRateLimiter | None:
+    """Get the limiter for a model ID (None if no rule matches)."""
+    for rule in _rate_limit_rules:
+        if rule.matches(model_id):
+            return _rate_limiters[rule.model]
+    return None
+
+
+def get_rate_limit_stats() -> dict[str, RateLimitStats]:
+    """Get wait-time metrics for every configured limiter, keyed by rule pattern."""
+    return {pattern: limiter.stats for pattern, limiter in _rate_limiters.items()}
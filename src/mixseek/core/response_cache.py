@@ -0,0 +1,312 @@
+"""Content-addressed LLM response cache for MixSeek-Core.
+
+Evaluator metrics (``evaluate_with_llm``) and ``JudgmentClient`` send the
+same structured-output requests again when an orchestration or
+``mixseek evaluate`` is re-run on identical submissions, and when a team is
+retried or recovered. With the cache enabled, the validated output of such a
+request is stored in a SQLite file in the workspace, keyed by a hash of
+everything that determines the response (call site, model, instruction,
+user prompt, model settings including seed, output schema). The
+``current_datetime`` the prompt templates render into the user prompt is
+masked in the key, so a replay at a later time still hits.
+
+- Opt-in (``[orchestrator.response_cache] enabled = true`` or
+  ``mixseek evaluate --response-cache``)
+- Only deterministic requests (temperature 0 or a fixed seed) are cached
+  unless ``cache_nondeterministic`` is set
+- Entries expire after ``ttl_seconds`` and the least recently used entries
+  are evicted beyond ``max_entries``
+
+SQLite is used rather than DuckDB because several processes (CLI runs, the
+Streamlit UI) may share the cache file concurrently.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILENAME = "llm_response_cache.db"
+
+# Timezone-aware ISO 8601 timestamps (``current_datetime`` of the prompt templates)
+_DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2}|Z)")
+_DATETIME_PLACEHOLDER = "<datetime>"
+
+
+class ResponseCacheSettings(BaseModel):
+    """LLM response cache settings.
+
+    Example (orchestrator.toml):
+        ```toml
+        [orchestrator.response_cache]
+        enabled = true
+        ttl_seconds = 604800
+        max_entries = 10000
+        ```
+    """
+
+    enabled: bool = Field(default=False, description="Enable the on-disk LLM response cache")
+    path: str | None = Field(
+        default=None,
+        description=f"Cache file path (relative to workspace or absolute, default: cache/{DEFAULT_CACHE_FILENAME})",
+    )
+    ttl_seconds: float | None = Field(
+        default=7 * 24 * 3600, gt=0, description="Entry lifetime in seconds (None: never expires)"
+    )
+    max_entries: int = Field(default=10000, gt=0, description="Maximum number of entries (LRU eviction)")
+    cache_nondeterministic: bool = Field(
+        default=False, description="Also cache requests with temperature > 0 and no seed"
+    )
+
+
+@dataclass
+class ResponseCacheStats:
+    """Response cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+
+def is_deterministic(temperature: float | None, seed: int | None) -> bool:
+    """Whether a request is expected to return the same response every time."""
+    return temperature == 0 or seed is not None
+
+
+class ResponseCache:
+    """SQLite-backed content-addressed cache of LLM responses (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float | None = None,
+        max_entries: int = 10000,
+        cache_nondeterministic: bool = False,
+    ) -> None:
+        """Initialize the cache and create the table if needed.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            ttl_seconds: Entry lifetime in seconds (None: never expires)
+            max_entries: Maximum number of entries before LRU eviction
+            cache_nondeterministic: Also cache non-deterministic requests
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.cache_nondeterministic = cache_nondeterministic
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_lru ON llm_response_cache (last_accessed_at)"
+        )
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash request parts into a cache key.
+
+        Parts are serialized as canonical JSON (sorted keys); Pydantic model
+        classes contribute their JSON schema, so a changed output type never
+        hits entries of the old one. Timezone-aware ISO 8601 timestamps are
+        replaced by a placeholder: the rendered ``current_datetime`` changes
+        on every call and would otherwise make every key unique.
+        """
+
+        def default(value: Any) -> Any:
+            if isinstance(value, type) and issubclass(value, BaseModel):
+                return value.model_json_schema()
+            return repr(value)
+
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=default)
+        payload = _DATETIME_PATTERN.sub(_DATETIME_PLACEHOLDER, payload)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def should_cache(self, temperature: float | None, seed: int | None) -> bool:
+        """Whether a request with these sampling settings may be served from the cache."""
+        return self.cache_nondeterministic or is_deterministic(temperature, seed)
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response.
+
+        Database errors are logged and treated as a miss, so a broken cache
+        never fails the LLM call.
+
+        Returns:
+            Serialized response, or None on miss or expiry
+        """
+        try:
+            return self._get(key, time.time())
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            self.stats.misses += 1
+            return None
+
+    async def aget(self, key: str) -> str | None:
+        """Get a cached response without blocking the event loop.
+
+        SQLite may wait up to 5 seconds for a lock held by another process
+        sharing the cache file, so the query runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    def _get(self, key: str, now: float) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE key = ?", [key]
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", [key])
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_response_cache SET last_accessed_at = ? WHERE key = ?", [now, key])
+            self.stats.hits += 1
+            return str(response)
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a response and evict the least recently used entries beyond max_entries.
+
+        Database errors are logged and ignored.
+
+        Args:
+            key: Cache key (see ``make_key``)
+            model: Model identifier (for inspection only)
+            response: Serialized response
+        """
+        try:
+            self._put(key, model, response, time.time())
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+    async def aput(self, key: str, model: str, response: str) -> None:
+        """Store a response without blocking the event loop (see ``aget``)."""
+        await asyncio.to_thread(self.put, key, model, response)
+
+    def _put(self, key: str, model: str, response: str, now: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_response_cache (key, model, response, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    response = excluded.response,
+                    created_at = excluded.created_at,
+                    last_accessed_at = excluded.last_accessed_at
+                """,
+                [key, model, response, now, now],
+            )
+            self.stats.writes += 1
+
+            cursor = self._conn.execute(
+                """
+                DELETE FROM llm_response_cache WHERE key IN (
+                    SELECT key FROM llm_response_cache
+                    ORDER BY last_accessed_at
+                    LIMIT max(0, (SELECT COUNT(*) FROM llm_response_cache) - ?)
+                )
+                """,
+                [self.max_entries],
+            )
+            self.stats.evictions += max(0, cursor.rowcount)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def configure_response_cache(
+    settings: ResponseCacheSettings | dict[str, Any] | None,
+    workspace: Path,
+) -> ResponseCache | None:
+    """Enable, reconfigure or disable the process-wide response cache.
+
+    Args:
+        settings: Cache settings (ResponseCacheSettings, dict from TOML, or None to disable)
+        workspace: Workspace path (base for relative cache paths)
+
+    Returns:
+        Active cache, or None when disabled
+    """
+    global _response_cache
+    if settings is None:
+        parsed = ResponseCacheSettings()
+    elif isinstance(settings, ResponseCacheSettings):
+        parsed = settings
+    else:
+        parsed = ResponseCacheSettings.model_validate(settings)
+
+    path: Path | None = None
+    if parsed.enabled:
+        path = Path(parsed.path) if parsed.path else Path("cache") / DEFAULT_CACHE_FILENAME
+        if not path.is_absolute():
+            path = workspace / path
+
+    with _response_cache_lock:
+        current = _response_cache
+        if current is not None and path is not None and current.path == path:
+            current.ttl_seconds = parsed.ttl_seconds
+            current.max_entries = parsed.max_entries
+            current.cache_nondeterministic = parsed.cache_nondeterministic
+            return current
+
+        if current is not None:
+            current.close()
+            _response_cache = None
+        if path is not None:
+            _response_cache = ResponseCache(
+                path,
+                ttl_seconds=parsed.ttl_seconds,
+                max_entries=parsed.max_entries,
+                cache_nondeterministic=parsed.cache_nondeterministic,
+            )
+        return _response_cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get the process-wide response cache (None when disabled)."""
+    return _response_cache
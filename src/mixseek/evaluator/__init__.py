@@ -5,12 +5,16 @@
 
 公開API:
     - Evaluator: メイン評価器クラス
+    - EvaluationOutcome / EvaluationBatchResult: 一括評価（evaluate_many）の結果
+    - EvaluationUsage: 評価LLM呼び出しのトークン使用量
     - EvaluationRequest: 評価用の入力モデル
     - EvaluationResult: スコアを含む出力モデル
     - EvaluationConfig: 設定モデル
 """
 
+from mixseek.evaluator.batch import EvaluationBatchResult, EvaluationOutcome
 from mixseek.evaluator.evaluator import Evaluator
+from mixseek.evaluator.usage import EvaluationUsage
 from mixseek.models.evaluation_config import EvaluationConfig
 from mixseek.models.evaluation_request import EvaluationRequest
 from mixseek.models.evaluation_result import EvaluationResult
@@ -20,4 +24,7 @@ __all__ = [
     "EvaluationRequest",
     "EvaluationResult",
     "EvaluationConfig",
+    "EvaluationOutcome",
+    "EvaluationBatchResult",
+    "EvaluationUsage",
 ]
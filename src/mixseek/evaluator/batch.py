@@ -0,0 +1,72 @@
+"""Evaluator.evaluate_many の結果モデル。"""
+
+from dataclasses import dataclass, field
+
+from mixseek.evaluator.usage import EvaluationUsage
+from mixseek.models.evaluation_request import EvaluationRequest
+from mixseek.models.evaluation_result import EvaluationResult
+
+
+@dataclass
+class EvaluationOutcome:
+    """1ペア（クエリ, Submission）の評価結果。
+
+    Attributes:
+        index: 入力リスト内の位置
+        request: 評価リクエスト
+        result: 評価結果（失敗時はNone）
+        error: 評価中に発生した例外（成功時はNone）
+        usage: このペアの評価LLM呼び出しのトークン使用量
+    """
+
+    index: int
+    request: EvaluationRequest
+    result: EvaluationResult | None = None
+    error: Exception | None = None
+    usage: EvaluationUsage = field(default_factory=EvaluationUsage)
+
+    @property
+    def succeeded(self) -> bool:
+        """評価が成功したか"""
+        return self.result is not None
+
+
+@dataclass
+class EvaluationBatchResult:
+    """Evaluator.evaluate_many の集計結果。
+
+    Attributes:
+        outcomes: 各ペアの評価結果（入力順）
+        usage: バッチ全体のトークン使用量
+        elapsed_seconds: バッチ全体の所要時間（秒）
+    """
+
+    outcomes: list[EvaluationOutcome] = field(default_factory=list)
+    usage: EvaluationUsage = field(default_factory=EvaluationUsage)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """成功したペア数"""
+        return sum(1 for outcome in self.outcomes if outcome.succeeded)
+
+    @property
+    def failed(self) -> int:
+        """失敗したペア数"""
+        return len(self.outcomes) - self.succeeded
+
+    @property
+    def pairs_per_minute(self) -> float:
+        """スループット（ペア/分）"""
+        return _per_minute(len(self.outcomes), self.elapsed_seconds)
+
+    @property
+    def tokens_per_minute(self) -> float:
+        """スループット（トークン/分）"""
+        return _per_minute(self.usage.total_tokens, self.elapsed_seconds)
+
+
+def _per_minute(count: int, elapsed_seconds: float) -> float:
+    if elapsed_seconds <= 0:
+        return 0.0
+    return count * 60.0 / elapsed_seconds
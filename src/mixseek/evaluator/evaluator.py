@@ -1,8 +1,11 @@
 """AIエージェント出力評価のためのメインEvaluatorクラス。"""
 
+import asyncio
 import importlib
 import logging
 import re
+import time
+from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -10,12 +13,15 @@ if TYPE_CHECKING:
     from mixseek.config.schema import PromptBuilderSettings
 
 from mixseek.config.schema import EvaluatorSettings
-from mixseek.evaluator.exceptions import EvaluatorAPIError
+from mixseek.core.agent_pool import AgentPool, use_agent_pool
+from mixseek.evaluator.batch import EvaluationBatchResult, EvaluationOutcome
+from mixseek.evaluator.exceptions import EvaluatorAPIError, MetricEvaluationError
 from mixseek.evaluator.metrics.base import BaseMetric, LLMJudgeMetric
 from mixseek.evaluator.metrics.clarity_coherence import ClarityCoherence
 from mixseek.evaluator.metrics.coverage import Coverage
 from mixseek.evaluator.metrics.llm_plain import LLMPlain
 from mixseek.evaluator.metrics.relevance import Relevance
+from mixseek.evaluator.usage import track_evaluation_usage
 from mixseek.models.evaluation_config import EvaluationConfig, evaluator_settings_to_evaluation_config
 from mixseek.models.evaluation_request import EvaluationRequest
 from mixseek.models.evaluation_result import EvaluationResult, MetricScore
@@ -34,8 +40,10 @@ class Evaluator:
         - {workspace}/configs/evaluator.tomlから設定を読み込み
         - 設定されたメトリクスを使用してSubmissionを評価
         - 重み付き総合スコアを計算
+        - 複数Submissionの一括評価（evaluate_many）
         - カスタムメトリクスの登録をサポート
         - リトライロジックによるLLM APIエラーの処理
+        - LLM評価用Agentの再利用（AgentPool）
 
     Example:
         ```python
@@ -115,13 +123,16 @@ class Evaluator:
         # メトリクスディレクトリのパスを保存（動的ロード用）
         self._metrics_dir = Path(__file__).parent / "metrics"
 
+        # LLM評価用Agentのプール（同一パラメータのAgentをメトリクス・呼び出し間で再利用）
+        self.agent_pool = AgentPool()
+
     async def evaluate(self, request: EvaluationRequest) -> EvaluationResult:
         """設定されたメトリクスを使用してSubmissionを評価します。
 
         このメソッドは以下を実行します:
         1. 入力を検証(空でないクエリとSubmission)
         2. 使用する設定を決定(カスタムまたはデフォルト)
-        3. 各メトリクスを順次評価
+        3. 各メトリクスを並列評価（max_concurrent_metricsで同時実行数を制限）
         4. 重み付き総合スコアを計算
         5. EvaluationResultを返却
 
@@ -129,11 +140,12 @@ class Evaluator:
             request: クエリ、Submission、およびオプションの設定を含むEvaluationRequest
 
         Returns:
-            個別のメトリクススコアと総合スコアを含むEvaluationResult
+            個別のメトリクススコア（設定順）と総合スコアを含むEvaluationResult
 
         Raises:
             ValueError: 入力が無効な場合(空のクエリ/Submission)
-            EvaluatorAPIError: すべてのリトライ後にLLM API呼び出しが失敗した場合
+            EvaluatorAPIError: すべてのリトライ後にLLM API呼び出しが失敗した場合（fail_fastモード）
+            MetricEvaluationError: 1つ以上のメトリクスが失敗した場合（collect_allモード）
             FileNotFoundError: 設定ファイルが見つからない場合
 
         Example:
@@ -158,66 +170,99 @@ class Evaluator:
         """
         # 入力検証 - Pydanticバリデータで既に処理済み
         # 必要に応じて追加チェックをここに追加可能
+        return await self._evaluate(request)
+
+    async def evaluate_many(
+        self,
+        requests: Sequence[EvaluationRequest],
+        max_concurrent_requests: int = 4,
+        max_concurrent_metrics: int | None = None,
+        on_outcome: Callable[[EvaluationOutcome], Awaitable[None]] | None = None,
+    ) -> EvaluationBatchResult:
+        """複数のSubmissionをまとめて評価します。
 
+        最大 max_concurrent_requests 個のワーカーが入力順にペアを取り出して評価します。
+        メトリクス評価（LLM呼び出し）の同時実行数は、各ペアの max_concurrent_metrics に加えて
+        バッチ全体で max_concurrent_metrics に制限されます。メトリクス・Agentインスタンス
+        （AgentPool）は全ペアで共有されます。
+
+        1ペアの評価失敗はバッチを中断せず、EvaluationOutcome.error に記録されます。
+
+        Args:
+            requests: 評価リクエストのリスト
+            max_concurrent_requests: 同時に評価するペアの最大数
+            max_concurrent_metrics: バッチ全体で同時に評価するメトリクスの最大数
+                （Noneの場合は max_concurrent_requests × 設定のmax_concurrent_metrics）
+            on_outcome: 1ペアの評価完了ごとに（完了順で）呼び出されるコールバック（結果の逐次書き込み用）
+
+        Returns:
+            各ペアの結果（入力順）、トークン使用量、所要時間を含むEvaluationBatchResult
+
+        Raises:
+            ValueError: 同時実行数が1未満の場合
+        """
+        if max_concurrent_metrics is None:
+            max_concurrent_metrics = max_concurrent_requests * self.config.max_concurrent_metrics
+        if max_concurrent_requests < 1 or max_concurrent_metrics < 1:
+            raise ValueError("max_concurrent_requests and max_concurrent_metrics must be at least 1")
+
+        metric_semaphore = asyncio.Semaphore(max_concurrent_metrics)
+        batch = EvaluationBatchResult(
+            outcomes=[EvaluationOutcome(index=i, request=request) for i, request in enumerate(requests)]
+        )
+        pending = iter(batch.outcomes)
+
+        async def worker() -> None:
+            # 単一イベントループ上のため、イテレータの共有に排他制御は不要
+            for outcome in pending:
+                with track_evaluation_usage(outcome.usage):
+                    try:
+                        outcome.result = await self._evaluate(outcome.request, metric_semaphore)
+                    except Exception as e:
+                        logger.warning(f"Evaluation {outcome.index} failed: {e}")
+                        outcome.error = e
+                if on_outcome is not None:
+                    await on_outcome(outcome)
+
+        start = time.perf_counter()
+        with track_evaluation_usage(batch.usage):
+            await asyncio.gather(*(worker() for _ in range(min(max_concurrent_requests, len(batch.outcomes)))))
+        batch.elapsed_seconds = time.perf_counter() - start
+        return batch
+
+    async def _evaluate(
+        self,
+        request: EvaluationRequest,
+        shared_semaphore: asyncio.Semaphore | None = None,
+    ) -> EvaluationResult:
+        """Submissionを評価します（evaluate/evaluate_manyの共通処理）。
+
+        Args:
+            request: 評価リクエスト
+            shared_semaphore: 複数ペアで共有するメトリクス同時実行数の制限（evaluate_many用）
+
+        Returns:
+            EvaluationResult
+        """
         # 使用する設定を決定
         config = request.config if request.config else self.config
 
-        # 各メトリクスを順次評価
-        metric_scores = []
-        for metric_config in config.metrics:
-            metric_name = metric_config.name
-
-            # 適切なメトリクス実装を取得
-            metric = self._get_metric(metric_name)
+        # メトリクス実装を事前に解決（設定エラーはLLM呼び出し前に検出）
+        metrics = [(metric_config.name, self._get_metric(metric_config.name)) for metric_config in config.metrics]
 
-            try:
-                # メトリクスの型に応じて適切なパラメータで評価を実行
-                if isinstance(metric, LLMJudgeMetric):
-                    # このメトリクス用のLLMパラメータを取得（フォールバックロジック）
-                    model = config.get_model_for_metric(metric_name)
-                    temperature = config.get_temperature_for_metric(metric_name)
-                    max_tokens = config.get_max_tokens_for_metric(metric_name)
-                    max_retries = config.get_max_retries_for_metric(metric_name)
-                    system_instruction = config.get_system_instruction_for_metric(metric_name)
-                    timeout_seconds = config.get_timeout_seconds_for_metric(metric_name)
-                    stop_sequences = config.get_stop_sequences_for_metric(metric_name)
-                    top_p = config.get_top_p_for_metric(metric_name)
-                    seed = config.get_seed_for_metric(metric_name)
-                    # LLM-as-a-Judgeメトリクスの場合はLLMパラメータを渡す
-                    score = await metric.evaluate(
-                        user_query=request.user_query,
-                        submission=request.submission,
-                        model=model,
-                        temperature=temperature,
-                        max_tokens=max_tokens,
-                        max_retries=max_retries,
-                        system_instruction=system_instruction,
-                        timeout_seconds=timeout_seconds,
-                        stop_sequences=stop_sequences,
-                        top_p=top_p,
-                        seed=seed,
-                        prompt_builder_settings=self.prompt_builder_settings,
-                        execution_id=request.execution_id,
-                        team_id=request.team_id,
-                        round_number=request.round_number,
-                    )
-                else:
-                    # LLM以外のメトリクス（統計ベース等）の場合
-                    # BaseMetric.evaluate()は非同期なのでawaitで呼び出す
-                    score = await metric.evaluate(
-                        user_query=request.user_query,
-                        submission=request.submission,
-                        execution_id=request.execution_id,
-                        team_id=request.team_id,
-                        round_number=request.round_number,
-                    )
+        # 各メトリクスを並列評価（同時実行数はmax_concurrent_metricsで制限）
+        semaphore = asyncio.Semaphore(config.max_concurrent_metrics)
 
-                metric_scores.append(score)
+        async def evaluate_with_limit(metric_name: str, metric: BaseMetric) -> MetricScore:
+            async with semaphore:
+                if shared_semaphore is None:
+                    return await self._evaluate_metric(metric_name, metric, request, config)
+                async with shared_semaphore:
+                    return await self._evaluate_metric(metric_name, metric, request, config)
 
-            except EvaluatorAPIError as e:
-                # エラーにメトリクスコンテキストを追加
-                e.metric_name = metric_name
-                raise
+        with use_agent_pool(self.agent_pool):
+            tasks = [asyncio.create_task(evaluate_with_limit(name, metric)) for name, metric in metrics]
+            metric_scores = await self._gather_metric_scores(tasks, metrics, config)
 
         # 重み付き総合スコアを計算
         overall_score = self._calculate_overall_score(metric_scores, config)
@@ -225,6 +270,109 @@ class Evaluator:
         # 結果を返却
         return EvaluationResult(metrics=metric_scores, overall_score=overall_score)
 
+    async def _evaluate_metric(
+        self,
+        metric_name: str,
+        metric: BaseMetric,
+        request: EvaluationRequest,
+        config: EvaluationConfig,
+    ) -> MetricScore:
+        """単一メトリクスを評価します。
+
+        Args:
+            metric_name: メトリクス名
+            metric: メトリクス実装
+            request: 評価リクエスト
+            config: 使用する評価設定
+
+        Returns:
+            メトリクスのスコア
+
+        Raises:
+            EvaluatorAPIError: すべてのリトライ後にLLM API呼び出しが失敗した場合
+        """
+        try:
+            # メトリクスの型に応じて適切なパラメータで評価を実行
+            if isinstance(metric, LLMJudgeMetric):
+                # LLM-as-a-Judgeメトリクスの場合はLLMパラメータを渡す（フォールバックロジック）
+                return await metric.evaluate(
+                    user_query=request.user_query,
+                    submission=request.submission,
+                    model=config.get_model_for_metric(metric_name),
+                    temperature=config.get_temperature_for_metric(metric_name),
+                    max_tokens=config.get_max_tokens_for_metric(metric_name),
+                    max_retries=config.get_max_retries_for_metric(metric_name),
+                    system_instruction=config.get_system_instruction_for_metric(metric_name),
+                    timeout_seconds=config.get_timeout_seconds_for_metric(metric_name),
+                    stop_sequences=config.get_stop_sequences_for_metric(metric_name),
+                    top_p=config.get_top_p_for_metric(metric_name),
+                    seed=config.get_seed_for_metric(metric_name),
+                    prompt_builder_settings=self.prompt_builder_settings,
+                    execution_id=request.execution_id,
+                    team_id=request.team_id,
+                    round_number=request.round_number,
+                )
+
+            # LLM以外のメトリクス（統計ベース等）の場合
+            # BaseMetric.evaluate()は非同期なのでawaitで呼び出す
+            return await metric.evaluate(
+                user_query=request.user_query,
+                submission=request.submission,
+                execution_id=request.execution_id,
+                team_id=request.team_id,
+                round_number=request.round_number,
+            )
+
+        except EvaluatorAPIError as e:
+            # エラーにメトリクスコンテキストを追加
+            e.metric_name = metric_name
+            raise
+
+    async def _gather_metric_scores(
+        self,
+        tasks: list["asyncio.Task[MetricScore]"],
+        metrics: list[tuple[str, BaseMetric]],
+        config: EvaluationConfig,
+    ) -> list[MetricScore]:
+        """メトリクス評価タスクの結果を設定順に収集します。
+
+        Args:
+            tasks: メトリクス評価タスク（設定順）
+            metrics: (メトリクス名, メトリクス実装) のリスト（設定順）
+            config: 使用する評価設定（metric_error_modeを参照）
+
+        Returns:
+            MetricScoreのリスト（設定順）
+
+        Raises:
+            EvaluatorAPIError: fail_fastモードで最初に失敗したメトリクスのエラー
+            MetricEvaluationError: collect_allモードで1つ以上のメトリクスが失敗した場合
+        """
+        if config.metric_error_mode == "fail_fast":
+            try:
+                return list(await asyncio.gather(*tasks))
+            except BaseException:
+                # 最初の失敗で残りのメトリクス評価をキャンセル
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        errors: dict[str, Exception] = {}
+        metric_scores: list[MetricScore] = []
+        for (metric_name, _), outcome in zip(metrics, outcomes, strict=True):
+            if isinstance(outcome, MetricScore):
+                metric_scores.append(outcome)
+            elif isinstance(outcome, Exception):
+                errors[metric_name] = outcome
+            else:
+                raise outcome
+
+        if errors:
+            raise MetricEvaluationError(errors)
+        return metric_scores
+
     def register_custom_metric(self, name: str, metric: BaseMetric) -> None:
         """カスタム評価メトリクスを登録します。
 
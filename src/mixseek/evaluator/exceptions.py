@@ -105,3 +105,36 @@ class EvaluatorAPIError(Exception):
         if self.retry_count is not None:
             parts.append(f"Retries: {self.retry_count}")
         return " | ".join(parts)
+
+
+class MetricEvaluationError(EvaluatorAPIError):
+    """複数メトリクスの評価失敗をまとめた例外。
+
+    metric_error_mode = "collect_all" の場合、すべてのメトリクスを評価した後、
+    1つ以上のメトリクスが失敗していればこの例外が発生します。
+
+    Attributes:
+        errors: メトリクス名から発生した例外へのマッピング（設定順）
+
+    Example:
+        ```python
+        try:
+            result = await evaluator.evaluate(request)
+        except MetricEvaluationError as e:
+            for metric_name, error in e.errors.items():
+                print(f"{metric_name}: {error}")
+        ```
+    """
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        """MetricEvaluationErrorを初期化します。
+
+        Args:
+            errors: メトリクス名から発生した例外へのマッピング
+        """
+        self.errors = errors
+        details = "; ".join(f"{name}: {error}" for name, error in errors.items())
+        super().__init__(
+            f"{len(errors)} metric(s) failed to evaluate: {details}",
+            metric_name=", ".join(errors),
+        )
@@ -6,8 +6,11 @@ from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 
+from mixseek.core.agent_pool import agent_cache_key, get_agent_pool
 from mixseek.core.auth import create_authenticated_model
+from mixseek.core.response_cache import get_response_cache
 from mixseek.evaluator.exceptions import EvaluatorAPIError
+from mixseek.evaluator.usage import record_evaluation_usage
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,10 @@ async def evaluate_with_llm(
     この関数はPydantic AI Agentを使用して、
     構造化された出力、自動リトライ、包括的なエラー処理を持つ
     シンプルな評価インターフェースを提供します。
+    AgentPoolが有効な場合（Evaluator.evaluate実行中）、同一パラメータのAgentは再利用されます。
+    LLM応答キャッシュが有効な場合、決定的なリクエスト（temperature=0またはseed指定）の
+    結果はキャッシュから返されます。
+    Agent実行のトークン使用量は track_evaluation_usage で有効なトラッカーに加算されます。
 
     Args:
         instruction: 評価者の役割と指示を定義するシステムプロンプト
@@ -90,17 +97,6 @@ async def evaluate_with_llm(
             "(e.g., 'anthropic:claude-sonnet-4-5-20250929')"
         )
 
-    # 認証済みモデル作成（DRY準拠）
-    try:
-        authenticated_model = create_authenticated_model(model)
-    except Exception as e:
-        raise EvaluatorAPIError(
-            f"Failed to create authenticated model: {str(e)}",
-            provider=provider,
-            metric_name=None,
-            retry_count=0,
-        ) from e
-
     # ModelSettings作成
     model_settings = ModelSettings(temperature=temperature)
     if max_tokens is not None:
@@ -114,18 +110,53 @@ async def evaluate_with_llm(
     if seed is not None:
         model_settings["seed"] = seed
 
-    # Agent作成（構造化出力とリトライ設定）
-    agent = Agent(
-        authenticated_model,
-        output_type=response_model,  # 構造化出力を自動的に実現
-        instructions=instruction,  # システムプロンプト
-        model_settings=model_settings,  # temperature, max_tokens
-        retries=max_retries,  # 自動リトライ
-    )
+    def build_agent() -> Agent[None, BaseModel]:
+        # 認証済みモデル作成（DRY準拠）
+        try:
+            authenticated_model = create_authenticated_model(model)
+        except Exception as e:
+            raise EvaluatorAPIError(
+                f"Failed to create authenticated model: {str(e)}",
+                provider=provider,
+                metric_name=None,
+                retry_count=0,
+            ) from e
+
+        # Agent作成（構造化出力とリトライ設定）
+        return Agent(
+            authenticated_model,
+            output_type=response_model,  # 構造化出力を自動的に実現
+            instructions=instruction,  # システムプロンプト
+            model_settings=model_settings,  # temperature, max_tokens
+            retries=max_retries,  # 自動リトライ
+        )
+
+    # Agentプールが有効な場合は同一パラメータのAgentを再利用
+    pool = get_agent_pool()
+    if pool is not None:
+        key = agent_cache_key("evaluator", model, model_settings, instruction, response_model, max_retries)
+        agent = pool.get_or_create(key, build_agent)
+    else:
+        agent = build_agent()
+
+    # LLM応答キャッシュ（有効かつ決定的なリクエストのみ）
+    cache = get_response_cache()
+    cache_key: str | None = None
+    if cache is not None and cache.should_cache(temperature, seed):
+        cache_key = cache.make_key("evaluator", model, instruction, user_prompt, dict(model_settings), response_model)
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            try:
+                return response_model.model_validate_json(cached)
+            except ValueError as e:
+                logger.warning(f"Discarding invalid cached evaluator response: {e}")
 
     # 実行（非同期）
     try:
         result = await agent.run(user_prompt)
+        record_evaluation_usage(result.usage())
+        if cache is not None and cache_key is not None:
+            await cache.aput(cache_key, model, result.output.model_dump_json())
         return result.output
 
     except Exception as e:
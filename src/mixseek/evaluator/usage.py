@@ -0,0 +1,70 @@
+"""評価LLM呼び出しのトークン使用量集計。
+
+evaluate_with_llm は実行中のコンテキストで有効な全てのUsageTrackerに
+Agent実行のトークン使用量を加算します。Evaluator.evaluate_many は
+バッチ全体と各ペアのトラッカーをネストして有効化し、ペアごとの使用量と
+スループット（トークン/分）を算出します。
+
+LLM応答キャッシュから返された評価は使用量0として扱われます。
+有効なトラッカーは ``ContextVar`` で管理されるため、
+``asyncio.gather``/``asyncio.create_task`` で作成したタスクにも伝播します。
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class EvaluationUsage:
+    """評価LLM呼び出しのトークン使用量"""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    requests: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """入力・出力トークンの合計"""
+        return self.input_tokens + self.output_tokens
+
+    def add(self, usage: Any) -> None:
+        """pydantic-aiのRunUsage（または同じ属性を持つオブジェクト）を加算します。"""
+        self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+        self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+        self.requests += getattr(usage, "requests", 0) or 0
+
+    def to_dict(self) -> dict[str, int]:
+        """JSON出力用の辞書"""
+        return asdict(self)
+
+
+_active_trackers: ContextVar[tuple[EvaluationUsage, ...]] = ContextVar("mixseek_evaluation_usage_trackers", default=())
+
+
+@contextmanager
+def track_evaluation_usage(usage: EvaluationUsage | None = None) -> Iterator[EvaluationUsage]:
+    """``with`` ブロック内の評価LLM呼び出しのトークン使用量を集計します。
+
+    ネストした場合は外側のトラッカーにも加算されます。
+
+    Args:
+        usage: 加算先（Noneの場合は新規作成）
+
+    Yields:
+        集計中のEvaluationUsage
+    """
+    tracker = usage if usage is not None else EvaluationUsage()
+    token = _active_trackers.set((*_active_trackers.get(), tracker))
+    try:
+        yield tracker
+    finally:
+        _active_trackers.reset(token)
+
+
+def record_evaluation_usage(usage: Any) -> None:
+    """有効な全てのトラッカーにトークン使用量を加算します（トラッカーがなければ何もしない）。"""
+    for tracker in _active_trackers.get():
+        tracker.add(usage)
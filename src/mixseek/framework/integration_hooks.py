@@ -7,9 +7,11 @@ Member Agents with the broader MixSeek-Core framework and Leader Agent system.
 import asyncio
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -69,6 +71,10 @@ class IntegrationHook(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release resources held by the hook (called on manager shutdown)."""
+        pass
+
 
 class LoggingIntegrationHook(IntegrationHook):
     """Integration hook that logs all events."""
@@ -174,43 +180,94 @@ class MetricsIntegrationHook(IntegrationHook):
         self._execution_times.clear()
 
 
+class WebhookPayloadFormat(Enum):
+    """Request body format of webhook POSTs."""
+
+    EVENT = "event"  # One event object per POST (original format)
+    BATCH = "batch"  # {"events": [...]} with up to batch_size events per POST
+
+
 class WebhookIntegrationHook(IntegrationHook):
-    """Integration hook that sends events to external webhooks."""
+    """Integration hook that sends events to external webhooks.
+
+    Events are POSTed over a long-lived ``aiohttp.ClientSession``. With the
+    default ``WebhookPayloadFormat.EVENT`` each POST carries one event object,
+    as before. ``WebhookPayloadFormat.BATCH`` changes the body to
+    ``{"events": [...]}``; receivers must accept that format. A batch is sent
+    when ``batch_size`` events are buffered or ``flush_interval_seconds`` after
+    the first buffered event.
+
+    Failed POSTs are retried with exponential backoff and their events are then
+    kept in the bounded buffer for the next flush; when the buffer is full the
+    oldest events are dropped.
+    """
 
-    def __init__(self, webhook_url: str, event_types: list[IntegrationEventType] | None = None):
+    def __init__(
+        self,
+        webhook_url: str,
+        event_types: list[IntegrationEventType] | None = None,
+        batch_size: int = 50,
+        flush_interval_seconds: float = 1.0,
+        max_buffer_size: int = 1000,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        timeout_seconds: float = 5.0,
+        payload_format: WebhookPayloadFormat = WebhookPayloadFormat.EVENT,
+    ):
         """Initialize webhook integration.
 
         Args:
             webhook_url: URL to send webhook events to
             event_types: List of event types to send (None = all events)
+            batch_size: Maximum number of events per POST (BATCH format only)
+            flush_interval_seconds: Maximum time an event waits in the buffer before a POST
+            max_buffer_size: Maximum number of buffered (unsent or failed) events
+            max_retries: Retries per batch before it is put back into the buffer
+            retry_backoff_seconds: Initial retry delay (doubled on each retry)
+            timeout_seconds: Total timeout per POST
+            payload_format: Request body format (EVENT: one event object, BATCH: {"events": [...]})
         """
         self.webhook_url = webhook_url
         self.event_types = set(event_types) if event_types else None
+        self.payload_format = payload_format
+        self.batch_size = batch_size if payload_format is WebhookPayloadFormat.BATCH else 1
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffer_size = max_buffer_size
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self.delivered = 0
+        self.dropped = 0
+        self.failed_posts = 0
+
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._session: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def handle_event(self, event: IntegrationEvent) -> None:
-        """Send event to webhook."""
-        try:
-            import aiohttp
-
-            payload = {
-                "event_type": event.event_type.value,
-                "timestamp": event.timestamp.isoformat(),
-                "agent_name": event.agent_name,
-                "agent_type": event.agent_type,
-                "metadata": event.metadata,
-                "payload": event.payload,
-                "error": event.error,
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url, json=payload, timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status >= 400:
-                        logger.warning(f"Webhook returned {response.status} for event {event.event_type.value}")
+        """Buffer the event and send a batch when it is full."""
+        self._bind_loop()
+        self._buffer_events(
+            [
+                {
+                    "event_type": event.event_type.value,
+                    "timestamp": event.timestamp.isoformat(),
+                    "agent_name": event.agent_name,
+                    "agent_type": event.agent_type,
+                    "metadata": event.metadata,
+                    "payload": event.payload,
+                    "error": event.error,
+                }
+            ]
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to send webhook for event {event.event_type.value}: {e}")
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
 
     def is_interested_in(self, event_type: IntegrationEventType) -> bool:
         """Check if this event type should be sent to webhook."""
@@ -218,6 +275,133 @@ class WebhookIntegrationHook(IntegrationHook):
             return True
         return event_type in self.event_types
 
+    async def flush(self) -> None:
+        """Send buffered events in batches until the buffer is empty or a batch fails."""
+        self._bind_loop()
+        assert self._flush_lock is not None
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    delivered = await self._post_with_retry(batch)
+                except asyncio.CancelledError:
+                    self._buffer.extendleft(reversed(batch))
+                    raise
+                if not delivered:
+                    # Keep failed events for the next flush (oldest are dropped if the buffer is full)
+                    self._buffer.extendleft(reversed(batch))
+                    self._trim_buffer()
+                    return
+                self.delivered += len(batch)
+
+    async def close(self) -> None:
+        """Flush remaining events and close the HTTP session."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+
+        if self._buffer:
+            await self.flush()
+            # Events that still could not be delivered are discarded
+            self.dropped += len(self._buffer)
+            self._buffer.clear()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get delivery counters snapshot."""
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed_posts": self.failed_posts,
+            "pending": len(self._buffer),
+        }
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state (session, lock, timer) if the event loop has changed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        old_loop, old_session = self._loop, self._session
+        if old_loop is not None:
+            logger.debug("Event loop changed, recreating webhook session")
+            if self._buffer:
+                logger.warning(
+                    f"Event loop changed, carrying over {len(self._buffer)} buffered webhook event(s) to the new loop"
+                )
+        self._session = None
+        self._flush_task = None
+        self._flush_lock = asyncio.Lock()
+        self._loop = loop
+        if old_session is not None:
+            self._close_stale_session(old_session, old_loop)
+
+    @staticmethod
+    def _close_stale_session(session: Any, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close a session created on a previous event loop (it cannot be awaited on the current one)."""
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # The old loop is still alive in another thread: close the session there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The old loop has stopped: release the connections synchronously
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            try:
+                connector._close()
+            except RuntimeError as e:
+                # Transports of an already closed loop cannot schedule their shutdown
+                logger.debug(f"Failed to close stale webhook connector: {e}")
+
+    def _buffer_events(self, events: list[dict[str, Any]]) -> None:
+        self._buffer.extend(events)
+        self._trim_buffer()
+
+    def _trim_buffer(self) -> None:
+        overflow = len(self._buffer) - self.max_buffer_size
+        if overflow > 0:
+            for _ in range(overflow):
+                self._buffer.popleft()
+            self.dropped += overflow
+            logger.warning(f"Webhook buffer full, dropped {overflow} oldest event(s)")
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.flush_interval_seconds)
+        await self.flush()
+
+    async def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout_seconds))
+        return self._session
+
+    async def _post_with_retry(self, batch: list[dict[str, Any]]) -> bool:
+        """POST one batch, retrying with exponential backoff.
+
+        Returns:
+            True if the batch was accepted by the webhook
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                session = await self._get_session()
+                body = {"events": batch} if self.payload_format is WebhookPayloadFormat.BATCH else batch[0]
+                async with session.post(self.webhook_url, json=body) as response:
+                    if response.status < 400:
+                        return True
+                    logger.warning(f"Webhook returned {response.status} for batch of {len(batch)} event(s)")
+            except Exception as e:
+                logger.error(f"Failed to send webhook batch of {len(batch)} event(s): {e}")
+
+            self.failed_posts += 1
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff_seconds * (2**attempt))
+        return False
+
 
 class CustomIntegrationHook(IntegrationHook):
     """Integration hook with custom handler functions."""
@@ -257,59 +441,144 @@ class CustomIntegrationHook(IntegrationHook):
         return event_type in self.event_types
 
 
+class OverflowPolicy(Enum):
+    """What to do when a hook's event queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+@dataclass
+class HookQueueStats:
+    """Queue metrics for a single hook worker."""
+
+    hook_name: str
+    max_queue_size: int
+    queue_size: int = 0
+    enqueued: int = 0
+    processed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+
+
+class _HookWorker:
+    """Bounded event queue and worker task for one hook."""
+
+    def __init__(self, hook: IntegrationHook, max_queue_size: int):
+        self.hook = hook
+        self.queue: asyncio.Queue[tuple[IntegrationEvent, float]] = asyncio.Queue(maxsize=max_queue_size)
+        self.stats = HookQueueStats(hook_name=type(hook).__name__, max_queue_size=max_queue_size)
+        self.task: asyncio.Task[None] = asyncio.create_task(self._run())
+
+    async def put(self, event: IntegrationEvent, policy: OverflowPolicy) -> None:
+        item = (event, time.monotonic())
+        if policy is OverflowPolicy.BLOCK:
+            await self.queue.put(item)
+        else:
+            if self.queue.full():
+                if policy is OverflowPolicy.DROP_NEWEST:
+                    self._record_drop()
+                    return
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._record_drop()
+            self.queue.put_nowait(item)
+        self.stats.enqueued += 1
+
+    def _record_drop(self) -> None:
+        self.stats.dropped += 1
+        if self.stats.dropped == 1 or self.stats.dropped % 100 == 0:
+            logger.warning(
+                f"Integration queue for {self.stats.hook_name} is full, {self.stats.dropped} event(s) dropped so far"
+            )
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                event, enqueued_at = await self.queue.get()
+                lag = time.monotonic() - enqueued_at
+                self.stats.last_lag_seconds = lag
+                self.stats.max_lag_seconds = max(self.stats.max_lag_seconds, lag)
+                try:
+                    await self.hook.handle_event(event)
+                    self.stats.processed += 1
+                except Exception as e:
+                    self.stats.failed += 1
+                    logger.error(f"Error in integration hook {self.stats.hook_name}: {e}")
+                finally:
+                    self.queue.task_done()
+        except asyncio.CancelledError:
+            logger.debug(f"Integration worker for {self.stats.hook_name} cancelled")
+
+    async def stop(self) -> None:
+        if not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+
 class IntegrationManager:
-    """Manager for integration hooks and events."""
+    """Manager for integration hooks and events.
 
-    def __init__(self) -> None:
-        """Initialize integration manager."""
+    Each hook gets its own bounded queue and worker task, so a slow hook only
+    delays its own events. When a queue is full, ``overflow_policy`` decides
+    whether ``emit_event`` waits (BLOCK) or an event is dropped (DROP_OLDEST /
+    DROP_NEWEST); the dropping policies never make the emitter wait.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """Initialize integration manager.
+
+        Args:
+            max_queue_size: Maximum number of pending events per hook
+            overflow_policy: Behavior when a hook's queue is full
+        """
         self.hooks: list[IntegrationHook] = []
-        self.event_queue: asyncio.Queue[IntegrationEvent] | None = None
-        self.is_processing = False
-        self._processor_task: asyncio.Task[None] | None = None
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self._workers: dict[int, _HookWorker] = {}
         self._current_loop: asyncio.AbstractEventLoop | None = None
 
-    def _ensure_queue(self) -> asyncio.Queue[IntegrationEvent]:
-        """Ensure queue exists in current event loop.
+    @property
+    def is_processing(self) -> bool:
+        """Whether any hook worker is running."""
+        return any(not worker.task.done() for worker in self._workers.values())
 
-        Returns:
-            asyncio.Queue: Event queue bound to current event loop
+    def _ensure_loop(self) -> None:
+        """Discard workers bound to a previous event loop.
 
         Note:
-            If the event loop has changed, the old queue and processor task are discarded
-            and a new queue is created for the current event loop.
+            Queues and tasks belong to the loop they were created in. If the event
+            loop has changed, the old workers (and their pending events) are discarded
+            and new ones are created lazily for the current event loop.
         """
-        try:
-            current_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No running event loop - should not happen in async context
-            logger.warning("No running event loop in _ensure_queue()")
-            if self.event_queue is None:
-                self.event_queue = asyncio.Queue()
-            return self.event_queue
-
-        # Check if event loop has changed
+        current_loop = asyncio.get_running_loop()
         if self._current_loop is not None and self._current_loop is not current_loop:
             logger.debug(
                 f"Event loop changed (old={id(self._current_loop)}, new={id(current_loop)}), "
-                "creating new queue and canceling old processor"
+                "discarding old integration workers"
             )
-            # Cancel old processor task if running
-            if self._processor_task and not self._processor_task.done():
-                self._processor_task.cancel()
-            # Reset state for new event loop
-            self.event_queue = None
-            self._processor_task = None
-            self.is_processing = False
-
-        # Update current loop reference
+            for worker in self._workers.values():
+                if not worker.task.done():
+                    worker.task.cancel()
+            self._workers = {}
         self._current_loop = current_loop
 
-        # Create queue if needed
-        if self.event_queue is None:
-            self.event_queue = asyncio.Queue()
-            logger.debug(f"Created new queue for event loop {id(current_loop)}")
-
-        return self.event_queue
+    def _get_worker(self, hook: IntegrationHook) -> _HookWorker:
+        worker = self._workers.get(id(hook))
+        if worker is None or worker.task.done():
+            worker = _HookWorker(hook, self.max_queue_size)
+            self._workers[id(hook)] = worker
+        return worker
 
     def register_hook(self, hook: IntegrationHook) -> None:
         """Register an integration hook.
@@ -323,11 +592,16 @@ class IntegrationManager:
     def unregister_hook(self, hook: IntegrationHook) -> None:
         """Unregister an integration hook.
 
+        Pending events for the hook are discarded.
+
         Args:
             hook: The integration hook to unregister
         """
         if hook in self.hooks:
             self.hooks.remove(hook)
+            worker = self._workers.pop(id(hook), None)
+            if worker is not None and not worker.task.done():
+                worker.task.cancel()
             logger.debug(f"Unregistered integration hook: {type(hook).__name__}")
 
     async def emit_event(self, event: IntegrationEvent) -> None:
@@ -336,57 +610,63 @@ class IntegrationManager:
         Args:
             event: The integration event to emit
         """
-        queue = self._ensure_queue()
-        await queue.put(event)
+        self._ensure_loop()
+        for hook in self.hooks:
+            if hook.is_interested_in(event.event_type):
+                await self._get_worker(hook).put(event, self.overflow_policy)
 
-        # Start processor if not already running
-        if not self.is_processing:
-            self._processor_task = asyncio.create_task(self._process_events())
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued events have been handled.
 
-    async def _process_events(self) -> None:
-        """Process events from the queue."""
-        self.is_processing = True
-        queue = self._ensure_queue()
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
 
+        Returns:
+            True if all queues were drained, False on timeout
+        """
+        workers = list(self._workers.values())
+        if not workers:
+            return True
         try:
-            while True:
-                try:
-                    # Wait for event with timeout
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
-
-                    # Send event to interested hooks
-                    tasks = []
-                    for hook in self.hooks:
-                        if hook.is_interested_in(event.event_type):
-                            tasks.append(hook.handle_event(event))
-
-                    if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.wait_for(asyncio.gather(*(w.queue.join() for w in workers)), timeout=timeout)
+        except TimeoutError:
+            pending = sum(w.queue.qsize() for w in workers)
+            logger.warning(f"Integration flush timed out with {pending} event(s) pending")
+            return False
+        return True
 
-                    # Mark task as done
-                    queue.task_done()
+    async def stop_processing(self) -> None:
+        """Stop all hook workers without waiting for pending events."""
+        workers = list(self._workers.values())
+        self._workers = {}
+        for worker in workers:
+            await worker.stop()
 
-                except TimeoutError:
-                    # No events to process, continue
-                    continue
-                except Exception as e:
-                    logger.error(f"Error processing integration event: {e}")
+    async def shutdown(self, timeout: float | None = None) -> bool:
+        """Drain queues, stop workers and close hooks.
 
-        except asyncio.CancelledError:
-            logger.debug("Integration event processor cancelled")
-        finally:
-            self.is_processing = False
+        Args:
+            timeout: Maximum seconds to wait for queued events (None = no limit)
 
-    async def stop_processing(self) -> None:
-        """Stop event processing."""
-        if self._processor_task and not self._processor_task.done():
-            self._processor_task.cancel()
+        Returns:
+            True if all queued events were handled before stopping
+        """
+        drained = await self.flush(timeout)
+        await self.stop_processing()
+        for hook in self.hooks:
             try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
-
-        self.is_processing = False
+                await hook.close()
+            except Exception as e:
+                logger.error(f"Error closing integration hook {type(hook).__name__}: {e}")
+        return drained
+
+    def get_queue_stats(self) -> list[HookQueueStats]:
+        """Get a snapshot of per-hook queue metrics."""
+        snapshots = []
+        for worker in self._workers.values():
+            snapshot = replace(worker.stats, queue_size=worker.queue.qsize())
+            snapshots.append(snapshot)
+        return snapshots
 
     def get_registered_hooks(self) -> list[str]:
         """Get list of registered hook class names."""
@@ -547,16 +827,35 @@ def setup_metrics_collection() -> MetricsIntegrationHook:
     return metrics_hook
 
 
-def setup_webhook_integration(webhook_url: str, event_types: list[IntegrationEventType] | None = None) -> None:
+def setup_webhook_integration(
+    webhook_url: str,
+    event_types: list[IntegrationEventType] | None = None,
+    batch_size: int = 50,
+    flush_interval_seconds: float = 1.0,
+    payload_format: WebhookPayloadFormat = WebhookPayloadFormat.EVENT,
+) -> WebhookIntegrationHook:
     """Set up webhook integration.
 
     Args:
         webhook_url: URL to send events to
         event_types: Event types to send (None = all)
+        batch_size: Maximum number of events per POST (BATCH format only)
+        flush_interval_seconds: Maximum time an event waits before being sent
+        payload_format: Request body format (BATCH sends {"events": [...]})
+
+    Returns:
+        The webhook hook (for delivery counters and close())
     """
     manager = get_integration_manager()
-    webhook_hook = WebhookIntegrationHook(webhook_url, event_types)
+    webhook_hook = WebhookIntegrationHook(
+        webhook_url,
+        event_types,
+        batch_size=batch_size,
+        flush_interval_seconds=flush_interval_seconds,
+        payload_format=payload_format,
+    )
     manager.register_hook(webhook_hook)
+    return webhook_hook
 
 
 def setup_custom_integration(
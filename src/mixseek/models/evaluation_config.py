@@ -1,7 +1,7 @@
 """評価設定モデル。"""
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -362,9 +362,14 @@ class EvaluationConfig(BaseModel):
         metric_weights: メトリクス名を重みにマッピングする辞書（メトリクスリストから派生）
         enabled_metrics: 有効なメトリクス名のリスト（メトリクスリストから派生）
         custom_metrics: カスタムメトリクス設定のオプションの辞書
+        max_concurrent_metrics: 同時に評価するメトリクスの最大数
+        metric_error_mode: メトリクス失敗時の動作（"fail_fast" または "collect_all"）
 
     Example TOML:
         ```toml
+        max_concurrent_metrics = 4
+        metric_error_mode = "fail_fast"
+
         [llm_default]
         model = "anthropic:claude-sonnet-4-5-20250929"
         temperature = 0.0
@@ -428,6 +433,18 @@ class EvaluationConfig(BaseModel):
         description="カスタムメトリクス設定のオプションの辞書",
     )
 
+    max_concurrent_metrics: int = Field(
+        default=4,
+        ge=1,
+        description="同時に評価するメトリクスの最大数（1で順次評価）",
+    )
+
+    metric_error_mode: Literal["fail_fast", "collect_all"] = Field(
+        default="fail_fast",
+        description="メトリクス失敗時の動作（fail_fast: 最初の失敗で残りをキャンセル、"
+        "collect_all: 全メトリクスを評価してから失敗をまとめて報告）",
+    )
+
     @model_validator(mode="after")
     def apply_equal_weights_if_needed(self) -> "EvaluationConfig":
         """重みが指定されていない場合、メトリクスに均等な重みを適用します。
@@ -820,6 +837,8 @@ def evaluator_settings_to_evaluation_config(
         llm_default=llm_default,
         metrics=metric_configs,
         custom_metrics=evaluator_settings.custom_metrics if evaluator_settings.custom_metrics else None,
+        max_concurrent_metrics=evaluator_settings.max_concurrent_metrics,
+        metric_error_mode=evaluator_settings.metric_error_mode,
     )
 
     return evaluation_config
@@ -2,13 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from pydantic import BaseModel, Field, field_validator
 
-if TYPE_CHECKING:
-    from mixseek.models.evaluation_config import EvaluationConfig
-
 
 class EvaluationRequest(BaseModel):
     """AIエージェントのSubmissionを評価するためのリクエスト。
@@ -161,3 +156,9 @@ class EvaluationRequest(BaseModel):
             ]
         }
     }
+
+
+# EvaluationConfigはモデル定義後にインポートし、前方参照（config）を解決する
+from mixseek.models.evaluation_config import EvaluationConfig  # noqa: E402
+
+EvaluationRequest.model_rebuild()
@@ -2,7 +2,8 @@
 
 text/json で ConsoleOptions の使用/不使用を切り替える。
 - text: ConsoleOptions + TeeWriter(stderr + mixseek.log) でスパンツリー表示
-- json: ConsoleOptions無効 + JsonSpanProcessor で構造化JSON出力
+- json: ConsoleOptions無効 + BatchJsonSpanProcessor で構造化JSON出力
+  （サンプリング・属性サイズ上限付きでバックグラウンドスレッドから出力）
 """
 
 from __future__ import annotations
@@ -11,12 +12,17 @@ import atexit
 import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import IO, TYPE_CHECKING, Any, Literal, TextIO
 
 from mixseek.config.logfire import LogfireConfig, LogfirePrivacyMode
 from mixseek.config.logging import LogFormatType
+from mixseek.observability.logging_setup import PipelineQueueHandler
 from mixseek.observability.tee_writer import TeeWriter
 
 if TYPE_CHECKING:
@@ -35,19 +41,28 @@ class JsonSpanProcessor:
     LogfireLoggingHandler には SkipTracesFilter で再送防止済み。
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_attribute_length: int | None = None) -> None:
+        """初期化
+
+        Args:
+            max_attribute_length: 文字列属性値の最大長（超過分は切り詰め、JSON復元しない）。None は無制限
+        """
         self._traces_logger = logging.getLogger("mixseek.traces")
+        self._max_attribute_length = max_attribute_length
 
     @staticmethod
-    def _parse_json_values(attrs: dict[str, Any]) -> dict[str, Any]:
+    def _parse_json_values(attrs: dict[str, Any], max_length: int | None = None) -> dict[str, Any]:
         """JSON文字列の属性値をPythonオブジェクトに復元し、二重シリアライズを防止する。
 
         pydantic-ai/logfire はスパン属性に複雑なデータをJSON文字列として格納する。
         そのまま JsonFormatter に渡すと二重エスケープが発生するため、事前にデシリアライズする。
+        max_length を超える文字列は切り詰めて文字列のまま出力する（巨大なメッセージ履歴の復元を避ける）。
         """
         result: dict[str, Any] = {}
         for k, v in attrs.items():
-            if isinstance(v, str) and len(v) >= 2 and v[0] in ("{", "["):
+            if isinstance(v, str) and max_length is not None and len(v) > max_length:
+                result[k] = f"{v[:max_length]}...[truncated {len(v) - max_length} chars]"
+            elif isinstance(v, str) and len(v) >= 2 and v[0] in ("{", "["):
                 try:
                     result[k] = json.loads(v)
                 except (json.JSONDecodeError, ValueError):
@@ -58,21 +73,33 @@ class JsonSpanProcessor:
 
     def on_start(self, span: ReadableSpan, parent_context: Context | None = None) -> None:
         """スパン開始時に構造化 JSON レコードを出力"""
+        self._log_start(span, dict(span.attributes) if span.attributes else {})
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """スパン完了時に構造化 JSON レコードを出力"""
+        self._log_end(span)
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def _log_start(self, span: ReadableSpan, attributes: dict[str, Any]) -> None:
         record_data: dict[str, Any] = {
             "type": "span_start",
             "trace_id": format(span.context.trace_id, "032x"),
             "span_name": span.name,
             "span_id": format(span.context.span_id, "016x"),
             "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
-            "attributes": self._parse_json_values(dict(span.attributes)) if span.attributes else {},
+            "attributes": self._parse_json_values(attributes, self._max_attribute_length) if attributes else {},
         }
         self._traces_logger.info(
             f"{span.name} started",
             extra=record_data,
         )
 
-    def on_end(self, span: ReadableSpan) -> None:
-        """スパン完了時に構造化 JSON レコードを出力"""
+    def _log_end(self, span: ReadableSpan) -> None:
         duration_ms = None
         if span.end_time and span.start_time:
             duration_ms = (span.end_time - span.start_time) / 1_000_000
@@ -98,19 +125,158 @@ class JsonSpanProcessor:
             "duration_ms": duration_ms,
             "status": span.status.status_code.name if span.status else None,
             "events": events,
-            "attributes": self._parse_json_values(dict(span.attributes)) if span.attributes else {},
+            "attributes": (
+                self._parse_json_values(dict(span.attributes), self._max_attribute_length) if span.attributes else {}
+            ),
         }
         self._traces_logger.info(
             f"{span.name} completed",
             extra=record_data,
         )
 
-    def shutdown(self) -> None:
-        pass
+
+# BatchJsonSpanProcessor のデフォルト値
+SPAN_QUEUE_MAX_SIZE = 2048
+SPAN_EXPORT_BATCH_SIZE = 512
+SPAN_SCHEDULE_DELAY_SECONDS = 1.0
+
+# trace_id 下位64ビットによるヘッドサンプリング（OpenTelemetry TraceIdRatioBased と同じ方式）
+_TRACE_ID_LOWER_BITS = (1 << 64) - 1
+
+
+class BatchJsonSpanProcessor(JsonSpanProcessor):
+    """JsonSpanProcessor のバッチ版。
+
+    on_start/on_end ではサンプリング判定とキュー投入のみを行い、属性の JSON 復元と
+    ログ出力はバックグラウンドスレッドでまとめて行う。
+
+    - ヘッドサンプリング: trace_id 単位で sample_rate の割合のトレースを出力
+    - テールサンプリング: サンプリング対象外でもエラー/遅いスパンは span_end を出力
+    - 有界キュー: 満杯時はスパンを破棄し、破棄件数を WARNING で報告
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float | None = None,
+        max_attribute_length: int | None = None,
+        max_queue_size: int = SPAN_QUEUE_MAX_SIZE,
+        max_export_batch_size: int = SPAN_EXPORT_BATCH_SIZE,
+        schedule_delay_seconds: float = SPAN_SCHEDULE_DELAY_SECONDS,
+    ) -> None:
+        """初期化（エクスポートスレッドを開始）
+
+        Args:
+            sample_rate: ヘッドサンプリング率（0.0〜1.0）
+            slow_threshold_ms: この時間以上のスパンはサンプリング対象外でも出力（None で無効）
+            max_attribute_length: 文字列属性値の最大長
+            max_queue_size: キューに保持する最大スパン数
+            max_export_batch_size: 1回に出力する最大スパン数
+            schedule_delay_seconds: キューが溜まらない場合の出力間隔（秒）
+        """
+        super().__init__(max_attribute_length=max_attribute_length)
+        self._sample_bound = round(sample_rate * (1 << 64))
+        self._slow_threshold_ns = None if slow_threshold_ms is None else int(slow_threshold_ms * 1_000_000)
+        self._max_export_batch_size = max_export_batch_size
+        self._schedule_delay_seconds = schedule_delay_seconds
+        self._queue: queue.Queue[tuple[str, Any, dict[str, Any]] | None] = queue.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name="mixseek-span-export", daemon=True)
+        self._thread.start()
+
+    def on_start(self, span: ReadableSpan, parent_context: Context | None = None) -> None:
+        """サンプリング対象のスパンの開始をキューに投入"""
+        if self._shutdown or not self._is_sampled(span.context.trace_id):
+            return
+        # 開始時点の属性を固定する（スパンは終了まで更新され続けるため）
+        snapshot = SimpleNamespace(name=span.name, context=span.context, parent=span.parent)
+        self._enqueue(("start", snapshot, dict(span.attributes) if span.attributes else {}))
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """サンプリング対象、またはエラー/遅いスパンの完了をキューに投入"""
+        if self._shutdown:
+            return
+        if self._is_sampled(span.context.trace_id) or self._is_interesting(span):
+            self._enqueue(("end", span, {}))
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """キュー内のスパンが全て出力されるまで待つ"""
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
         return True
 
+    def shutdown(self) -> None:
+        """残りのスパンを出力してエクスポートスレッドを停止"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._queue.put(None)
+        self._thread.join(timeout=self._schedule_delay_seconds + 5.0)
+
+    def _is_sampled(self, trace_id: int) -> bool:
+        return (trace_id & _TRACE_ID_LOWER_BITS) < self._sample_bound
+
+    def _is_interesting(self, span: ReadableSpan) -> bool:
+        if span.status is not None and span.status.status_code.name == "ERROR":
+            return True
+        if self._slow_threshold_ns is not None and span.end_time is not None and span.start_time is not None:
+            return span.end_time - span.start_time >= self._slow_threshold_ns
+        return False
+
+    def _enqueue(self, item: tuple[str, Any, dict[str, Any]]) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self._schedule_delay_seconds)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < self._max_export_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is not None:
+                    self._export(item)
+            self._report_dropped()
+            for _ in batch:
+                self._queue.task_done()
+
+            if any(item is None for item in batch):
+                return
+
+    def _export(self, item: tuple[str, Any, dict[str, Any]]) -> None:
+        kind, span, attributes = item
+        try:
+            if kind == "start":
+                self._log_start(span, attributes)
+            else:
+                self._log_end(span)
+        except Exception as e:
+            # 1件のスパン変換失敗でエクスポートスレッドを停止させない
+            logger.debug(f"Failed to export span {getattr(span, 'name', '?')}: {e}")
+
+    def _report_dropped(self) -> None:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            logger.warning(f"Span queue full: dropped {dropped} span record(s)")
+
 
 def setup_logfire(
     config: LogfireConfig,
@@ -121,7 +287,7 @@ def setup_logfire(
     """Logfire初期化。log_format に応じて出力方式を切り替える。
 
     - text: ConsoleOptions + TeeWriter(stderr + mixseek.log) でスパンツリー表示
-    - json: ConsoleOptions無効 + JsonSpanProcessor で構造化JSON出力
+    - json: ConsoleOptions無効 + BatchJsonSpanProcessor で構造化JSON出力
 
     Args:
         config: Logfire設定
@@ -171,9 +337,15 @@ def setup_logfire(
                     console = ConsoleOptions(output=TeeWriter(writers))  # type: ignore[arg-type]
             # writers が空の場合は console=False のまま
         elif log_format == "json":
-            # Mode 4: ConsoleOptions無効 + JsonSpanProcessor
+            # Mode 4: ConsoleOptions無効 + BatchJsonSpanProcessor
             console = False
-            additional_processors.append(JsonSpanProcessor())
+            additional_processors.append(
+                BatchJsonSpanProcessor(
+                    sample_rate=config.span_sample_rate,
+                    slow_threshold_ms=config.span_slow_threshold_ms,
+                    max_attribute_length=config.span_max_attribute_length,
+                )
+            )
 
         logfire.configure(
             send_to_logfire=config.send_to_logfire,
@@ -228,12 +400,20 @@ def finalize_mode3_handlers() -> None:
     # ConsoleOptions 移行後も残したい LogfireLoggingHandler 等の StreamHandler サブクラスを
     # 誤って除去しないため、サブクラスを含む isinstance ではなく型完全一致で判定する。
     # 将来カスタム StreamHandler サブクラスを追加する場合、残すかどうかをここで判断すること。
+    # PipelineQueueHandler はコンソール/ファイル出力のみを保持するため、丸ごと除去する。
     handlers_to_remove = [
-        h for h in mixseek_logger.handlers if (type(h) is logging.StreamHandler or isinstance(h, logging.FileHandler))
+        h
+        for h in mixseek_logger.handlers
+        if (
+            type(h) is logging.StreamHandler
+            or isinstance(h, logging.FileHandler)
+            or isinstance(h, PipelineQueueHandler)
+        )
     ]
     for h in handlers_to_remove:
-        # FileHandler のみクローズ（StreamHandler(stderr) はクローズしない）
-        if isinstance(h, logging.FileHandler):
+        # FileHandler/PipelineQueueHandler のみクローズ（StreamHandler(stderr) はクローズしない）
+        # PipelineQueueHandler の close() はキュー内のレコードを出力してからライタースレッドを停止する
+        if isinstance(h, (logging.FileHandler, PipelineQueueHandler)):
             h.close()
         mixseek_logger.removeHandler(h)
 
@@ -2,14 +2,23 @@
 
 4モード（logfire有無 x text/json）に対応する setup_logging() を提供。
 root logger ではなく "mixseek" named logger を使用し、propagate=False で独立動作する。
+
+queue_enabled=True（デフォルト）の場合、コンソール/ファイル出力は QueueLogPipeline の
+専用ライタースレッドで行う。ロガーには QueueHandler のみを追加するため、イベントループ上の
+呼び出し元はフォーマット（JSON化）やディスク I/O で待たされない。
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from mixseek.config.logging import LoggingConfig
 
@@ -25,6 +34,9 @@ LOG_LEVEL_MAP: dict[str, int] = {
 # テキストフォーマット文字列
 TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# ライタースレッドが1回に取り出す最大レコード数（この単位でflushする）
+LOG_BATCH_SIZE = 256
+
 # LogRecord 標準属性セット（extra フィールド抽出時に除外する）
 _STANDARD_FIELDS: frozenset[str] = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()) | {
     "message",
@@ -84,10 +96,255 @@ class SkipTracesFilter(logging.Filter):
         return not record.name.startswith("mixseek.traces")
 
 
+class _DeferredFlushMixin:
+    """flush() をライタースレッドのバッチ単位に遅延させる出力ハンドラ用 Mixin。
+
+    StreamHandler.emit() はレコードごとに flush() を呼ぶため、ここでは何もしない。
+    QueueLogPipeline がバッチ書き込み後に flush_now() を呼ぶ。
+    """
+
+    def flush(self) -> None:
+        pass
+
+    def flush_now(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+
+class BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler[TextIO]):
+    """バッチ単位で flush する StreamHandler。"""
+
+
+class BatchedRotatingFileHandler(_DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    """バッチ単位で flush するサイズローテーション付き FileHandler。"""
+
+
+class QueueLogPipeline:
+    """専用ライタースレッドでコンソール/ファイル出力を行うログパイプライン。
+
+    - 有界キュー: enqueue は待たない。満杯時は INFO 以下を破棄し、WARNING 以上は
+      キュー内で最も古い INFO 以下のレコードを追い出して格納する（無ければ破棄）
+    - 破棄件数は集約し、キューに空きができた時点で1件の WARNING として出力
+    - ライタースレッドはキューからまとめて取り出し、バッチごとに flush
+    """
+
+    def __init__(self, handlers: list[logging.Handler], max_queue_size: int) -> None:
+        """初期化（ライタースレッドを開始）
+
+        Args:
+            handlers: 出力ハンドラ（ライタースレッドからのみ呼び出される）
+            max_queue_size: キューに保持する最大レコード数
+        """
+        self.handlers = list(handlers)
+        self._queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="mixseek-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        """未報告の破棄レコード数"""
+        with self._dropped_lock:
+            return self._dropped
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """レコードをキューに追加（呼び出し元スレッドをブロックしない）
+
+        Args:
+            record: QueueHandler.prepare() 済みのレコード
+        """
+        if self._stopped:
+            return
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.WARNING and self._replace_oldest_low_level(record):
+            return
+
+        with self._dropped_lock:
+            self._dropped += 1
+
+    def _replace_oldest_low_level(self, record: logging.LogRecord) -> bool:
+        """キュー内で最も古い INFO 以下のレコードを破棄して record を末尾に追加
+
+        Returns:
+            追い出せるレコードがあり、record を追加できた場合 True
+        """
+        # queue.Queue の内部 deque を mutex 下で直接操作する（件数・未完了タスク数は変わらない）
+        with self._queue.mutex:
+            pending = self._queue.queue
+            for index, item in enumerate(pending):
+                if item is not None and item.levelno < logging.WARNING:
+                    del pending[index]
+                    pending.append(record)
+                    break
+            else:
+                return False
+        with self._dropped_lock:
+            self._dropped += 1
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """キュー内のレコードが全て出力されるまで待つ
+
+        Args:
+            timeout: 最大待機時間（秒）。None の場合は無期限
+
+        Returns:
+            期限内に出力が完了した場合 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """残りのレコードを出力してライタースレッドを停止し、出力ハンドラを close
+
+        Args:
+            timeout: ライタースレッドの終了待機時間（秒）
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        for handler in self.handlers:
+            handler.close()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            batch = [record]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in batch:
+                if item is not None:
+                    self._emit(item)
+            self._report_dropped()
+            self._flush_handlers()
+            for _ in batch:
+                self._queue.task_done()
+
+            if any(item is None for item in batch):
+                return
+
+    def _emit(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _report_dropped(self) -> None:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            self._emit(
+                logging.LogRecord(
+                    name="mixseek.logging",
+                    level=logging.WARNING,
+                    pathname=__file__,
+                    lineno=0,
+                    msg=f"Log queue full: dropped {dropped} record(s)",
+                    args=(),
+                    exc_info=None,
+                )
+            )
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            try:
+                if isinstance(handler, _DeferredFlushMixin):
+                    handler.flush_now()
+                else:
+                    handler.flush()
+            except Exception:
+                # 出力先の一時的な障害（ディスクフル等）でライタースレッドを停止させない
+                pass
+
+
+class PipelineQueueHandler(logging.handlers.QueueHandler):
+    """ "mixseek" ロガーに追加する QueueHandler。
+
+    prepare() でメッセージを確定させたレコードを QueueLogPipeline に渡す。
+    close() でパイプラインも停止する（setup_logging 再呼び出し時の FD リーク防止）。
+    """
+
+    def __init__(self, pipeline: QueueLogPipeline) -> None:
+        super().__init__(queue.Queue())  # 未使用（enqueue をオーバーライド）
+        self.pipeline = pipeline
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.pipeline.enqueue(record)
+
+    def close(self) -> None:
+        self.pipeline.stop()
+        super().close()
+
+
+def get_output_handlers(logger: logging.Logger | None = None) -> list[logging.Handler]:
+    """実際に出力を行うハンドラ一覧を取得（キュー経由の場合はパイプラインのハンドラを展開）
+
+    Args:
+        logger: 対象ロガー（省略時は "mixseek"）
+
+    Returns:
+        出力ハンドラのリスト
+    """
+    target = logger or logging.getLogger("mixseek")
+    handlers: list[logging.Handler] = []
+    for h in target.handlers:
+        if isinstance(h, PipelineQueueHandler):
+            handlers.extend(h.pipeline.handlers)
+        else:
+            handlers.append(h)
+    return handlers
+
+
+def flush_logging(timeout: float | None = 5.0) -> bool:
+    """ "mixseek" ロガーのキュー内レコードを全て出力するまで待つ
+
+    Args:
+        timeout: 最大待機時間（秒）
+
+    Returns:
+        期限内に出力が完了した場合 True（キュー未使用時も True）
+    """
+    for h in logging.getLogger("mixseek").handlers:
+        if isinstance(h, PipelineQueueHandler) and not h.pipeline.flush(timeout):
+            return False
+    return True
+
+
+def _stop_pipelines_at_exit() -> None:
+    for h in list(logging.getLogger("mixseek").handlers):
+        if isinstance(h, PipelineQueueHandler):
+            h.pipeline.stop()
+
+
+atexit.register(_stop_pipelines_at_exit)
+
+
 def setup_logging(config: LoggingConfig, workspace: Path | None = None) -> logging.Logger:
     """統一ロガー "mixseek" を初期化。4モードに対応。
 
     全モードで初期段階は StreamHandler/FileHandler を追加する。
+    config.queue_enabled の場合、これらは QueueLogPipeline のライタースレッドが保持し、
+    ロガーには PipelineQueueHandler のみが追加される（get_output_handlers() で参照可能）。
     Mode 3 (logfire+text) では setup_logfire() 内の finalize_mode3_handlers() で
     StreamHandler/FileHandler を除去し、ConsoleOptions/TeeWriter に移行する。
 
@@ -120,23 +377,44 @@ def setup_logging(config: LoggingConfig, workspace: Path | None = None) -> loggi
     # Mode 3 (logfire+text) では setup_logfire() 完了後に除去されるが、
     # setup_logfire() 完了前のログ欠損を防ぐため、初期段階では全モードで追加する。
 
+    output_handlers: list[logging.Handler] = []
+
     # コンソール出力
     if config.console_enabled:
-        handler = logging.StreamHandler(sys.stderr)
+        handler: logging.Handler = (
+            BatchedStreamHandler(sys.stderr) if config.queue_enabled else logging.StreamHandler(sys.stderr)
+        )
         handler.setLevel(level)
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        output_handlers.append(handler)
 
-    # ファイル出力
+    # ファイル出力（サイズローテーション）
     if config.file_enabled and workspace:
         log_dir = workspace / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_dir / "mixseek.log", mode="a", encoding="utf-8")
+        file_handler_cls = BatchedRotatingFileHandler if config.queue_enabled else logging.handlers.RotatingFileHandler
+        file_handler = file_handler_cls(
+            log_dir / "mixseek.log",
+            mode="a",
+            maxBytes=config.file_max_bytes,
+            backupCount=config.file_backup_count,
+            encoding="utf-8",
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+
+    # キュー有効時はライタースレッド経由、無効時はロガーに直接追加
+    if config.queue_enabled and output_handlers:
+        queue_handler = PipelineQueueHandler(QueueLogPipeline(output_handlers, config.queue_max_size))
+        queue_handler.setLevel(level)
+        logger.addHandler(queue_handler)
+    else:
+        for h in output_handlers:
+            logger.addHandler(h)
 
     # Logfire handler（標準ログを Logfire cloud に転送）
+    # トレースコンテキストを呼び出し元スレッドで取得する必要があるため、キューを経由しない
     if config.logfire_enabled:
         try:
             import logfire
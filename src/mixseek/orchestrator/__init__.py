@@ -7,10 +7,12 @@ from mixseek.orchestrator.models import (
     TeamStatus,
 )
 from mixseek.orchestrator.orchestrator import Orchestrator, load_orchestrator_settings
+from mixseek.orchestrator.scheduler import TeamScheduler
 
 __all__ = [
     "Orchestrator",
     "OrchestratorTask",
+    "TeamScheduler",
     "TeamStatus",
     "RoundResult",
     "ExecutionSummary",
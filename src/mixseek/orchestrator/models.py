@@ -60,6 +60,13 @@ class TeamStatus(BaseModel):
         description="実行ステータス",
     )
     current_round: int = Field(default=0, ge=0, description="現在のラウンド番号")
+    queued_at: datetime | None = Field(default=None, description="実行待機キューへの投入日時")
+    queue_depth: int | None = Field(
+        default=None,
+        ge=0,
+        description="実行待機中に自チームより前に並んでいるチーム数（実行枠獲得後はNone）",
+    )
+    queue_wait_seconds: float | None = Field(default=None, ge=0, description="実行枠獲得までの待機時間（秒）")
     started_at: datetime | None = Field(default=None, description="実行開始日時")
     completed_at: datetime | None = Field(default=None, description="実行完了日時")
     error_message: str | None = Field(default=None, description="エラーメッセージ")
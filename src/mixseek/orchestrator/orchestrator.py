@@ -11,6 +11,9 @@ from typing import TYPE_CHECKING, Any
 
 from mixseek.agents.leader.config import load_team_config
 from mixseek.config import ConfigurationManager, OrchestratorSettings
+from mixseek.core.auth import configure_http_clients, configure_rate_limits, get_rate_limit_stats
+from mixseek.core.progress import get_progress_bus
+from mixseek.core.response_cache import configure_response_cache, get_response_cache
 
 # Logfireインポート（オプショナル）
 try:
@@ -28,6 +31,7 @@ from mixseek.orchestrator.models import (
     PartialTeamFailureError,
     TeamStatus,
 )
+from mixseek.orchestrator.scheduler import TeamScheduler
 
 if TYPE_CHECKING:
     from mixseek.round_controller import OnRoundCompleteCallback, RoundController
@@ -100,6 +104,19 @@ class Orchestrator:
         self.workspace = self.settings.workspace_path
         self.max_retries = self.settings.max_retries_per_team
         self.team_statuses: dict[str, TeamStatus] = {}
+        self.scheduler = TeamScheduler(
+            self.settings.max_concurrent_teams,
+            on_queue_change=self._update_queue_depths,
+        )
+
+        # プロセス全体で共有されるLLMレート制限を設定（Leader/Member/Evaluator/Judgmentで共有）
+        configure_rate_limits(self.settings.rate_limits)
+
+        # プロバイダーごとに共有されるHTTPクライアントの接続プール設定
+        configure_http_clients(self.settings.http_client)
+
+        # Evaluator/JudgmentのLLM応答キャッシュ（オプトイン）
+        configure_response_cache(self.settings.response_cache, self.workspace)
 
     async def execute(
         self,
@@ -144,17 +161,22 @@ class Orchestrator:
                 judgment_timeout_seconds=self.settings.judgment_timeout_seconds,
             )
 
-        # Logfireトレース開始（execution_idを記録）
-        if LOGFIRE_AVAILABLE:
-            with logfire.span(
-                "orchestrator.execute",
-                execution_id=task.execution_id,
-                team_count=len(self.settings.teams),
-                timeout_seconds=timeout,
-            ) as span:
-                return await self._execute_impl(task, timeout, span)
-        else:
-            return await self._execute_impl(task, timeout, None)
+        try:
+            # Logfireトレース開始（execution_idを記録）
+            if LOGFIRE_AVAILABLE:
+                with logfire.span(
+                    "orchestrator.execute",
+                    execution_id=task.execution_id,
+                    team_count=len(self.settings.teams),
+                    timeout_seconds=timeout,
+                ) as span:
+                    return await self._execute_impl(task, timeout, span)
+            else:
+                return await self._execute_impl(task, timeout, None)
+        finally:
+            # 購読者は発行スレッドで同期的に呼ばれるため、ここで最終スナップショットは消費済み。
+            # 以降の参照は進捗イベントログ（{execution_id}.progress.jsonl）から行う
+            get_progress_bus().clear(task.execution_id)
 
     async def _execute_impl(
         self,
@@ -174,22 +196,25 @@ class Orchestrator:
         """
         # 循環インポート回避のため遅延インポート
         from mixseek.round_controller import RoundController
+        from mixseek.storage.ranking import LeaderBoardRanking
 
         user_prompt = task.user_prompt
 
         logger.info(f"Starting orchestration with {len(task.team_configs)} teams (timeout: {timeout}s)")
         logger.debug(f"Workspace: {self.workspace}")
 
+        # チーム設定を1回ずつ読み込み（RoundControllerでの再読み込みは設定キャッシュから取得される）
+        team_configs = [load_team_config(team_config_path, self.workspace) for team_config_path in task.team_configs]
+
         # デバッグ: API 認証情報の確認（credentials_status のみ）
         from mixseek.core.auth import get_auth_info
 
         try:
-            for team_config_path in task.team_configs:
-                temp_config = load_team_config(team_config_path, self.workspace)
-                if temp_config.leader and temp_config.leader.model:
-                    auth_info = get_auth_info(temp_config.leader.model)
+            for team_config in team_configs:
+                if team_config.leader and team_config.leader.model:
+                    auth_info = get_auth_info(team_config.leader.model)
                     logger.debug(
-                        f"Team {temp_config.team_id}: Model={temp_config.leader.model}, "
+                        f"Team {team_config.team_id}: Model={team_config.leader.model}, "
                         f"Auth={auth_info.get('provider', 'unknown')}, "
                         f"Credentials={auth_info.get('credentials_status', 'unknown')}"
                     )
@@ -198,24 +223,21 @@ class Orchestrator:
 
         # team_id重複チェック（data integrity保証）
         team_ids: list[str] = []
-        for team_config_path in task.team_configs:
-            temp_config = load_team_config(team_config_path, self.workspace)
-            if temp_config.team_id in team_ids:
+        for team_config in team_configs:
+            if team_config.team_id in team_ids:
                 raise ValueError(
-                    f"Duplicate team_id detected: '{temp_config.team_id}'. "
+                    f"Duplicate team_id detected: '{team_config.team_id}'. "
                     f"Each team configuration must have a unique team_id."
                 )
-            team_ids.append(temp_config.team_id)
+            team_ids.append(team_config.team_id)
 
         # TeamStatus初期化
-        for team_config_path in task.team_configs:
-            # 一時的にチームIDを取得（設定読み込み）
-            temp_config = load_team_config(team_config_path, self.workspace)
-            self.team_statuses[temp_config.team_id] = TeamStatus(
-                team_id=temp_config.team_id,
-                team_name=temp_config.team_name,
+        for team_config in team_configs:
+            self.team_statuses[team_config.team_id] = TeamStatus(
+                team_id=team_config.team_id,
+                team_name=team_config.team_name,
             )
-            logger.debug(f"Registered team: {temp_config.team_id} ({temp_config.team_name})")
+            logger.debug(f"Registered team: {team_config.team_id} ({team_config.team_name})")
 
         # Evaluator設定を取得
         config_manager = ConfigurationManager(workspace=self.workspace)
@@ -227,6 +249,9 @@ class Orchestrator:
         # PromptBuilder設定を取得
         prompt_builder_settings = config_manager.get_prompt_builder_settings(self.settings.prompt_builder_config)
 
+        # 全チームで共有するランキング（save_to_leader_boardで増分更新）
+        ranking = LeaderBoardRanking(task.execution_id)
+
         # RoundController作成
         controllers = [
             RoundController(
@@ -238,13 +263,17 @@ class Orchestrator:
                 prompt_builder_settings=prompt_builder_settings,
                 save_db=self.save_db,
                 on_round_complete=self._on_round_complete,
+                ranking=ranking,
             )
             for team_config_path in task.team_configs
         ]
 
-        # 並列実行
+        # 並列実行（同時実行数はTeamSchedulerがmax_concurrent_teamsで制限）
         start_time = time.time()
-        logger.info(f"Executing {len(controllers)} teams in parallel (execution_id: {task.execution_id})...")
+        logger.info(
+            f"Executing {len(controllers)} teams in parallel "
+            f"(max_concurrent_teams: {self.scheduler.max_concurrent}, execution_id: {task.execution_id})..."
+        )
 
         results = await asyncio.gather(
             *[self._run_team(controller, user_prompt, timeout) for controller in controllers],
@@ -253,6 +282,23 @@ class Orchestrator:
 
         execution_time = time.time() - start_time
 
+        # レート制限による待機時間を記録
+        for pattern, stats in get_rate_limit_stats().items():
+            logger.info(
+                f"Rate limit [{pattern}]: {stats.requests} requests, {stats.throttled_requests} throttled, "
+                f"{stats.rate_limited_responses} HTTP 429, total wait {stats.total_wait_seconds:.2f}s "
+                f"(max {stats.max_wait_seconds:.2f}s)"
+            )
+
+        # LLM応答キャッシュのヒット率を記録
+        response_cache = get_response_cache()
+        if response_cache is not None:
+            cache_stats = response_cache.stats
+            logger.info(
+                f"LLM response cache: {cache_stats.hits} hits, {cache_stats.misses} misses, "
+                f"{cache_stats.writes} writes, {cache_stats.evictions} evictions"
+            )
+
         # 結果収集
         team_results: list[LeaderBoardEntry] = []
         failed_teams_info: list[FailedTeamInfo] = []
@@ -328,7 +374,8 @@ class Orchestrator:
         if self.save_db:
             from mixseek.storage.aggregation_store import AggregationStore
 
-            store = AggregationStore(db_path=self.workspace / "mixseek.db")
+            # write-behind: 保留中のチーム書き込みをflushしてからサマリーを保存
+            store = AggregationStore(db_path=self.workspace / "mixseek.db", write_behind=True)
 
             await store.save_execution_summary(
                 execution_id=summary.execution_id,
@@ -386,7 +433,7 @@ class Orchestrator:
             return None
         try:
             entry = await controller._finalize_and_return_best(exit_reason, None)
-            self._write_error_to_progress_file(controller, error_msg)
+            self._publish_error_progress(controller, error_msg)
             return PartialTeamFailureError(entry=entry, original_error=original_error)
         except Exception as recovery_err:
             # リカバリはベストエフォート: DB書き込み失敗等が起きても、
@@ -400,7 +447,40 @@ class Orchestrator:
         user_prompt: str,
         timeout_seconds: int,
     ) -> LeaderBoardEntry:
-        """チーム単位の実行（タイムアウト付き）
+        """チーム単位の実行（同時実行数制限・タイムアウト付き）
+
+        TeamSchedulerで実行枠を獲得するまで待機し、獲得後に実行を開始する。
+        タイムアウトは実行枠獲得後（実行開始時点）から計測される。
+
+        Returns LeaderBoardEntry
+        """
+        team_id = controller.get_team_id()
+        status = self.team_statuses[team_id]
+        status.queued_at = datetime.now(UTC)
+
+        async with self.scheduler.admit(team_id) as wait_seconds:
+            status.queue_wait_seconds = wait_seconds
+            if wait_seconds > 0.01:
+                logger.debug(f"Team {team_id} admitted after waiting {wait_seconds:.2f}s in queue")
+            return await self._run_admitted_team(controller, user_prompt, timeout_seconds)
+
+    def _update_queue_depths(self, waiting_team_ids: list[str]) -> None:
+        """待機キュー変化時に各チームのTeamStatus.queue_depthを更新する.
+
+        Args:
+            waiting_team_ids: 待機中のteam_id（先頭から実行枠獲得順）
+        """
+        waiting_positions = {team_id: position for position, team_id in enumerate(waiting_team_ids)}
+        for team_id, status in self.team_statuses.items():
+            status.queue_depth = waiting_positions.get(team_id)
+
+    async def _run_admitted_team(
+        self,
+        controller: RoundController,
+        user_prompt: str,
+        timeout_seconds: int,
+    ) -> LeaderBoardEntry:
+        """実行枠獲得済みチームの実行（リトライ・タイムアウト付き）
 
         Returns LeaderBoardEntry
         """
@@ -435,7 +515,7 @@ class Orchestrator:
                 if partial_err is not None:
                     raise partial_err
 
-                self._write_error_to_progress_file(controller, error_msg)
+                self._publish_error_progress(controller, error_msg)
                 raise
             except Exception as e:
                 error_type = type(e).__name__
@@ -468,35 +548,35 @@ class Orchestrator:
                     if partial_err is not None:
                         raise partial_err
 
-                    self._write_error_to_progress_file(controller, error_msg)
+                    self._publish_error_progress(controller, error_msg)
                     raise
 
         # このコードに到達してはいけません（すべてのコードパスでreturnまたはraise）
         raise RuntimeError(f"Unexpected control flow in _run_team for team {team_id}")
 
-    def _write_error_to_progress_file(self, controller: RoundController, error_message: str) -> None:
-        """進捗ファイルにエラー情報を書き込む.
+    def _publish_error_progress(self, controller: RoundController, error_message: str) -> None:
+        """チームの失敗を進捗イベントとして発行する.
 
         Args:
             controller: RoundController instance
             error_message: エラーメッセージ
 
         Note:
-            RoundController経由で進捗JSONファイルに直接書き込む
-            実行中でもDuckDBアクセス不要で書き込み可能
+            RoundController経由で進捗バス（UI/CLI）とイベントログに通知する
+            実行中でもDuckDBアクセス不要で通知可能
         """
         try:
-            # RoundControllerの_write_progress_fileを使用してエラー情報を書き込む
+            # RoundControllerの_publish_progressを使用してエラー情報を発行する
             # NOTE: RoundControllerのprivateメソッドを直接呼び出しているが、
             # これはOrchestrator-RoundController間の密結合された関係のため許容される
-            controller._write_progress_file(
+            controller._publish_progress(
                 current_round=len(controller.round_history) if controller.round_history else 1,
                 status="failed",
                 error_message=error_message,
             )
         except Exception as e:
-            # 進捗ファイル書き込み失敗は無視（本体処理に影響させない）
-            logger.debug(f"Failed to write error to progress file: {e}")
+            # 進捗イベント発行失敗は無視（本体処理に影響させない）
+            logger.debug(f"Failed to publish error progress: {e}")
 
     async def get_team_status(self, team_id: str) -> TeamStatus:
         """特定チームのステータス取得"""
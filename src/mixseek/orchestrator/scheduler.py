@@ -0,0 +1,84 @@
+"""TeamScheduler - チーム実行のアドミッション制御
+
+OrchestratorSettings.max_concurrent_teams に基づき、同時に実行されるチーム数を制限する。
+待機中のチームは登録順（FIFO）に実行枠へ割り当てられ、実行中チームの完了に応じて順次補充される。
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+QueueChangeCallback = Callable[[list[str]], None]
+"""待機キュー変化時に呼び出されるコールバック（引数: 待機中team_idの先頭からの順序付きリスト）"""
+
+
+class TeamScheduler:
+    """同時実行チーム数を制限するFIFOスケジューラ
+
+    asyncio.Semaphoreは待機者を到着順に起床させるため、
+    admit()を呼び出した順にチームが実行枠を獲得する。
+    """
+
+    def __init__(self, max_concurrent: int, on_queue_change: QueueChangeCallback | None = None) -> None:
+        """TeamSchedulerインスタンス作成
+
+        Args:
+            max_concurrent: 同時実行可能なチーム数（1以上）
+            on_queue_change: 待機キュー変化時のコールバック（オプション）
+
+        Raises:
+            ValueError: max_concurrentが1未満の場合
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
+
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting: list[str] = []
+        self._running = 0
+        self._on_queue_change = on_queue_change
+
+    @property
+    def queue_depth(self) -> int:
+        """実行枠を待機中のチーム数"""
+        return len(self._waiting)
+
+    @property
+    def running_count(self) -> int:
+        """実行中のチーム数"""
+        return self._running
+
+    @asynccontextmanager
+    async def admit(self, team_id: str) -> AsyncIterator[float]:
+        """実行枠を獲得し、ブロック終了時に解放する
+
+        Args:
+            team_id: チーム識別子
+
+        Yields:
+            実行枠獲得までの待機時間（秒）
+
+        Note:
+            待機中にキャンセルされた場合は実行枠を獲得せずに待機キューから除外される。
+        """
+        enqueued_at = time.monotonic()
+        self._waiting.append(team_id)
+        self._notify_queue_change()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting.remove(team_id)
+            self._notify_queue_change()
+
+        self._running += 1
+        try:
+            yield time.monotonic() - enqueued_at
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+
+    def _notify_queue_change(self) -> None:
+        """待機キューの変化をコールバックへ通知する"""
+        if self._on_queue_change is not None:
+            self._on_queue_change(list(self._waiting))
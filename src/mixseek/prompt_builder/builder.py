@@ -6,9 +6,12 @@ Date: 2025-11-19
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
-from jinja2 import Environment, StrictUndefined, TemplateSyntaxError, UndefinedError
+from jinja2 import Environment, StrictUndefined, Template, TemplateSyntaxError, UndefinedError
 
 if TYPE_CHECKING:
     from mixseek.config.schema import PromptBuilderSettings
@@ -22,6 +25,55 @@ from mixseek.prompt_builder.formatters import (
 )
 from mixseek.prompt_builder.models import EvaluatorPromptContext, RoundPromptContext
 
+# Shared Jinja2 environment with StrictUndefined to catch undefined variables.
+# Templates compiled from it are immutable and safe to render concurrently.
+_jinja_env = Environment(autoescape=False, undefined=StrictUndefined)
+
+# Maximum number of distinct template texts kept compiled (LRU)
+TEMPLATE_CACHE_MAX_ENTRIES = 128
+
+_compiled_templates: OrderedDict[str, Template] = OrderedDict()
+_compiled_templates_lock = threading.Lock()
+
+
+def get_compiled_template(template_string: str) -> Template:
+    """Return the compiled template for a template text, compiling it on first use.
+
+    Templates are cached by the SHA-256 of their text, so every UserPromptBuilder
+    (RoundController per team, LLMJudgeMetric per evaluation) shares one compile
+    per distinct PromptBuilderSettings template.
+
+    Args:
+        template_string: Jinja2 template string
+
+    Returns:
+        Compiled Jinja2 template
+
+    Raises:
+        TemplateSyntaxError: If the template text is invalid (not cached)
+    """
+    key = hashlib.sha256(template_string.encode()).hexdigest()
+    with _compiled_templates_lock:
+        template = _compiled_templates.get(key)
+        if template is not None:
+            _compiled_templates.move_to_end(key)
+            return template
+
+    # Compile outside the lock; a concurrent duplicate compile is harmless
+    template = _jinja_env.from_string(template_string)
+    with _compiled_templates_lock:
+        _compiled_templates[key] = template
+        _compiled_templates.move_to_end(key)
+        while len(_compiled_templates) > TEMPLATE_CACHE_MAX_ENTRIES:
+            _compiled_templates.popitem(last=False)
+    return template
+
+
+def clear_template_cache() -> None:
+    """Drop all compiled templates."""
+    with _compiled_templates_lock:
+        _compiled_templates.clear()
+
 
 class UserPromptBuilder:
     """Component for formatting user prompts.
@@ -58,8 +110,8 @@ class UserPromptBuilder:
         self.settings = settings
         self.store = store
 
-        # Initialize Jinja2 environment with StrictUndefined to catch undefined variables
-        self.jinja_env = Environment(autoescape=False, undefined=StrictUndefined)
+        # Shared environment; templates are compiled once per text via get_compiled_template()
+        self.jinja_env = _jinja_env
 
     async def build_team_prompt(self, context: RoundPromptContext) -> str:
         """Format Team user prompt.
@@ -95,7 +147,7 @@ class UserPromptBuilder:
             RuntimeError: If Jinja2 template syntax error occurs
         """
         try:
-            template = self.jinja_env.from_string(template_string)
+            template = get_compiled_template(template_string)
             return template.render(template_vars)
         except (TemplateSyntaxError, UndefinedError) as e:
             msg = f"Jinja2 template error: {e}"
@@ -117,7 +169,13 @@ class UserPromptBuilder:
         }
 
         # Format submission history (always call formatters, which handles empty history)
-        template_vars["submission_history"] = format_submission_history(context.round_history)
+        # The configured strategy bounds how much of the history is included
+        template_vars["submission_history"] = format_submission_history(
+            context.round_history,
+            strategy=self.settings.submission_history_strategy,
+            last_k=self.settings.submission_history_last_k,
+            max_tokens=self.settings.submission_history_max_tokens,
+        )
 
         # Fetch ranking data (if store is available and round > 1)
         ranking = None
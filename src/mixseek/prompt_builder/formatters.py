@@ -6,15 +6,20 @@ Date: 2025-11-19
 
 from __future__ import annotations
 
+import difflib
 import json
+import math
 import os
 from datetime import UTC, datetime, tzinfo
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 if TYPE_CHECKING:
+    from mixseek.config.schema import SubmissionHistoryStrategy
     from mixseek.round_controller.models import RoundState
 
+_TRUNCATION_MARKER = "\n...（以下省略）"
+
 
 def get_current_datetime_with_timezone() -> str:
     """Get current datetime based on TZ environment variable (ISO 8601 format).
@@ -56,11 +61,120 @@ def get_current_datetime_with_timezone() -> str:
     return now.isoformat()
 
 
-def format_submission_history(round_history: list[RoundState]) -> str:
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in text without a tokenizer.
+
+    ASCII text averages about 4 characters per token; other characters
+    (e.g. Japanese) are counted as one token each. The estimate is
+    deliberately conservative so that budgets are not exceeded.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+
+    Example:
+        >>> estimate_tokens("Hello, world")
+        3
+        >>> estimate_tokens("こんにちは")
+        5
+    """
+    ascii_chars = len(text.encode("ascii", errors="ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _format_round(state: RoundState, submission_label: str, submission_text: str) -> list[str]:
+    return [
+        f"## ラウンド {state.round_number}",
+        f"### スコア: {state.evaluation_score:.2f}/100",
+        "### スコア詳細:",
+        json.dumps(state.score_details, ensure_ascii=False, indent=2),
+        f"### {submission_label}:",
+        submission_text,
+    ]
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text so that its estimated token count is at most max_tokens."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    budget = max(max_tokens - estimate_tokens(_TRUNCATION_MARKER), 0)
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + _TRUNCATION_MARKER
+
+
+def _select_within_budget(round_history: list[RoundState], max_tokens: int) -> list[list[str]]:
+    """Select the most recent rounds whose formatted size fits in max_tokens.
+
+    The latest round is always included; its submission is truncated if it
+    alone exceeds the budget.
+    """
+    blocks: list[list[str]] = []
+    used = 0
+    for state in reversed(round_history):
+        block = _format_round(state, "あなたの提出内容", state.submission_content)
+        size = estimate_tokens("\n".join(block)) + 1
+        if used + size > max_tokens:
+            if not blocks:
+                header_size = estimate_tokens("\n".join(block[:-1])) + 1
+                block[-1] = _truncate_to_tokens(state.submission_content, max(max_tokens - header_size, 0))
+                blocks.append(block)
+            break
+        blocks.append(block)
+        used += size
+    blocks.reverse()
+    return blocks
+
+
+def _diff_blocks(round_history: list[RoundState]) -> list[list[str]]:
+    """Render the first round verbatim and later rounds as diffs against their predecessor."""
+    blocks = [_format_round(round_history[0], "あなたの提出内容", round_history[0].submission_content)]
+    for previous, state in zip(round_history, round_history[1:]):
+        diff = "\n".join(
+            difflib.unified_diff(
+                previous.submission_content.splitlines(),
+                state.submission_content.splitlines(),
+                fromfile=f"ラウンド {previous.round_number}",
+                tofile=f"ラウンド {state.round_number}",
+                lineterm="",
+            )
+        )
+        blocks.append(
+            _format_round(
+                state,
+                f"あなたの提出内容（ラウンド {previous.round_number} からの差分）",
+                f"```diff\n{diff}\n```" if diff else "（変更なし）",
+            )
+        )
+    return blocks
+
+
+def format_submission_history(
+    round_history: list[RoundState],
+    strategy: SubmissionHistoryStrategy = "all",
+    last_k: int = 3,
+    max_tokens: int = 8000,
+) -> str:
     """Format past submission history.
 
     Args:
         round_history: History of all past rounds
+        strategy: Which rounds to include and how
+            - ``all``: every round verbatim
+            - ``last_k``: the most recent ``last_k`` rounds verbatim
+            - ``best``: only the highest-scoring round (latest wins ties)
+            - ``token_budget``: the most recent rounds that fit in ``max_tokens``
+            - ``diff``: the first round verbatim, later rounds as a diff against the previous round
+        last_k: Number of recent rounds for the ``last_k`` strategy
+        max_tokens: Estimated token budget for the ``token_budget`` strategy
 
     Returns:
         Formatted history string. Returns "まだ過去のSubmissionはありません。"
@@ -82,14 +196,26 @@ def format_submission_history(round_history: list[RoundState]) -> str:
     if not round_history:
         return "まだ過去のSubmissionはありません。"
 
+    if strategy == "last_k":
+        blocks = [
+            _format_round(state, "あなたの提出内容", state.submission_content) for state in round_history[-last_k:]
+        ]
+    elif strategy == "best":
+        best = max(reversed(round_history), key=lambda state: state.evaluation_score)
+        blocks = [_format_round(best, "あなたの提出内容", best.submission_content)]
+    elif strategy == "token_budget":
+        blocks = _select_within_budget(round_history, max_tokens)
+    elif strategy == "diff":
+        blocks = _diff_blocks(round_history)
+    else:
+        blocks = [_format_round(state, "あなたの提出内容", state.submission_content) for state in round_history]
+
     parts = []
-    for state in round_history:
-        parts.append(f"## ラウンド {state.round_number}")
-        parts.append(f"### スコア: {state.evaluation_score:.2f}/100")
-        parts.append("### スコア詳細:")
-        parts.append(json.dumps(state.score_details, ensure_ascii=False, indent=2))
-        parts.append("### あなたの提出内容:")
-        parts.append(state.submission_content)
+    if len(blocks) < len(round_history):
+        parts.append(f"※ 全{len(round_history)}ラウンドのうち{len(blocks)}ラウンド分のみ表示しています。")
+        parts.append("")
+    for block in blocks:
+        parts.extend(block)
         parts.append("")  # Empty line between rounds
 
     # Remove trailing empty line
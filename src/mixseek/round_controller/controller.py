@@ -3,12 +3,17 @@
 This module manages multi-round execution for a single team.
 """
 
-import json
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from pydantic_ai import Agent
+
 from mixseek.agents.leader.agent import create_leader_agent
 from mixseek.agents.leader.config import team_settings_to_team_config
 from mixseek.agents.leader.dependencies import TeamDependencies
@@ -17,6 +22,8 @@ from mixseek.agents.member.factory import MemberAgentFactory
 from mixseek.config import ConfigurationManager
 from mixseek.config.member_agent_loader import member_settings_to_config
 from mixseek.config.schema import EvaluatorSettings, JudgmentSettings, PromptBuilderSettings
+from mixseek.core.agent_pool import AgentPool
+from mixseek.core.progress import ProgressEvent, get_progress_bus, progress_log_path
 from mixseek.evaluator import Evaluator
 from mixseek.models.evaluation_config import EvaluationConfig  # noqa: F401
 from mixseek.models.evaluation_request import EvaluationRequest
@@ -24,12 +31,22 @@ from mixseek.models.leaderboard import LeaderBoardEntry
 from mixseek.orchestrator.models import OrchestratorTask
 from mixseek.prompt_builder import UserPromptBuilder
 from mixseek.prompt_builder.models import RoundPromptContext
+from mixseek.round_controller.exceptions import PhaseTimeoutError
 from mixseek.round_controller.judgment_client import JudgmentClient
 from mixseek.round_controller.models import OnRoundCompleteCallback, RoundState
 from mixseek.storage.aggregation_store import AggregationStore
+from mixseek.storage.ranking import LeaderBoardRanking
 
 logger = logging.getLogger(__name__)
 
+# チームタイムアウト前にベスト結果を確定（DB保存）するために残す時間（秒、上限）
+FINALIZE_RESERVE_SECONDS = 5.0
+# 同上（チームタイムアウトに対する割合。短いタイムアウトでもフェーズ時間を確保）
+FINALIZE_RESERVE_RATIO = 0.1
+# 提出フェーズのうちMember Agent呼び出しに使える時間の割合
+# （残りはLeader AgentがMember応答を統合して提出を生成するための時間）
+MEMBER_PHASE_BUDGET_RATIO = 0.8
+
 # Logfireインポート(オプショナル)
 try:
     import logfire
@@ -59,6 +76,7 @@ class RoundController:
         prompt_builder_settings: PromptBuilderSettings,
         save_db: bool = True,
         on_round_complete: OnRoundCompleteCallback | None = None,
+        ranking: LeaderBoardRanking | None = None,
     ) -> None:
         """Initialize RoundController instance
 
@@ -75,6 +93,8 @@ class RoundController:
             save_db: DuckDBへの保存フラグ
             on_round_complete: Callback invoked after each round completes.
                 Receives (RoundState, list[MemberSubmission]). Exceptions are logged but don't stop execution.
+            ranking: Execution-scoped leaderboard ranking shared by all teams (from Orchestrator).
+                When None, rankings for prompts are queried from DuckDB.
 
         Raises:
             FileNotFoundError: If team_config_path does not exist
@@ -94,7 +114,10 @@ class RoundController:
         self.prompt_builder_settings = prompt_builder_settings
         self.save_db = save_db
         if self.save_db:
-            self.store: AggregationStore | None = AggregationStore(db_path=self.workspace / "mixseek.db")
+            # write-behind: 全チームのupsertを共有キューでバッチコミット（ラウンド完了時にflush）
+            self.store: AggregationStore | None = AggregationStore(
+                db_path=self.workspace / "mixseek.db", write_behind=True, ranking=ranking
+            )
         else:
             self.store = None
         self.round_history: list[RoundState] = []
@@ -106,6 +129,18 @@ class RoundController:
         # Initialize JudgmentClient with settings
         self.judgment_client = JudgmentClient(settings=judgment_settings)
 
+        # EvaluatorSettings と PromptBuilderSettings から Evaluator を生成（ラウンド間で再利用）
+        self.evaluator = Evaluator(
+            settings=self.evaluator_settings,
+            prompt_builder_settings=self.prompt_builder_settings,
+        )
+
+        # Leader/Member Agentのプール（チーム実行中はラウンド間で再利用）
+        self.agent_pool = AgentPool()
+
+        # チーム実行の期限（イベントループ時刻、run_round()開始時に設定）
+        self._deadline: float | None = None
+
     def get_team_id(self) -> str:
         """Get team identifier"""
         return self.team_config.team_id
@@ -114,14 +149,14 @@ class RoundController:
         """Get team name"""
         return self.team_config.team_name
 
-    def _write_progress_file(
+    def _publish_progress(
         self,
         current_round: int,
         status: str = "running",
         current_agent: str | None = None,
         error_message: str | None = None,
     ) -> None:
-        """進捗ファイルを書き出す（UI用）.
+        """進捗イベントを発行する（UI/CLI用）.
 
         Args:
             current_round: 現在のラウンド番号
@@ -130,39 +165,25 @@ class RoundController:
             error_message: エラーメッセージ（status="failed"時に設定）
 
         Note:
-            進捗ファイル: $MIXSEEK_WORKSPACE/logs/{execution_id}.{team_id}.progress.json
-            UIはこのファイルからリアルタイム進捗を取得する
+            プロセス内の購読者（UI/CLI）には ProgressBus 経由で即時に通知され、
+            別プロセス向けに $MIXSEEK_WORKSPACE/logs/{execution_id}.progress.jsonl に追記される
         """
         try:
-            # logsディレクトリを確保
-            logs_dir = self.workspace / "logs"
-            logs_dir.mkdir(exist_ok=True)
-
-            # 進捗ファイルパス（チームごとに分離）
-            progress_file = logs_dir / f"{self.task.execution_id}.{self.team_config.team_id}.progress.json"
-
-            # 進捗データ
-            progress_data = {
-                "execution_id": self.task.execution_id,
-                "status": status,
-                "current_round": current_round,
-                "total_rounds": self.task.max_rounds,
-                "team_id": self.team_config.team_id,
-                "team_name": self.team_config.team_name,
-                "current_agent": current_agent,
-                "updated_at": datetime.now(UTC).isoformat(),
-            }
-
-            # エラーメッセージを追加（存在する場合）
-            if error_message:
-                progress_data["error_message"] = error_message
-
-            # JSON書き出し（上書き）
-            with open(progress_file, "w", encoding="utf-8") as f:
-                json.dump(progress_data, f, indent=2, ensure_ascii=False)
+            event = ProgressEvent(
+                execution_id=self.task.execution_id,
+                team_id=self.team_config.team_id,
+                team_name=self.team_config.team_name,
+                status=status,
+                current_round=current_round,
+                total_rounds=self.task.max_rounds,
+                updated_at=datetime.now(UTC).isoformat(),
+                current_agent=current_agent,
+                error_message=error_message or None,
+            )
+            get_progress_bus().publish(event, log_path=progress_log_path(self.workspace, self.task.execution_id))
 
         except Exception:
-            # 進捗ファイル書き出し失敗は無視（本体処理に影響させない）
+            # 進捗イベント発行失敗は無視（本体処理に影響させない）
             pass
 
     async def run_round(
@@ -216,23 +237,40 @@ class RoundController:
         Returns:
             LeaderBoardEntry: Best submission entry
         """
+        # チームの実行期限: 各フェーズはこの期限を超えないよう打ち切り、完了済みラウンドで確定する
+        reserve = min(FINALIZE_RESERVE_SECONDS, timeout_seconds * FINALIZE_RESERVE_RATIO)
+        self._deadline = asyncio.get_running_loop().time() + timeout_seconds - reserve
+
         # Multi-round loop
         for round_number in range(1, self.task.max_rounds + 1):
-            # 進捗ファイル更新（ラウンド開始）
-            self._write_progress_file(round_number, status="running")
+            # 進捗イベント発行（ラウンド開始）
+            self._publish_progress(round_number, status="running")
 
             # Format prompt for this round
             formatted_prompt = await self._format_prompt_for_round(user_prompt, round_number)
 
             # Execute single round
-            round_state = await self._execute_single_round(
-                round_number, formatted_prompt, user_prompt, timeout_seconds
-            )
+            try:
+                round_state = await self._execute_single_round(
+                    round_number, formatted_prompt, user_prompt, timeout_seconds
+                )
+            except PhaseTimeoutError as e:
+                # 完了ラウンドがない場合はチーム失敗（Orchestratorで記録）
+                if not self.round_history:
+                    raise
+                logger.warning(
+                    f"Team {self.team_config.team_id}: {e}. Finalizing with the best completed round",
+                )
+                return await self._finalize_and_return_best(f"{e.phase}_timeout", span)
             self.round_history.append(round_state)
 
             # Round continuation judgment (3-stage)
             should_continue, exit_reason = await self._should_continue_round(user_prompt, round_number)
 
+            # ラウンド完了: 保留中の書き込みを永続化
+            if self.store is not None:
+                await self.store.flush()
+
             if not should_continue:
                 # Finalize and return best submission
                 return await self._finalize_and_return_best(exit_reason, span)
@@ -240,6 +278,44 @@ class RoundController:
         # Max rounds reached
         return await self._finalize_and_return_best("max_rounds_reached", span)
 
+    def _phase_timeout(self, timeout_seconds: float | None) -> float | None:
+        """フェーズに使える時間（フェーズのタイムアウトとチームの残り時間の小さい方）
+
+        Args:
+            timeout_seconds: フェーズのタイムアウト（秒、Noneの場合はチームの残り時間のみ）
+
+        Returns:
+            フェーズに使える時間（秒、期限切れの場合は0、期限がない場合はNone）
+        """
+        if self._deadline is None:
+            return timeout_seconds
+        remaining = max(0.0, self._deadline - asyncio.get_running_loop().time())
+        return remaining if timeout_seconds is None else min(timeout_seconds, remaining)
+
+    @asynccontextmanager
+    async def _phase(
+        self, phase: str, timeout_seconds: float | None, round_number: int
+    ) -> AsyncIterator[float | None]:
+        """フェーズ単位の期限付き実行
+
+        Args:
+            phase: フェーズ名（"submission", "evaluation", or "judgment"）
+            timeout_seconds: フェーズのタイムアウト（秒、Noneの場合はチームの残り時間のみ）
+            round_number: ラウンド番号
+
+        Yields:
+            フェーズに使える時間（秒、期限がない場合はNone）
+
+        Raises:
+            PhaseTimeoutError: 期限内にフェーズが完了しなかった場合（実行中の処理はキャンセル）
+        """
+        allowed = self._phase_timeout(timeout_seconds)
+        try:
+            async with asyncio.timeout(allowed):
+                yield allowed
+        except TimeoutError as e:
+            raise PhaseTimeoutError(phase, allowed or 0.0, round_number) from e
+
     async def _format_prompt_for_round(self, user_prompt: str, round_number: int) -> str:
         """Format prompt for specific round using UserPromptBuilder
 
@@ -263,6 +339,34 @@ class RoundController:
 
         return await self.prompt_builder.build_team_prompt(context)
 
+    def _get_leader_agent(self) -> Agent[TeamDependencies, str]:
+        """Get the Leader Agent for this team, creating it on first use.
+
+        Member Agents and the Leader Agent depend only on the team settings,
+        so they are built once per team and reused across rounds via the
+        agent pool (model construction and tool registration happen once).
+
+        Returns:
+            Leader Agent with Member Agent tools registered
+        """
+
+        def create_member_agents() -> dict[str, object]:
+            # Use member_settings_to_config() for consistent MemberAgentConfig generation
+            member_agents: dict[str, object] = {}
+            for member_settings in self.team_settings.members:
+                # member_settings_to_config()を使用（詳細設定を保持）
+                member_config = member_settings_to_config(member_settings, agent_data=None, workspace=self.workspace)
+                member_agents[member_settings.agent_name] = self.agent_pool.get_or_create(
+                    ("member", member_settings.agent_name),
+                    partial(MemberAgentFactory.create_agent, member_config),
+                )
+            return member_agents
+
+        return self.agent_pool.get_or_create(
+            ("leader", self.team_config.team_id),
+            lambda: create_leader_agent(self.team_config, create_member_agents()),
+        )
+
     async def _execute_single_round(
         self,
         round_number: int,
@@ -283,21 +387,11 @@ class RoundController:
         """
         round_started_at = datetime.now(UTC)
 
-        # 1. Create Member Agents
-        # Use member_settings_to_config() for consistent MemberAgentConfig generation
-        member_agents: dict[str, object] = {}
-        for member_settings in self.team_settings.members:
-            # member_settings_to_config()を使用（詳細設定を保持）
-            member_config = member_settings_to_config(member_settings, agent_data=None, workspace=self.workspace)
-
-            member_agent = MemberAgentFactory.create_agent(member_config)
-            member_agents[member_settings.agent_name] = member_agent
-
-        # 2. Execute Leader Agent
-        # 進捗ファイル更新: Leader実行開始
-        self._write_progress_file(round_number, status="running", current_agent="leader")
+        # 1-2. Get Leader Agent (Member Agents are registered as tools; reused across rounds)
+        # 進捗イベント発行: Leader実行開始
+        self._publish_progress(round_number, status="running", current_agent="leader")
 
-        leader_agent = create_leader_agent(self.team_config, member_agents)
+        leader_agent = self._get_leader_agent()
         deps = TeamDependencies(
             execution_id=self.task.execution_id,
             team_id=self.team_config.team_id,
@@ -305,12 +399,16 @@ class RoundController:
             round_number=round_number,
         )
 
-        result = await leader_agent.run(user_prompt, deps=deps)
+        async with self._phase("submission", self.task.submission_timeout_seconds, round_number) as allowed:
+            # Member Agent呼び出しは提出フェーズの途中で打ち切り、Leader Agentが提出を生成する時間を残す
+            if allowed is not None:
+                deps.member_deadline = asyncio.get_running_loop().time() + allowed * MEMBER_PHASE_BUDGET_RATIO
+            result = await leader_agent.run(user_prompt, deps=deps)
         submission_content: str = result.output
         message_history = result.all_messages()
 
-        # 進捗ファイル更新: Leader実行完了
-        self._write_progress_file(round_number, status="running", current_agent=None)
+        # 進捗イベント発行: Leader実行完了
+        self._publish_progress(round_number, status="running", current_agent=None)
 
         # 3. Save round history (existing table)
         member_record = MemberSubmissionsRecord(
@@ -325,14 +423,9 @@ class RoundController:
             await self.store.save_aggregation(self.task.execution_id, member_record, message_history)
 
         # 4. Execute Evaluator
-        # 進捗ファイル更新: Evaluator実行開始
-        self._write_progress_file(round_number, status="running", current_agent="evaluator")
+        # 進捗イベント発行: Evaluator実行開始
+        self._publish_progress(round_number, status="running", current_agent="evaluator")
 
-        # EvaluatorSettings と PromptBuilderSettings から Evaluator を生成
-        evaluator = Evaluator(
-            settings=self.evaluator_settings,
-            prompt_builder_settings=self.prompt_builder_settings,
-        )
         request = EvaluationRequest(
             user_query=original_user_prompt,
             submission=submission_content,
@@ -341,11 +434,13 @@ class RoundController:
             round_number=round_number,
         )
 
-        evaluation_result = await evaluator.evaluate(request)
+        # 評価フェーズ専用のタイムアウトはないため、チームの残り時間で打ち切る
+        async with self._phase("evaluation", None, round_number):
+            evaluation_result = await self.evaluator.evaluate(request)
         evaluation_score = evaluation_result.overall_score
 
-        # 進捗ファイル更新: Evaluator実行完了
-        self._write_progress_file(round_number, status="running", current_agent=None)
+        # 進捗イベント発行: Evaluator実行完了
+        self._publish_progress(round_number, status="running", current_agent=None)
 
         # Build score_details
         score_details: dict[str, Any] = {
@@ -473,7 +568,25 @@ class RoundController:
         formatted_prompt = await self.prompt_builder.build_judgment_prompt(judgment_context)
 
         # 整形済みプロンプトをJudgmentClientに渡す
-        judgment = await self.judgment_client.judge_improvement_prospects(formatted_prompt)
+        try:
+            async with self._phase("judgment", self.task.judgment_timeout_seconds, current_round):
+                judgment = await self.judgment_client.judge_improvement_prospects(formatted_prompt)
+        except PhaseTimeoutError as e:
+            # 判定が期限内に得られない場合は継続せず、完了済みラウンドで確定する
+            logger.warning(f"Team {self.team_config.team_id}: {e}. Stopping after this round")
+            if self.store is not None:
+                await self.store.save_round_status(
+                    execution_id=self.task.execution_id,
+                    team_id=self.team_config.team_id,
+                    team_name=self.team_config.team_name,
+                    round_number=current_round,
+                    should_continue=False,
+                    reasoning=str(e),
+                    confidence_score=None,
+                    round_started_at=self.round_history[-1].round_started_at.isoformat(),
+                    round_ended_at=self.round_history[-1].round_ended_at.isoformat(),
+                )
+            return False, "judgment_timeout"
 
         # Stage (c): Check maximum rounds (override LLM decision)
         if current_round >= self.task.max_rounds:
@@ -532,6 +645,7 @@ class RoundController:
                 final_submission=True,
                 exit_reason=exit_reason,
             )
+            await self.store.flush()
 
         # Create and return LeaderBoardEntry
         leader_board_entry = LeaderBoardEntry(
@@ -556,7 +670,7 @@ class RoundController:
             span.set_attribute("best_score", best_state.evaluation_score)
             span.set_attribute("exit_reason", exit_reason)
 
-        # 進捗ファイル更新（完了）
-        self._write_progress_file(best_state.round_number, status="completed")
+        # 進捗イベント発行（完了）
+        self._publish_progress(best_state.round_number, status="completed")
 
         return leader_board_entry
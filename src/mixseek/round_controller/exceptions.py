@@ -47,3 +47,30 @@ class JudgmentAPIError(Exception):
         if self.retry_count is not None:
             parts.append(f"Retries: {self.retry_count}")
         return " | ".join(parts)
+
+
+class PhaseTimeoutError(Exception):
+    """Raised when a round phase does not finish before its deadline.
+
+    The deadline of a phase is the smaller of its own timeout
+    (``submission_timeout_seconds`` / ``judgment_timeout_seconds``) and the
+    remaining team time budget.
+
+    Attributes:
+        phase: Phase that timed out ("submission", "evaluation" or "judgment")
+        timeout_seconds: Time allowed for the phase (seconds)
+        round_number: Round in which the phase timed out
+    """
+
+    def __init__(self, phase: str, timeout_seconds: float, round_number: int) -> None:
+        """Initialize PhaseTimeoutError.
+
+        Args:
+            phase: Phase that timed out ("submission", "evaluation" or "judgment")
+            timeout_seconds: Time allowed for the phase (seconds)
+            round_number: Round in which the phase timed out
+        """
+        super().__init__(f"{phase} phase timed out after {timeout_seconds:.1f}s in round {round_number}")
+        self.phase = phase
+        self.timeout_seconds = timeout_seconds
+        self.round_number = round_number
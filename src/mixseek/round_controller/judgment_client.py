@@ -7,6 +7,7 @@ Responsibility: Agent呼び出しとsystem_interaction生成のみ
 プロンプト整形はRoundControllerがUserPromptBuilderで行う
 """
 
+import logging
 import textwrap
 from typing import Any
 
@@ -15,9 +16,12 @@ from pydantic_ai.settings import ModelSettings
 
 from mixseek.config.schema import JudgmentSettings
 from mixseek.core.auth import create_authenticated_model
+from mixseek.core.response_cache import get_response_cache
 from mixseek.round_controller.exceptions import JudgmentAPIError
 from mixseek.round_controller.models import ImprovementJudgment
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_SYSTEM_INSTRUCTION = """
     あなたは複数ラウンドにわたるチームの提出物の改善を分析する専門的な判定者です。
 
@@ -56,6 +60,8 @@ class JudgmentClient:
             settings: Judgment設定（JudgmentSettings インスタンス）
         """
         self.settings = settings
+        self._agent: Agent[None, ImprovementJudgment] | None = None
+        self._model_settings: ModelSettings | None = None
 
     def _get_system_instruction(self) -> str:
         """Get system instruction (configurable or default).
@@ -66,23 +72,17 @@ class JudgmentClient:
         instruction = self.settings.system_instruction or DEFAULT_SYSTEM_INSTRUCTION
         return textwrap.dedent(instruction).strip()
 
-    async def judge_improvement_prospects(self, formatted_prompt: str) -> ImprovementJudgment:
-        """Judge if the team should continue to the next round
+    def _get_agent(self) -> Agent[None, ImprovementJudgment]:
+        """Get the judgment Agent, creating it on first use.
 
-        This method uses Pydantic AI Agent for structured output and automatic retries.
-        Prompt formatting is handled by RoundController using UserPromptBuilder.
-
-        Args:
-            formatted_prompt: Pre-formatted user prompt (from RoundController)
+        Settings are fixed for the lifetime of the client, so the Agent
+        (and its authenticated model) is built once and reused every round.
 
         Returns:
-            ImprovementJudgment: Judgment result
-
-        Raises:
-            JudgmentAPIError: If all retries fail
+            Judgment Agent
         """
-        if not formatted_prompt or not formatted_prompt.strip():
-            raise ValueError("formatted_prompt cannot be empty")
+        if self._agent is not None:
+            return self._agent
 
         # 認証済みモデル作成（DRY準拠）
         authenticated_model = create_authenticated_model(self.settings.model)
@@ -101,19 +101,64 @@ class JudgmentClient:
         if self.settings.seed is not None:
             model_settings_dict["seed"] = self.settings.seed
         model_settings = ModelSettings(**model_settings_dict)  # type: ignore[typeddict-item]
+        self._model_settings = model_settings
 
         # Agent作成（構造化出力とリトライ設定）
-        agent = Agent(
+        self._agent = Agent(
             authenticated_model,
             output_type=ImprovementJudgment,  # 構造化出力を自動的に実現
             instructions=self._get_system_instruction(),  # システムプロンプト
             model_settings=model_settings,  # LLM設定
             retries=self.settings.max_retries,  # 自動リトライ
         )
+        return self._agent
+
+    async def judge_improvement_prospects(self, formatted_prompt: str) -> ImprovementJudgment:
+        """Judge if the team should continue to the next round
+
+        This method uses Pydantic AI Agent for structured output and automatic retries.
+        When the LLM response cache is enabled, deterministic judgments
+        (temperature 0 or a fixed seed) are served from the cache on replay.
+        Prompt formatting is handled by RoundController using UserPromptBuilder.
+
+        Args:
+            formatted_prompt: Pre-formatted user prompt (from RoundController)
+
+        Returns:
+            ImprovementJudgment: Judgment result
+
+        Raises:
+            JudgmentAPIError: If all retries fail
+        """
+        if not formatted_prompt or not formatted_prompt.strip():
+            raise ValueError("formatted_prompt cannot be empty")
+
+        agent = self._get_agent()
+
+        # LLM応答キャッシュ（有効かつ決定的なリクエストのみ）
+        cache = get_response_cache()
+        cache_key: str | None = None
+        if cache is not None and cache.should_cache(self.settings.temperature, self.settings.seed):
+            cache_key = cache.make_key(
+                "judgment",
+                self.settings.model,
+                self._get_system_instruction(),
+                formatted_prompt,
+                dict(self._model_settings or {}),
+                ImprovementJudgment,
+            )
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                try:
+                    return ImprovementJudgment.model_validate_json(cached)
+                except ValueError as e:
+                    logger.warning(f"Discarding invalid cached judgment: {e}")
 
         # 実行
         try:
             result = await agent.run(formatted_prompt)
+            if cache is not None and cache_key is not None:
+                await cache.aput(cache_key, self.settings.model, result.output.model_dump_json())
             return result.output
 
         except Exception as e:
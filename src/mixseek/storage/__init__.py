@@ -4,5 +4,6 @@ DuckDBベースのデータ永続化層を提供します。
 """
 
 from mixseek.storage.aggregation_store import AggregationStore
+from mixseek.storage.ranking import LeaderBoardRanking
 
-__all__ = ["AggregationStore"]
+__all__ = ["AggregationStore", "LeaderBoardRanking"]
@@ -11,6 +11,16 @@ Technical Strategy:
     スレッドローカルコネクションにより、各チームが独立した
     コネクションを使用してMVCC並列書き込みを実現。
 
+    write_behind=True の場合、round_history・leader_board・round_statusへの
+    upsertは同一DBファイルを共有する全ストア（複数チーム）のwrite-behindキューに
+    追加され、flush間隔ごとに1トランザクションでまとめてコミットされます
+    （mixseek.storage.write_behind参照）。
+
+    Message History（Leader AgentおよびMember Agentのall_messages）は
+    round_historyのJSONカラムではなく、1メッセージ1行のround_messages
+    テーブルに正規化して保存します。DuckDBのカラムナ圧縮が効き、書き込みは
+    メッセージ単位の追記、読み込みは必要な範囲のみ（load_messages）で済みます。
+
 """
 
 import asyncio
@@ -18,32 +28,39 @@ import json
 import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
 import duckdb
 import pandas as pd
+from pydantic import TypeAdapter
 from pydantic_ai import ModelMessage
-from pydantic_core import to_jsonable_python
 
 from mixseek.agents.leader.models import MemberSubmissionsRecord
 from mixseek.storage import schema
+from mixseek.storage.duckdb_service import get_duckdb_service
+from mixseek.storage.exceptions import DatabaseReadError, DatabaseWriteError
+from mixseek.storage.ranking import LeaderBoardRanking
+from mixseek.storage.write_behind import WriteBehindQueue, WriteOperation, get_write_behind_queue
 
 # Pydantic AI Message型アダプター（遅延インポート回避）
 try:
     from pydantic_ai.messages import ModelMessagesTypeAdapter
 except ImportError:
-    from pydantic import TypeAdapter
-
     ModelMessagesTypeAdapter = TypeAdapter(list[ModelMessage])
 
+# round_messages 1行分のメッセージ型アダプター
+ModelMessageTypeAdapter: TypeAdapter[ModelMessage] = TypeAdapter(ModelMessage)
 
-class DatabaseWriteError(Exception):
-    """データベース書き込み失敗（3回リトライ後）"""
+# round_messages.source の値
+MESSAGE_SOURCE_LEADER = "leader"
+MESSAGE_SOURCE_MEMBER = "member"
 
-
-class DatabaseReadError(Exception):
-    """データベース読み込み失敗"""
+# member_submissions_recordのJSONから除外するフィールド（all_messagesはround_messagesに保存）
+_SUBMISSION_MESSAGES_EXCLUDE: dict[str, Any] = {
+    field: {"__all__": {"all_messages"}} for field in ("submissions", "successful_submissions", "failed_submissions")
+}
 
 
 class AggregationStore:
@@ -53,9 +70,19 @@ class AggregationStore:
     スレッドプールに退避して非同期実行を実現。
     スレッドローカルコネクションにより、各チームが独立した
     コネクションを使用してMVCC並列書き込みを実現。
+
+    write_behind=True の場合、upsertはwrite-behindキューでバッチ化されます。
+    読み込みメソッドは実行前に保留中の書き込みをコミットするため、
+    同一プロセス内では書き込み結果が常に読み込みに反映されます。
     """
 
-    def __init__(self, workspace: Path | None = None, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        workspace: Path | None = None,
+        db_path: Path | None = None,
+        write_behind: bool = False,
+        ranking: LeaderBoardRanking | None = None,
+    ) -> None:
         """初期化
 
         Args:
@@ -63,6 +90,10 @@ class AggregationStore:
                       Noneの場合はConfigurationManager経由で取得
             db_path: データベースファイルパス
                     Noneの場合は{workspace}/mixseek.dbを使用
+            write_behind: Trueの場合、upsertをwrite-behindキューでバッチ化
+                         （永続化にはflush()を呼び出す）
+            ranking: 実行単位のランキングキャッシュ。指定時はsave_to_leader_boardで増分更新し、
+                    同じexecution_idのget_leader_board_rankingはDBを参照せずに返す
 
         Raises:
             WorkspacePathNotSpecifiedError: workspace未指定かつConfigurationManagerで取得できない場合
@@ -74,6 +105,9 @@ class AggregationStore:
         # スレッドローカル変数（各スレッドが独立したコネクション保持）
         self._local = threading.local()
 
+        self.write_behind = write_behind
+        self.ranking = ranking
+
         # 初期化（テーブル作成）
         self._init_tables_sync()
 
@@ -105,13 +139,14 @@ class AggregationStore:
         """スレッドローカルコネクション取得
 
         各スレッドが独立したDuckDBコネクションを使用することで、
-        MVCC並列書き込みを実現。
+        MVCC並列書き込みを実現。コネクションはDuckDBServiceに登録され、
+        同一プロセス内の読み込み（UI）から共有されます。
 
         Returns:
             DuckDBコネクション
         """
         if not hasattr(self._local, "conn"):
-            self._local.conn = duckdb.connect(str(self.db_path))
+            self._local.conn = get_duckdb_service(self.db_path).connect_writer()
         return cast(duckdb.DuckDBPyConnection, self._local.conn)
 
     @contextmanager
@@ -135,10 +170,51 @@ class AggregationStore:
             conn.execute("ROLLBACK")
             raise
 
+    def _write_queue(self) -> WriteBehindQueue | None:
+        """write-behindキュー取得（write_behind=Falseの場合はNone）"""
+        if not self.write_behind:
+            return None
+        return get_write_behind_queue(self.db_path)
+
+    async def _enqueue_write(self, operation: WriteOperation, description: str) -> bool:
+        """write-behindキューに書き込みを追加
+
+        Args:
+            operation: トランザクション内で実行する書き込み関数
+            description: エラーメッセージ用の操作説明
+
+        Returns:
+            キューに追加した場合True（write_behind=Falseの場合False）
+        """
+        queue = self._write_queue()
+        if queue is None:
+            return False
+        await queue.enqueue(operation, description, owner=self)
+        return True
+
+    async def flush(self) -> None:
+        """保留中の書き込みをコミット（ラウンド/実行完了時の永続化）
+
+        write_behind=Falseの場合は何もしません。共有キュー上の他チーム
+        （他のAggregationStore）の書き込みエラーは送出しません。
+
+        Raises:
+            DatabaseWriteError: このストアがキューに追加した書き込みが失敗した場合
+        """
+        queue = self._write_queue()
+        if queue is not None:
+            await queue.flush(owner=self)
+
+    async def _flush_before_read(self) -> None:
+        """読み込み前に保留中の書き込みをコミット（書き込みエラーは次回flush()で報告）"""
+        queue = self._write_queue()
+        if queue is not None:
+            await queue.flush(raise_errors=False)
+
     def _init_tables_sync(self) -> None:
         """テーブル初期化（同期版）
 
-        round_history、leader_board、execution_summaryテーブルを作成。
+        round_history、leader_board、execution_summary、evaluation_resultsテーブルを作成。
         Orchestrator統合対応: execution_idカラム追加（025-mixseek-core-orchestration）
         """
         conn = self._get_connection()
@@ -157,7 +233,7 @@ class AggregationStore:
                 team_name TEXT NOT NULL,
                 round_number INTEGER NOT NULL,
 
-                -- Pydantic AI Message History（JSON型）
+                -- Pydantic AI Message History（JSON型、旧形式。現在はround_messagesに保存）
                 message_history JSON,
 
                 -- Member Agent応答記録（JSON型）
@@ -224,6 +300,43 @@ class AggregationStore:
             ON round_history(execution_id, team_id, round_number)
         """)
 
+        # round_messagesテーブル（Message Historyの1メッセージ1行の正規化テーブル）
+        # source: 'leader'（Leader Agent）または 'member'（submission_index番目のMember Agent）
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS round_messages (
+                execution_id TEXT NOT NULL,
+                team_id TEXT NOT NULL,
+                round_number INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                submission_index INTEGER NOT NULL,
+                message_index INTEGER NOT NULL,
+                message_kind TEXT NOT NULL,
+                message JSON NOT NULL,
+                PRIMARY KEY (execution_id, team_id, round_number, source, submission_index, message_index)
+            )
+        """)
+
+        # evaluation_resultsテーブル（mixseek evaluate --input の一括評価結果）
+        # input_idは入力JSONLのid（既定はline-<n>）のため、(クエリ, Submission)のハッシュと組で一意とする
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS evaluation_results (
+                input_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                execution_id TEXT,
+                team_id TEXT,
+                round_number INTEGER,
+                user_query TEXT NOT NULL,
+                submission TEXT NOT NULL,
+                overall_score DOUBLE,
+                metrics JSON,
+                error TEXT,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                evaluated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (input_id, content_hash)
+            )
+        """)
+
         conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_leader_board_execution
             ON leader_board(execution_id)
@@ -254,29 +367,90 @@ class AggregationStore:
         """
         conn = self._get_connection()
 
-        # Pydantic AI → JSON変換
-        messages_dict = to_jsonable_python(message_history)
-        aggregated_dict = aggregated.model_dump(mode="json")
-
         with self._transaction(conn):
-            conn.execute(
-                """
-                INSERT INTO round_history
-                (execution_id, team_id, team_name, round_number, message_history, member_submissions_record)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
-                    message_history = EXCLUDED.message_history,
-                    member_submissions_record = EXCLUDED.member_submissions_record
-            """,
+            self._upsert_round_history(conn, execution_id, aggregated, message_history)
+
+    def _upsert_round_history(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        execution_id: str,
+        aggregated: MemberSubmissionsRecord,
+        message_history: list[ModelMessage],
+    ) -> None:
+        """round_historyへのupsert（トランザクション内で実行）
+
+        Member Agentのall_messagesを除いた集約結果をround_historyに、
+        Message Historyをround_messagesに保存します。
+        """
+        aggregated_json = aggregated.model_dump_json(exclude=_SUBMISSION_MESSAGES_EXCLUDE)
+
+        conn.execute(
+            """
+            INSERT INTO round_history
+            (execution_id, team_id, team_name, round_number, message_history, member_submissions_record)
+            VALUES (?, ?, ?, ?, NULL, ?)
+            ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
+                message_history = NULL,
+                member_submissions_record = EXCLUDED.member_submissions_record
+        """,
+            [
+                execution_id,
+                aggregated.team_id,
+                aggregated.team_name,
+                aggregated.round_number,
+                aggregated_json,
+            ],
+        )
+
+        key = (execution_id, aggregated.team_id, aggregated.round_number)
+        self._append_messages(conn, key, MESSAGE_SOURCE_LEADER, 0, message_history)
+        for index, submission in enumerate(aggregated.submissions):
+            self._append_messages(conn, key, MESSAGE_SOURCE_MEMBER, index, submission.all_messages or [])
+
+    @staticmethod
+    def _append_messages(
+        conn: duckdb.DuckDBPyConnection,
+        key: tuple[str, str, int],
+        source: str,
+        submission_index: int,
+        messages: list[ModelMessage],
+    ) -> None:
+        """round_messagesへメッセージを追記（トランザクション内で実行）
+
+        同一ラウンドの再保存時は既存メッセージを上書きし、
+        新しい履歴より後ろの古いメッセージを削除します。
+        """
+        conn.execute(
+            """
+            DELETE FROM round_messages
+            WHERE execution_id = ? AND team_id = ? AND round_number = ?
+              AND source = ? AND submission_index = ? AND message_index >= ?
+        """,
+            [*key, source, submission_index, len(messages)],
+        )
+        if not messages:
+            return
+
+        conn.executemany(
+            """
+            INSERT INTO round_messages
+            (execution_id, team_id, round_number, source, submission_index, message_index, message_kind, message)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (execution_id, team_id, round_number, source, submission_index, message_index)
+            DO UPDATE SET message_kind = EXCLUDED.message_kind, message = EXCLUDED.message
+        """,
+            [
                 [
-                    execution_id,
-                    aggregated.team_id,
-                    aggregated.team_name,
-                    aggregated.round_number,
-                    json.dumps(messages_dict, ensure_ascii=False),
-                    json.dumps(aggregated_dict, ensure_ascii=False),
-                ],
-            )
+                    *key,
+                    source,
+                    submission_index,
+                    message_index,
+                    message.kind,
+                    ModelMessageTypeAdapter.dump_json(message).decode(),
+                ]
+                for message_index, message in enumerate(messages)
+            ],
+        )
 
     async def save_aggregation(
         self, execution_id: str, aggregated: MemberSubmissionsRecord, message_history: list[ModelMessage]
@@ -295,6 +469,16 @@ class AggregationStore:
         Raises:
             DatabaseWriteError: 書き込み失敗（3回リトライ後）
         """
+        # write-behind: キューに追加して即座に返る（コミットはflush間隔ごと）
+        operation = partial(
+            self._upsert_round_history,
+            execution_id=execution_id,
+            aggregated=aggregated,
+            message_history=message_history,
+        )
+        if await self._enqueue_write(operation, "save aggregation"):
+            return
+
         # エクスポネンシャルバックオフリトライ
         delays = [1, 2, 4]
 
@@ -308,7 +492,7 @@ class AggregationStore:
                 await asyncio.sleep(delay)
 
     def _load_round_history_sync(
-        self, execution_id: str, team_id: str, round_number: int
+        self, execution_id: str, team_id: str, round_number: int, include_messages: bool = True
     ) -> tuple[MemberSubmissionsRecord | None, list[ModelMessage]]:
         """ラウンド履歴を読み込み（同期版）
 
@@ -316,6 +500,7 @@ class AggregationStore:
             execution_id: 実行識別子(UUID)
             team_id: チームID
             round_number: ラウンド番号
+            include_messages: Falseの場合、Message Historyを読み込まない
 
         Returns:
             (集約結果, Message History)のタプル
@@ -339,14 +524,44 @@ class AggregationStore:
         if result[0]:
             aggregated = MemberSubmissionsRecord.model_validate_json(result[0])
 
-        messages: list[ModelMessage] = []
+        if not include_messages:
+            if aggregated is not None:
+                for submission in aggregated.submissions:
+                    submission.all_messages = None
+            return aggregated, []
+
+        # 旧形式（round_history.message_historyのJSON）で保存されたレコード
         if result[1]:
-            messages = ModelMessagesTypeAdapter.validate_json(result[1])
+            return aggregated, ModelMessagesTypeAdapter.validate_json(result[1])
+
+        rows = conn.execute(
+            """
+            SELECT source, submission_index, message
+            FROM round_messages
+            WHERE execution_id = ? AND team_id = ? AND round_number = ?
+            ORDER BY source, submission_index, message_index
+        """,
+            [execution_id, team_id, round_number],
+        ).fetchall()
+
+        messages: list[ModelMessage] = []
+        member_messages: dict[int, list[ModelMessage]] = {}
+        for source, submission_index, message_json in rows:
+            message = ModelMessageTypeAdapter.validate_json(message_json)
+            if source == MESSAGE_SOURCE_LEADER:
+                messages.append(message)
+            else:
+                member_messages.setdefault(submission_index, []).append(message)
+
+        if aggregated is not None:
+            for index, submission_messages in member_messages.items():
+                if index < len(aggregated.submissions):
+                    aggregated.submissions[index].all_messages = submission_messages
 
         return aggregated, messages
 
     async def load_round_history(
-        self, execution_id: str, team_id: str, round_number: int
+        self, execution_id: str, team_id: str, round_number: int, include_messages: bool = True
     ) -> tuple[MemberSubmissionsRecord | None, list[ModelMessage]]:
         """ラウンド履歴を読み込み
 
@@ -354,6 +569,8 @@ class AggregationStore:
             execution_id: 実行識別子(UUID)
             team_id: チームID
             round_number: ラウンド番号
+            include_messages: Falseの場合、Message History（Leader AgentおよびMember Agentの
+                             all_messages）を読み込まない。必要なメッセージはload_messages()で取得
 
         Returns:
             (集約結果, Message History)のタプル
@@ -362,11 +579,76 @@ class AggregationStore:
         Raises:
             DatabaseReadError: 読み込み失敗
         """
+        await self._flush_before_read()
         try:
-            return await asyncio.to_thread(self._load_round_history_sync, execution_id, team_id, round_number)
+            return await asyncio.to_thread(
+                self._load_round_history_sync, execution_id, team_id, round_number, include_messages
+            )
         except Exception as e:
             raise DatabaseReadError(f"Failed to load round history: {e}") from e
 
+    def _load_messages_sync(
+        self,
+        execution_id: str,
+        team_id: str,
+        round_number: int,
+        source: str,
+        submission_index: int,
+        start: int,
+        limit: int | None,
+    ) -> list[ModelMessage]:
+        """round_messagesからメッセージを範囲読み込み（同期版）"""
+        conn = self._get_connection()
+
+        rows = conn.execute(
+            """
+            SELECT message
+            FROM round_messages
+            WHERE execution_id = ? AND team_id = ? AND round_number = ?
+              AND source = ? AND submission_index = ? AND message_index >= ?
+            ORDER BY message_index
+            LIMIT ?
+        """,
+            [execution_id, team_id, round_number, source, submission_index, start, limit],
+        ).fetchall()
+
+        return [ModelMessageTypeAdapter.validate_json(row[0]) for row in rows]
+
+    async def load_messages(
+        self,
+        execution_id: str,
+        team_id: str,
+        round_number: int,
+        source: str = MESSAGE_SOURCE_LEADER,
+        submission_index: int = 0,
+        start: int = 0,
+        limit: int | None = None,
+    ) -> list[ModelMessage]:
+        """Message Historyの一部を読み込み
+
+        Args:
+            execution_id: 実行識別子(UUID)
+            team_id: チームID
+            round_number: ラウンド番号
+            source: "leader"（Leader Agent）または "member"（Member Agent）
+            submission_index: sourceが"member"の場合のサブミッション番号
+            start: 読み込み開始メッセージ番号（0始まり）
+            limit: 最大読み込み件数（Noneの場合は末尾まで）
+
+        Returns:
+            メッセージリスト（message_index順）
+
+        Raises:
+            DatabaseReadError: 読み込み失敗
+        """
+        await self._flush_before_read()
+        try:
+            return await asyncio.to_thread(
+                self._load_messages_sync, execution_id, team_id, round_number, source, submission_index, start, limit
+            )
+        except Exception as e:
+            raise DatabaseReadError(f"Failed to load messages: {e}") from e
+
     def _get_leader_board_sync(self, limit: int) -> pd.DataFrame:
         """Leader Board取得（同期版）
 
@@ -409,6 +691,7 @@ class AggregationStore:
         Raises:
             DatabaseReadError: 読み込み失敗
         """
+        await self._flush_before_read()
         try:
             return await asyncio.to_thread(self._get_leader_board_sync, limit)
         except Exception as e:
@@ -477,6 +760,7 @@ class AggregationStore:
         Raises:
             DatabaseReadError: 読み込み失敗
         """
+        await self._flush_before_read()
         try:
             return await asyncio.to_thread(self._get_team_statistics_sync, team_id)
         except Exception as e:
@@ -563,6 +847,9 @@ class AggregationStore:
         Raises:
             DatabaseWriteError: 書き込み失敗（3回リトライ後）
         """
+        # 実行完了時: 保留中のチーム書き込みを先にコミット（他チームの書き込みエラーは送出しない）
+        await self.flush()
+
         # エクスポネンシャルバックオフリトライ
         delays = [1, 2, 4]
 
@@ -588,6 +875,130 @@ class AggregationStore:
                     raise DatabaseWriteError(f"Failed to save execution summary after {attempt} retries: {e}") from e
                 await asyncio.sleep(delay)
 
+    def _save_evaluation_result_sync(
+        self,
+        input_id: str,
+        content_hash: str,
+        user_query: str,
+        submission: str,
+        execution_id: str | None,
+        team_id: str | None,
+        round_number: int | None,
+        overall_score: float | None,
+        metrics: list[dict[str, Any]] | None,
+        error: str | None,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> None:
+        """一括評価結果保存（同期版、同じ(input_id, content_hash)は上書き）"""
+        conn = self._get_connection()
+
+        with self._transaction(conn):
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO evaluation_results
+                (input_id, content_hash, execution_id, team_id, round_number, user_query, submission,
+                 overall_score, metrics, error, input_tokens, output_tokens, evaluated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+                [
+                    input_id,
+                    content_hash,
+                    execution_id,
+                    team_id,
+                    round_number,
+                    user_query,
+                    submission,
+                    overall_score,
+                    json.dumps(metrics, ensure_ascii=False) if metrics is not None else None,
+                    error,
+                    input_tokens,
+                    output_tokens,
+                ],
+            )
+
+    async def save_evaluation_result(
+        self,
+        input_id: str,
+        content_hash: str,
+        user_query: str,
+        submission: str,
+        execution_id: str | None = None,
+        team_id: str | None = None,
+        round_number: int | None = None,
+        overall_score: float | None = None,
+        metrics: list[dict[str, Any]] | None = None,
+        error: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """一括評価結果保存（非同期版、mixseek evaluate --input）
+
+        同じ(input_id, content_hash)の既存行は上書きされます（失敗した評価の再実行用）。
+        idが同じでも内容の異なるペア（別ファイルのline-<n>など）は別の行として保存されます。
+
+        Args:
+            input_id: 入力JSONLのid
+            content_hash: (ユーザクエリ, Submission)のハッシュ
+            user_query: ユーザクエリ
+            submission: 評価対象のSubmission
+            execution_id: 実行識別子（リーダーボード再評価時）
+            team_id: チームID
+            round_number: ラウンド番号
+            overall_score: 総合スコア（失敗時はNone）
+            metrics: メトリクススコアのリスト（失敗時はNone）
+            error: エラーメッセージ（成功時はNone）
+            input_tokens: 評価LLM呼び出しの入力トークン数
+            output_tokens: 評価LLM呼び出しの出力トークン数
+
+        Raises:
+            DatabaseWriteError: 書き込み失敗（3回リトライ後）
+        """
+        delays = [1, 2, 4]
+
+        for attempt, delay in enumerate(delays, 1):
+            try:
+                await asyncio.to_thread(
+                    self._save_evaluation_result_sync,
+                    input_id,
+                    content_hash,
+                    user_query,
+                    submission,
+                    execution_id,
+                    team_id,
+                    round_number,
+                    overall_score,
+                    metrics,
+                    error,
+                    input_tokens,
+                    output_tokens,
+                )
+                return
+            except Exception as e:
+                if attempt == len(delays):
+                    raise DatabaseWriteError(f"Failed to save evaluation result after {attempt} retries: {e}") from e
+                await asyncio.sleep(delay)
+
+    def _get_evaluated_input_keys_sync(self) -> set[tuple[str, str]]:
+        """評価済み(input_id, content_hash)取得（同期版）"""
+        conn = self._get_connection()
+        rows = conn.execute("SELECT input_id, content_hash FROM evaluation_results WHERE error IS NULL").fetchall()
+        return {(row[0], row[1]) for row in rows}
+
+    async def get_evaluated_input_keys(self) -> set[tuple[str, str]]:
+        """評価に成功した(input_id, content_hash)の集合を取得（一括評価の再開用）
+
+        Returns:
+            エラーなしで保存済みの(input_id, content_hash)の集合
+
+        Raises:
+            DatabaseReadError: 読み込み失敗
+        """
+        try:
+            return await asyncio.to_thread(self._get_evaluated_input_keys_sync)
+        except Exception as e:
+            raise DatabaseReadError(f"Failed to get evaluated input keys: {e}") from e
+
     def initialize_schema(self) -> None:
         """Initialize Round Controller DuckDB schema (Feature 037)
 
@@ -631,44 +1042,79 @@ class AggregationStore:
         Raises:
             ValueError: Invalid parameters
         """
-        # Validate confidence_score if provided
-        if confidence_score is not None and not (0.0 <= confidence_score <= 1.0):
-            raise ValueError(f"confidence_score must be between 0.0 and 1.0, got {confidence_score}")
+        self._validate_confidence_score(confidence_score)
 
         conn = self._get_connection()
 
+        with self._transaction(conn):
+            self._upsert_round_status(
+                conn,
+                execution_id,
+                team_id,
+                team_name,
+                round_number,
+                should_continue,
+                reasoning,
+                confidence_score,
+                round_started_at,
+                round_ended_at,
+            )
+
+    @staticmethod
+    def _validate_confidence_score(confidence_score: float | None) -> None:
+        """Validate confidence_score if provided
+
+        Raises:
+            ValueError: confidence_score is out of range
+        """
+        if confidence_score is not None and not (0.0 <= confidence_score <= 1.0):
+            raise ValueError(f"confidence_score must be between 0.0 and 1.0, got {confidence_score}")
+
+    def _upsert_round_status(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        execution_id: str,
+        team_id: str,
+        team_name: str,
+        round_number: int,
+        should_continue: bool | None,
+        reasoning: str | None,
+        confidence_score: float | None,
+        round_started_at: str,
+        round_ended_at: str,
+    ) -> None:
+        """Upsert round_status row (executed inside a transaction)"""
         # Get current timestamp for updated_at
         from datetime import UTC, datetime
 
         updated_at = datetime.now(UTC).isoformat()
 
-        with self._transaction(conn):
-            conn.execute(
-                """
-                INSERT INTO round_status
-                (execution_id, team_id, team_name, round_number, should_continue,
-                 reasoning, confidence_score, round_started_at, round_ended_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
-                    should_continue = EXCLUDED.should_continue,
-                    reasoning = EXCLUDED.reasoning,
-                    confidence_score = EXCLUDED.confidence_score,
-                    round_ended_at = EXCLUDED.round_ended_at,
-                    updated_at = EXCLUDED.updated_at
-            """,
-                [
-                    execution_id,
-                    team_id,
-                    team_name,
-                    round_number,
-                    should_continue,
-                    reasoning,
-                    confidence_score,
-                    round_started_at,
-                    round_ended_at,
-                    updated_at,
-                ],
-            )
+        conn.execute(
+            """
+            INSERT INTO round_status
+            (execution_id, team_id, team_name, round_number, should_continue,
+             reasoning, confidence_score, round_started_at, round_ended_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
+                should_continue = EXCLUDED.should_continue,
+                reasoning = EXCLUDED.reasoning,
+                confidence_score = EXCLUDED.confidence_score,
+                round_ended_at = EXCLUDED.round_ended_at,
+                updated_at = EXCLUDED.updated_at
+        """,
+            [
+                execution_id,
+                team_id,
+                team_name,
+                round_number,
+                should_continue,
+                reasoning,
+                confidence_score,
+                round_started_at,
+                round_ended_at,
+                updated_at,
+            ],
+        )
 
     async def save_round_status(
         self,
@@ -697,7 +1143,25 @@ class AggregationStore:
 
         Raises:
             DatabaseWriteError: Write failed after 3 retries
+            ValueError: Invalid parameters
         """
+        # write-behind: validate now, commit on the next flush
+        self._validate_confidence_score(confidence_score)
+        operation = partial(
+            self._upsert_round_status,
+            execution_id=execution_id,
+            team_id=team_id,
+            team_name=team_name,
+            round_number=round_number,
+            should_continue=should_continue,
+            reasoning=reasoning,
+            confidence_score=confidence_score,
+            round_started_at=round_started_at,
+            round_ended_at=round_ended_at,
+        )
+        if await self._enqueue_write(operation, "save round status"):
+            return
+
         delays = [1, 2, 4]
 
         for attempt, delay in enumerate(delays, 1):
@@ -757,40 +1221,69 @@ class AggregationStore:
         """
         conn = self._get_connection()
 
+        with self._transaction(conn):
+            self._upsert_leader_board(
+                conn,
+                execution_id,
+                team_id,
+                team_name,
+                round_number,
+                submission_content,
+                submission_format,
+                score,
+                score_details,
+                final_submission,
+                exit_reason,
+            )
+
+    def _upsert_leader_board(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        execution_id: str,
+        team_id: str,
+        team_name: str,
+        round_number: int,
+        submission_content: str,
+        submission_format: str,
+        score: float,
+        score_details: dict[str, Any],
+        final_submission: bool,
+        exit_reason: str | None,
+    ) -> None:
+        """Upsert leader_board row (executed inside a transaction)"""
         # Get current timestamp for updated_at
         from datetime import UTC, datetime
 
         updated_at = datetime.now(UTC).isoformat()
 
-        with self._transaction(conn):
-            conn.execute(
-                """
-                INSERT INTO leader_board
-                (execution_id, team_id, team_name, round_number, submission_content,
-                 submission_format, score, score_details, final_submission, exit_reason, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
-                    submission_content = EXCLUDED.submission_content,
-                    score = EXCLUDED.score,
-                    score_details = EXCLUDED.score_details,
-                    final_submission = EXCLUDED.final_submission,
-                    exit_reason = EXCLUDED.exit_reason,
-                    updated_at = EXCLUDED.updated_at
-            """,
-                [
-                    execution_id,
-                    team_id,
-                    team_name,
-                    round_number,
-                    submission_content,
-                    submission_format,
-                    score,
-                    json.dumps(score_details, ensure_ascii=False),
-                    final_submission,
-                    exit_reason,
-                    updated_at,
-                ],
-            )
+        conn.execute(
+            """
+            INSERT INTO leader_board
+            (execution_id, team_id, team_name, round_number, submission_content,
+             submission_format, score, score_details, final_submission, exit_reason, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (execution_id, team_id, round_number) DO UPDATE SET
+                submission_content = EXCLUDED.submission_content,
+                score = EXCLUDED.score,
+                score_details = EXCLUDED.score_details,
+                final_submission = EXCLUDED.final_submission,
+                exit_reason = EXCLUDED.exit_reason,
+                updated_at = EXCLUDED.updated_at
+        """,
+            [
+                execution_id,
+                team_id,
+                team_name,
+                round_number,
+                submission_content,
+                submission_format,
+                score,
+                json.dumps(score_details, ensure_ascii=False),
+                final_submission,
+                exit_reason,
+                updated_at,
+            ],
+        )
 
     async def save_to_leader_board(
         self,
@@ -824,6 +1317,24 @@ class AggregationStore:
         Raises:
             DatabaseWriteError: Write failed after 3 retries
         """
+        # write-behind: commit on the next flush
+        operation = partial(
+            self._upsert_leader_board,
+            execution_id=execution_id,
+            team_id=team_id,
+            team_name=team_name,
+            round_number=round_number,
+            submission_content=submission_content,
+            submission_format=submission_format,
+            score=score,
+            score_details=score_details,
+            final_submission=final_submission,
+            exit_reason=exit_reason,
+        )
+        if await self._enqueue_write(operation, "save to leader board"):
+            self._record_ranking(execution_id, team_id, team_name, round_number, score)
+            return
+
         delays = [1, 2, 4]
 
         for attempt, delay in enumerate(delays, 1):
@@ -841,6 +1352,7 @@ class AggregationStore:
                     final_submission,
                     exit_reason,
                 )
+                self._record_ranking(execution_id, team_id, team_name, round_number, score)
                 return
             except ValueError:
                 # ValidationError は即座に再発生
@@ -850,6 +1362,13 @@ class AggregationStore:
                     raise DatabaseWriteError(f"Failed to save to leader board after {attempt} retries: {e}") from e
                 await asyncio.sleep(delay)
 
+    def _record_ranking(
+        self, execution_id: str, team_id: str, team_name: str, round_number: int, score: float
+    ) -> None:
+        """Apply a leader_board save to the shared ranking cache (if it tracks this execution)"""
+        if self.ranking is not None and self.ranking.execution_id == execution_id:
+            self.ranking.record(team_id, team_name, round_number, score)
+
     def _get_leader_board_ranking_sync(self, execution_id: str) -> list[dict[str, Any]]:
         """Get leader board ranking for all teams (synchronous version)
 
@@ -891,6 +1410,8 @@ class AggregationStore:
         """Get leader board ranking for all teams (asynchronous version)
 
         Feature 037: Get max score for each team to display in next round prompt.
+        When a LeaderBoardRanking for this execution is attached, the ranking is
+        served from memory without querying leader_board.
 
         Args:
             execution_id: Execution identifier (UUID)
@@ -901,7 +1422,42 @@ class AggregationStore:
         Raises:
             DatabaseReadError: Read failed
         """
+        ranking = self.ranking
+        if ranking is not None and ranking.execution_id == execution_id:
+            if not ranking.loaded:
+                # Seed once from rows saved before the cache was attached (e.g. resumed execution)
+                await self._flush_before_read()
+                try:
+                    rows = await asyncio.to_thread(self._get_leader_board_scores_sync, execution_id)
+                except Exception as e:
+                    raise DatabaseReadError(f"Failed to get leader board ranking: {e}") from e
+                ranking.load(rows)
+            return ranking.ranking()
+
+        await self._flush_before_read()
         try:
             return await asyncio.to_thread(self._get_leader_board_ranking_sync, execution_id)
         except Exception as e:
             raise DatabaseReadError(f"Failed to get leader board ranking: {e}") from e
+
+    def _get_leader_board_scores_sync(self, execution_id: str) -> list[tuple[str, str, int, float]]:
+        """Get per-round scores of an execution to seed a LeaderBoardRanking (synchronous version)
+
+        Args:
+            execution_id: Execution identifier (UUID)
+
+        Returns:
+            List of (team_id, team_name, round_number, score)
+        """
+        conn = self._get_connection()
+
+        result = conn.execute(
+            """
+            SELECT team_id, team_name, round_number, score
+            FROM leader_board
+            WHERE execution_id = ?
+        """,
+            [execution_id],
+        ).fetchall()
+
+        return [(row[0], row[1], int(row[2]), float(row[3])) for row in result]
@@ -0,0 +1,155 @@
+"""単一ライターのDuckDB接続サービス
+
+DuckDBは1つのDBファイルに対して、読み書き接続を持つプロセスを1つしか許可しません。
+また同一プロセス内でも、読み書き接続と読み取り専用接続（``read_only=True``）を
+同時に開くことはできません（"different configuration" エラー）。
+
+このため、Streamlit UIのように同一プロセス内でOrchestratorを実行しながら
+読み取り専用接続を都度開くと、実行中は接続に失敗して空の結果しか表示できません。
+
+DuckDBServiceはDBファイルごとにプロセス内の接続を一元管理します。
+
+- 書き込み側（AggregationStore、write-behindキュー）は ``connect_writer()`` で接続を作成・登録
+- 読み込み側は ``read()`` / ``connect_reader()`` で接続を取得
+  - プロセス内にライターがある場合: ライター接続の ``cursor()``（MVCCスナップショット、
+    ロック競合や接続コストなし）
+  - ライターがない場合: 従来通りの読み取り専用接続
+
+ライター接続は弱参照で保持するため、AggregationStoreの破棄とともにファイルロックは解放されます。
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# 読み取り専用接続との構成競合時のライター接続リトライ間隔（秒）
+WRITER_CONNECT_RETRY_DELAYS: tuple[float, ...] = (0.05, 0.1, 0.2, 0.4, 0.8)
+
+
+class DuckDBService:
+    """DBファイルごとのプロセス内DuckDB接続サービス"""
+
+    def __init__(self, db_path: Path) -> None:
+        """初期化
+
+        Args:
+            db_path: データベースファイルパス
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._writers: weakref.WeakSet[duckdb.DuckDBPyConnection] = weakref.WeakSet()
+
+    @property
+    def has_writer(self) -> bool:
+        """プロセス内に書き込み接続が存在するか"""
+        with self._lock:
+            return len(self._writers) > 0
+
+    def connect_writer(self) -> duckdb.DuckDBPyConnection:
+        """書き込み用接続を作成し、読み込み側から共有できるよう登録
+
+        同一プロセス内で読み取り専用接続が開かれている間は接続できないため、
+        構成競合（ConnectionException）の場合は短い間隔でリトライします。
+
+        Returns:
+            読み書き可能なDuckDBコネクション
+
+        Raises:
+            duckdb.Error: 接続に失敗した場合
+        """
+        for attempt in range(len(WRITER_CONNECT_RETRY_DELAYS) + 1):
+            try:
+                conn = duckdb.connect(str(self.db_path))
+                break
+            except duckdb.ConnectionException:
+                if attempt == len(WRITER_CONNECT_RETRY_DELAYS):
+                    raise
+                time.sleep(WRITER_CONNECT_RETRY_DELAYS[attempt])
+
+        with self._lock:
+            self._writers.add(conn)
+        return conn
+
+    def connect_reader(self) -> duckdb.DuckDBPyConnection:
+        """読み込み用接続を取得
+
+        プロセス内にライターがある場合はそのcursorを返し、実行中の書き込みと
+        並行してコミット済みデータを参照できます。
+
+        Returns:
+            DuckDBコネクション（使用後に必ずclose()すること）
+
+        Raises:
+            duckdb.Error: 接続に失敗した場合（別プロセスが書き込み中など）
+        """
+        cursor = self._writer_cursor()
+        if cursor is not None:
+            return cursor
+
+        try:
+            return duckdb.connect(str(self.db_path), read_only=True)
+        except duckdb.ConnectionException:
+            # 確認後にプロセス内でライターが接続した場合
+            cursor = self._writer_cursor()
+            if cursor is None:
+                raise
+            return cursor
+
+    @contextmanager
+    def read(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """読み込み用接続のコンテキストマネージャー
+
+        Yields:
+            DuckDBコネクション（終了時にclose）
+
+        Raises:
+            duckdb.Error: 接続に失敗した場合
+        """
+        conn = self.connect_reader()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _writer_cursor(self) -> duckdb.DuckDBPyConnection | None:
+        with self._lock:
+            writers = list(self._writers)
+
+        for writer in writers:
+            try:
+                return writer.cursor()
+            except duckdb.Error:
+                # close済みのライター接続は除外
+                with self._lock:
+                    self._writers.discard(writer)
+        return None
+
+
+_services: dict[Path, DuckDBService] = {}
+_services_lock = threading.Lock()
+
+
+def get_duckdb_service(db_path: Path) -> DuckDBService:
+    """DBファイルに対応するプロセス内共有サービスを取得
+
+    Args:
+        db_path: データベースファイルパス
+
+    Returns:
+        共有DuckDBService
+    """
+    key = db_path.resolve()
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = DuckDBService(key)
+            _services[key] = service
+        return service
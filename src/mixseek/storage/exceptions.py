@@ -0,0 +1,9 @@
+"""ストレージ層の例外"""
+
+
+class DatabaseWriteError(Exception):
+    """データベース書き込み失敗（3回リトライ後）"""
+
+
+class DatabaseReadError(Exception):
+    """データベース読み込み失敗"""
@@ -0,0 +1,100 @@
+"""実行単位のリーダーボードランキングキャッシュ
+
+UserPromptBuilderは2ラウンド目以降、各チームのプロンプトと改善見込み判定の
+プロンプトを生成するたびにランキング（チームごとの最高スコア）を参照します。
+AggregationStore.get_leader_board_ranking はそのたびに leader_board 全体を
+GROUP BY していました。
+
+LeaderBoardRankingは1実行分のランキングをメモリ上に保持し、
+save_to_leader_board のたびに増分更新します。Orchestratorが実行ごとに1つ作成し、
+全RoundController（のAggregationStore）で共有します。
+
+- 参照: DBアクセスなし、O(チーム数 log チーム数)
+- 更新: O(1)（同一ラウンドのスコアが下がる上書き時のみ O(ラウンド数)）
+- 初回参照時に一度だけDBの既存レコードを読み込み（再開された実行への対応）
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class _TeamScores:
+    team_name: str
+    round_scores: dict[int, float] = field(default_factory=dict)
+    max_score: float = float("-inf")
+
+    def record(self, round_number: int, score: float) -> None:
+        previous = self.round_scores.get(round_number)
+        self.round_scores[round_number] = score
+        if score >= self.max_score:
+            self.max_score = score
+        elif previous is not None and previous >= self.max_score:
+            # 最高スコアのラウンドが低いスコアで上書きされた場合のみ再計算
+            self.max_score = max(self.round_scores.values())
+
+
+class LeaderBoardRanking:
+    """1実行分のリーダーボードランキング（増分更新）"""
+
+    def __init__(self, execution_id: str) -> None:
+        """初期化
+
+        Args:
+            execution_id: 対象の実行識別子(UUID)
+        """
+        self.execution_id = execution_id
+        self.loaded = False
+        self._teams: dict[str, _TeamScores] = {}
+
+    def record(self, team_id: str, team_name: str, round_number: int, score: float) -> None:
+        """leader_boardへの保存をランキングに反映
+
+        同一(team_id, round_number)への再保存はleader_boardのupsertと同様に上書きします。
+
+        Args:
+            team_id: チームID
+            team_name: チーム名
+            round_number: ラウンド番号
+            score: 評価スコア
+        """
+        team = self._teams.get(team_id)
+        if team is None:
+            team = self._teams[team_id] = _TeamScores(team_name=team_name)
+        team.team_name = team_name
+        team.record(round_number, score)
+
+    def load(self, rows: list[tuple[str, str, int, float]]) -> None:
+        """DBの既存レコードでランキングを初期化
+
+        読み込み中にrecord()で反映された（より新しい）スコアは上書きしません。
+
+        Args:
+            rows: (team_id, team_name, round_number, score)のリスト
+        """
+        for team_id, team_name, round_number, score in rows:
+            team = self._teams.get(team_id)
+            if team is not None and round_number in team.round_scores:
+                continue
+            if team is None:
+                team = self._teams[team_id] = _TeamScores(team_name=team_name)
+            team.record(round_number, float(score))
+        self.loaded = True
+
+    def ranking(self) -> list[dict[str, Any]]:
+        """チームごとの最高スコアによるランキング
+
+        Returns:
+            AggregationStore.get_leader_board_ranking と同形式のリスト
+            （max_score降順、同点はteam_id昇順）
+        """
+        ordered = sorted(self._teams.items(), key=lambda item: (-item[1].max_score, item[0]))
+        return [
+            {
+                "team_id": team_id,
+                "team_name": team.team_name,
+                "max_score": team.max_score,
+                "total_rounds": len(team.round_scores),
+            }
+            for team_id, team in ordered
+        ]
@@ -0,0 +1,253 @@
+"""DuckDB書き込みのwrite-behindキュー
+
+複数チームが同時実行されると、各ラウンドの保存処理（round_history、
+leader_board、round_status）がそれぞれ独立したトランザクションとなり、
+単一のDuckDBファイルへの書き込みが直列化されます。
+
+WriteBehindQueueは同一DBファイルへの書き込みをプロセス内（イベントループ単位）で
+1つのキューに集約し、flush間隔ごとに保留中の全upsertを1トランザクションで
+コミットします。
+
+- 書き込み順序はenqueue順に保持（upsertの結果は逐次実行と同一）
+- ``flush()`` で保留中の書き込みのコミットを待機（ラウンド/実行完了時の永続化）
+- 保留数が ``max_pending`` に達するとenqueueは空きが出るまで待機（バックプレッシャー）
+- バッチ全体が失敗した場合は操作ごとに個別コミットし、失敗した操作のみを
+  ``DatabaseWriteError`` として次の ``flush()`` で報告（``owner`` を指定した
+  ``flush()`` は同じ ``owner`` でenqueueされた操作のエラーのみを報告）
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+import duckdb
+
+from mixseek.storage.duckdb_service import get_duckdb_service
+from mixseek.storage.exceptions import DatabaseWriteError
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Callable[[duckdb.DuckDBPyConnection], None]
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.2
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_RETRY_DELAYS: tuple[float, ...] = (1, 2, 4)
+
+
+@dataclass
+class _PendingWrite:
+    seq: int
+    operation: WriteOperation
+    description: str
+    owner: Any = None
+
+
+@dataclass
+class WriteBehindStats:
+    """WriteBehindQueueの統計情報"""
+
+    operations: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    failed_operations: int = 0
+    backpressure_waits: int = 0
+
+
+class WriteBehindQueue:
+    """同一DuckDBファイルへの書き込みをバッチ化するwrite-behindキュー"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        retry_delays: Sequence[float] = DEFAULT_RETRY_DELAYS,
+    ) -> None:
+        """初期化
+
+        Args:
+            db_path: データベースファイルパス
+            flush_interval_seconds: 最初の保留書き込みからコミットまでの最大待機時間（秒）
+            max_pending: 保留可能な書き込み数の上限（超過時はenqueueが待機）
+            retry_delays: バッチコミット失敗時のリトライ間隔（秒）
+        """
+        self.db_path = db_path
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.retry_delays = tuple(retry_delays)
+        self.stats = WriteBehindStats()
+
+        self._pending: list[_PendingWrite] = []
+        self._enqueued_seq = 0
+        self._processed_seq = 0
+        self._errors: list[tuple[Any, DatabaseWriteError]] = []
+        self._flush_requested = asyncio.Event()
+        self._progress = asyncio.Condition()
+        self._worker: asyncio.Task[None] | None = None
+        self._local = threading.local()
+
+    @property
+    def pending_count(self) -> int:
+        """コミット待ちの書き込み数"""
+        return self._enqueued_seq - self._processed_seq
+
+    async def enqueue(self, operation: WriteOperation, description: str, owner: Any = None) -> None:
+        """書き込み操作をキューに追加
+
+        Args:
+            operation: トランザクション内で実行する書き込み関数（DuckDBコネクションを受け取る）
+            description: エラーメッセージ用の操作説明
+            owner: 操作の所有者（エラーの報告先。``flush(owner=...)`` で同一オブジェクトを指定）
+        """
+        if len(self._pending) >= self.max_pending:
+            self.stats.backpressure_waits += 1
+            self._flush_requested.set()
+            async with self._progress:
+                await self._progress.wait_for(lambda: len(self._pending) < self.max_pending)
+
+        self._enqueued_seq += 1
+        self._pending.append(_PendingWrite(self._enqueued_seq, operation, description, owner))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def flush(self, raise_errors: bool = True, owner: Any = None) -> None:
+        """呼び出し時点までに追加された書き込みのコミットを待機
+
+        キューは複数の所有者（チームごとのAggregationStore）で共有されるため、
+        コミットは全所有者の書き込みを待ちますが、送出するエラーは ``owner`` の
+        操作のものに限られます。
+
+        Args:
+            raise_errors: Trueの場合、未報告の書き込み失敗をDatabaseWriteErrorとして送出
+            owner: 報告対象の所有者（Noneの場合は全所有者のエラーを送出）
+
+        Raises:
+            DatabaseWriteError: 書き込みに失敗した操作がある場合
+        """
+        target = self._enqueued_seq
+        if self._processed_seq < target:
+            self._flush_requested.set()
+            async with self._progress:
+                await self._progress.wait_for(lambda: self._processed_seq >= target)
+
+        if not raise_errors:
+            return
+
+        errors = [error for error_owner, error in self._errors if owner is None or error_owner is owner]
+        if errors:
+            self._errors = [entry for entry in self._errors if not (owner is None or entry[0] is owner)]
+            if len(errors) == 1:
+                raise errors[0]
+            raise DatabaseWriteError(
+                f"{len(errors)} queued writes failed: " + "; ".join(str(error) for error in errors)
+            ) from errors[0]
+
+    async def _run(self) -> None:
+        """保留中の書き込みがなくなるまでバッチをコミット"""
+        try:
+            while self._pending:
+                if not self._flush_requested.is_set():
+                    try:
+                        await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval_seconds)
+                    except TimeoutError:
+                        pass
+                self._flush_requested.clear()
+
+                batch = self._pending
+                self._pending = []
+                async with self._progress:
+                    self._progress.notify_all()
+
+                await self._commit_batch(batch)
+
+                self._processed_seq = batch[-1].seq
+                async with self._progress:
+                    self._progress.notify_all()
+        finally:
+            self._worker = None
+
+    async def _commit_batch(self, batch: list[_PendingWrite]) -> None:
+        """バッチを1トランザクションでコミット（失敗時はリトライ後に個別コミット）"""
+        self.stats.batches += 1
+        self.stats.operations += len(batch)
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+
+        for attempt in range(len(self.retry_delays) + 1):
+            try:
+                await asyncio.to_thread(self._commit_sync, [write.operation for write in batch])
+                return
+            except Exception as e:
+                if attempt == len(self.retry_delays):
+                    logger.warning(f"Batched write of {len(batch)} operations failed, committing individually: {e}")
+                    break
+                await asyncio.sleep(self.retry_delays[attempt])
+
+        # 失敗した操作を特定するため個別にコミット
+        for write in batch:
+            try:
+                await asyncio.to_thread(self._commit_sync, [write.operation])
+            except Exception as e:
+                self.stats.failed_operations += 1
+                self._errors.append(
+                    (
+                        write.owner,
+                        DatabaseWriteError(
+                            f"Failed to {write.description} after {len(self.retry_delays)} retries: {e}"
+                        ),
+                    )
+                )
+
+    def _get_connection(self) -> duckdb.DuckDBPyConnection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = get_duckdb_service(self.db_path).connect_writer()
+        return cast(duckdb.DuckDBPyConnection, self._local.conn)
+
+    def _commit_sync(self, operations: list[WriteOperation]) -> None:
+        conn = self._get_connection()
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            for operation in operations:
+                operation(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+# asyncioプリミティブはイベントループに紐づくため、ループ×DBファイルごとにキューを保持
+_queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Path, WriteBehindQueue]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_write_behind_queue(
+    db_path: Path,
+    flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> WriteBehindQueue:
+    """DBファイルに対応する共有キューを取得（実行中のイベントループ単位）
+
+    同一DBファイルを使用する全AggregationStore（複数チーム）が同じキューを共有します。
+    キューの設定は最初に作成した呼び出しの値が使用されます。
+
+    Args:
+        db_path: データベースファイルパス
+        flush_interval_seconds: 最初の保留書き込みからコミットまでの最大待機時間（秒）
+        max_pending: 保留可能な書き込み数の上限
+
+    Returns:
+        共有WriteBehindQueue
+    """
+    loop = asyncio.get_running_loop()
+    queues = _queues.setdefault(loop, {})
+    key = db_path.resolve()
+    queue = queues.get(key)
+    if queue is None:
+        queue = WriteBehindQueue(key, flush_interval_seconds=flush_interval_seconds, max_pending=max_pending)
+        queues[key] = queue
+    return queue
@@ -44,6 +44,7 @@ if "logging_initialized" not in st.session_state:
             console_enabled=os.getenv("MIXSEEK_LOG_CONSOLE", "1") in ("true", "1"),
             file_enabled=file_enabled,
             log_format=log_format,
+            queue_enabled=os.getenv("MIXSEEK_LOG_QUEUE", "1") in ("true", "1"),
         )
     except ValidationError as e:
         st.error(f"ログ設定エラー: {e}")
@@ -4,7 +4,7 @@
 
 References:
     - リアルタイム進捗表示要件
-    - ポーリング更新パフォーマンス要件（2秒間隔）
+    - 進捗更新パフォーマンス要件（進捗イベント発行時に再描画、最大2秒間隔）
 """
 
 import pandas as pd
@@ -27,7 +27,7 @@ def render_realtime_progress(execution_id: str) -> None:
     Note:
         - ステータスがRUNNING以外の場合は何も表示しない
         - エラー時はst.error()でエラーメッセージを表示
-        - 2秒間隔ポーリングはページ側で実装
+        - 進捗イベント待ちによる再描画はページ側で実装
     """
     # 実行状態を取得
     state = get_execution_status(execution_id)
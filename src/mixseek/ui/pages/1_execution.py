@@ -6,10 +6,9 @@ References:
     - Develop: Existing execution service and orchestration selector
 """
 
-import time
-
 import streamlit as st
 
+from mixseek.ui.components.leaderboard_table import render_leaderboard_table
 from mixseek.ui.components.log_viewer import render_log_viewer
 from mixseek.ui.components.orchestration_selector import render_orchestration_selector
 from mixseek.ui.components.realtime_progress import render_realtime_progress, render_team_status_cards
@@ -22,7 +21,9 @@ from mixseek.ui.services.execution_service import (
     get_execution_status,
     get_team_ids_for_execution,
     run_orchestration_in_background,
+    wait_for_progress_update,
 )
+from mixseek.ui.services.leaderboard_service import fetch_leaderboard
 
 # セッション状態初期化
 if "is_running" not in st.session_state:
@@ -35,6 +36,8 @@ if "task_prompt" not in st.session_state:
     st.session_state.task_prompt = ""
 if "polling_enabled" not in st.session_state:
     st.session_state.polling_enabled = False
+if "progress_version" not in st.session_state:
+    st.session_state.progress_version = 0
 
 st.title("タスク実行")
 
@@ -49,6 +52,12 @@ if st.session_state.polling_enabled and st.session_state.current_execution_id:
     # チーム別ステータス表示
     render_team_status_cards(st.session_state.current_execution_id)
 
+    # ライブリーダーボード（実行中のOrchestratorの書き込み接続を共有して取得）
+    live_leaderboard = fetch_leaderboard(st.session_state.current_execution_id)
+    if live_leaderboard:
+        st.subheader("リーダーボード（実行中）")
+        render_leaderboard_table(live_leaderboard, key="live_leaderboard_selection")
+
     # 実行ログ表示
     render_log_viewer(lines=100, expanded=False)
 
@@ -71,15 +80,13 @@ if st.session_state.polling_enabled and st.session_state.current_execution_id:
         elif state.status == ExecutionStatus.PARTIAL_FAILURE:
             st.warning("⚠️ 一部のチームが失敗しました。詳細は下部の「エラーが発生したチーム」を確認してください。")
 
-        # DuckDBロック解放を待つため5秒待機
-        # Orchestratorの非同期処理完了とDB接続クローズを待つ
-        time.sleep(5)
-
         # ページを再レンダリング（詳細表示に切り替え）
         st.rerun()
     else:
-        # 実行中 → 2秒後に再レンダリング
-        time.sleep(2)
+        # 実行中 → 進捗イベント発行時（最大2秒後）に再レンダリング
+        st.session_state.progress_version = wait_for_progress_update(
+            st.session_state.current_execution_id, st.session_state.progress_version, timeout=2.0
+        )
         st.rerun()
 
 # ラウンド進捗表示 - 実行完了後のみ表示
@@ -129,6 +136,7 @@ if execute_button:
             st.session_state.is_running = True
             st.session_state.polling_enabled = True
             st.session_state.current_execution_id = execution_id
+            st.session_state.progress_version = 0
             st.session_state.task_prompt = prompt
 
             # 即座に再レンダリング（ポーリング開始）
@@ -5,17 +5,16 @@ import json
 import logging
 import os
 import threading
-import time
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import cast
 
-import duckdb
-
 from mixseek.config.logging import LogFormatType
 from mixseek.core.auth import clear_auth_caches
+from mixseek.core.progress import ProgressEvent, ProgressLogReader, get_progress_bus, progress_log_path
 from mixseek.orchestrator import Orchestrator, load_orchestrator_settings
+from mixseek.storage.duckdb_service import get_duckdb_service
 from mixseek.ui.models.config import OrchestrationOption
 from mixseek.ui.models.execution import Execution, ExecutionState, ExecutionStatus, FailedTeamInfo, TeamProgressState
 from mixseek.ui.utils.workspace import get_workspace_path
@@ -35,108 +34,142 @@ _execution_results: dict[str, Execution] = {}
 _execution_errors: dict[str, Exception] = {}
 
 
-def _read_progress_from_file(execution_id: str) -> ExecutionState | None:
-    """進捗ファイルから実行状態を読み取る（全チーム集約）.
+# グローバル辞書: イベントログパス → ProgressLogReader
+# 別プロセスで実行中のexecutionの進捗を増分読み込みするために使用
+_progress_log_readers: dict[Path, ProgressLogReader] = {}
+_progress_log_readers_lock = threading.Lock()
+
+
+def _load_team_progress(execution_id: str, workspace: Path | None = None) -> list[ProgressEvent]:
+    """チームごとの最新の進捗イベントを取得.
 
     Args:
         execution_id: 実行ID
+        workspace: ワークスペースパス（Noneの場合は環境変数から取得）
 
     Returns:
-        ExecutionState | None: 実行状態（全チームの最大ラウンド）、またはNone（ファイル不在時）
+        list[ProgressEvent]: チームごとの最新イベント（進捗がない場合は空リスト）
 
     Note:
-        複数チームが並列実行される場合、各チームの進捗ファイルを読み取り、
-        最も進んでいるラウンド情報を返す
+        以下の順に参照し、最初に見つかったものを返す
+        1. プロセス内の進捗バス（UIから起動した実行、ファイルI/Oなし）
+        2. 進捗イベントログ（{execution_id}.progress.jsonl、前回読み込み以降の追記分のみ解析）
+        3. 旧形式の進捗ファイル（{execution_id}.*.progress.json、以前のバージョンで実行された履歴）
     """
-    workspace = get_workspace_path()
-    logs_dir = workspace / "logs"
+    events = get_progress_bus().snapshot(execution_id)
+    if events:
+        return events
 
-    if not logs_dir.exists():
-        return None
+    if workspace is None:
+        workspace = get_workspace_path()
 
-    try:
-        # execution_idに一致するすべての進捗ファイルを検索
-        progress_files = list(logs_dir.glob(f"{execution_id}.*.progress.json"))
-        logger.debug(f"Found {len(progress_files)} progress files for execution_id={execution_id}")
+    log_path = progress_log_path(workspace, execution_id)
+    if log_path.exists():
+        with _progress_log_readers_lock:
+            reader = _progress_log_readers.get(log_path)
+            if reader is None:
+                reader = _progress_log_readers[log_path] = ProgressLogReader(log_path)
+            return reader.snapshot()
 
-        if not progress_files:
-            return None
+    logs_dir = workspace / "logs"
+    if not logs_dir.exists():
+        return []
 
-        # 全チームの進捗を読み取り
-        all_progress = []
-        for progress_file in progress_files:
-            try:
-                with open(progress_file) as f:
-                    data = json.load(f)
-                    all_progress.append(data)
-                    logger.debug(f"Read progress from {progress_file.name}: round={data.get('current_round')}")
-            except Exception as e:
-                logger.warning(f"Failed to read {progress_file.name}: {e}")
-                continue
-
-        if not all_progress:
-            return None
+    legacy_events: list[ProgressEvent] = []
+    for progress_file in logs_dir.glob(f"{execution_id}.*.progress.json"):
+        try:
+            with open(progress_file) as f:
+                legacy_events.append(ProgressEvent.from_dict(json.load(f)))
+        except (KeyError, json.JSONDecodeError) as e:
+            logger.warning(f"Invalid progress file {progress_file}: {e}")
+        except Exception as e:
+            logger.debug(f"Failed to read progress file {progress_file}: {e}")
+    return legacy_events
 
-        # 最も進んでいるチームの情報を使用
-        latest_progress = max(all_progress, key=lambda x: x.get("current_round", 0))
 
-        # 全チームが完了（completed または failed）しているか確認
-        all_completed_or_failed = all(p.get("status") in ["completed", "failed"] for p in all_progress)
+def _aggregate_progress(events: list[ProgressEvent]) -> ExecutionState:
+    """チームごとの進捗イベントを実行状態に集約.
 
-        # デバッグログ：各チームのステータス
-        for p in all_progress:
-            logger.debug(
-                f"Team {p.get('team_id')} ({p.get('team_name')}): "
-                f"status={p.get('status')}, round={p.get('current_round')}/{p.get('total_rounds')}"
-            )
-        logger.debug(f"All teams completed or failed: {all_completed_or_failed}")
-
-        if all_completed_or_failed:
-            # 全チーム完了：失敗チームの有無でステータスを決定
-            failed_teams = [p for p in all_progress if p.get("status") == "failed"]
-            completed_teams = [p for p in all_progress if p.get("status") == "completed"]
-
-            if failed_teams and not completed_teams:
-                # 全チーム失敗
-                overall_status = "failed"
-            elif failed_teams and completed_teams:
-                # 一部失敗、一部成功
-                overall_status = "partial_failure"
-            else:
-                # 全チーム成功
-                overall_status = "completed"
+    Args:
+        events: チームごとの最新イベント（1件以上）
 
-            # 失敗したチームのエラーメッセージを収集
-            if failed_teams:
-                error_messages = [p.get("error_message", "Unknown error") for p in failed_teams]
-                error_message = "; ".join(error_messages) if error_messages else None
-            else:
-                error_message = None
+    Returns:
+        ExecutionState: 実行状態（全チームの最大ラウンド）
+
+    Note:
+        複数チームが並列実行される場合、最も進んでいるラウンド情報を返す
+    """
+    # 最も進んでいるチームの情報を使用
+    latest_progress = max(events, key=lambda x: x.current_round)
+
+    # 全チームが完了（completed または failed）しているか確認
+    all_completed_or_failed = all(e.is_terminal for e in events)
+
+    # デバッグログ：各チームのステータス
+    for e in events:
+        logger.debug(f"Team {e.team_id} ({e.team_name}): status={e.status}, round={e.current_round}/{e.total_rounds}")
+    logger.debug(f"All teams completed or failed: {all_completed_or_failed}")
+
+    failed_teams = [e for e in events if e.status == "failed"]
+    if all_completed_or_failed:
+        # 全チーム完了：失敗チームの有無でステータスを決定
+        completed_teams = [e for e in events if e.status == "completed"]
+
+        if failed_teams and not completed_teams:
+            # 全チーム失敗
+            overall_status = "failed"
+        elif failed_teams and completed_teams:
+            # 一部失敗、一部成功
+            overall_status = "partial_failure"
         else:
-            # 実行中のチームがある場合
-            overall_status = "running"
-            # 既に失敗しているチームがある場合はエラーメッセージを表示
-            failed_teams = [p for p in all_progress if p.get("status") == "failed"]
-            if failed_teams:
-                error_messages = [p.get("error_message", "Unknown error") for p in failed_teams]
-                error_message = "; ".join(error_messages) if error_messages else None
-            else:
-                error_message = None
+            # 全チーム成功
+            overall_status = "completed"
+    else:
+        # 実行中のチームがある場合
+        overall_status = "running"
+
+    # 失敗したチームのエラーメッセージを収集（実行中でも既に失敗しているチームがあれば表示）
+    error_message = "; ".join(e.error_message or "Unknown error" for e in failed_teams) if failed_teams else None
+
+    return ExecutionState(
+        execution_id=latest_progress.execution_id,
+        status=ExecutionStatus(overall_status),
+        current_round=latest_progress.current_round,
+        total_rounds=latest_progress.total_rounds,
+        error_message=error_message,
+    )
 
-        return ExecutionState(
-            execution_id=latest_progress["execution_id"],
-            status=ExecutionStatus(overall_status),
-            current_round=latest_progress.get("current_round"),
-            total_rounds=latest_progress.get("total_rounds"),
-            error_message=error_message,
-        )
+
+def _read_progress(execution_id: str) -> ExecutionState | None:
+    """進捗から実行状態を取得（全チーム集約）.
+
+    Args:
+        execution_id: 実行ID
+
+    Returns:
+        ExecutionState | None: 実行状態（全チームの最大ラウンド）、またはNone（進捗なし）
+    """
+    try:
+        events = _load_team_progress(execution_id)
+        if not events:
+            return None
+        return _aggregate_progress(events)
     except Exception as e:
-        logger.warning(f"Failed to read progress files: {e}", exc_info=True)
+        logger.warning(f"Failed to read progress: {e}", exc_info=True)
         return None
 
 
+def _is_running_from_progress(execution_id: str) -> bool:
+    """進捗上で実行中のチームが存在するか（別プロセスでOrchestrator実行中の判定用）."""
+    try:
+        return any(not e.is_terminal for e in _load_team_progress(execution_id))
+    except Exception:
+        # 進捗チェックエラーは無視して続行
+        return False
+
+
 def _get_failed_teams_from_progress_files(execution_id: str, workspace: Path) -> list[FailedTeamInfo]:
-    """進捗ファイルから失敗チーム情報を取得.
+    """進捗から失敗チーム情報を取得.
 
     Args:
         execution_id: 実行ID
@@ -145,38 +178,15 @@ def _get_failed_teams_from_progress_files(execution_id: str, workspace: Path) ->
     Returns:
         list[FailedTeamInfo]: 失敗したチームの情報リスト
     """
-    logs_dir = workspace / "logs"
-    if not logs_dir.exists():
-        return []
-
-    failed_teams: list[FailedTeamInfo] = []
-    progress_files = list(logs_dir.glob(f"{execution_id}.*.progress.json"))
-
-    for progress_file in progress_files:
-        try:
-            with open(progress_file) as f:
-                data = json.load(f)
-                if data.get("status") == "failed" and data.get("error_message"):
-                    # 必須フィールドに直接アクセス（KeyErrorは外側のexceptで捕捉）
-                    failed_teams.append(
-                        FailedTeamInfo(
-                            team_id=data["team_id"],
-                            team_name=data["team_name"],
-                            error_message=data["error_message"],
-                        )
-                    )
-        except (KeyError, json.JSONDecodeError) as e:
-            logger.warning(f"Invalid progress file {progress_file}: {e}")
-            continue
-        except Exception as e:
-            logger.debug(f"Failed to read progress file {progress_file}: {e}")
-            continue
-
-    return failed_teams
+    return [
+        FailedTeamInfo(team_id=e.team_id, team_name=e.team_name, error_message=e.error_message)
+        for e in _load_team_progress(execution_id, workspace)
+        if e.status == "failed" and e.error_message
+    ]
 
 
 def get_all_teams_execution_status(execution_id: str) -> list[TeamProgressState]:
-    """全チームの実行状態を取得（ポーリング用）.
+    """全チームの実行状態を取得.
 
     Args:
         execution_id: 実行ID
@@ -185,48 +195,23 @@ def get_all_teams_execution_status(execution_id: str) -> list[TeamProgressState]
         list[TeamProgressState]: チーム別進捗状態のリスト（team_nameでソート済み）
 
     Note:
-        - 進捗ファイル（{execution_id}.*.progress.json）から全チーム情報を読み取り
+        - 進捗バス（別プロセスの実行は進捗イベントログ）から全チームの最新状態を取得
         - 各チームの進捗を個別に返却（集約しない）
-        - ファイル読み取り失敗したチームはスキップ
     """
-    workspace = get_workspace_path()
-    logs_dir = workspace / "logs"
-
-    if not logs_dir.exists():
-        return []
-
     try:
-        # execution_idに一致するすべての進捗ファイルを検索
-        progress_files = list(logs_dir.glob(f"{execution_id}.*.progress.json"))
-        logger.debug(f"Found {len(progress_files)} progress files for execution_id={execution_id}")
-
-        if not progress_files:
-            return []
-
-        # 全チームの進捗を読み取り
-        team_progress_list = []
-        for progress_file in progress_files:
-            try:
-                with open(progress_file) as f:
-                    data = json.load(f)
-
-                    team_progress = TeamProgressState(
-                        team_id=data["team_id"],
-                        team_name=data["team_name"],
-                        current_round=data["current_round"],
-                        total_rounds=data["total_rounds"],
-                        status=data["status"],
-                        current_agent=data.get("current_agent"),  # current_agentフィールドを読み取り
-                        updated_at=data["updated_at"],
-                        error_message=data.get("error_message"),  # エラーメッセージを読み取り
-                    )
-                    team_progress_list.append(team_progress)
-                    logger.debug(
-                        f"Read team progress: {team_progress.team_name} - round={team_progress.current_round}"
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to read team progress file {progress_file.name}: {e}")
-                continue
+        team_progress_list = [
+            TeamProgressState(
+                team_id=e.team_id,
+                team_name=e.team_name,
+                current_round=e.current_round,
+                total_rounds=e.total_rounds,
+                status=e.status,
+                current_agent=e.current_agent,
+                updated_at=datetime.fromisoformat(e.updated_at),
+                error_message=e.error_message,
+            )
+            for e in _load_team_progress(execution_id)
+        ]
 
         # team_nameでソート
         team_progress_list.sort(key=lambda x: x.team_name)
@@ -237,6 +222,24 @@ def get_all_teams_execution_status(execution_id: str) -> list[TeamProgressState]
         return []
 
 
+def wait_for_progress_update(execution_id: str, since_version: int, timeout: float) -> int:
+    """進捗イベントが発行されるまで待機（UIの再描画用）.
+
+    Args:
+        execution_id: 実行ID
+        since_version: 呼び出し側が既に反映済みのバージョン
+        timeout: 最大待機時間（秒）
+
+    Returns:
+        int: 現在のバージョン（タイムアウト時はsince_versionのまま）
+
+    Note:
+        プロセス内の実行は進捗イベント発行時に即座に戻る。
+        別プロセスの実行ではイベントが届かないため、timeout秒待機する。
+    """
+    return get_progress_bus().wait_for_update(execution_id, since_version, timeout)
+
+
 def run_orchestration(
     prompt: str, orchestration_option: OrchestrationOption, execution_id: str | None = None
 ) -> Execution:
@@ -409,36 +412,25 @@ def run_orchestration_in_background(prompt: str, orchestration_option: Orchestra
 
     def _background_task() -> None:
         """バックグラウンドで実行されるタスク."""
-        try:
-            # 別スレッドで定期的に進捗を更新
-            def _update_progress() -> None:
-                """進捗を定期的に更新（ポーリングループ用）."""
-                logger.debug(f"Progress update thread started for execution_id={execution_id}")
-                while execution_id in _execution_states:
-                    state = _execution_states[execution_id]
-                    # RUNNINGでない場合は更新停止
-                    if state.status != ExecutionStatus.RUNNING:
-                        logger.debug(f"Progress update stopped: status={state.status}")
-                        break
-
-                    # 進捗ファイルから読み取り
-                    file_state = _read_progress_from_file(execution_id)
-                    if file_state:
-                        # ファイルから読み取った状態で更新
-                        logger.debug(f"Progress updated: round={file_state.current_round}/{file_state.total_rounds}")
-                        _execution_states[execution_id] = file_state
-                    else:
-                        logger.debug(f"No progress file found for execution_id={execution_id}")
-                    # ファイルが存在しない場合は何もしない（Orchestrator未対応時）
-
-                    # 2秒待機
-                    time.sleep(2)
-                logger.debug(f"Progress update thread finished for execution_id={execution_id}")
-
-            # 進捗更新スレッドを起動
-            progress_thread = threading.Thread(target=_update_progress, daemon=True)
-            progress_thread.start()
 
+        # 進捗イベントを購読して実行状態を更新
+        def _on_progress(event: ProgressEvent) -> None:
+            """進捗イベント受信時に実行状態を更新."""
+            if event.execution_id != execution_id:
+                return
+            state = _execution_states.get(execution_id)
+            # RUNNINGでない場合は更新しない（完了状態は本スレッドで設定）
+            if state is None or state.status != ExecutionStatus.RUNNING:
+                return
+            events = get_progress_bus().snapshot(execution_id)
+            if events:
+                new_state = _aggregate_progress(events)
+                logger.debug(f"Progress updated: round={new_state.current_round}/{new_state.total_rounds}")
+                _execution_states[execution_id] = new_state
+
+        unsubscribe = get_progress_bus().subscribe(_on_progress)
+
+        try:
             # run_orchestration()を実行（同期的に完了を待つ）
             logger.debug(f"Calling run_orchestration() for execution_id={execution_id}")
             execution = run_orchestration(prompt, orchestration_option, execution_id)
@@ -470,6 +462,8 @@ def run_orchestration_in_background(prompt: str, orchestration_option: Orchestra
                 total_rounds=None,
                 error_message=str(e),
             )
+        finally:
+            unsubscribe()
 
     # スレッドを起動（daemon=Trueでメインプロセス終了時に自動終了）
     thread = threading.Thread(target=_background_task, daemon=True)
@@ -483,7 +477,7 @@ def get_execution_status(execution_id: str) -> ExecutionState:
     """実行状態を取得（ポーリング用）.
 
     グローバル辞書から実行状態を取得。
-    進捗情報はバックグラウンドスレッドで定期的に更新される。
+    進捗情報は進捗イベントの発行時にバックグラウンドスレッドで更新される。
 
     Args:
         execution_id: 実行ID
@@ -493,7 +487,7 @@ def get_execution_status(execution_id: str) -> ExecutionState:
 
     Note:
         - グローバル辞書に状態が存在しない場合、PENDINGステータスで返す
-        - データベースアクセスは行わない（バックグラウンドスレッドで更新）
+        - データベースアクセスは行わない（進捗イベント購読により更新）
     """
     # グローバル辞書から状態を取得
     if execution_id not in _execution_states:
@@ -533,32 +527,10 @@ def get_execution_result(execution_id: str) -> Execution | None:
             )
             return None
 
-    # 方法2: 進捗JSONファイルの存在チェック（より確実）
-    try:
-        workspace = get_workspace_path()
-        logs_dir = workspace / "logs"
-        if logs_dir.exists():
-            progress_files = list(logs_dir.glob(f"{execution_id}.*.progress.json"))
-            if progress_files:
-                # 進捗ファイルが存在 = Orchestrator実行中の可能性が高い
-                logger.debug(f"Progress files exist, execution may be running: execution_id={execution_id}")
-                # ファイルの中身をチェックしてstatusを確認
-                for progress_file in progress_files:
-                    try:
-                        with open(progress_file) as f:
-                            data = json.load(f)
-                            if data.get("status") in ["running", "pending"]:
-                                logger.debug(
-                                    f"Execution is running (from progress file), "
-                                    f"skipping DuckDB access: execution_id={execution_id}"
-                                )
-                                return None
-                    except Exception:
-                        # ファイル読み込みエラーは無視
-                        continue
-    except Exception:
-        # 進捗ファイルチェックエラーは無視して続行
-        pass
+    # 方法2: 進捗イベントのチェック（別プロセスの実行も含め、より確実）
+    if _is_running_from_progress(execution_id):
+        logger.debug(f"Execution is running (from progress), skipping DuckDB access: execution_id={execution_id}")
+        return None
 
     # 完了後のみDuckDBから読み取る
     try:
@@ -568,9 +540,9 @@ def get_execution_result(execution_id: str) -> Execution | None:
         if not db_path.exists():
             return None
 
-        # DuckDB接続を1回だけ試みる（Orchestrator実行中は失敗する）
+        # DuckDB接続を1回だけ試みる（別プロセスのOrchestrator実行中は失敗する）
         try:
-            conn = duckdb.connect(str(db_path), read_only=True)
+            conn = get_duckdb_service(db_path).connect_reader()
         except Exception as e:
             # 接続失敗時はNoneを返す（Orchestrator実行中の可能性）
             logger.debug(f"Failed to connect to DuckDB (likely Orchestrator is running): {e}")
@@ -597,7 +569,7 @@ def get_execution_result(execution_id: str) -> Execution | None:
             if result:
                 status = ExecutionStatus(result[2])
 
-                # 失敗チーム情報を進捗ファイルから取得
+                # 失敗チーム情報を進捗から取得
                 failed_teams_info: list[FailedTeamInfo] = []
                 if status in (ExecutionStatus.PARTIAL_FAILURE, ExecutionStatus.FAILED):
                     failed_teams_info = _get_failed_teams_from_progress_files(execution_id, workspace)
@@ -622,6 +594,14 @@ def get_execution_result(execution_id: str) -> Execution | None:
         return None
 
 
+def _has_in_process_writer() -> bool:
+    """同一プロセス内でmixseek.dbへの書き込み接続（実行中のOrchestrator）が存在するか."""
+    try:
+        return get_duckdb_service(get_workspace_path() / "mixseek.db").has_writer
+    except Exception:
+        return False
+
+
 def get_team_ids_for_execution(execution_id: str) -> list[str]:
     """実行に含まれるチームIDのリストを取得.
 
@@ -636,38 +616,23 @@ def get_team_ids_for_execution(execution_id: str) -> list[str]:
         - チームが存在しない場合は空リストを返す
         - DuckDB接続エラー時は最大5回リトライ
     """
-    # 実行中の場合はDuckDBにアクセスしない（接続競合を回避）
-    # 方法1: グローバル辞書チェック
-    if execution_id in _execution_states:
-        state = _execution_states[execution_id]
-        if state.status == ExecutionStatus.RUNNING:
-            logger.debug(
-                f"Execution is still running (from state dict), skipping DuckDB access: execution_id={execution_id}"
-            )
-            return []
+    # 同一プロセス内のOrchestrator実行中はライター接続を共有して読み込めるため、
+    # 別プロセスで実行中の可能性がある場合のみDuckDBにアクセスしない（接続競合を回避）
+    if not _has_in_process_writer():
+        # 方法1: グローバル辞書チェック
+        if execution_id in _execution_states:
+            state = _execution_states[execution_id]
+            if state.status == ExecutionStatus.RUNNING:
+                logger.debug(
+                    f"Execution is still running (from state dict), "
+                    f"skipping DuckDB access: execution_id={execution_id}"
+                )
+                return []
 
-    # 方法2: 進捗JSONファイルの存在チェック（より確実）
-    try:
-        workspace = get_workspace_path()
-        logs_dir = workspace / "logs"
-        if logs_dir.exists():
-            progress_files = list(logs_dir.glob(f"{execution_id}.*.progress.json"))
-            if progress_files:
-                # 進捗ファイルが存在 = Orchestrator実行中の可能性が高い
-                for progress_file in progress_files:
-                    try:
-                        with open(progress_file) as f:
-                            data = json.load(f)
-                            if data.get("status") in ["running", "pending"]:
-                                logger.debug(
-                                    f"Execution is running (from progress file), "
-                                    f"skipping DuckDB access: execution_id={execution_id}"
-                                )
-                                return []
-                    except Exception:
-                        continue
-    except Exception:
-        pass
+        # 方法2: 進捗イベントのチェック（別プロセスの実行も含め、より確実）
+        if _is_running_from_progress(execution_id):
+            logger.debug(f"Execution is running (from progress), skipping DuckDB access: execution_id={execution_id}")
+            return []
 
     try:
         workspace = get_workspace_path()
@@ -676,9 +641,9 @@ def get_team_ids_for_execution(execution_id: str) -> list[str]:
         if not db_path.exists():
             return []
 
-        # DuckDB接続を1回だけ試みる（Orchestrator実行中は失敗する）
+        # DuckDB接続を1回だけ試みる（別プロセスのOrchestrator実行中は失敗する）
         try:
-            conn = duckdb.connect(str(db_path), read_only=True)
+            conn = get_duckdb_service(db_path).connect_reader()
         except Exception as e:
             # 接続失敗時は空リストを返す（Orchestrator実行中の可能性）
             logger.debug(f"Failed to connect to DuckDB (likely Orchestrator is running): {e}")
@@ -3,8 +3,10 @@
 from mixseek.ui.models.execution import Execution, ExecutionStatus
 from mixseek.ui.models.history import HistoryEntry
 from mixseek.ui.utils.duckdb_conn import get_read_connection
+from mixseek.ui.utils.query_cache import watermark_cached
 
 
+@watermark_cached("execution_summary", "completed_at", per_execution=False)
 def fetch_history(
     page_number: int = 1,
     page_size: int = 50,
@@ -85,6 +87,7 @@ def fetch_history(
         return [], 0
 
 
+@watermark_cached("execution_summary", "completed_at")
 def fetch_execution_detail(execution_id: str) -> Execution | None:
     """実行詳細を取得.
 
@@ -4,8 +4,10 @@ import json
 
 from mixseek.ui.models.leaderboard import LeaderboardEntry, Submission
 from mixseek.ui.utils.duckdb_conn import get_read_connection
+from mixseek.ui.utils.query_cache import watermark_cached
 
 
+@watermark_cached("leader_board")
 def fetch_leaderboard(execution_id: str) -> list[LeaderboardEntry]:
     """指定実行IDのリーダーボードを取得（leader_boardテーブル）.
 
@@ -62,6 +64,7 @@ def fetch_leaderboard(execution_id: str) -> list[LeaderboardEntry]:
         return []
 
 
+@watermark_cached("leader_board")
 def fetch_team_submission(execution_id: str, team_id: str, round_number: int) -> Submission | None:
     """指定チームの特定ラウンドのサブミッションを取得（leader_boardテーブルから）.
 
@@ -120,6 +123,7 @@ def fetch_team_submission(execution_id: str, team_id: str, round_number: int) ->
         return None
 
 
+@watermark_cached("leader_board")
 def fetch_top_submission(execution_id: str) -> Submission | None:
     """最高スコアのサブミッションを取得（leader_boardテーブルから）.
 
@@ -17,8 +17,10 @@ import pandas as pd
 
 from mixseek.ui.models.round_models import RoundProgress, TeamSubmission
 from mixseek.ui.utils.db_utils import get_db_connection
+from mixseek.ui.utils.query_cache import watermark_cached
 
 
+@watermark_cached("round_status")
 def fetch_current_round_progress(execution_id: str) -> RoundProgress | None:
     """現在のラウンド進捗を取得（research.md クエリ1）.
 
@@ -64,6 +66,7 @@ def fetch_current_round_progress(execution_id: str) -> RoundProgress | None:
         conn.close()
 
 
+@watermark_cached("round_status")
 def fetch_team_progress_list(execution_id: str) -> list[RoundProgress]:
     """全チーム進捗一覧を取得（research.md クエリ2）.
 
@@ -104,6 +107,7 @@ def fetch_team_progress_list(execution_id: str) -> list[RoundProgress]:
         conn.close()
 
 
+@watermark_cached("round_status")
 def fetch_round_timeline(execution_id: str, team_id: str) -> list[RoundProgress]:
     """ラウンドタイムラインを取得（research.md クエリ3）.
 
@@ -147,6 +151,7 @@ def fetch_round_timeline(execution_id: str, team_id: str) -> list[RoundProgress]
         conn.close()
 
 
+@watermark_cached("leader_board")
 def fetch_all_teams_score_history(execution_id: str) -> pd.DataFrame:
     """全チームスコア推移を取得（research.md クエリ4）.
 
@@ -191,6 +196,7 @@ def fetch_all_teams_score_history(execution_id: str) -> pd.DataFrame:
         conn.close()
 
 
+@watermark_cached("leader_board")
 def fetch_team_final_submission(execution_id: str, team_id: str) -> TeamSubmission | None:
     """チーム最終サブミッションを取得（research.md クエリ5）.
 
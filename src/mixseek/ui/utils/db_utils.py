@@ -17,6 +17,8 @@ from pathlib import Path
 
 import duckdb
 
+from mixseek.storage.duckdb_service import get_duckdb_service
+
 
 def get_workspace_path() -> Path:
     """環境変数MIXSEEK_WORKSPACEからワークスペースパスを取得.
@@ -61,6 +63,8 @@ def get_db_connection() -> duckdb.DuckDBPyConnection | None:
 
     Note:
         接続はNoneでない場合、使用後に必ずclose()すること。
+        同一プロセス内でOrchestrator実行中の場合は書き込み接続のcursorを返すため、
+        実行中でもコミット済みのデータを参照できる。
     """
     try:
         db_path = get_workspace_path() / "mixseek.db"
@@ -68,11 +72,11 @@ def get_db_connection() -> duckdb.DuckDBPyConnection | None:
             # DBファイル不在時はNone返却（エラーとしない）
             return None
 
-        return duckdb.connect(str(db_path), read_only=True)
+        return get_duckdb_service(db_path).connect_reader()
     except ValueError as e:
         # 環境変数未設定時は例外を再発生
         raise e
     except Exception:
         # DuckDB接続エラー（ロック等）はNone返却
-        # Orchestrator実行中にUIがアクセスするとロックエラーが発生するため
+        # 別プロセスのOrchestrator実行中にUIがアクセスするとロックエラーが発生するため
         return None
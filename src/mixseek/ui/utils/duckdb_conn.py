@@ -4,6 +4,7 @@ import logging
 
 import duckdb
 
+from mixseek.storage.duckdb_service import get_duckdb_service
 from mixseek.ui.utils.workspace import get_db_path
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,8 @@ def get_read_connection() -> duckdb.DuckDBPyConnection | None:
 
     Note:
         - 接続は使用後に必ずclose()すること
-        - DuckDB接続エラー（Orchestrator実行中など）はNoneを返す
+        - 同一プロセス内でOrchestrator実行中の場合は書き込み接続のcursorを返す（DuckDBService）
+        - DuckDB接続エラー（別プロセスでOrchestrator実行中など）はNoneを返す
     """
     db_path = get_db_path()
     if not db_path.exists():
@@ -29,7 +31,7 @@ def get_read_connection() -> duckdb.DuckDBPyConnection | None:
         )
 
     try:
-        return duckdb.connect(str(db_path), read_only=True)
+        return get_duckdb_service(db_path).connect_reader()
     except Exception as e:
         # 接続エラー時（Orchestrator実行中など）はNoneを返す
         logger.debug(f"Failed to connect to DuckDB (likely in use by Orchestrator): {e}")
@@ -0,0 +1,137 @@
+"""ウォーターマーク方式のUIクエリキャッシュ.
+
+Streamlitは再実行（実行中は2秒ごとのポーリング）のたびにサービス関数を呼び出すため、
+そのままでは毎回DuckDBを開いて全件（submission_contentを含む）を再取得します。
+
+``watermark_cached`` はサービス関数の結果を ``st.cache_data`` に保存し、
+キャッシュキーに対象テーブルのウォーターマーク（行数と最終更新時刻）を含めます。
+ウォーターマークは軽量な集計クエリ1本で取得でき、データが変わったときだけ
+元のクエリが再実行されます。
+
+ウォーターマークを取得できない場合（DB不在、テーブル/カラム不在、接続失敗など）は
+キャッシュを使わずに元の関数をそのまま呼び出すため、既存のエラー処理は変わりません。
+
+Note:
+    DuckDBは読み取り専用接続を開いている間、別接続からの書き込みを許可しないため、
+    接続自体はキャッシュしません。接続の共有は ``DuckDBService`` が担います
+    （プロセス内にライターがある場合はそのcursorを使用）。
+"""
+
+import functools
+import inspect
+import logging
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+import streamlit as st
+
+from mixseek.storage.duckdb_service import get_duckdb_service
+from mixseek.ui.utils.workspace import get_db_path
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# キャッシュする結果の最大件数（全関数合計）
+QUERY_CACHE_MAX_ENTRIES = 128
+
+
+@st.cache_data(show_spinner=False, max_entries=QUERY_CACHE_MAX_ENTRIES)
+def _cached_call(
+    _func: Callable[..., Any],
+    func_key: str,
+    db_key: str,
+    watermark: tuple[Any, ...],
+    args: tuple[Any, ...],
+) -> Any:
+    # _funcはハッシュ対象外（先頭アンダースコア）のため、func_keyで関数を区別する
+    return _func(*args)
+
+
+def fetch_watermark(table: str, column: str, execution_id: str | None = None) -> tuple[str, tuple[Any, ...]] | None:
+    """テーブルのウォーターマークを取得.
+
+    Args:
+        table: テーブル名
+        column: 更新時刻カラム名（MAXを取る）
+        execution_id: 実行ID（指定時はその実行の行のみ対象）
+
+    Returns:
+        tuple[str, tuple] | None: (DBファイルパス, (行数, 最終更新時刻))、取得できない場合はNone
+    """
+    try:
+        db_path = get_db_path()
+        if not db_path.exists():
+            return None
+
+        query = f"SELECT COUNT(*), MAX({column}) FROM {table}"
+        params: list[Any] = []
+        if execution_id is not None:
+            query += " WHERE execution_id = ?"
+            params.append(execution_id)
+
+        with get_duckdb_service(db_path).read() as conn:
+            row = conn.execute(query, params).fetchone()
+    except Exception as e:
+        logger.debug(f"Failed to fetch watermark for {table}: {e}")
+        return None
+
+    if row is None:
+        return None
+    return str(db_path), tuple(row)
+
+
+def watermark_cached(
+    table: str,
+    column: str = "updated_at",
+    *,
+    per_execution: bool = True,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """テーブルのウォーターマークが変わるまで結果を再利用するデコレーター.
+
+    Args:
+        table: 結果が依存するテーブル名
+        column: ウォーターマークに使う更新時刻カラム名
+        per_execution: Trueの場合、関数の第1引数をexecution_idとしてウォーターマークを絞り込む
+
+    Returns:
+        デコレーター
+
+    Example:
+        >>> @watermark_cached("leader_board")
+        ... def fetch_leaderboard(execution_id: str) -> list[LeaderboardEntry]:
+        ...     ...
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        func_key = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # キーワード引数・デフォルト値を位置引数に正規化してキャッシュキーを揃える
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = bound.args
+
+            execution_id = call_args[0] if per_execution and call_args else None
+            if per_execution and not isinstance(execution_id, str):
+                return func(*args, **kwargs)
+
+            watermark = fetch_watermark(table, column, execution_id)
+            if watermark is None:
+                return func(*args, **kwargs)
+
+            db_key, marks = watermark
+            result: R = _cached_call(func, func_key, db_key, marks, call_args)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def clear_query_cache() -> None:
+    """UIクエリキャッシュを全て破棄."""
+    _cached_call.clear()
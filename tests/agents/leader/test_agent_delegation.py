@@ -187,3 +187,93 @@ class TestAgentDelegation:
         assert record.successful_submissions[1].agent_name == "summarizer"
         # 失敗したagentは含まれない
         assert all(s.agent_name != "slow-agent" for s in record.successful_submissions)
+
+
+class TestParallelMemberExecution:
+    """1ターン内の複数Member Agent呼び出しの並列実行テスト"""
+
+    @pytest.mark.asyncio
+    async def test_member_calls_run_concurrently_in_call_order(self) -> None:
+        """max_concurrent_membersまで並列実行され、submissionsは呼び出し順に記録される"""
+        import asyncio
+        from typing import Any
+
+        from pydantic_ai import Agent
+        from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
+        from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+        from mixseek.agents.leader.config import TeamConfig, TeamMemberAgentConfig
+        from mixseek.agents.leader.tools import register_member_tools
+        from mixseek.agents.member.base import BaseMemberAgent
+        from mixseek.models.member_agent import MemberAgentResult, ResultStatus
+
+        # 先に呼び出されたタスクほど遅く完了する
+        delays = {"task 0": 0.15, "task 1": 0.1, "task 2": 0.05, "task 3": 0.0}
+        running = 0
+        max_running = 0
+
+        def make_member(name: str) -> Any:
+            async def execute(task: str, context: dict[str, Any]) -> MemberAgentResult:
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(delays[task])
+                running -= 1
+                return MemberAgentResult(
+                    status=ResultStatus.SUCCESS, content=f"{task} done", agent_name=name, agent_type="plain"
+                )
+
+            member = AsyncMock(spec=BaseMemberAgent)
+            member.execute.side_effect = execute
+            return member
+
+        def leader_model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            if len(messages) == 1:
+                # 2つのMemberをそれぞれ2回ずつ、1ターンで呼び出す
+                return ModelResponse(
+                    parts=[ToolCallPart(f"delegate_to_member_{i % 2}", {"task": f"task {i}"}) for i in range(4)]
+                )
+            return ModelResponse(parts=[TextPart("final")])
+
+        team_config = TeamConfig(
+            team_id="team-001",
+            team_name="Test Team",
+            max_concurrent_members=2,
+            members=[
+                TeamMemberAgentConfig(
+                    agent_name=f"member_{i}",
+                    agent_type="plain",
+                    tool_name=f"delegate_to_member_{i}",
+                    tool_description=f"Member {i}",
+                    model="test",
+                    system_instruction="test",
+                )
+                for i in range(2)
+            ],
+        )
+        leader: Agent[TeamDependencies, str] = Agent(FunctionModel(leader_model), deps_type=TeamDependencies)
+        register_member_tools(leader, team_config, {f"member_{i}": make_member(f"member_{i}") for i in range(2)})
+
+        deps = TeamDependencies(team_id="team-001", team_name="Test Team", round_number=1, execution_id="exec-test")
+        result = await leader.run("task", deps=deps)
+
+        assert result.output == "final"
+        assert max_running == 2
+        assert [s.content for s in deps.submissions] == ["task 0 done", "task 1 done", "task 2 done", "task 3 done"]
+
+    def test_failed_call_does_not_block_later_submissions(self) -> None:
+        """失敗した呼び出し（None）は記録されず、後続の記録を妨げない"""
+        deps = TeamDependencies(team_id="team-001", team_name="Test Team", round_number=1, execution_id="exec-test")
+        first, second, third = (deps.begin_member_call() for _ in range(3))
+
+        def submission(name: str) -> MemberSubmission:
+            return MemberSubmission(
+                agent_name=name, agent_type="plain", content="", status="SUCCESS", usage=RunUsage()
+            )
+
+        deps.complete_member_call(third, submission("third"))
+        deps.complete_member_call(second, submission("second"))
+        assert deps.submissions == []
+
+        deps.complete_member_call(first, None)
+        assert [s.agent_name for s in deps.submissions] == ["second", "third"]
@@ -291,3 +291,59 @@ class TestToolFuncStatusPropagation:
         submission = deps.submissions[0]
         assert submission.status == "ERROR"
         assert submission.error_message == error_msg
+
+    @pytest.mark.asyncio
+    async def test_member_deadline_returns_error_submission(self) -> None:
+        """member_deadlineを超えたMember Agent呼び出しはERRORとして記録され、Leaderに応答を返す"""
+        import asyncio
+        from typing import Any
+        from unittest.mock import AsyncMock
+
+        from mixseek.agents.leader.dependencies import TeamDependencies
+        from mixseek.agents.member.base import BaseMemberAgent
+
+        async def slow_execute(task: str, context: dict[str, Any]) -> Any:
+            await asyncio.sleep(10)
+
+        mock_member_agent = AsyncMock(spec=BaseMemberAgent)
+        mock_member_agent.execute.side_effect = slow_execute
+
+        team_config = TeamConfig(
+            team_id="team-001",
+            team_name="Test Team",
+            members=[
+                TeamMemberAgentConfig(
+                    agent_name="slow_agent",
+                    agent_type="plain",
+                    tool_name="delegate_to_slow_agent",
+                    tool_description="Slow agent",
+                    model="gemini-2.5-flash-lite",
+                    system_instruction="test",
+                )
+            ],
+        )
+
+        leader_agent: Any = Mock()
+        registered_tools: list[Any] = []
+        leader_agent.tool = lambda func: registered_tools.append(func)
+        register_member_tools(leader_agent, team_config, {"slow_agent": mock_member_agent})
+        tool_func = registered_tools[0]
+
+        deps = TeamDependencies(
+            team_id="team-001",
+            team_name="Test Team",
+            round_number=1,
+            execution_id="exec-test",
+            member_deadline=asyncio.get_running_loop().time() + 0.05,
+        )
+        mock_ctx: Any = Mock()
+        mock_ctx.deps = deps
+
+        result = await asyncio.wait_for(tool_func(mock_ctx, "slow task"), timeout=5)
+
+        assert "timed out" in result
+        assert len(deps.submissions) == 1
+        assert deps.submissions[0].status == "ERROR"
+        assert "slow_agent" in (deps.submissions[0].error_message or "")
+        # 経過時間は呼び出し開始から計測される（タイムアウト時にリセットしない）
+        assert deps.submissions[0].execution_time_ms >= 40
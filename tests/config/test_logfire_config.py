@@ -22,6 +22,9 @@ def clean_env() -> Generator[None]:
         "LOGFIRE_SEND_TO_LOGFIRE",
         "MIXSEEK_LOG_CONSOLE",
         "MIXSEEK_LOG_FILE",
+        "LOGFIRE_SPAN_SAMPLE_RATE",
+        "LOGFIRE_SPAN_SLOW_THRESHOLD_MS",
+        "LOGFIRE_SPAN_MAX_ATTRIBUTE_LENGTH",
     ]
     original_env = {}
     for var in env_vars_to_clean:
@@ -86,6 +89,21 @@ class TestLogfireConfigExistingFields:
         assert config.send_to_logfire is True
         assert config.console_output is True
 
+    def test_from_env_span_export_settings(self, clean_env: None) -> None:
+        os.environ["LOGFIRE_SPAN_SAMPLE_RATE"] = "0.25"
+        os.environ["LOGFIRE_SPAN_SLOW_THRESHOLD_MS"] = "500"
+        os.environ["LOGFIRE_SPAN_MAX_ATTRIBUTE_LENGTH"] = "1024"
+        config = LogfireConfig.from_env()
+        assert config.span_sample_rate == 0.25
+        assert config.span_slow_threshold_ms == 500.0
+        assert config.span_max_attribute_length == 1024
+
+    def test_from_env_span_export_defaults(self, clean_env: None) -> None:
+        config = LogfireConfig.from_env()
+        assert config.span_sample_rate == 1.0
+        assert config.span_slow_threshold_ms is None
+        assert config.span_max_attribute_length == 8192
+
     def test_direct_construction(self) -> None:
         """直接構築でフィールドが正しく設定される"""
         config = LogfireConfig(
@@ -19,6 +19,7 @@ def clean_env() -> Generator[None]:
         "MIXSEEK_LOG_CONSOLE",
         "MIXSEEK_LOG_FILE",
         "MIXSEEK_LOG_FORMAT",
+        "MIXSEEK_LOG_QUEUE",
     ]
     original_env = {}
     for var in env_vars_to_clean:
@@ -124,6 +125,11 @@ class TestLoggingConfigFromEnv:
         config = LoggingConfig.from_env()
         assert config.file_enabled is True
 
+    def test_from_env_queue_disabled(self, clean_env: None) -> None:
+        os.environ["MIXSEEK_LOG_QUEUE"] = "false"
+        config = LoggingConfig.from_env()
+        assert config.queue_enabled is False
+
     def test_from_env_log_format_json(self, clean_env: None) -> None:
         """MIXSEEK_LOG_FORMAT=json を読み取る"""
         os.environ["MIXSEEK_LOG_FORMAT"] = "json"
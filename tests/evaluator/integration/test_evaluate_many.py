@@ -0,0 +1,172 @@
+"""Integration tests for bulk evaluation (Evaluator.evaluate_many).
+
+Tests cover:
+- Input-ordered outcomes with per-pair failures recorded instead of raised
+- Bounded concurrency across pairs and across metrics
+- Token usage per pair and for the whole batch
+- Usage recording in evaluate_with_llm
+"""
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai.usage import RunUsage
+
+from mixseek.config.manager import ConfigurationManager
+from mixseek.config.schema import PromptBuilderSettings
+from mixseek.evaluator import EvaluationOutcome, EvaluationUsage
+from mixseek.evaluator.evaluator import Evaluator
+from mixseek.evaluator.exceptions import EvaluatorAPIError
+from mixseek.evaluator.llm_client import evaluate_with_llm
+from mixseek.evaluator.usage import record_evaluation_usage, track_evaluation_usage
+from mixseek.models.evaluation_request import EvaluationRequest
+from mixseek.models.evaluation_result import MetricScore
+
+METRIC_NAMES = ("ClarityCoherence", "Coverage", "Relevance")
+
+
+def _make_evaluator(temp_workspace: Path) -> Evaluator:
+    settings = ConfigurationManager(workspace=temp_workspace).get_evaluator_settings()
+    return Evaluator(settings=settings, prompt_builder_settings=PromptBuilderSettings())
+
+
+def _requests(count: int) -> list[EvaluationRequest]:
+    return [EvaluationRequest(user_query=f"query {i}", submission=f"answer {i}") for i in range(count)]
+
+
+class _FakeMetrics:
+    """Patch the built-in metrics with fakes that record concurrency and token usage."""
+
+    def __init__(self, evaluator: Evaluator, fail_query: str | None = None, delay: float = 0.01) -> None:
+        self.evaluator = evaluator
+        self.fail_query = fail_query
+        self.delay = delay
+        self.active_metrics = 0
+        self.peak_metrics = 0
+        self.active_queries: Counter[str] = Counter()
+        self.peak_queries = 0
+
+    def _make_eval(self, name: str) -> Any:
+        async def evaluate(*args: Any, user_query: str, **kwargs: Any) -> MetricScore:
+            self.active_metrics += 1
+            self.peak_metrics = max(self.peak_metrics, self.active_metrics)
+            self.active_queries[user_query] += 1
+            self.peak_queries = max(self.peak_queries, len(self.active_queries))
+            try:
+                await asyncio.sleep(self.delay)
+                record_evaluation_usage(RunUsage(input_tokens=10, output_tokens=2, requests=1))
+                if user_query == self.fail_query:
+                    raise EvaluatorAPIError("API failure")
+                return MetricScore(metric_name=name, score=float(user_query.split()[-1]), evaluator_comment="ok")
+            finally:
+                self.active_metrics -= 1
+                self.active_queries[user_query] -= 1
+                if not self.active_queries[user_query]:
+                    del self.active_queries[user_query]
+
+        return evaluate
+
+    def __enter__(self) -> "_FakeMetrics":
+        metrics = self.evaluator._builtin_metrics
+        self._patches = [patch.object(metrics[name], "evaluate", new=self._make_eval(name)) for name in METRIC_NAMES]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        for p in self._patches:
+            p.stop()
+
+
+class TestEvaluateMany:
+    """Test Evaluator.evaluate_many."""
+
+    @pytest.mark.asyncio
+    async def test_outcomes_in_input_order_with_failures_recorded(
+        self, temp_workspace: Path, mock_all_api_keys: None
+    ) -> None:
+        """A failing pair does not abort the batch and outcomes keep input order."""
+        evaluator = _make_evaluator(temp_workspace)
+        completed: list[int] = []
+
+        async def on_outcome(outcome: EvaluationOutcome) -> None:
+            completed.append(outcome.index)
+
+        with _FakeMetrics(evaluator, fail_query="query 1"):
+            batch = await evaluator.evaluate_many(_requests(4), max_concurrent_requests=2, on_outcome=on_outcome)
+
+        assert [outcome.index for outcome in batch.outcomes] == [0, 1, 2, 3]
+        assert sorted(completed) == [0, 1, 2, 3]
+        assert (batch.succeeded, batch.failed) == (3, 1)
+        assert isinstance(batch.outcomes[1].error, EvaluatorAPIError)
+        assert batch.outcomes[3].result is not None
+        assert batch.outcomes[3].result.overall_score == 3.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("max_requests", "max_metrics"), [(1, None), (3, None), (3, 2)])
+    async def test_concurrency_is_bounded_across_pairs_and_metrics(
+        self,
+        temp_workspace: Path,
+        mock_all_api_keys: None,
+        max_requests: int,
+        max_metrics: int | None,
+    ) -> None:
+        """At most max_concurrent_requests pairs and max_concurrent_metrics metrics run at once."""
+        evaluator = _make_evaluator(temp_workspace)
+
+        with _FakeMetrics(evaluator) as fake:
+            await evaluator.evaluate_many(
+                _requests(6), max_concurrent_requests=max_requests, max_concurrent_metrics=max_metrics
+            )
+
+        expected_metrics = max_metrics or max_requests * evaluator.config.max_concurrent_metrics
+        assert fake.peak_queries <= max_requests
+        assert fake.peak_metrics == min(expected_metrics, max_requests * len(METRIC_NAMES))
+
+    @pytest.mark.asyncio
+    async def test_token_usage_and_throughput(self, temp_workspace: Path, mock_all_api_keys: None) -> None:
+        """Usage is tracked per pair and summed for the batch."""
+        evaluator = _make_evaluator(temp_workspace)
+
+        with _FakeMetrics(evaluator):
+            batch = await evaluator.evaluate_many(_requests(2))
+
+        assert batch.outcomes[0].usage == EvaluationUsage(input_tokens=30, output_tokens=6, requests=3)
+        assert batch.usage == EvaluationUsage(input_tokens=60, output_tokens=12, requests=6)
+        assert batch.elapsed_seconds > 0
+        assert batch.pairs_per_minute > 0
+        assert batch.tokens_per_minute == pytest.approx(72 * 60 / batch.elapsed_seconds)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, temp_workspace: Path) -> None:
+        evaluator = _make_evaluator(temp_workspace)
+
+        with pytest.raises(ValueError, match="at least 1"):
+            await evaluator.evaluate_many(_requests(1), max_concurrent_requests=0)
+
+
+class _Score(BaseModel):
+    score: float
+    comment: str
+
+
+@pytest.mark.asyncio
+@patch("mixseek.evaluator.llm_client.create_authenticated_model")
+@patch("mixseek.evaluator.llm_client.Agent")
+async def test_evaluate_with_llm_records_usage(mock_agent_class: MagicMock, mock_create_model: MagicMock) -> None:
+    """evaluate_with_llm adds the agent run usage to every active tracker."""
+    mock_result = MagicMock()
+    mock_result.output = _Score(score=80.0, comment="ok")
+    mock_result.usage.return_value = RunUsage(input_tokens=100, output_tokens=20, requests=1)
+    mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+
+    with track_evaluation_usage() as outer:
+        with track_evaluation_usage() as inner:
+            await evaluate_with_llm(instruction="judge", user_prompt="q", model="openai:gpt-4o", response_model=_Score)
+
+    assert inner == outer == EvaluationUsage(input_tokens=100, output_tokens=20, requests=1)
@@ -2,11 +2,12 @@
 
 Tests cover:
 - Basic evaluation with default config and all 3 metrics
-- Sequential metric evaluation (no parallel execution)
+- Parallel metric evaluation (bounded concurrency, config-ordered results)
 - LLM API retry logic with mocked failures
 - Empty/whitespace input validation
 """
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -17,7 +18,7 @@ from pydantic import ValidationError
 from mixseek.config.manager import ConfigurationManager
 from mixseek.config.schema import PromptBuilderSettings
 from mixseek.evaluator.evaluator import Evaluator
-from mixseek.evaluator.exceptions import EvaluatorAPIError
+from mixseek.evaluator.exceptions import EvaluatorAPIError, MetricEvaluationError
 from mixseek.models.evaluation_request import EvaluationRequest
 from mixseek.models.evaluation_result import MetricScore
 
@@ -141,8 +142,8 @@ class TestBasicEvaluation:
         assert result.overall_score == pytest.approx(expected_overall, abs=0.01)
 
 
-class TestSequentialEvaluation:
-    """Test that metrics are evaluated sequentially, not in parallel."""
+class TestParallelEvaluation:
+    """Test that metrics are evaluated in parallel with bounded concurrency."""
 
     @pytest.mark.asyncio
     async def test_metrics_evaluated_in_order(
@@ -151,7 +152,7 @@ class TestSequentialEvaluation:
         sample_evaluation_request_data: dict[str, Any],
         mock_all_api_keys: None,
     ) -> None:
-        """Test that metrics are called sequentially in configuration order."""
+        """Test that metric evaluations are started in configuration order."""
         manager = ConfigurationManager(workspace=temp_workspace)
         settings = manager.get_evaluator_settings()
         prompt_builder_settings = PromptBuilderSettings()
@@ -212,6 +213,153 @@ class TestSequentialEvaluation:
                 await evaluator.evaluate(request)
 
             assert "API failure" in str(exc_info.value)
+            assert exc_info.value.metric_name == "ClarityCoherence"
+
+    @staticmethod
+    def _make_evaluator(temp_workspace: Path, **overrides: Any) -> Evaluator:
+        manager = ConfigurationManager(workspace=temp_workspace)
+        settings = manager.get_evaluator_settings().model_copy(update=overrides)
+        return Evaluator(settings=settings, prompt_builder_settings=PromptBuilderSettings())
+
+    @pytest.mark.asyncio
+    async def test_results_keep_config_order_when_completion_differs(
+        self,
+        temp_workspace: Path,
+        sample_evaluation_request_data: dict[str, Any],
+        mock_all_api_keys: None,
+    ) -> None:
+        """Test that results follow config order even if later metrics finish first."""
+        evaluator = self._make_evaluator(temp_workspace)
+        request = EvaluationRequest(**sample_evaluation_request_data, config=None)
+        delays = {"ClarityCoherence": 0.03, "Coverage": 0.02, "Relevance": 0.0}
+        completion_order: list[str] = []
+
+        def make_eval(name: str) -> Any:
+            async def evaluate(*args: Any, **kwargs: Any) -> MetricScore:
+                await asyncio.sleep(delays[name])
+                completion_order.append(name)
+                return MetricScore(metric_name=name, score=80.0, evaluator_comment="ok")
+
+            return evaluate
+
+        metrics = evaluator._builtin_metrics
+        with (
+            patch.object(metrics["ClarityCoherence"], "evaluate", new=make_eval("ClarityCoherence")),
+            patch.object(metrics["Coverage"], "evaluate", new=make_eval("Coverage")),
+            patch.object(metrics["Relevance"], "evaluate", new=make_eval("Relevance")),
+        ):
+            result = await evaluator.evaluate(request)
+
+        assert completion_order == ["Relevance", "Coverage", "ClarityCoherence"]
+        assert [m.metric_name for m in result.metrics] == ["ClarityCoherence", "Coverage", "Relevance"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_metrics", [1, 2, 3])
+    async def test_concurrency_is_bounded(
+        self,
+        temp_workspace: Path,
+        sample_evaluation_request_data: dict[str, Any],
+        mock_all_api_keys: None,
+        max_concurrent_metrics: int,
+    ) -> None:
+        """Test that at most max_concurrent_metrics metrics run at the same time."""
+        evaluator = self._make_evaluator(temp_workspace, max_concurrent_metrics=max_concurrent_metrics)
+        request = EvaluationRequest(**sample_evaluation_request_data, config=None)
+        active = 0
+        peak = 0
+
+        def make_eval(name: str) -> Any:
+            async def evaluate(*args: Any, **kwargs: Any) -> MetricScore:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return MetricScore(metric_name=name, score=80.0, evaluator_comment="ok")
+
+            return evaluate
+
+        metrics = evaluator._builtin_metrics
+        with (
+            patch.object(metrics["ClarityCoherence"], "evaluate", new=make_eval("ClarityCoherence")),
+            patch.object(metrics["Coverage"], "evaluate", new=make_eval("Coverage")),
+            patch.object(metrics["Relevance"], "evaluate", new=make_eval("Relevance")),
+        ):
+            await evaluator.evaluate(request)
+
+        assert peak == max_concurrent_metrics
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_remaining_metrics(
+        self,
+        temp_workspace: Path,
+        sample_evaluation_request_data: dict[str, Any],
+        mock_all_api_keys: None,
+    ) -> None:
+        """Test that fail_fast mode cancels in-flight metrics on the first failure."""
+        evaluator = self._make_evaluator(temp_workspace)
+        request = EvaluationRequest(**sample_evaluation_request_data, config=None)
+        cancelled: list[str] = []
+
+        async def slow_eval(*args: Any, **kwargs: Any) -> MetricScore:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            raise AssertionError("unreachable")
+
+        with (
+            patch.object(evaluator._builtin_metrics["ClarityCoherence"], "evaluate", new=slow_eval),
+            patch.object(evaluator._builtin_metrics["Coverage"], "evaluate", new=slow_eval),
+            patch.object(
+                evaluator._builtin_metrics["Relevance"],
+                "evaluate",
+                side_effect=EvaluatorAPIError("API failure"),
+            ),
+        ):
+            with pytest.raises(EvaluatorAPIError) as exc_info:
+                await asyncio.wait_for(evaluator.evaluate(request), timeout=5)
+
+        assert not isinstance(exc_info.value, MetricEvaluationError)
+        assert exc_info.value.metric_name == "Relevance"
+        assert cancelled == ["slow", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_collect_all_reports_every_failure(
+        self,
+        temp_workspace: Path,
+        sample_evaluation_request_data: dict[str, Any],
+        mock_all_api_keys: None,
+    ) -> None:
+        """Test that collect_all mode evaluates every metric and aggregates failures."""
+        evaluator = self._make_evaluator(temp_workspace, metric_error_mode="collect_all")
+        request = EvaluationRequest(**sample_evaluation_request_data, config=None)
+
+        with (
+            patch.object(
+                evaluator._builtin_metrics["ClarityCoherence"],
+                "evaluate",
+                side_effect=EvaluatorAPIError("clarity down"),
+            ),
+            patch.object(
+                evaluator._builtin_metrics["Coverage"],
+                "evaluate",
+                return_value=MetricScore(metric_name="Coverage", score=80.0, evaluator_comment="ok"),
+            ) as mock_coverage,
+            patch.object(
+                evaluator._builtin_metrics["Relevance"],
+                "evaluate",
+                side_effect=EvaluatorAPIError("relevance down"),
+            ),
+        ):
+            with pytest.raises(MetricEvaluationError) as exc_info:
+                await evaluator.evaluate(request)
+
+        assert mock_coverage.call_count == 1
+        assert list(exc_info.value.errors) == ["ClarityCoherence", "Relevance"]
+        assert "clarity down" in str(exc_info.value)
+        assert "relevance down" in str(exc_info.value)
 
 
 class TestRetryLogic:
@@ -13,11 +13,12 @@ import pytest
 from mixseek.config.logfire import LogfireConfig, LogfirePrivacyMode
 from mixseek.config.logging import LoggingConfig
 from mixseek.observability.logfire import (
+    BatchJsonSpanProcessor,
     JsonSpanProcessor,
     finalize_mode3_handlers,
     setup_logfire,
 )
-from mixseek.observability.logging_setup import setup_logging
+from mixseek.observability.logging_setup import BatchedStreamHandler, get_output_handlers, setup_logging
 
 
 @pytest.fixture
@@ -89,9 +90,11 @@ class TestTextMode:
         setup_logging(logging_config, temp_workspace)
 
         logger = logging.getLogger("mixseek")
-        # StreamHandler と FileHandler が存在
-        stream_handlers = [h for h in logger.handlers if type(h) is logging.StreamHandler]
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        # StreamHandler と FileHandler が存在（キュー経由の場合はパイプライン内）
+        stream_handlers = [
+            h for h in get_output_handlers(logger) if type(h) in (logging.StreamHandler, BatchedStreamHandler)
+        ]
+        file_handlers = [h for h in get_output_handlers(logger) if isinstance(h, logging.FileHandler)]
         assert len(stream_handlers) > 0
         assert len(file_handlers) > 0
 
@@ -99,7 +102,9 @@ class TestTextMode:
 
         # 除去後
         remaining = [
-            h for h in logger.handlers if type(h) is logging.StreamHandler or isinstance(h, logging.FileHandler)
+            h
+            for h in get_output_handlers(logger)
+            if type(h) in (logging.StreamHandler, BatchedStreamHandler) or isinstance(h, logging.FileHandler)
         ]
         assert len(remaining) == 0
 
@@ -109,7 +114,7 @@ class TestTextMode:
         setup_logging(logging_config, temp_workspace)
 
         logger = logging.getLogger("mixseek")
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = [h for h in get_output_handlers(logger) if isinstance(h, logging.FileHandler)]
         assert len(file_handlers) > 0
 
         # ストリームを事前に保持
@@ -175,6 +180,8 @@ class TestJsonMode:
         processors = call_kwargs.get("additional_span_processors")
         assert processors is not None
         assert any(isinstance(p, JsonSpanProcessor) for p in processors)
+        for p in processors:
+            p.shutdown()
 
 
 class TestJsonSpanProcessor:
@@ -358,6 +365,88 @@ class TestJsonSpanProcessor:
             # 空オブジェクトは有効なJSONとしてパースされる
             assert attrs["just_braces"] == {}
 
+    def test_long_attribute_truncated_without_parsing(self):
+        """max_attribute_length を超える属性値は切り詰められ、JSON復元されない"""
+        processor = JsonSpanProcessor(max_attribute_length=10)
+
+        span = MagicMock()
+        span.name = "test.span"
+        span.context.span_id = 0x123456
+        span.context.trace_id = 0xABCDEF
+        span.parent = None
+        span.attributes = {
+            "pydantic_ai.all_messages": '[{"role": "user", "content": "long message"}]',
+            "short": '{"a": 1}',
+        }
+
+        with patch.object(processor._traces_logger, "info") as mock_info:
+            processor.on_start(span)
+            attrs = mock_info.call_args[1]["extra"]["attributes"]
+            assert attrs["pydantic_ai.all_messages"].startswith('[{"role": ')
+            assert "truncated" in attrs["pydantic_ai.all_messages"]
+            assert attrs["short"] == {"a": 1}
+
+
+def _make_span(name: str, trace_id: int, duration_ns: int = 1000, status: str = "OK") -> MagicMock:
+    span = MagicMock()
+    span.name = name
+    span.context.span_id = 0x123456
+    span.context.trace_id = trace_id
+    span.parent = None
+    span.attributes = {"key": "value"}
+    span.start_time = 1_000_000_000
+    span.end_time = 1_000_000_000 + duration_ns
+    span.status.status_code.name = status
+    span.events = []
+    return span
+
+
+class TestBatchJsonSpanProcessor:
+    """BatchJsonSpanProcessor ユニットテスト"""
+
+    def test_records_exported_after_flush(self):
+        """on_start/on_end はキュー投入のみで、force_flush 後に出力される"""
+        processor = BatchJsonSpanProcessor(schedule_delay_seconds=0.05)
+        try:
+            with patch.object(processor._traces_logger, "info") as mock_info:
+                span = _make_span("test.span", trace_id=1)
+                processor.on_start(span)
+                processor.on_end(span)
+                assert processor.force_flush(timeout_millis=5000)
+
+                types = [c[1]["extra"]["type"] for c in mock_info.call_args_list]
+                assert types == ["span_start", "span_end"]
+        finally:
+            processor.shutdown()
+
+    def test_head_sampling_by_trace_id(self):
+        """sample_rate=0 の場合、通常のスパンは出力されない"""
+        processor = BatchJsonSpanProcessor(sample_rate=0.0, schedule_delay_seconds=0.05)
+        try:
+            with patch.object(processor._traces_logger, "info") as mock_info:
+                span = _make_span("test.span", trace_id=1)
+                processor.on_start(span)
+                processor.on_end(span)
+                assert processor.force_flush(timeout_millis=5000)
+                mock_info.assert_not_called()
+        finally:
+            processor.shutdown()
+
+    def test_tail_sampling_keeps_error_and_slow_spans(self):
+        """サンプリング対象外でもエラー/遅いスパンの span_end は出力される"""
+        processor = BatchJsonSpanProcessor(sample_rate=0.0, slow_threshold_ms=100, schedule_delay_seconds=0.05)
+        try:
+            with patch.object(processor._traces_logger, "info") as mock_info:
+                processor.on_end(_make_span("fast.ok", trace_id=1))
+                processor.on_end(_make_span("fast.error", trace_id=2, status="ERROR"))
+                processor.on_end(_make_span("slow.ok", trace_id=3, duration_ns=200_000_000))
+                assert processor.force_flush(timeout_millis=5000)
+
+                names = sorted(c[1]["extra"]["span_name"] for c in mock_info.call_args_list)
+                assert names == ["fast.error", "slow.ok"]
+        finally:
+            processor.shutdown()
+
 
 class TestExistingBehavior:
     """既存の動作互換性テスト"""
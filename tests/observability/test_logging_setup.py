@@ -6,6 +6,8 @@ TextFormatter, JsonFormatter, SkipTracesFilter のユニットテストを含む
 
 import json
 import logging
+import threading
+import time
 from collections.abc import Generator
 from pathlib import Path
 
@@ -13,15 +15,33 @@ import pytest
 
 from mixseek.config.logging import LoggingConfig
 from mixseek.observability.logging_setup import (
+    BatchedStreamHandler,
     JsonFormatter,
+    PipelineQueueHandler,
+    QueueLogPipeline,
     SkipTracesFilter,
     TextFormatter,
+    flush_logging,
+    get_output_handlers,
     setup_logging,
 )
 
 LOGGER_NAME = "mixseek"
 
 
+def _handler_kinds(logger: logging.Logger) -> list[str]:
+    """出力ハンドラの種別名一覧（キュー経由の場合はパイプライン内のハンドラを展開）"""
+    kinds = []
+    for h in get_output_handlers(logger):
+        if isinstance(h, logging.FileHandler):
+            kinds.append("FileHandler")
+        elif type(h) in (logging.StreamHandler, BatchedStreamHandler):
+            kinds.append("StreamHandler")
+        else:
+            kinds.append(type(h).__name__)
+    return kinds
+
+
 @pytest.fixture
 def temp_workspace(tmp_path: Path) -> Path:
     """テスト用一時ワークスペースディレクトリを作成"""
@@ -81,7 +101,7 @@ class TestSetupLoggingNamedLogger:
         setup_logging(config, temp_workspace)
 
         logger = logging.getLogger(LOGGER_NAME)
-        old_handlers = list(logger.handlers)
+        old_handlers = get_output_handlers(logger)
         file_handlers = [h for h in old_handlers if isinstance(h, logging.FileHandler)]
         assert len(file_handlers) > 0
 
@@ -129,7 +149,7 @@ class TestMode1LogfireDisabledText:
         config = LoggingConfig(log_format="text")
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" in handler_types
 
@@ -138,7 +158,7 @@ class TestMode1LogfireDisabledText:
         config = LoggingConfig(log_format="text")
         logger = setup_logging(config, temp_workspace)
 
-        for h in logger.handlers:
+        for h in get_output_handlers(logger):
             if isinstance(h, (logging.StreamHandler, logging.FileHandler)):
                 assert isinstance(h.formatter, TextFormatter)
 
@@ -157,6 +177,7 @@ class TestMode1LogfireDisabledText:
 
         logger.info("Test message for file")
 
+        assert flush_logging()
         log_file = temp_workspace / "logs" / "mixseek.log"
         content = log_file.read_text()
         assert "Test message for file" in content
@@ -170,7 +191,7 @@ class TestMode2LogfireDisabledJson:
         config = LoggingConfig(log_format="json")
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" in handler_types
 
@@ -179,7 +200,7 @@ class TestMode2LogfireDisabledJson:
         config = LoggingConfig(log_format="json")
         logger = setup_logging(config, temp_workspace)
 
-        for h in logger.handlers:
+        for h in get_output_handlers(logger):
             if isinstance(h, (logging.StreamHandler, logging.FileHandler)):
                 assert isinstance(h.formatter, JsonFormatter)
 
@@ -190,6 +211,7 @@ class TestMode2LogfireDisabledJson:
 
         logger.info("Test JSON message")
 
+        assert flush_logging()
         log_file = temp_workspace / "logs" / "mixseek.log"
         content = log_file.read_text().strip()
         data = json.loads(content)
@@ -202,6 +224,7 @@ class TestMode2LogfireDisabledJson:
 
         logger.info("Test", extra={"agent": "researcher", "score": 0.85})
 
+        assert flush_logging()
         log_file = temp_workspace / "logs" / "mixseek.log"
         content = log_file.read_text().strip()
         data = json.loads(content)
@@ -221,7 +244,7 @@ class TestMode3LogfireEnabledText:
         config = LoggingConfig(logfire_enabled=True, log_format="text")
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" in handler_types
         # LogfireLoggingHandler は logfire パッケージがインストールされている場合のみ
@@ -245,7 +268,7 @@ class TestMode3LogfireEnabledText:
         finalize_mode3_handlers()
 
         logger = logging.getLogger(LOGGER_NAME)
-        remaining_types = [type(h).__name__ for h in logger.handlers]
+        remaining_types = _handler_kinds(logger)
         # StreamHandler と FileHandler は除去されている
         # （LogfireLoggingHandler が残る場合あり）
         stream_or_file = [t for t in remaining_types if t in ("StreamHandler", "FileHandler")]
@@ -260,7 +283,7 @@ class TestMode4LogfireEnabledJson:
         config = LoggingConfig(logfire_enabled=True, log_format="json")
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" in handler_types
 
@@ -269,7 +292,7 @@ class TestMode4LogfireEnabledJson:
         config = LoggingConfig(logfire_enabled=True, log_format="json")
         logger = setup_logging(config, temp_workspace)
 
-        for h in logger.handlers:
+        for h in get_output_handlers(logger):
             if isinstance(h, (logging.StreamHandler, logging.FileHandler)):
                 assert isinstance(h.formatter, JsonFormatter)
 
@@ -298,7 +321,7 @@ class TestSetupLoggingDisableOutputs:
         config = LoggingConfig(console_enabled=False)
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" not in handler_types
         assert "FileHandler" in handler_types
 
@@ -306,7 +329,7 @@ class TestSetupLoggingDisableOutputs:
         config = LoggingConfig(file_enabled=False)
         logger = setup_logging(config, temp_workspace)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" not in handler_types
 
@@ -326,7 +349,7 @@ class TestSetupLoggingNoWorkspace:
         config = LoggingConfig()
         logger = setup_logging(config, workspace=None)
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
+        handler_types = _handler_kinds(logger)
         assert "StreamHandler" in handler_types
         assert "FileHandler" not in handler_types
 
@@ -498,3 +521,93 @@ class TestSkipTracesFilter:
             exc_info=None,
         )
         assert f.filter(record) is True
+
+
+class TestQueuePipeline:
+    """キュー経由のログパイプラインのテスト"""
+
+    def test_queue_handler_only_on_logger(self, temp_workspace: Path) -> None:
+        """queue_enabled=True: ロガーには PipelineQueueHandler のみが追加される"""
+        config = LoggingConfig()
+        logger = setup_logging(config, temp_workspace)
+
+        assert [type(h) for h in logger.handlers] == [PipelineQueueHandler]
+
+    def test_queue_disabled_direct_handlers(self, temp_workspace: Path) -> None:
+        """queue_enabled=False: 出力ハンドラがロガーに直接追加される"""
+        config = LoggingConfig(queue_enabled=False)
+        logger = setup_logging(config, temp_workspace)
+
+        assert not any(isinstance(h, PipelineQueueHandler) for h in logger.handlers)
+        assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+
+    def test_log_file_rotated_by_size(self, temp_workspace: Path) -> None:
+        """file_max_bytes を超えるとローテーションされる"""
+        config = LoggingConfig(console_enabled=False, file_max_bytes=200, file_backup_count=2)
+        logger = setup_logging(config, temp_workspace)
+
+        for i in range(20):
+            logger.info(f"rotation test message {i}")
+        assert flush_logging()
+
+        log_dir = temp_workspace / "logs"
+        assert (log_dir / "mixseek.log.1").exists()
+        assert not (log_dir / "mixseek.log.3").exists()
+
+    def test_dropped_records_reported(self) -> None:
+        """キュー満杯で破棄したレコード数が1件の WARNING として出力される"""
+        records: list[logging.LogRecord] = []
+
+        class _Collect(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                records.append(record)
+
+        pipeline = QueueLogPipeline([_Collect()], max_queue_size=1)
+        try:
+            for i in range(1000):
+                pipeline.enqueue(logging.LogRecord("mixseek", logging.INFO, "", 0, f"m{i}", (), None))
+            assert pipeline.flush(timeout=5.0)
+        finally:
+            pipeline.stop()
+
+        dropped_reports = [r for r in records if "dropped" in r.getMessage()]
+        info_records = [r for r in records if r.levelno == logging.INFO]
+        assert len(info_records) + sum(int(r.getMessage().split()[4]) for r in dropped_reports) == 1000
+
+    def test_warning_never_blocks_and_evicts_oldest_info(self) -> None:
+        """キュー満杯でも WARNING は待たず、最も古い INFO と入れ替えて格納される"""
+        writer_busy = threading.Event()
+        release = threading.Event()
+        messages: list[str] = []
+
+        class _Blocking(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                if record.getMessage() == "first":
+                    writer_busy.set()
+                    release.wait(5.0)
+                messages.append(record.getMessage())
+
+        def make(level: int, msg: str) -> logging.LogRecord:
+            return logging.LogRecord("mixseek", level, "", 0, msg, (), None)
+
+        pipeline = QueueLogPipeline([_Blocking()], max_queue_size=2)
+        try:
+            pipeline.enqueue(make(logging.INFO, "first"))
+            assert writer_busy.wait(5.0)
+            pipeline.enqueue(make(logging.INFO, "info-1"))
+            pipeline.enqueue(make(logging.INFO, "info-2"))
+
+            started = time.monotonic()
+            pipeline.enqueue(make(logging.WARNING, "warning"))
+            pipeline.enqueue(make(logging.ERROR, "error"))
+            pipeline.enqueue(make(logging.ERROR, "no-room"))
+            assert time.monotonic() - started < 0.5
+
+            release.set()
+            assert pipeline.flush(timeout=5.0)
+        finally:
+            release.set()
+            pipeline.stop()
+
+        # 破棄件数の報告は "first" のバッチ直後に出力される（info-1, info-2 を追い出し、no-room は破棄）
+        assert messages == ["first", "Log queue full: dropped 3 record(s)", "warning", "error"]
@@ -267,3 +267,91 @@ def test_get_failed_teams_from_progress_files_no_logs_dir(tmp_path: Path) -> Non
     result = _get_failed_teams_from_progress_files("test-execution", tmp_path)
 
     assert result == []
+
+
+def test_get_all_teams_execution_status_from_progress_event_log(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """別プロセスの実行は進捗イベントログから最新状態を取得."""
+    from mixseek.core.progress import ProgressBus, ProgressEvent, progress_log_path
+    from mixseek.ui.services.execution_service import get_all_teams_execution_status
+
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    execution_id = "test-execution-log"
+    log_path = progress_log_path(tmp_path, execution_id)
+
+    # 別プロセスのバス（このプロセスのバスには届かない）
+    other_process_bus = ProgressBus()
+
+    def publish(team_id: str, current_round: int, status: str) -> None:
+        other_process_bus.publish(
+            ProgressEvent(
+                execution_id=execution_id,
+                team_id=team_id,
+                team_name=f"Team {team_id}",
+                status=status,
+                current_round=current_round,
+                total_rounds=3,
+                updated_at="2025-01-01T10:00:00+00:00",
+            ),
+            log_path=log_path,
+        )
+
+    publish("b", 1, "running")
+    publish("a", 1, "running")
+    assert [(t.team_id, t.current_round) for t in get_all_teams_execution_status(execution_id)] == [
+        ("a", 1),
+        ("b", 1),
+    ]
+
+    publish("a", 2, "completed")
+    result = get_all_teams_execution_status(execution_id)
+    assert [(t.team_id, t.current_round, t.status) for t in result] == [
+        ("a", 2, "completed"),
+        ("b", 1, "running"),
+    ]
+
+
+def test_get_execution_status_updated_by_progress_events(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """バックグラウンド実行中の状態が進捗イベントで更新される."""
+    import threading
+
+    import mixseek.ui.services.execution_service as execution_service
+    from mixseek.core.progress import ProgressEvent, get_progress_bus
+
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    published = threading.Event()
+    release = threading.Event()
+
+    def fake_run_orchestration(prompt: str, option: OrchestrationOption, execution_id: str) -> MagicMock:
+        get_progress_bus().publish(
+            ProgressEvent(
+                execution_id=execution_id,
+                team_id="team-a",
+                team_name="Team A",
+                status="running",
+                current_round=2,
+                total_rounds=3,
+                updated_at="2025-01-01T10:00:00+00:00",
+            )
+        )
+        published.set()
+        release.wait(timeout=5)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(execution_service, "run_orchestration", fake_run_orchestration)
+    option = OrchestrationOption(
+        config_file_name="test.toml",
+        orchestration_id="test_orch",
+        display_label="test.toml - test_orch",
+    )
+
+    execution_id = execution_service.run_orchestration_in_background("task", option)
+    try:
+        assert published.wait(timeout=5)
+        state = execution_service.get_execution_status(execution_id)
+        assert state.status == ExecutionStatus.RUNNING
+        assert (state.current_round, state.total_rounds) == (2, 3)
+    finally:
+        release.set()
+        get_progress_bus().clear(execution_id)
@@ -5,6 +5,7 @@ from pathlib import Path
 import duckdb
 import pytest
 
+from mixseek.storage.aggregation_store import AggregationStore
 from mixseek.ui.services.leaderboard_service import (
     fetch_leaderboard,
     fetch_team_submission,
@@ -144,3 +145,24 @@ def test_fetch_team_submission_returns_none_when_not_found(monkeypatch: pytest.M
     monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
     submission = fetch_team_submission("nonexistent-exec-id", "nonexistent-team", 1)
     assert submission is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_leaderboard_while_store_holds_writer(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """同一プロセス内で書き込み接続が開いていても（Orchestrator実行中）リーダーボードを取得できる."""
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    store = AggregationStore(db_path=tmp_path / "mixseek.db")
+    await store.save_to_leader_board(
+        execution_id="exec1",
+        team_id="team1",
+        team_name="Team Alpha",
+        round_number=1,
+        submission_content="Content 1",
+        submission_format="md",
+        score=95.5,
+        score_details={},
+    )
+
+    leaderboard = fetch_leaderboard("exec1")
+
+    assert [entry.team_id for entry in leaderboard] == ["team1"]
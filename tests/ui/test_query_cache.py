@@ -0,0 +1,87 @@
+"""Tests for watermark-based UI query cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from mixseek.ui.utils.query_cache import clear_query_cache, fetch_watermark, watermark_cached
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    clear_query_cache()
+    yield
+    clear_query_cache()
+
+
+def _create_leader_board(db_path: Path) -> None:
+    conn = duckdb.connect(str(db_path))
+    conn.execute("""
+        CREATE TABLE leader_board (
+            execution_id VARCHAR NOT NULL,
+            team_id VARCHAR NOT NULL,
+            score FLOAT NOT NULL,
+            updated_at TIMESTAMP NOT NULL
+        )
+    """)
+    conn.execute("INSERT INTO leader_board VALUES ('exec1', 'team1', 1.0, '2025-01-01 10:00:00')")
+    conn.close()
+
+
+def test_fetch_watermark_returns_none_when_db_not_found(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """DBファイル不在時はNoneを返す."""
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    assert fetch_watermark("leader_board", "updated_at", "exec1") is None
+
+
+def test_fetch_watermark_returns_none_when_column_missing(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """カラム不在時はNoneを返す（キャッシュを使わない）."""
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    _create_leader_board(tmp_path / "mixseek.db")
+    assert fetch_watermark("leader_board", "missing_column", "exec1") is None
+
+
+def test_watermark_cached_reuses_result_until_data_changes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """ウォーターマークが変わらない間は再取得しない."""
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    db_path = tmp_path / "mixseek.db"
+    _create_leader_board(db_path)
+    calls: list[str] = []
+
+    @watermark_cached("leader_board")
+    def fetch_scores(execution_id: str) -> list[float]:
+        calls.append(execution_id)
+        conn = duckdb.connect(str(db_path), read_only=True)
+        try:
+            rows = conn.execute("SELECT score FROM leader_board WHERE execution_id = ?", [execution_id]).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    assert fetch_scores("exec1") == [1.0]
+    assert fetch_scores("exec1") == [1.0]
+    assert calls == ["exec1"]
+
+    conn = duckdb.connect(str(db_path))
+    conn.execute("INSERT INTO leader_board VALUES ('exec1', 'team2', 2.0, '2025-01-01 10:05:00')")
+    conn.close()
+
+    assert fetch_scores("exec1") == [1.0, 2.0]
+    assert calls == ["exec1", "exec1"]
+
+
+def test_watermark_cached_calls_through_without_db(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """ウォーターマーク取得不可の場合は毎回元の関数を呼ぶ."""
+    monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+    calls: list[str] = []
+
+    @watermark_cached("leader_board")
+    def fetch_scores(execution_id: str) -> list[float]:
+        calls.append(execution_id)
+        return []
+
+    fetch_scores("exec1")
+    fetch_scores("exec1")
+    assert calls == ["exec1", "exec1"]
@@ -0,0 +1,88 @@
+"""mixseek CLI 起動時間テスト
+
+コマンドモジュールは初回使用時に読み込まれる（LazyCommandGroup）。
+`python -X importtime` の出力から、起動時に読み込まれるモジュールと
+import時間が予算内であることを確認する。
+"""
+
+import subprocess
+import sys
+
+import click
+import pytest
+import typer
+
+from mixseek.cli.main import LAZY_COMMANDS, app, load_command
+
+# `mixseek --version` の mixseek.cli.main import時間の上限（マイクロ秒）
+IMPORT_TIME_BUDGET_US = 500_000
+
+# 特定のコマンドでのみ必要な重い依存
+HEAVY_MODULES = {
+    "streamlit",
+    "duckdb",
+    "pandas",
+    "pydantic_ai",
+    "google.genai",
+    "openai",
+    "anthropic",
+    "mixseek.core.auth",
+    "mixseek.orchestrator",
+}
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """CLIを`-X importtime`付きで実行し、モジュールごとの累積import時間（マイクロ秒）を返す"""
+    code = f"from mixseek.cli.main import app; app({list(args)!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_version_within_import_budget() -> None:
+    """--version は重い依存を読み込まず、import時間が予算内"""
+    times = _import_times("--version")
+
+    assert "mixseek.cli.main" in times
+    assert HEAVY_MODULES.isdisjoint(times), sorted(HEAVY_MODULES & times.keys())
+    assert times["mixseek.cli.main"] < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize(
+    ("command", "dependency", "unused"),
+    [("member", "mixseek.config.member_agent_loader", {"streamlit", "duckdb", "mixseek.orchestrator"})],
+)
+def test_command_loads_only_its_own_dependencies(command: str, dependency: str, unused: set[str]) -> None:
+    """サブコマンド実行時は他コマンドの依存を読み込まない"""
+    times = _import_times(command, "--help")
+
+    assert dependency in times
+    assert unused.isdisjoint(times), sorted(unused & times.keys())
+
+
+def test_all_commands_registered() -> None:
+    """全コマンドが登録順に一覧され、読み込める"""
+    assert load_command("config").name == "config"
+
+    group = typer.main.get_command(app)
+    assert isinstance(group, click.Group)
+    ctx = click.Context(group)
+
+    assert group.list_commands(ctx) == list(LAZY_COMMANDS)
+    for name in LAZY_COMMANDS:
+        command = group.get_command(ctx, name)
+        assert command is not None
+        assert command.name == name
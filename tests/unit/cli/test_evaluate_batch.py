@@ -0,0 +1,218 @@
+"""Unit tests for bulk evaluation (`mixseek evaluate --input`).
+
+Test Coverage:
+    - load_evaluation_inputs: id defaults, optional leaderboard fields, invalid lines
+    - run_evaluation_batch: incremental JSONL/DuckDB results, resume, id collisions across files
+    - evaluate --input: JSONL stdout, exit code, argument validation
+"""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from mixseek.cli.batch_jsonl import default_batch_output_path
+from mixseek.cli.commands.evaluate_batch import (
+    DuckDBResultWriter,
+    JsonlResultWriter,
+    create_result_writer,
+    load_evaluation_inputs,
+    run_evaluation_batch,
+)
+from mixseek.cli.main import app
+from mixseek.config.schema import EvaluatorSettings, PromptBuilderSettings
+from mixseek.evaluator import Evaluator
+from mixseek.evaluator.exceptions import EvaluatorAPIError
+from mixseek.models.evaluation_result import MetricScore
+
+_EVALUATE_MODULE = "mixseek.cli.commands.evaluate"
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    path = tmp_path / "submissions.jsonl"
+    lines = [
+        {"id": "a", "user_query": "q", "submission": "good", "team_id": "t1", "execution_id": "e1", "round_number": 1},
+        {"user_query": "q", "submission": "bad"},
+        {"id": "c", "user_query": "q", "submission": "fine"},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def evaluator() -> Iterator[Evaluator]:
+    """Evaluator whose built-in metrics score without calling an LLM ("bad" submissions fail)."""
+    evaluator = Evaluator(settings=EvaluatorSettings(), prompt_builder_settings=PromptBuilderSettings())
+    fail = {"bad"}
+
+    def make_eval(name: str) -> Any:
+        async def evaluate(*args: Any, submission: str, **kwargs: Any) -> MetricScore:
+            if submission in fail:
+                raise EvaluatorAPIError("API failure")
+            return MetricScore(metric_name=name, score=60.0, evaluator_comment="ok")
+
+        return evaluate
+
+    patches = [
+        patch.object(metric, "evaluate", new=make_eval(name)) for name, metric in evaluator._builtin_metrics.items()
+    ]
+    for p in patches:
+        p.start()
+    evaluator.fail = fail  # type: ignore[attr-defined]
+    yield evaluator
+    for p in patches:
+        p.stop()
+
+
+class TestLoadEvaluationInputs:
+    """Test input JSONL parsing."""
+
+    def test_ids_and_optional_fields(self, input_file: Path) -> None:
+        inputs = load_evaluation_inputs(input_file)
+
+        assert [item.input_id for item in inputs] == ["a", "line-2", "c"]
+        assert inputs[0].request.team_id == "t1"
+        assert inputs[0].request.round_number == 1
+        assert inputs[1].request.team_id is None
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            ("not json\n", "invalid JSON"),
+            ('{"user_query": "q", "submission": " "}\n', "invalid evaluation pair"),
+            (
+                '{"id": "x", "user_query": "q", "submission": "a"}\n'
+                '{"id": "x", "user_query": "q", "submission": "b"}\n',
+                "duplicate id",
+            ),
+        ],
+    )
+    def test_invalid_lines(self, tmp_path: Path, content: str, message: str) -> None:
+        path = tmp_path / "in.jsonl"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=message):
+            load_evaluation_inputs(path)
+
+
+class TestRunEvaluationBatch:
+    """Test incremental writes and resume."""
+
+    @pytest.mark.asyncio
+    async def test_jsonl_results_resume_failed_pairs(self, input_file: Path, evaluator: Evaluator) -> None:
+        output = default_batch_output_path(input_file)
+        inputs = load_evaluation_inputs(input_file)
+
+        writer = create_result_writer(output)
+        assert isinstance(writer, JsonlResultWriter)
+        first = await run_evaluation_batch(evaluator, inputs, writer, max_concurrent_requests=2)
+        writer.close()
+
+        records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert (first.succeeded, first.failed) == (2, 1)
+        assert {record["id"]: record["status"] for record in records} == {"a": "ok", "line-2": "error", "c": "ok"}
+        assert records[0]["usage"] == {"input_tokens": 0, "output_tokens": 0, "requests": 0}
+
+        evaluator.fail.clear()  # type: ignore[attr-defined]
+        writer = create_result_writer(output)
+        second = await run_evaluation_batch(evaluator, inputs, writer)
+        writer.close()
+
+        assert [outcome.request.submission for outcome in second.outcomes] == ["bad"]
+        assert second.succeeded == 1
+
+    @pytest.mark.asyncio
+    async def test_duckdb_results_resume_failed_pairs(
+        self, input_file: Path, evaluator: Evaluator, tmp_path: Path
+    ) -> None:
+        db_path = tmp_path / "rescored.duckdb"
+        inputs = load_evaluation_inputs(input_file)
+
+        writer = create_result_writer(db_path)
+        assert isinstance(writer, DuckDBResultWriter)
+        await run_evaluation_batch(evaluator, inputs, writer)
+        evaluator.fail.clear()  # type: ignore[attr-defined]
+        second = await run_evaluation_batch(evaluator, inputs, writer)
+
+        assert len(second.outcomes) == 1
+        rows = (
+            writer.store._get_connection()
+            .execute("SELECT input_id, team_id, overall_score, error FROM evaluation_results ORDER BY input_id")
+            .fetchall()
+        )
+        assert rows == [("a", "t1", 60.0, None), ("c", None, 60.0, None), ("line-2", None, 60.0, None)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output_name", ["rescored.duckdb", "rescored.jsonl"])
+    async def test_second_export_with_same_ids_is_evaluated(
+        self, input_file: Path, evaluator: Evaluator, tmp_path: Path, output_name: str
+    ) -> None:
+        """A second file whose line-<n> ids collide is neither skipped nor overwrites earlier rows."""
+        output = tmp_path / output_name
+        first_inputs = load_evaluation_inputs(input_file)
+        second_file = tmp_path / "second.jsonl"
+        lines = [{"user_query": "q2", "submission": "other"}, {"user_query": "q2", "submission": "another"}]
+        second_file.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+        second_inputs = load_evaluation_inputs(second_file)
+        assert second_inputs[1].input_id == first_inputs[1].input_id == "line-2"
+        evaluator.fail.clear()  # type: ignore[attr-defined]
+
+        writer = create_result_writer(output)
+        await run_evaluation_batch(evaluator, first_inputs, writer)
+        second = await run_evaluation_batch(evaluator, second_inputs, writer)
+
+        assert sorted(outcome.request.submission for outcome in second.outcomes) == ["another", "other"]
+        completed = await writer.completed_keys()
+        assert {first_inputs[1].key, second_inputs[1].key} <= completed
+
+        if isinstance(writer, DuckDBResultWriter):
+            rows = (
+                writer.store._get_connection()
+                .execute("SELECT submission FROM evaluation_results WHERE input_id = 'line-2' ORDER BY submission")
+                .fetchall()
+            )
+            assert rows == [("another",), ("bad",)]
+        writer.close()
+
+
+class TestEvaluateInputCommand:
+    """Test `mixseek evaluate --input`."""
+
+    @patch(f"{_EVALUATE_MODULE}.close_all_auth_clients", new_callable=AsyncMock)
+    @patch(f"{_EVALUATE_MODULE}.initialize_observability")
+    @patch(f"{_EVALUATE_MODULE}.create_evaluator")
+    def test_streams_jsonl_and_exits_1_on_failures(
+        self,
+        mock_create_evaluator: Any,
+        mock_init_obs: Any,
+        mock_close_auth: AsyncMock,
+        input_file: Path,
+        evaluator: Evaluator,
+        tmp_path: Path,
+    ) -> None:
+        mock_create_evaluator.return_value = evaluator
+        output = tmp_path / "out.jsonl"
+
+        result = CliRunner(mix_stderr=False).invoke(
+            app,
+            ["evaluate", "--input", str(input_file), "--output", str(output), "-f", "json", "-w", str(tmp_path)],
+        )
+
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert result.exit_code == 1
+        assert sorted(record["id"] for record in records) == ["a", "c", "line-2"]
+        assert output.read_text(encoding="utf-8").count("\n") == 3
+        assert "pairs/min" in result.stderr
+        mock_create_evaluator.assert_called_once()
+        mock_close_auth.assert_awaited_once()
+
+    @pytest.mark.parametrize("args", [["q", "s", "--input", "{input}"], ["only-query"]])
+    def test_pair_and_input_are_exclusive(self, args: list[str], input_file: Path) -> None:
+        result = CliRunner().invoke(app, ["evaluate", *[arg.format(input=input_file) for arg in args]])
+
+        assert result.exit_code == 2
@@ -0,0 +1,242 @@
+"""mixseek exec --batch テスト
+
+Test Coverage:
+    - load_batch_prompts: id補完、不正行・重複idの検出
+    - run_batch: 完了順の追記、再実行時のスキップ（failedは再実行）、プロンプト並列度
+    - exec --batch: JSONL出力、終了コード、Orchestratorの再利用
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from mixseek.cli.batch_jsonl import default_batch_output_path
+from mixseek.cli.commands.exec_batch import load_batch_prompts, load_completed_prompt_ids, run_batch
+from mixseek.cli.main import app
+from mixseek.config.preflight import CategoryResult, CheckResult, CheckStatus, PreflightResult
+from mixseek.models.leaderboard import LeaderBoardEntry
+from mixseek.orchestrator.models import ExecutionSummary, FailedTeamInfo
+
+_EXEC_MODULE = "mixseek.cli.commands.exec"
+
+
+def _summary(user_prompt: str, succeeded: bool = True) -> ExecutionSummary:
+    team_results = []
+    failed_teams_info = []
+    if succeeded:
+        team_results.append(
+            LeaderBoardEntry(
+                execution_id="exec-id",
+                team_id="team-1",
+                team_name="Team 1",
+                round_number=1,
+                submission_content="submission",
+                score=80.0,
+                score_details={},
+            )
+        )
+    else:
+        failed_teams_info.append(FailedTeamInfo(team_id="team-1", team_name="Team 1", error_message="failed"))
+    return ExecutionSummary(
+        execution_id="exec-id",
+        user_prompt=user_prompt,
+        team_results=team_results,
+        failed_teams_info=[]
+        if succeeded
+        else [FailedTeamInfo(team_id="team-1", team_name="Team 1", error_message="x")],
+        best_team_id="team-1" if succeeded else None,
+        best_score=80.0 if succeeded else None,
+        total_execution_time_seconds=1.0,
+    )
+
+
+class _FakeOrchestrator:
+    """execute()の呼び出しと同時実行数を記録するOrchestratorの代替"""
+
+    running = 0
+    max_running = 0
+
+    def __init__(self, fail_prompts: set[str] | None = None, failed_team_prompts: set[str] | None = None) -> None:
+        self.prompts: list[str] = []
+        self.fail_prompts = fail_prompts or set()
+        self.failed_team_prompts = failed_team_prompts or set()
+
+    async def execute(self, user_prompt: str, timeout_seconds: int | None = None) -> ExecutionSummary:
+        self.prompts.append(user_prompt)
+        _FakeOrchestrator.running += 1
+        _FakeOrchestrator.max_running = max(_FakeOrchestrator.max_running, _FakeOrchestrator.running)
+        try:
+            await asyncio.sleep(0.01)
+            if user_prompt in self.fail_prompts:
+                raise RuntimeError("boom")
+            return _summary(user_prompt, succeeded=user_prompt not in self.failed_team_prompts)
+        finally:
+            _FakeOrchestrator.running -= 1
+
+
+@pytest.fixture
+def batch_file(tmp_path: Path) -> Path:
+    path = tmp_path / "prompts.jsonl"
+    lines = [{"id": "a", "prompt": "first"}, {"prompt": "second"}, {"id": "c", "prompt": "third"}]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+    return path
+
+
+class TestLoadBatchPrompts:
+    """入力JSONL読み込みテスト"""
+
+    def test_ids_default_to_line_number(self, batch_file: Path) -> None:
+        prompts = load_batch_prompts(batch_file)
+
+        assert [(p.prompt_id, p.user_prompt) for p in prompts] == [
+            ("a", "first"),
+            ("line-2", "second"),
+            ("c", "third"),
+        ]
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            ('{"prompt": "x"}\nnot json\n', "invalid JSON"),
+            ('{"id": "x", "prompt": "a"}\n{"id": "x", "prompt": "b"}\n', "duplicate id"),
+            ('{"id": "x", "prompt": ""}\n', "non-empty string"),
+        ],
+    )
+    def test_invalid_lines(self, tmp_path: Path, content: str, message: str) -> None:
+        path = tmp_path / "prompts.jsonl"
+        path.write_text(content, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=message):
+            load_batch_prompts(path)
+
+
+class TestRunBatch:
+    """run_batch テスト"""
+
+    @pytest.mark.asyncio
+    async def test_appends_records_and_resumes(self, batch_file: Path) -> None:
+        output_file = default_batch_output_path(batch_file)
+        prompts = load_batch_prompts(batch_file)
+
+        failing = _FakeOrchestrator(fail_prompts={"second"})
+        result = await run_batch([failing], prompts, output_file)
+
+        assert (result.completed, result.errors) == (2, 1)
+        assert load_completed_prompt_ids(output_file) == {"a", "c"}
+
+        # クラッシュで書きかけになった末尾行は無視される
+        with open(output_file, "a", encoding="utf-8") as f:
+            f.write('{"id": "line-2", "summ')
+
+        retry = _FakeOrchestrator()
+        resumed = await run_batch([retry], prompts, output_file)
+
+        assert retry.prompts == ["second"]
+        assert (resumed.skipped, resumed.completed) == (2, 1)
+        assert load_completed_prompt_ids(output_file) == {"a", "line-2", "c"}
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_prompts_where_all_teams_failed(self, batch_file: Path) -> None:
+        """全チーム失敗（status: failed）の記録は完了扱いにせず再実行する"""
+        output_file = default_batch_output_path(batch_file)
+        prompts = load_batch_prompts(batch_file)
+
+        outage = _FakeOrchestrator(failed_team_prompts={"third"})
+        result = await run_batch([outage], prompts, output_file)
+
+        assert (result.completed, result.failed) == (2, 1)
+        assert load_completed_prompt_ids(output_file) == {"a", "line-2"}
+
+        retry = _FakeOrchestrator()
+        resumed = await run_batch([retry], prompts, output_file)
+
+        assert retry.prompts == ["third"]
+        assert (resumed.skipped, resumed.completed) == (2, 1)
+        assert load_completed_prompt_ids(output_file) == {"a", "line-2", "c"}
+
+    @pytest.mark.asyncio
+    async def test_prompt_concurrency_bounded_by_orchestrators(self, tmp_path: Path) -> None:
+        path = tmp_path / "prompts.jsonl"
+        path.write_text("".join(json.dumps({"prompt": f"p{i}"}) + "\n" for i in range(6)), encoding="utf-8")
+        orchestrators = [_FakeOrchestrator(), _FakeOrchestrator()]
+        _FakeOrchestrator.max_running = 0
+
+        result = await run_batch(orchestrators, load_batch_prompts(path), tmp_path / "out.jsonl")
+
+        assert result.completed == 6
+        assert _FakeOrchestrator.max_running == 2
+        assert all(orchestrator.prompts for orchestrator in orchestrators)
+
+
+class TestExecBatchCommand:
+    """exec --batch CLI テスト"""
+
+    @staticmethod
+    def _preflight() -> PreflightResult:
+        result = PreflightResult(
+            categories=[
+                CategoryResult(
+                    category="オーケストレータ",
+                    checks=[CheckResult(name="orchestrator_config", status=CheckStatus.OK)],
+                )
+            ]
+        )
+        result.orchestrator_settings = MagicMock()
+        return result
+
+    @patch(f"{_EXEC_MODULE}.close_all_auth_clients", new_callable=AsyncMock)
+    @patch(f"{_EXEC_MODULE}.initialize_observability")
+    @patch(f"{_EXEC_MODULE}.ConfigurationManager")
+    @patch(f"{_EXEC_MODULE}.Orchestrator")
+    @patch(f"{_EXEC_MODULE}.run_preflight_check")
+    def test_streams_jsonl_and_reuses_orchestrators(
+        self,
+        mock_preflight: MagicMock,
+        mock_orchestrator_cls: MagicMock,
+        mock_config_mgr: MagicMock,
+        mock_init_obs: MagicMock,
+        mock_close_auth: AsyncMock,
+        batch_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        mock_preflight.return_value = self._preflight()
+        mock_orchestrator_cls.return_value.execute = AsyncMock(
+            side_effect=lambda user_prompt, timeout_seconds=None: _summary(
+                user_prompt, succeeded=user_prompt != "third"
+            )
+        )
+        config = tmp_path / "orchestrator.toml"
+
+        result = CliRunner().invoke(
+            app,
+            ["exec", "--batch", str(batch_file), "--config", str(config), "--concurrency", "2", "-f", "json"],
+        )
+
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert result.exit_code == 1
+        assert sorted(record["id"] for record in records) == ["a", "c", "line-2"]
+        assert {record["id"]: record["status"] for record in records}["c"] == "failed"
+        assert mock_orchestrator_cls.call_count == 2
+        mock_preflight.assert_called_once()
+        assert default_batch_output_path(batch_file).read_text(encoding="utf-8").count("\n") == 3
+
+    @patch(f"{_EXEC_MODULE}.close_all_auth_clients", new_callable=AsyncMock)
+    @patch(f"{_EXEC_MODULE}.initialize_observability")
+    @patch(f"{_EXEC_MODULE}.ConfigurationManager")
+    def test_prompt_and_batch_are_exclusive(
+        self,
+        mock_config_mgr: MagicMock,
+        mock_init_obs: MagicMock,
+        mock_close_auth: AsyncMock,
+        batch_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        config = tmp_path / "orchestrator.toml"
+
+        result = CliRunner().invoke(app, ["exec", "prompt", "--batch", str(batch_file), "--config", str(config)])
+
+        assert result.exit_code == 2
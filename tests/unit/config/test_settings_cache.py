@@ -0,0 +1,106 @@
+"""Unit tests for the process-wide settings cache used by ConfigurationManager."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mixseek.config import ConfigurationManager, clear_settings_cache
+from mixseek.config.settings_cache import SettingsCache, get_settings_cache
+from mixseek.config.sources.team_toml_source import TeamTomlSource
+
+TEAM_TOML = """
+[team]
+team_id = "cached_team"
+team_name = "Cached Team"
+
+[team.leader]
+model = "google-gla:gemini-2.5-flash"
+
+[[team.members]]
+config = "agents/member.toml"
+"""
+
+MEMBER_TOML = """
+[agent]
+name = "member"
+type = "plain"
+description = "Member agent"
+model = "google-gla:gemini-2.5-flash-lite"
+temperature = {temperature}
+"""
+
+
+@pytest.fixture
+def team_workspace(tmp_path: Path) -> Iterator[Path]:
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "member.toml").write_text(MEMBER_TOML.format(temperature=0.2))
+    (tmp_path / "team.toml").write_text(TEAM_TOML)
+    clear_settings_cache()
+    yield tmp_path
+    clear_settings_cache()
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestSettingsCache:
+    """Test cache hits and invalidation."""
+
+    def test_repeated_loads_parse_once(self, team_workspace: Path) -> None:
+        with patch.object(
+            TeamTomlSource, "_load_and_resolve", autospec=True, side_effect=TeamTomlSource._load_and_resolve
+        ) as load:
+            first = ConfigurationManager(workspace=team_workspace).load_team_settings(Path("team.toml"))
+            second = ConfigurationManager(workspace=team_workspace).load_team_settings(Path("team.toml"))
+
+        assert load.call_count == 1
+        assert first == second
+        assert first is not second
+        assert second.get_trace_info("team_id") is not None
+
+    def test_returned_settings_are_independent_copies(self, team_workspace: Path) -> None:
+        manager = ConfigurationManager(workspace=team_workspace)
+        first = manager.load_team_settings(Path("team.toml"))
+        first.members[0].temperature = 0.9
+
+        assert manager.load_team_settings(Path("team.toml")).members[0].temperature == 0.2
+
+    def test_modified_referenced_file_is_reloaded(self, team_workspace: Path) -> None:
+        manager = ConfigurationManager(workspace=team_workspace)
+        manager.load_team_settings(Path("team.toml"))
+
+        member_toml = team_workspace / "agents" / "member.toml"
+        member_toml.write_text(MEMBER_TOML.format(temperature=0.7))
+        _touch(member_toml)
+
+        assert manager.load_team_settings(Path("team.toml")).members[0].temperature == 0.7
+
+    def test_environment_change_is_a_miss(self, team_workspace: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        manager = ConfigurationManager(workspace=team_workspace)
+        manager.load_team_settings(Path("team.toml"))
+
+        monkeypatch.setenv("MIXSEEK_TEAM__TEAM_NAME", "From Env")
+
+        assert manager.load_team_settings(Path("team.toml")).team_name == "From Env"
+
+    def test_clear_settings_cache(self, team_workspace: Path) -> None:
+        ConfigurationManager(workspace=team_workspace).load_team_settings(Path("team.toml"))
+        assert len(get_settings_cache()) == 1
+
+        clear_settings_cache()
+
+        assert len(get_settings_cache()) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, team_workspace: Path) -> None:
+        cache = SettingsCache(max_entries=1)
+        settings = ConfigurationManager(workspace=team_workspace).load_team_settings(Path("team.toml"))
+        cache.put("a", settings, [])
+        cache.put("b", settings, [])
+
+        assert cache.get("a", type(settings)) is None
+        assert cache.get("b", type(settings)) == settings
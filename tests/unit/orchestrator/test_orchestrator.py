@@ -333,8 +333,8 @@ async def test_run_team_partial_failure_with_round_history(tmp_path: Path) -> No
     mock_entry = _make_mock_entry()
     mock_controller._finalize_and_return_best = AsyncMock(return_value=mock_entry)
 
-    # _write_progress_file のモック
-    mock_controller._write_progress_file = MagicMock()
+    # _publish_progress のモック
+    mock_controller._publish_progress = MagicMock()
 
     # When
     with pytest.raises(PartialTeamFailureError) as exc_info:
@@ -371,7 +371,7 @@ async def test_run_team_no_round_history_raises_original(tmp_path: Path) -> None
     mock_controller.get_team_name.return_value = "Test Team 1"
     mock_controller.round_history = []  # 空: ラウンド0で失敗
     mock_controller.run_round = AsyncMock(side_effect=RuntimeError("immediate failure"))
-    mock_controller._write_progress_file = MagicMock()
+    mock_controller._publish_progress = MagicMock()
 
     with pytest.raises(RuntimeError, match="immediate failure"):
         await orchestrator._run_team(mock_controller, "test prompt", 600)
@@ -400,7 +400,7 @@ async def test_execute_impl_handles_partial_team_failure(tmp_path: Path) -> None
         mock_rc.round_history = [_make_mock_round_state()]
         mock_rc.run_round = AsyncMock(side_effect=RuntimeError("round 2 failed"))
         mock_rc._finalize_and_return_best = AsyncMock(return_value=mock_entry)
-        mock_rc._write_progress_file = MagicMock()
+        mock_rc._publish_progress = MagicMock()
         mock_rc_class.return_value = mock_rc
 
         summary = await orchestrator.execute(user_prompt="Test prompt", timeout_seconds=300)
@@ -412,3 +412,135 @@ async def test_execute_impl_handles_partial_team_failure(tmp_path: Path) -> None
     assert summary.failed_teams_info[0].team_id == "test-team-001"
     assert summary.total_teams == 1  # 重複排除
     assert summary.partial_teams == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_clears_progress_snapshot(tmp_path: Path) -> None:
+    """execute: 実行完了後にプロセス内の進捗スナップショットを破棄する"""
+    from mixseek.core.progress import ProgressEvent, get_progress_bus
+
+    team1_path = str(Path("tests/fixtures/team1.toml").resolve())
+    settings = OrchestratorSettings(
+        workspace_path=tmp_path,
+        timeout_per_team_seconds=600,
+        teams=[{"config": team1_path}],
+    )
+    orchestrator = Orchestrator(settings=settings, save_db=False)
+    execution_id = "exec-progress-clear"
+    snapshots: list[list[ProgressEvent]] = []
+
+    async def run_round(*args: object, **kwargs: object) -> None:
+        get_progress_bus().publish(
+            ProgressEvent(
+                execution_id=execution_id,
+                team_id="test-team-001",
+                team_name="Test Team 1",
+                status="running",
+                current_round=1,
+                total_rounds=1,
+                updated_at="2025-01-01T10:00:00+00:00",
+            )
+        )
+        snapshots.append(get_progress_bus().snapshot(execution_id))
+        raise RuntimeError("round failed")
+
+    with patch("mixseek.round_controller.RoundController") as mock_rc_class:
+        mock_rc_class.return_value = _make_mock_controller("test-team-001", AsyncMock(side_effect=run_round))
+
+        await orchestrator.execute(user_prompt="Test prompt", timeout_seconds=300, execution_id=execution_id)
+
+    assert len(snapshots[0]) == 1
+    assert get_progress_bus().snapshot(execution_id) == []
+    assert get_progress_bus().version(execution_id) == 0
+
+
+# =============================================================================
+# max_concurrent_teams scheduling tests
+# =============================================================================
+
+
+def _make_mock_controller(team_id: str, run_round: AsyncMock) -> MagicMock:
+    """テスト用RoundControllerモック生成ヘルパー"""
+    mock_controller = MagicMock()
+    mock_controller.get_team_id.return_value = team_id
+    mock_controller.get_team_name.return_value = f"Team {team_id}"
+    mock_controller.round_history = []
+    mock_controller.run_round = run_round
+    mock_controller._publish_progress = MagicMock()
+    return mock_controller
+
+
+@pytest.mark.asyncio
+async def test_run_team_respects_max_concurrent_teams(tmp_path: Path) -> None:
+    """_run_team: max_concurrent_teams を超えてチームが同時実行されないこと"""
+    import asyncio
+
+    from mixseek.orchestrator.models import TeamStatus
+
+    settings = OrchestratorSettings(
+        workspace_path=tmp_path,
+        timeout_per_team_seconds=600,
+        max_concurrent_teams=2,
+        teams=[{"config": "tests/fixtures/team1.toml"}],
+    )
+    orchestrator = Orchestrator(settings=settings, save_db=False)
+
+    active = 0
+    peak = 0
+
+    async def fake_run_round(user_prompt: str, timeout_seconds: int) -> LeaderBoardEntry:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return _make_mock_entry()
+
+    controllers = []
+    for i in range(5):
+        team_id = f"team-{i}"
+        orchestrator.team_statuses[team_id] = TeamStatus(team_id=team_id, team_name=f"Team {i}")
+        controllers.append(_make_mock_controller(team_id, AsyncMock(side_effect=fake_run_round)))
+
+    await asyncio.gather(*[orchestrator._run_team(c, "test prompt", 600) for c in controllers])
+
+    assert peak == 2
+    statuses = orchestrator.team_statuses
+    assert all(s.queued_at is not None for s in statuses.values())
+    assert all(s.queue_depth is None for s in statuses.values())
+    # 後続チームは先行チームの完了を待ってから実行される
+    assert statuses["team-4"].queue_wait_seconds is not None
+    assert statuses["team-4"].queue_wait_seconds >= 0.03
+
+
+@pytest.mark.asyncio
+async def test_run_team_timeout_measured_from_admission(tmp_path: Path) -> None:
+    """_run_team: タイムアウトは待機時間を含まず実行開始から計測されること"""
+    import asyncio
+
+    from mixseek.orchestrator.models import TeamStatus
+
+    settings = OrchestratorSettings(
+        workspace_path=tmp_path,
+        timeout_per_team_seconds=600,
+        max_concurrent_teams=1,
+        teams=[{"config": "tests/fixtures/team1.toml"}],
+    )
+    orchestrator = Orchestrator(settings=settings, save_db=False)
+
+    async def fake_run_round(user_prompt: str, timeout_seconds: int) -> LeaderBoardEntry:
+        await asyncio.sleep(0.6)
+        return _make_mock_entry()
+
+    controllers = []
+    for i in range(2):
+        team_id = f"team-{i}"
+        orchestrator.team_statuses[team_id] = TeamStatus(team_id=team_id, team_name=f"Team {i}")
+        controllers.append(_make_mock_controller(team_id, AsyncMock(side_effect=fake_run_round)))
+
+    # 各チームの実行時間(0.6s)はタイムアウト(1s)未満だが、合計はタイムアウトを超える
+    results = await asyncio.gather(*[orchestrator._run_team(c, "test prompt", 1) for c in controllers])
+
+    assert len(results) == 2
+    assert orchestrator.team_statuses["team-1"].status == "running"
+    assert orchestrator.team_statuses["team-1"].queue_wait_seconds >= 0.5  # type: ignore[operator]
@@ -0,0 +1,105 @@
+"""Unit tests for TeamScheduler"""
+
+import asyncio
+
+import pytest
+
+from mixseek.orchestrator.scheduler import TeamScheduler
+
+
+def test_scheduler_rejects_invalid_max_concurrent() -> None:
+    """max_concurrent < 1 は ValueError"""
+    with pytest.raises(ValueError, match="max_concurrent must be >= 1"):
+        TeamScheduler(0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_limits_concurrency() -> None:
+    """同時実行数が max_concurrent を超えないこと"""
+    scheduler = TeamScheduler(2)
+    active = 0
+    peak = 0
+
+    async def run(team_id: str) -> None:
+        nonlocal active, peak
+        async with scheduler.admit(team_id):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*[run(f"team-{i}") for i in range(6)])
+
+    assert peak == 2
+    assert scheduler.running_count == 0
+    assert scheduler.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_admits_in_fifo_order() -> None:
+    """待機中のチームは登録順に実行枠を獲得すること"""
+    scheduler = TeamScheduler(1)
+    admitted: list[str] = []
+
+    async def run(team_id: str) -> None:
+        async with scheduler.admit(team_id):
+            admitted.append(team_id)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*[run(f"team-{i}") for i in range(4)])
+
+    assert admitted == ["team-0", "team-1", "team-2", "team-3"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reports_queue_changes_and_wait_time() -> None:
+    """待機キューの変化通知と待機時間が取得できること"""
+    snapshots: list[list[str]] = []
+    scheduler = TeamScheduler(1, on_queue_change=snapshots.append)
+    waits: dict[str, float] = {}
+
+    async def run(team_id: str) -> None:
+        async with scheduler.admit(team_id) as wait_seconds:
+            waits[team_id] = wait_seconds
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(run("a"), run("b"))
+
+    assert ["b"] in snapshots
+    assert snapshots[-1] == []
+    assert waits["a"] < waits["b"]
+    assert waits["b"] >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancelled_waiter_leaves_queue() -> None:
+    """待機中にキャンセルされたチームは実行枠を消費せずにキューから外れること"""
+    scheduler = TeamScheduler(1)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.admit("holder"):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    async def wait_forever() -> None:
+        async with scheduler.admit("waiter"):
+            pass
+
+    waiter = asyncio.create_task(wait_forever())
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.queue_depth == 0
+
+    release.set()
+    await holder
+
+    # 実行枠が正しく返却されていること
+    async with scheduler.admit("next") as wait_seconds:
+        assert wait_seconds < 0.1
@@ -401,3 +401,45 @@ class TestUserPromptBuilderCustomTemplate:
         assert "Time: " in result
         # Verify ISO 8601 format with timezone (should end with +00:00 for UTC)
         assert "+00:00" in result or "Z" in result
+
+    async def test_submission_history_strategy_from_toml(self, tmp_path: Path) -> None:
+        """Test submission history strategy settings loaded from TOML."""
+        from datetime import UTC, datetime
+
+        from mixseek.config import ConfigurationManager
+        from mixseek.round_controller.models import RoundState
+
+        toml_path = tmp_path / "prompt_builder.toml"
+        toml_path.write_text(
+            '[prompt_builder]\nteam_user_prompt = """{{ submission_history }}"""\n'
+            'submission_history_strategy = "last_k"\nsubmission_history_last_k = 1\n',
+            encoding="utf-8",
+        )
+        settings = ConfigurationManager(workspace=tmp_path).load_prompt_builder_settings(toml_path)
+        builder = UserPromptBuilder(settings=settings, store=None)
+        now = datetime.now(UTC)
+        context = RoundPromptContext(
+            user_prompt="Task",
+            round_number=3,
+            round_history=[
+                RoundState(
+                    round_number=n,
+                    submission_content=f"Submission {n}",
+                    evaluation_score=50.0,
+                    score_details={},
+                    round_started_at=now,
+                    round_ended_at=now,
+                )
+                for n in (1, 2)
+            ],
+            team_id="team1",
+            team_name="Alpha",
+            execution_id="exec1",
+            store=None,
+        )
+
+        result = await builder.build_team_prompt(context)
+
+        assert settings.submission_history_strategy == "last_k"
+        assert "Submission 2" in result
+        assert "Submission 1" not in result
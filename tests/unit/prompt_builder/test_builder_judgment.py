@@ -412,7 +412,12 @@ DateTime: {{ current_datetime }}"""
             prompt = await builder.build_judgment_prompt(context)
 
             # Verify format_submission_history called
-            mock_history.assert_called_once_with(round_history)
+            mock_history.assert_called_once_with(
+                round_history,
+                strategy=builder.settings.submission_history_strategy,
+                last_k=builder.settings.submission_history_last_k,
+                max_tokens=builder.settings.submission_history_max_tokens,
+            )
 
             # Verify format_ranking_table called with correct signature (positional args)
             mock_ranking.assert_called_once()
@@ -9,6 +9,7 @@ from datetime import UTC, datetime
 import pytest
 
 from mixseek.prompt_builder.formatters import (
+    estimate_tokens,
     format_ranking_table,
     format_submission_history,
     generate_position_message,
@@ -101,6 +102,97 @@ class TestFormatSubmissionHistory:
         assert "スコア: 85.00/100" in result
 
 
+def _round(round_number: int, content: str, score: float) -> RoundState:
+    now = datetime.now(UTC)
+    return RoundState(
+        round_number=round_number,
+        submission_content=content,
+        evaluation_score=score,
+        score_details={},
+        round_started_at=now,
+        round_ended_at=now,
+    )
+
+
+class TestSubmissionHistoryStrategies:
+    """Tests for bounded submission history strategies."""
+
+    def test_last_k_keeps_recent_rounds(self) -> None:
+        """Only the most recent rounds are included, with an omission note."""
+        history = [_round(n, f"Submission {n}", 50.0 + n) for n in range(1, 6)]
+
+        result = format_submission_history(history, strategy="last_k", last_k=2)
+
+        assert "## ラウンド 3" not in result
+        assert "## ラウンド 4" in result
+        assert "## ラウンド 5" in result
+        assert result.startswith("※ 全5ラウンドのうち2ラウンド分のみ表示しています。")
+
+    def test_last_k_larger_than_history_has_no_note(self) -> None:
+        """No omission note when every round fits."""
+        history = [_round(1, "Only", 60.0)]
+
+        assert format_submission_history(history, strategy="last_k", last_k=3) == format_submission_history(history)
+
+    def test_best_keeps_highest_score_latest_on_tie(self) -> None:
+        """Only the best round is included; the latest wins ties."""
+        history = [_round(1, "First", 70.0), _round(2, "Second", 90.0), _round(3, "Third", 90.0)]
+
+        result = format_submission_history(history, strategy="best")
+
+        assert "## ラウンド 3" in result
+        assert "## ラウンド 2" not in result
+        assert "Third" in result
+
+    def test_token_budget_bounds_history_size(self) -> None:
+        """History stays within the estimated token budget regardless of round count."""
+        history = [_round(n, f"Round {n} " + "x" * 400, 50.0) for n in range(1, 21)]
+
+        result = format_submission_history(history, strategy="token_budget", max_tokens=500)
+
+        # Budget applies to the rounds; the omission note adds a small constant
+        assert estimate_tokens(result) <= 550
+        assert "## ラウンド 20" in result
+        assert "## ラウンド 1\n" not in result
+
+    def test_token_budget_truncates_single_oversized_round(self) -> None:
+        """The latest round is always included and truncated when it alone exceeds the budget."""
+        history = [_round(1, "old", 10.0), _round(2, "y" * 10_000, 20.0)]
+
+        result = format_submission_history(history, strategy="token_budget", max_tokens=200)
+
+        assert "## ラウンド 2" in result
+        assert "以下省略" in result
+        assert estimate_tokens(result) < 300
+
+    def test_diff_renders_changes_against_previous_round(self) -> None:
+        """Later rounds are rendered as unified diffs against the previous round."""
+        history = [
+            _round(1, "line a\nline b", 60.0),
+            _round(2, "line a\nline c", 70.0),
+            _round(3, "line a\nline c", 75.0),
+        ]
+
+        result = format_submission_history(history, strategy="diff")
+
+        assert "line b" in result
+        assert "-line b" in result
+        assert "+line c" in result
+        assert "（ラウンド 1 からの差分）" in result
+        assert "（変更なし）" in result
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens function."""
+
+    def test_ascii_and_non_ascii(self) -> None:
+        """ASCII counts ~4 chars per token, other characters one token each."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("こんにちは") == 5
+        assert estimate_tokens("abcdこんにちは") == 6
+
+
 class TestFormatRankingTable:
     """Tests for format_ranking_table function."""
 
@@ -0,0 +1,95 @@
+"""Unit tests for the compiled Jinja2 template cache."""
+
+import time
+from collections.abc import Callable, Iterator
+from unittest.mock import patch
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from mixseek.config.schema import PromptBuilderSettings
+from mixseek.prompt_builder.builder import (
+    UserPromptBuilder,
+    _jinja_env,
+    clear_template_cache,
+    get_compiled_template,
+)
+from mixseek.prompt_builder.models import EvaluatorPromptContext
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+class TestTemplateCache:
+    """Tests for get_compiled_template."""
+
+    def test_same_text_compiled_once(self) -> None:
+        """The same template text returns the same compiled template."""
+        first = get_compiled_template("Hello {{ name }}")
+        second = get_compiled_template("Hello {{ name }}")
+
+        assert first is second
+        assert first.render(name="mixseek") == "Hello mixseek"
+
+    def test_different_text_compiled_separately(self) -> None:
+        """Different template texts get different compiled templates."""
+        assert get_compiled_template("A {{ x }}") is not get_compiled_template("B {{ x }}")
+
+    def test_syntax_error_not_cached(self) -> None:
+        """Invalid templates raise on every call."""
+        for _ in range(2):
+            with pytest.raises(TemplateSyntaxError):
+                get_compiled_template("{% if %}")
+
+    def test_builders_share_environment_and_templates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Builders created per metric evaluation reuse the shared environment and compiled template."""
+        monkeypatch.delenv("TZ", raising=False)
+        settings = PromptBuilderSettings()
+        builder1 = UserPromptBuilder(settings=settings)
+        builder2 = UserPromptBuilder(settings=settings)
+        context = EvaluatorPromptContext(user_query="質問", submission="回答")
+
+        with patch.object(_jinja_env, "from_string", wraps=_jinja_env.from_string) as spy:
+            builder1.build_evaluator_prompt(context)
+            compiled_by_first = spy.call_count
+            builder2.build_evaluator_prompt(context)
+
+        assert builder1.jinja_env is builder2.jinja_env is _jinja_env
+        # The second builder renders from the cache without compiling again
+        assert spy.call_count == compiled_by_first
+        assert [call.args[0] for call in spy.call_args_list].count(settings.evaluator_user_prompt) == 1
+
+
+@pytest.mark.performance
+def test_cached_render_faster_than_compile(record_property: Callable[[str, object], None]) -> None:
+    """Microbenchmark: per-render cost with the cache vs. parse+compile on every render."""
+    template_text = PromptBuilderSettings().team_user_prompt
+    iterations = 200
+    variables = {
+        "user_prompt": "データ分析タスク",
+        "round_number": 2,
+        "submission_history": "history",
+        "ranking_table": "ranking",
+        "team_position_message": "position",
+        "current_datetime": "2025-01-01T00:00:00+09:00",
+    }
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _jinja_env.from_string(template_text).render(variables)
+    uncached = (time.perf_counter() - start) / iterations
+
+    get_compiled_template(template_text)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        get_compiled_template(template_text).render(variables)
+    cached = (time.perf_counter() - start) / iterations
+
+    record_property("per_render_uncached_us", round(uncached * 1e6, 1))
+    record_property("per_render_cached_us", round(cached * 1e6, 1))
+    # Compiling dominates the uncached path; require a clear margin rather than any difference
+    assert cached * 2 < uncached
@@ -191,3 +191,23 @@ async def test_judge_improvement_prospects_all_retries_failed_raises_exception(m
     # Note: Agent handles retries internally, so mock_agent_class is called once
     # The actual retry logic is tested in integration tests with real Agent behavior
     assert mock_agent_class.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("mixseek.round_controller.judgment_client.create_authenticated_model")
+@patch("mixseek.round_controller.judgment_client.Agent")
+async def test_judgment_agent_is_reused_across_calls(
+    mock_agent_class: MagicMock, mock_create_model: MagicMock
+) -> None:
+    """Agentと認証済みモデルはクライアントごとに一度だけ生成される"""
+    mock_result = MagicMock()
+    mock_result.output = ImprovementJudgment(should_continue=True, reasoning="継続", confidence_score=0.8)
+    mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+
+    client = JudgmentClient(settings=JudgmentSettings())
+    await client.judge_improvement_prospects(formatted_prompt="ラウンド 1")
+    await client.judge_improvement_prospects(formatted_prompt="ラウンド 2")
+
+    assert mock_create_model.call_count == 1
+    assert mock_agent_class.call_count == 1
+    assert mock_agent_class.return_value.run.await_count == 2
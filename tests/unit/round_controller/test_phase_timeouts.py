@@ -0,0 +1,149 @@
+"""Unit tests for RoundController phase-level timeouts
+
+Test Coverage:
+    - 提出フェーズのタイムアウト: 完了済みラウンドで確定 / 完了ラウンドがない場合は失敗
+    - 判定フェーズのタイムアウト: 継続せずに確定
+    - チームの残り時間による評価フェーズの打ち切り
+"""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from mixseek.config.schema import EvaluatorSettings, JudgmentSettings, PromptBuilderSettings
+from mixseek.evaluator import EvaluationResult
+from mixseek.models.evaluation_result import MetricScore
+from mixseek.orchestrator.models import OrchestratorTask
+from mixseek.round_controller import RoundController
+from mixseek.round_controller.exceptions import PhaseTimeoutError
+from mixseek.round_controller.models import ImprovementJudgment
+
+TEAM_CONFIG_PATH = Path.cwd() / "tests" / "fixtures" / "team1.toml"
+
+
+def _evaluation(score: float) -> EvaluationResult:
+    return EvaluationResult(
+        metrics=[MetricScore(metric_name="ClarityCoherence", score=score, evaluator_comment="ok")],
+        overall_score=score,
+    )
+
+
+async def _hang(*args: Any, **kwargs: Any) -> Any:
+    await asyncio.sleep(60)
+
+
+def _hang_after(first: Any) -> Any:
+    """初回はfirstを返し、2回目以降は応答しないside_effect"""
+    calls = 0
+
+    async def side_effect(*args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return first
+        return await _hang()
+
+    return side_effect
+
+
+@pytest.fixture
+def mocks() -> Iterator[dict[str, MagicMock]]:
+    """Leader Agent/Evaluator/JudgmentClient/AggregationStoreのモック"""
+    with (
+        patch("mixseek.round_controller.controller.create_leader_agent") as mock_leader,
+        patch("mixseek.round_controller.controller.Evaluator") as mock_eval_class,
+        patch("mixseek.round_controller.controller.AggregationStore") as mock_store,
+        patch("mixseek.round_controller.controller.JudgmentClient") as mock_judgment_client_class,
+    ):
+        leader_result = Mock()
+        leader_result.output = "submission"
+        leader_result.all_messages = Mock(return_value=[])
+        mock_leader.return_value.run = AsyncMock(return_value=leader_result)
+        mock_eval_class.return_value.evaluate = AsyncMock(return_value=_evaluation(80.0))
+        mock_judgment_client_class.return_value.judge_improvement_prospects = AsyncMock(
+            return_value=ImprovementJudgment(should_continue=True, reasoning="継続", confidence_score=0.9)
+        )
+        mock_store.return_value = AsyncMock()
+        yield {
+            "leader_run": mock_leader.return_value.run,
+            "evaluate": mock_eval_class.return_value.evaluate,
+            "judge": mock_judgment_client_class.return_value.judge_improvement_prospects,
+            "store": mock_store.return_value,
+        }
+
+
+def _controller(tmp_path: Path, **task_kwargs: Any) -> RoundController:
+    task = OrchestratorTask(
+        execution_id="550e8400-e29b-41d4-a716-446655440000",
+        user_prompt="テストプロンプト",
+        team_configs=[TEAM_CONFIG_PATH],
+        timeout_seconds=300,
+        max_rounds=3,
+        min_rounds=1,
+        **task_kwargs,
+    )
+    return RoundController(
+        team_config_path=TEAM_CONFIG_PATH,
+        workspace=tmp_path,
+        task=task,
+        evaluator_settings=EvaluatorSettings(),
+        judgment_settings=JudgmentSettings(),
+        prompt_builder_settings=PromptBuilderSettings(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_submission_timeout_finalizes_best_completed_round(tmp_path: Path, mocks: dict[str, MagicMock]) -> None:
+    """提出フェーズのタイムアウト: 完了済みラウンドのベストで確定する"""
+    mocks["leader_run"].side_effect = _hang_after(mocks["leader_run"].return_value)
+    controller = _controller(tmp_path, submission_timeout_seconds=1)
+
+    result = await asyncio.wait_for(controller.run_round("テストプロンプト", timeout_seconds=600), timeout=10)
+
+    assert result.round_number == 1
+    assert result.exit_reason == "submission_timeout"
+    assert len(controller.round_history) == 1
+
+
+@pytest.mark.asyncio
+async def test_submission_timeout_in_first_round_raises(tmp_path: Path, mocks: dict[str, MagicMock]) -> None:
+    """提出フェーズのタイムアウト: 完了ラウンドがない場合はPhaseTimeoutError"""
+    mocks["leader_run"].side_effect = _hang
+    controller = _controller(tmp_path, submission_timeout_seconds=1)
+
+    with pytest.raises(PhaseTimeoutError) as exc_info:
+        await asyncio.wait_for(controller.run_round("テストプロンプト", timeout_seconds=600), timeout=10)
+
+    assert exc_info.value.phase == "submission"
+    assert exc_info.value.round_number == 1
+
+
+@pytest.mark.asyncio
+async def test_judgment_timeout_stops_after_round(tmp_path: Path, mocks: dict[str, MagicMock]) -> None:
+    """判定フェーズのタイムアウト: 継続せずに確定し、round_statusに記録する"""
+    mocks["judge"].side_effect = _hang
+    controller = _controller(tmp_path, judgment_timeout_seconds=1)
+
+    result = await asyncio.wait_for(controller.run_round("テストプロンプト", timeout_seconds=600), timeout=10)
+
+    assert result.exit_reason == "judgment_timeout"
+    assert mocks["leader_run"].await_count == 1
+    status_call = mocks["store"].save_round_status.await_args_list[-1]
+    assert status_call.kwargs["should_continue"] is False
+    assert "judgment phase timed out" in status_call.kwargs["reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_team_budget_bounds_evaluation(tmp_path: Path, mocks: dict[str, MagicMock]) -> None:
+    """チームの残り時間で評価フェーズを打ち切り、チームタイムアウト前に確定する"""
+    mocks["evaluate"].side_effect = _hang_after(_evaluation(70.0))
+    controller = _controller(tmp_path)
+
+    result = await asyncio.wait_for(controller.run_round("テストプロンプト", timeout_seconds=1), timeout=1)
+
+    assert result.exit_reason == "evaluation_timeout"
+    assert result.score == 70.0
@@ -91,3 +91,64 @@ async def test_round_controller_run_round(tmp_path: Path) -> None:
         assert result.submission_content == "テストSubmission"
         assert result.score == 87.5  # 0-100スケールのまま
         assert result.final_submission is True
+
+
+@pytest.mark.asyncio
+async def test_round_controller_reuses_agents_across_rounds(tmp_path: Path) -> None:
+    """Leader/Member Agent・Evaluatorはラウンドごとに再生成されない"""
+    team_config_path = Path.cwd() / "tests" / "fixtures" / "team1.toml"
+    task = OrchestratorTask(
+        execution_id="550e8400-e29b-41d4-a716-446655440001",
+        user_prompt="テストプロンプト",
+        team_configs=[team_config_path],
+        timeout_seconds=300,
+        max_rounds=3,
+        min_rounds=3,
+    )
+
+    with (
+        patch("mixseek.round_controller.controller.create_leader_agent") as mock_leader,
+        patch("mixseek.round_controller.controller.MemberAgentFactory.create_agent") as mock_create_member,
+        patch("mixseek.round_controller.controller.Evaluator") as mock_eval_class,
+        patch("mixseek.round_controller.controller.AggregationStore") as mock_store,
+        patch("mixseek.round_controller.controller.JudgmentClient") as mock_judgment_client_class,
+    ):
+        from mixseek.round_controller.models import ImprovementJudgment
+
+        mock_judgment_client_class.return_value.judge_improvement_prospects = AsyncMock(
+            return_value=ImprovementJudgment(should_continue=True, reasoning="継続", confidence_score=0.9)
+        )
+
+        mock_leader_result = Mock()
+        mock_leader_result.output = "テストSubmission"
+        mock_leader_result.all_messages = Mock(return_value=[])
+        mock_leader.return_value.run = AsyncMock(return_value=mock_leader_result)
+
+        mock_eval_class.return_value.evaluate = AsyncMock(
+            return_value=EvaluationResult(
+                metrics=[MetricScore(metric_name="ClarityCoherence", score=80.0, evaluator_comment="ok")],
+                overall_score=80.0,
+            )
+        )
+
+        mock_store_instance = AsyncMock()
+        mock_store_instance.get_ranking_by_execution.return_value = []
+        mock_store.return_value = mock_store_instance
+
+        controller = RoundController(
+            team_config_path=team_config_path,
+            workspace=tmp_path,
+            task=task,
+            evaluator_settings=EvaluatorSettings(),
+            judgment_settings=JudgmentSettings(),
+            prompt_builder_settings=PromptBuilderSettings(),
+        )
+
+        await controller.run_round(user_prompt="テストプロンプト", timeout_seconds=600)
+
+        assert mock_leader.return_value.run.await_count == 3
+        assert mock_leader.call_count == 1
+        assert mock_create_member.call_count == len(controller.team_settings.members)
+        assert mock_eval_class.call_count == 1
+        assert mock_eval_class.return_value.evaluate.await_count == 3
+        assert controller.agent_pool.stats.hits == 2
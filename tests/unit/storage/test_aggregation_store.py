@@ -4,6 +4,7 @@ Test Coverage:
     - __init__: 環境変数チェック、テーブル作成
     - save_aggregation: 集約結果保存、リトライ
     - load_round_history: 履歴読み込み、Pydantic AI復元
+    - round_messages: Message Historyの正規化保存、範囲読み込み、旧形式互換
     - save_to_leader_board: Leader Board保存
     - get_leader_board: ランキング取得
 """
@@ -13,7 +14,7 @@ from typing import cast
 
 import pytest
 from pydantic_ai import ModelMessage
-from pydantic_ai.messages import ModelRequest, UserPromptPart
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
 
 from mixseek.agents.leader.models import MemberSubmission, MemberSubmissionsRecord
 from mixseek.exceptions import WorkspacePathNotSpecifiedError
@@ -237,6 +238,142 @@ class TestLoadRoundHistory:
         assert restored_messages[0].parts[0].content == "Original prompt"
 
 
+class TestRoundMessages:
+    """round_messages（Message History正規化テーブル）テスト"""
+
+    EXECUTION_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+    @pytest.fixture
+    def store(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> AggregationStore:
+        """テスト用ストア"""
+        monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+        return AggregationStore()
+
+    @staticmethod
+    def _messages(count: int, prefix: str = "message") -> list[ModelMessage]:
+        messages: list[ModelMessage] = []
+        for index in range(count):
+            if index % 2 == 0:
+                messages.append(ModelRequest(parts=[UserPromptPart(content=f"{prefix} {index}")]))
+            else:
+                messages.append(ModelResponse(parts=[TextPart(content=f"{prefix} {index}")]))
+        return messages
+
+    def _record(self, member_messages: list[ModelMessage] | None) -> MemberSubmissionsRecord:
+        from pydantic_ai import RunUsage
+
+        return MemberSubmissionsRecord(
+            execution_id=self.EXECUTION_ID,
+            team_id="team-001",
+            team_name="Team",
+            round_number=1,
+            submissions=[
+                MemberSubmission(
+                    agent_name="a1",
+                    agent_type="plain",
+                    content="R",
+                    status="SUCCESS",
+                    usage=RunUsage(input_tokens=100, output_tokens=200, requests=1),
+                    all_messages=member_messages,
+                )
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_messages_stored_one_row_per_message(self, store: AggregationStore) -> None:
+        """正常系: Leader/MemberのMessage Historyが1メッセージ1行で保存される"""
+        await store.save_aggregation(self.EXECUTION_ID, self._record(self._messages(2, "member")), self._messages(3))
+
+        conn = store._get_connection()
+        rows = conn.execute(
+            "SELECT source, submission_index, message_index, message_kind FROM round_messages ORDER BY ALL"
+        ).fetchall()
+        history = conn.execute("SELECT message_history, member_submissions_record FROM round_history").fetchone()
+
+        assert rows == [
+            ("leader", 0, 0, "request"),
+            ("leader", 0, 1, "response"),
+            ("leader", 0, 2, "request"),
+            ("member", 0, 0, "request"),
+            ("member", 0, 1, "response"),
+        ]
+        assert history is not None
+        assert history[0] is None
+        assert "all_messages" not in history[1]
+
+    @pytest.mark.asyncio
+    async def test_load_round_history_restores_member_messages(self, store: AggregationStore) -> None:
+        """正常系: Member Agentのall_messagesも復元される"""
+        await store.save_aggregation(self.EXECUTION_ID, self._record(self._messages(2, "member")), self._messages(3))
+
+        aggregated, messages = await store.load_round_history(self.EXECUTION_ID, "team-001", 1)
+
+        assert aggregated is not None
+        assert len(messages) == 3
+        member_messages = aggregated.submissions[0].all_messages
+        assert member_messages is not None
+        assert isinstance(member_messages[1], ModelResponse)
+        assert member_messages[1].parts[0].content == "member 1"
+
+    @pytest.mark.asyncio
+    async def test_load_round_history_without_messages(self, store: AggregationStore) -> None:
+        """正常系: include_messages=FalseではMessage Historyを読み込まない"""
+        await store.save_aggregation(self.EXECUTION_ID, self._record(self._messages(2)), self._messages(3))
+
+        aggregated, messages = await store.load_round_history(self.EXECUTION_ID, "team-001", 1, include_messages=False)
+
+        assert aggregated is not None
+        assert aggregated.submissions[0].all_messages is None
+        assert messages == []
+
+    @pytest.mark.asyncio
+    async def test_load_messages_range(self, store: AggregationStore) -> None:
+        """正常系: load_messagesで必要な範囲のみ読み込める"""
+        await store.save_aggregation(self.EXECUTION_ID, self._record(self._messages(4, "member")), self._messages(5))
+
+        leader = await store.load_messages(self.EXECUTION_ID, "team-001", 1, start=1, limit=2)
+        member = await store.load_messages(self.EXECUTION_ID, "team-001", 1, source="member", start=3)
+
+        assert [message.parts[0].content for message in leader] == ["message 1", "message 2"]
+        assert [message.parts[0].content for message in member] == ["member 3"]
+
+    @pytest.mark.asyncio
+    async def test_resave_replaces_messages(self, store: AggregationStore) -> None:
+        """正常系: 同一ラウンドの再保存で古いメッセージが残らない"""
+        await store.save_aggregation(self.EXECUTION_ID, self._record(None), self._messages(4))
+        await store.save_aggregation(self.EXECUTION_ID, self._record(None), self._messages(2, "updated"))
+
+        _, messages = await store.load_round_history(self.EXECUTION_ID, "team-001", 1)
+
+        assert [message.parts[0].content for message in messages] == ["updated 0", "updated 1"]
+
+    @pytest.mark.asyncio
+    async def test_load_legacy_json_message_history(self, store: AggregationStore) -> None:
+        """後方互換: round_history.message_historyに保存された旧形式を読み込める"""
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        record = self._record(self._messages(1, "member"))
+        conn = store._get_connection()
+        conn.execute(
+            """
+            INSERT INTO round_history
+            (execution_id, team_id, team_name, round_number, message_history, member_submissions_record)
+            VALUES (?, 'team-001', 'Team', 1, ?, ?)
+            """,
+            [
+                self.EXECUTION_ID,
+                ModelMessagesTypeAdapter.dump_json(self._messages(2)).decode(),
+                record.model_dump_json(),
+            ],
+        )
+
+        aggregated, messages = await store.load_round_history(self.EXECUTION_ID, "team-001", 1)
+
+        assert len(messages) == 2
+        assert aggregated is not None
+        assert aggregated.submissions[0].all_messages is not None
+
+
 class TestLeaderBoard:
     """Leader Boardテスト（US3の一部だがUS2で基本機能テスト）"""
 
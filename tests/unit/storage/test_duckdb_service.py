@@ -0,0 +1,110 @@
+"""DuckDBService ユニットテスト
+
+Test Coverage:
+    - ライター接続が存在する場合、読み込みはライターのcursorを共有
+    - ライター接続がない場合、読み込みは読み取り専用接続
+    - ライター破棄後のロック解放
+    - 読み取り専用接続との構成競合時のライター接続リトライ
+"""
+
+import gc
+import threading
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from mixseek.storage.duckdb_service import DuckDBService, get_duckdb_service
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    db_path = tmp_path / "mixseek.db"
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER)")
+    return db_path
+
+
+class TestDuckDBService:
+    """DuckDBService テスト"""
+
+    def test_service_is_shared_per_db_file(self, db_path: Path) -> None:
+        """正常系: 同一DBファイルは同じサービスを返す"""
+        assert get_duckdb_service(db_path) is get_duckdb_service(
+            db_path.parent / ".." / db_path.parent.name / "mixseek.db"
+        )
+
+    def test_reader_is_read_only_without_writer(self, db_path: Path) -> None:
+        """正常系: ライターがない場合は読み取り専用接続"""
+        service = DuckDBService(db_path)
+
+        with service.read() as conn:
+            assert not service.has_writer
+            with pytest.raises(duckdb.Error):
+                conn.execute("INSERT INTO items VALUES (1)")
+
+    def test_reader_sees_committed_writes_while_writer_is_open(self, db_path: Path) -> None:
+        """正常系: ライター接続中も読み込みが失敗せずコミット済みデータを参照できる"""
+        service = DuckDBService(db_path)
+        writer = service.connect_writer()
+
+        writer.execute("BEGIN TRANSACTION")
+        writer.execute("INSERT INTO items VALUES (1)")
+        with service.read() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM items").fetchone()
+            assert row == (0,)
+
+        writer.execute("COMMIT")
+        with service.read() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM items").fetchone()
+            assert row == (1,)
+
+        writer.close()
+
+    def test_readers_from_multiple_threads(self, db_path: Path) -> None:
+        """正常系: 複数スレッドから同時に読み込める"""
+        service = DuckDBService(db_path)
+        writer = service.connect_writer()
+        writer.execute("INSERT INTO items VALUES (1)")
+        results: list[tuple[int, ...] | None] = []
+
+        def read() -> None:
+            with service.read() as conn:
+                results.append(conn.execute("SELECT COUNT(*) FROM items").fetchone())
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [(1,)] * 4
+        writer.close()
+
+    def test_closed_writer_falls_back_to_read_only(self, db_path: Path) -> None:
+        """正常系: close済み/破棄済みのライターは使用されない"""
+        service = DuckDBService(db_path)
+        writer = service.connect_writer()
+        writer.close()
+
+        with service.read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+        assert not service.has_writer
+
+        writer = service.connect_writer()
+        del writer
+        gc.collect()
+        assert not service.has_writer
+
+    def test_writer_waits_for_read_only_connection(self, db_path: Path) -> None:
+        """正常系: 読み取り専用接続がcloseされるまでライター接続をリトライ"""
+        service = DuckDBService(db_path)
+        reader = service.connect_reader()
+        timer = threading.Timer(0.1, reader.close)
+        timer.start()
+
+        writer = service.connect_writer()
+        timer.join()
+
+        assert service.has_writer
+        writer.close()
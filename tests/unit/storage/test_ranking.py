@@ -0,0 +1,118 @@
+"""LeaderBoardRanking ユニットテスト
+
+Test Coverage:
+    - record: 増分更新、同一ラウンドの上書き
+    - load: DB既存レコードでの初期化
+    - AggregationStore連携: DBを参照しないランキング取得
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mixseek.storage import AggregationStore, LeaderBoardRanking
+
+EXECUTION_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+async def _save(store: AggregationStore, team_id: str, round_number: int, score: float) -> None:
+    await store.save_to_leader_board(
+        execution_id=EXECUTION_ID,
+        team_id=team_id,
+        team_name=f"Team {team_id}",
+        round_number=round_number,
+        submission_content="submission",
+        submission_format="md",
+        score=score,
+        score_details={},
+    )
+
+
+class TestLeaderBoardRanking:
+    """LeaderBoardRanking テスト"""
+
+    def test_ranking_orders_by_max_score_then_team_id(self) -> None:
+        """正常系: 最高スコア降順、同点はteam_id昇順"""
+        ranking = LeaderBoardRanking(EXECUTION_ID)
+        ranking.record("team-b", "Team B", 1, 70.0)
+        ranking.record("team-a", "Team A", 1, 80.0)
+        ranking.record("team-c", "Team C", 1, 60.0)
+        ranking.record("team-c", "Team C", 2, 80.0)
+
+        assert ranking.ranking() == [
+            {"team_id": "team-a", "team_name": "Team A", "max_score": 80.0, "total_rounds": 1},
+            {"team_id": "team-c", "team_name": "Team C", "max_score": 80.0, "total_rounds": 2},
+            {"team_id": "team-b", "team_name": "Team B", "max_score": 70.0, "total_rounds": 1},
+        ]
+
+    def test_overwriting_best_round_recomputes_max(self) -> None:
+        """正常系: 最高スコアのラウンドを低いスコアで上書きすると再計算される"""
+        ranking = LeaderBoardRanking(EXECUTION_ID)
+        ranking.record("team-a", "Team A", 1, 50.0)
+        ranking.record("team-a", "Team A", 2, 90.0)
+        ranking.record("team-a", "Team A", 2, 40.0)
+
+        [entry] = ranking.ranking()
+        assert entry["max_score"] == 50.0
+        assert entry["total_rounds"] == 2
+
+    def test_load_keeps_newer_recorded_scores(self) -> None:
+        """正常系: load()はrecord()済みのラウンドを上書きしない"""
+        ranking = LeaderBoardRanking(EXECUTION_ID)
+        ranking.record("team-a", "Team A", 2, 95.0)
+
+        ranking.load([("team-a", "Team A", 1, 60.0), ("team-a", "Team A", 2, 10.0), ("team-b", "Team B", 1, 70.0)])
+
+        assert ranking.loaded
+        assert [(entry["team_id"], entry["max_score"]) for entry in ranking.ranking()] == [
+            ("team-a", 95.0),
+            ("team-b", 70.0),
+        ]
+
+
+class TestAggregationStoreRanking:
+    """AggregationStore(ranking=...) テスト"""
+
+    @pytest.mark.asyncio
+    async def test_ranking_matches_database_without_querying(self, tmp_path: Path) -> None:
+        """正常系: 共有ランキングがDBのGROUP BY結果と一致し、DBを参照しない"""
+        db_path = tmp_path / "mixseek.db"
+        ranking = LeaderBoardRanking(EXECUTION_ID)
+        ranking.loaded = True
+        stores = [AggregationStore(db_path=db_path, ranking=ranking) for _ in range(2)]
+
+        await _save(stores[0], "team-a", 1, 70.0)
+        await _save(stores[1], "team-b", 1, 85.0)
+        await _save(stores[0], "team-a", 2, 90.0)
+
+        with patch.object(AggregationStore, "_get_leader_board_ranking_sync") as query:
+            cached = await stores[1].get_leader_board_ranking(EXECUTION_ID)
+        query.assert_not_called()
+
+        expected = await AggregationStore(db_path=db_path).get_leader_board_ranking(EXECUTION_ID)
+        assert cached == expected
+
+    @pytest.mark.asyncio
+    async def test_ranking_seeded_from_existing_rows(self, tmp_path: Path) -> None:
+        """正常系: 初回参照時にDBの既存レコードを一度だけ読み込む"""
+        db_path = tmp_path / "mixseek.db"
+        await _save(AggregationStore(db_path=db_path), "team-a", 1, 60.0)
+
+        store = AggregationStore(db_path=db_path, ranking=LeaderBoardRanking(EXECUTION_ID))
+        await _save(store, "team-b", 1, 75.0)
+
+        ranking = await store.get_leader_board_ranking(EXECUTION_ID)
+
+        assert [entry["team_id"] for entry in ranking] == ["team-b", "team-a"]
+
+    @pytest.mark.asyncio
+    async def test_other_execution_uses_database(self, tmp_path: Path) -> None:
+        """正常系: 別のexecution_idはDBから取得する"""
+        db_path = tmp_path / "mixseek.db"
+        store = AggregationStore(db_path=db_path, ranking=LeaderBoardRanking("other-execution"))
+        await _save(store, "team-a", 1, 60.0)
+
+        ranking = await store.get_leader_board_ranking(EXECUTION_ID)
+
+        assert [entry["team_id"] for entry in ranking] == ["team-a"]
@@ -0,0 +1,232 @@
+"""write-behindキュー ユニットテスト
+
+Test Coverage:
+    - 複数チームの書き込みを1バッチでコミット
+    - 読み込み前の自動flush（read-your-writes）
+    - flush()による永続化とエラー報告
+    - バックプレッシャー
+"""
+
+import asyncio
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from mixseek.agents.leader.models import MemberSubmissionsRecord
+from mixseek.storage.aggregation_store import AggregationStore, DatabaseWriteError
+from mixseek.storage.write_behind import WriteBehindQueue, get_write_behind_queue
+
+
+def _record(team_id: str, round_number: int = 1) -> MemberSubmissionsRecord:
+    return MemberSubmissionsRecord(
+        execution_id="550e8400-e29b-41d4-a716-446655440000",
+        team_id=team_id,
+        team_name=f"Team {team_id}",
+        round_number=round_number,
+        submissions=[],
+    )
+
+
+def _count_rows(db_path: Path, table: str) -> int:
+    with duckdb.connect(str(db_path)) as conn:
+        row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    assert row is not None
+    return int(row[0])
+
+
+class TestAggregationStoreWriteBehind:
+    """AggregationStore(write_behind=True) テスト"""
+
+    @pytest.mark.asyncio
+    async def test_writes_from_multiple_teams_share_one_batch(self, tmp_path: Path) -> None:
+        """正常系: 複数チームのupsertが1トランザクションにまとめられる"""
+        db_path = tmp_path / "mixseek.db"
+        stores = [AggregationStore(db_path=db_path, write_behind=True) for _ in range(3)]
+
+        for index, store in enumerate(stores):
+            record = _record(f"team-{index}")
+            await store.save_aggregation(record.execution_id, record, [])
+            await store.save_to_leader_board(
+                execution_id=record.execution_id,
+                team_id=record.team_id,
+                team_name=record.team_name,
+                round_number=1,
+                submission_content="submission",
+                submission_format="md",
+                score=80.0,
+                score_details={},
+            )
+
+        queue = get_write_behind_queue(db_path)
+        assert queue.pending_count == 6
+
+        await stores[0].flush()
+
+        assert queue.pending_count == 0
+        assert queue.stats.batches == 1
+        assert queue.stats.largest_batch == 6
+        assert _count_rows(db_path, "round_history") == 3
+        assert _count_rows(db_path, "leader_board") == 3
+
+    @pytest.mark.asyncio
+    async def test_reads_see_pending_writes(self, tmp_path: Path) -> None:
+        """正常系: 読み込み前に保留中の書き込みがコミットされる"""
+        store = AggregationStore(db_path=tmp_path / "mixseek.db", write_behind=True)
+        record = _record("team-001")
+
+        await store.save_aggregation(record.execution_id, record, [])
+        loaded, _ = await store.load_round_history(record.execution_id, record.team_id, 1)
+
+        assert loaded is not None
+        assert loaded.team_id == "team-001"
+
+    @pytest.mark.asyncio
+    async def test_writes_committed_after_flush_interval(self, tmp_path: Path) -> None:
+        """正常系: flushを呼ばなくてもflush間隔後にコミットされる"""
+        db_path = tmp_path / "mixseek.db"
+        store = AggregationStore(db_path=db_path, write_behind=True)
+        record = _record("team-001")
+
+        await store.save_aggregation(record.execution_id, record, [])
+        queue = get_write_behind_queue(db_path)
+        for _ in range(50):
+            if queue.pending_count == 0:
+                break
+            await asyncio.sleep(queue.flush_interval_seconds)
+
+        assert queue.pending_count == 0
+        assert _count_rows(db_path, "round_history") == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_round_status_raises_immediately(self, tmp_path: Path) -> None:
+        """異常系: バリデーションエラーはキュー追加前に送出される"""
+        store = AggregationStore(db_path=tmp_path / "mixseek.db", write_behind=True)
+
+        with pytest.raises(ValueError, match="confidence_score"):
+            await store.save_round_status(
+                execution_id="550e8400-e29b-41d4-a716-446655440000",
+                team_id="team-001",
+                team_name="Team",
+                round_number=1,
+                should_continue=True,
+                reasoning=None,
+                confidence_score=1.5,
+                round_started_at="2025-01-01T00:00:00+00:00",
+                round_ended_at="2025-01-01T00:01:00+00:00",
+            )
+
+        assert get_write_behind_queue(store.db_path).pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_other_team_write_error_not_raised(self, tmp_path: Path) -> None:
+        """異常系: 他チームの書き込みエラーは自チームのflush()・実行サマリー保存に影響しない"""
+        db_path = tmp_path / "mixseek.db"
+        store_a = AggregationStore(db_path=db_path, write_behind=True)
+        store_b = AggregationStore(db_path=db_path, write_behind=True)
+        summary_store = AggregationStore(db_path=db_path, write_behind=True)
+        get_write_behind_queue(store_a.db_path).retry_delays = ()
+
+        def broken(conn: duckdb.DuckDBPyConnection) -> None:
+            raise RuntimeError("boom")
+
+        await store_a._enqueue_write(broken, "save team A")
+        await store_b.flush()
+        await summary_store.save_execution_summary(
+            execution_id="550e8400-e29b-41d4-a716-446655440000",
+            user_prompt="prompt",
+            status="completed",
+            team_results=[],
+            total_teams=2,
+            best_team_id=None,
+            best_score=None,
+            total_execution_time_seconds=1.0,
+        )
+
+        with pytest.raises(DatabaseWriteError, match="save team A"):
+            await store_a.flush()
+
+
+class TestWriteBehindQueue:
+    """WriteBehindQueue テスト"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path: Path) -> Path:
+        db_path = tmp_path / "queue.db"
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        return db_path
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_is_isolated_and_reported(self, db_path: Path) -> None:
+        """異常系: 失敗した操作のみがflush()でDatabaseWriteErrorとして報告される"""
+        queue = WriteBehindQueue(db_path, retry_delays=())
+
+        def broken(conn: duckdb.DuckDBPyConnection) -> None:
+            raise RuntimeError("boom")
+
+        await queue.enqueue(lambda conn: conn.execute("INSERT INTO items VALUES (1)"), "insert 1")
+        await queue.enqueue(broken, "insert broken")
+        await queue.enqueue(lambda conn: conn.execute("INSERT INTO items VALUES (2)"), "insert 2")
+
+        with pytest.raises(DatabaseWriteError, match="insert broken"):
+            await queue.flush()
+
+        assert _count_rows(db_path, "items") == 2
+        assert queue.stats.failed_operations == 1
+        # エラーは一度だけ報告される
+        await queue.flush()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_when_queue_is_full(self, db_path: Path) -> None:
+        """正常系: 保留数が上限に達するとenqueueが待機する"""
+        queue = WriteBehindQueue(db_path, flush_interval_seconds=10, max_pending=2)
+
+        for item_id in range(5):
+            await queue.enqueue(
+                lambda conn, item_id=item_id: conn.execute("INSERT INTO items VALUES (?)", [item_id]),
+                f"insert {item_id}",
+            )
+        await queue.flush()
+
+        assert queue.stats.backpressure_waits > 0
+        assert queue.stats.largest_batch <= 2
+        assert _count_rows(db_path, "items") == 5
+
+    @pytest.mark.asyncio
+    async def test_operations_keep_enqueue_order(self, db_path: Path) -> None:
+        """正常系: 同一キーへのupsertはenqueue順に適用される"""
+        queue = WriteBehindQueue(db_path)
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("CREATE TABLE kv (k INTEGER PRIMARY KEY, v INTEGER)")
+
+        for value in range(3):
+            await queue.enqueue(
+                lambda conn, value=value: conn.execute(
+                    "INSERT INTO kv VALUES (1, ?) ON CONFLICT (k) DO UPDATE SET v = EXCLUDED.v", [value]
+                ),
+                f"upsert {value}",
+            )
+        await queue.flush()
+
+        with duckdb.connect(str(db_path)) as conn:
+            assert conn.execute("SELECT v FROM kv").fetchone() == (2,)
+
+    @pytest.mark.asyncio
+    async def test_errors_reported_only_to_owner(self, db_path: Path) -> None:
+        """異常系: 共有キューのエラーはenqueueした所有者のflush()でのみ報告される"""
+        queue = WriteBehindQueue(db_path, retry_delays=())
+        team_a, team_b = object(), object()
+
+        def broken(conn: duckdb.DuckDBPyConnection) -> None:
+            raise RuntimeError("boom")
+
+        await queue.enqueue(broken, "insert for team A", owner=team_a)
+        await queue.enqueue(lambda conn: conn.execute("INSERT INTO items VALUES (1)"), "insert 1", owner=team_b)
+
+        # team Bのflushは全書き込みのコミットを待つが、team Aのエラーは送出しない
+        await queue.flush(owner=team_b)
+        assert _count_rows(db_path, "items") == 1
+
+        with pytest.raises(DatabaseWriteError, match="team A"):
+            await queue.flush(owner=team_a)
@@ -0,0 +1,93 @@
+"""Unit tests for agent instance pooling."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import BaseModel
+
+from mixseek.core.agent_pool import AgentPool, agent_cache_key, get_agent_pool, use_agent_pool
+from mixseek.evaluator.llm_client import evaluate_with_llm
+
+
+class _Score(BaseModel):
+    score: float
+    comment: str
+
+
+class TestAgentCacheKey:
+    """Test cache key construction."""
+
+    def test_dict_order_does_not_matter(self) -> None:
+        assert agent_cache_key({"temperature": 0.0, "seed": 1}) == agent_cache_key({"seed": 1, "temperature": 0.0})
+
+    def test_nested_lists_are_hashable(self) -> None:
+        key = agent_cache_key("openai:gpt-4o", {"stop_sequences": ["END", "STOP"]})
+        assert hash(key) is not None
+        assert key != agent_cache_key("openai:gpt-4o", {"stop_sequences": ["STOP", "END"]})
+
+
+class TestAgentPool:
+    """Test pool caching and context propagation."""
+
+    def test_get_or_create_builds_once(self) -> None:
+        pool = AgentPool()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.get_or_create(("a",), factory)
+        second = pool.get_or_create(("a",), factory)
+        other = pool.get_or_create(("b",), factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 2
+        assert len(pool) == 2
+
+    async def test_pool_propagates_to_tasks(self) -> None:
+        pool = AgentPool()
+        assert get_agent_pool() is None
+
+        async def current() -> AgentPool | None:
+            return get_agent_pool()
+
+        with use_agent_pool(pool):
+            seen = await asyncio.gather(current(), current())
+
+        assert seen == [pool, pool]
+        assert get_agent_pool() is None
+
+
+class TestEvaluateWithLLMPooling:
+    """Test Agent reuse in evaluate_with_llm."""
+
+    @patch("mixseek.evaluator.llm_client.create_authenticated_model")
+    @patch("mixseek.evaluator.llm_client.Agent")
+    async def test_agent_reused_within_pool(self, mock_agent_class: MagicMock, mock_create_model: MagicMock) -> None:
+        mock_result = MagicMock()
+        mock_result.output = _Score(score=80.0, comment="ok")
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        kwargs = {"instruction": "judge", "model": "openai:gpt-4o", "response_model": _Score}
+
+        with use_agent_pool(AgentPool()):
+            await evaluate_with_llm(user_prompt="first", **kwargs)
+            await evaluate_with_llm(user_prompt="second", **kwargs)
+            await evaluate_with_llm(user_prompt="third", temperature=0.5, **kwargs)
+
+        assert mock_create_model.call_count == 2
+        assert mock_agent_class.call_count == 2
+
+    @patch("mixseek.evaluator.llm_client.create_authenticated_model")
+    @patch("mixseek.evaluator.llm_client.Agent")
+    async def test_agent_built_per_call_without_pool(
+        self, mock_agent_class: MagicMock, mock_create_model: MagicMock
+    ) -> None:
+        mock_result = MagicMock()
+        mock_result.output = _Score(score=80.0, comment="ok")
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        kwargs = {"instruction": "judge", "model": "openai:gpt-4o", "response_model": _Score}
+
+        await evaluate_with_llm(user_prompt="first", **kwargs)
+        await evaluate_with_llm(user_prompt="second", **kwargs)
+
+        assert mock_agent_class.call_count == 2
@@ -21,9 +21,13 @@ import pytest
 from mixseek.core.auth import (
     AuthenticationError,
     AuthProvider,
+    HttpClientSettings,
     _create_google_model_cached,
+    _get_http_client,
     _managed_http_clients,
     clear_auth_caches,
+    close_all_auth_clients,
+    configure_http_clients,
     create_authenticated_model,
     detect_auth_provider,
     get_auth_info,
@@ -348,7 +352,9 @@ class TestAuthenticatedModelCreation:
 
             assert model == mock_model_instance
             mock_validate_creds.assert_called_once()
-            mock_grok_provider.assert_called_once_with(api_key="xai-test-key")
+            mock_grok_provider.assert_called_once_with(
+                api_key="xai-test-key", http_client=mock_grok_provider.call_args.kwargs["http_client"]
+            )
             mock_openai_model.assert_called_once_with("grok-2-1212", provider=mock_provider_instance)
 
 
@@ -545,3 +551,68 @@ class TestClearAuthCaches:
         cache_info = _create_google_model_cached.cache_info()
         assert cache_info.currsize == 0
         assert len(_managed_http_clients) == 0
+
+
+class TestSharedHttpClients:
+    """Test pooled HTTP clients shared by all providers."""
+
+    @pytest.fixture(autouse=True)
+    def reset_http_clients(self) -> Any:
+        configure_http_clients(None)
+        clear_auth_caches()
+        yield
+        configure_http_clients(None)
+        clear_auth_caches()
+
+    @pytest.mark.parametrize(
+        ("model_id", "env"),
+        [
+            ("openai:gpt-4o", {"OPENAI_API_KEY": "sk-test"}),
+            ("anthropic:claude-sonnet-4-5-20250929", {"ANTHROPIC_API_KEY": "sk-ant-test"}),
+            ("grok:grok-3", {"GROK_API_KEY": "xai-test"}),
+            ("grok-responses:grok-4", {"GROK_API_KEY": "xai-test"}),
+        ],
+    )
+    @patch("mixseek.core.auth.validate_test_environment", return_value=False)
+    def test_models_share_provider_client(self, _: Any, model_id: str, env: dict[str, str]) -> None:
+        """Test that repeated model creation reuses one pooled client per provider."""
+        with patch.dict(os.environ, env, clear=True):
+            first = create_authenticated_model(model_id)
+            second = create_authenticated_model(model_id)
+
+        assert first is not second
+        assert first.client._client is second.client._client  # type: ignore[union-attr]
+        assert first.client._client in _managed_http_clients  # type: ignore[union-attr]
+
+    def test_clients_are_per_provider(self) -> None:
+        """Test that each provider gets its own client."""
+        assert _get_http_client("openai") is _get_http_client("openai")
+        assert _get_http_client("openai") is not _get_http_client("anthropic")
+        assert len(_managed_http_clients) == 2
+
+    def test_configure_applies_pool_limits(self) -> None:
+        """Test that configured settings reach newly created clients."""
+        before = _get_http_client("openai")
+        configure_http_clients({"max_connections": 7, "keepalive_expiry_seconds": 5.0})
+
+        after = _get_http_client("openai")
+
+        assert after is not before
+        assert after._transport.settings == HttpClientSettings(  # type: ignore[attr-defined]
+            max_connections=7, keepalive_expiry_seconds=5.0
+        )
+
+    def test_configure_with_same_settings_keeps_clients(self) -> None:
+        """Test that unchanged settings keep existing clients."""
+        client = _get_http_client("openai")
+        configure_http_clients(HttpClientSettings())
+        assert _get_http_client("openai") is client
+
+    async def test_close_all_auth_clients_closes_shared_clients(self) -> None:
+        """Test that close_all_auth_clients closes and forgets shared clients."""
+        client = _get_http_client("anthropic")
+
+        await close_all_auth_clients()
+
+        assert client.is_closed
+        assert _get_http_client("anthropic") is not client
@@ -4,12 +4,18 @@ This module tests the dynamic loading mechanism for custom Member Agents,
 including both agent_module (recommended) and path (alternative) methods.
 """
 
+import os
 import sys
 
 import pytest
 
 from mixseek.agents.member.base import BaseMemberAgent
-from mixseek.agents.member.dynamic_loader import load_agent_from_module, load_agent_from_path
+from mixseek.agents.member.dynamic_loader import (
+    clear_plugin_module_cache,
+    load_agent_from_module,
+    load_agent_from_path,
+    plugin_module_cache_stats,
+)
 from mixseek.models.member_agent import MemberAgentConfig
 
 
@@ -282,3 +288,55 @@ class TestLoadAgentFromPath:
         assert isinstance(agent2, BaseMemberAgent)
         assert type(agent1).__name__ == "Agent1"
         assert type(agent2).__name__ == "Agent2"
+
+
+class TestPluginModuleCache:
+    """Tests for the path plugin module cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_plugin_module_cache()
+        yield
+        clear_plugin_module_cache()
+
+    def test_module_executed_once(self, tmp_path, mock_config, monkeypatch):
+        """Repeated loads of an unchanged file should reuse the executed module."""
+        monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+        agent_file = tmp_path / "cached_agent.py"
+        agent_file.write_text(VALID_AGENT_CODE)
+
+        agent1 = load_agent_from_path(path=str(agent_file), agent_class="TestAgent", config=mock_config)
+        agent2 = load_agent_from_path(path=str(agent_file), agent_class="TestAgent", config=mock_config)
+
+        assert agent1 is not agent2
+        assert type(agent1) is type(agent2)
+        assert plugin_module_cache_stats.misses == 1
+        assert plugin_module_cache_stats.hits == 1
+        assert plugin_module_cache_stats.reloads == 0
+
+    def test_touched_file_not_reloaded(self, tmp_path, mock_config, monkeypatch):
+        """A changed mtime with identical content should keep the cached module."""
+        monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+        agent_file = tmp_path / "touched_agent.py"
+        agent_file.write_text(VALID_AGENT_CODE)
+
+        agent1 = load_agent_from_path(path=str(agent_file), agent_class="TestAgent", config=mock_config)
+        stat = agent_file.stat()
+        os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        agent2 = load_agent_from_path(path=str(agent_file), agent_class="TestAgent", config=mock_config)
+
+        assert type(agent1) is type(agent2)
+        assert plugin_module_cache_stats.reloads == 0
+
+    def test_modified_file_reloaded(self, tmp_path, mock_config, monkeypatch):
+        """Changing the file content should re-execute it and pick up the new class."""
+        monkeypatch.setenv("MIXSEEK_WORKSPACE", str(tmp_path))
+        agent_file = tmp_path / "changing_agent.py"
+        agent_file.write_text(VALID_AGENT_CODE)
+        load_agent_from_path(path=str(agent_file), agent_class="TestAgent", config=mock_config)
+
+        agent_file.write_text(VALID_AGENT_CODE.replace("TestAgent", "RenamedAgent"))
+        agent = load_agent_from_path(path=str(agent_file), agent_class="RenamedAgent", config=mock_config)
+
+        assert type(agent).__name__ == "RenamedAgent"
+        assert plugin_module_cache_stats.reloads == 1
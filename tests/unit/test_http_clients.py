@@ -0,0 +1,108 @@
+"""Unit tests for pooled provider HTTP clients."""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from mixseek.core.http_clients import (
+    HttpClientSettings,
+    LoopLocalTransport,
+    create_pooled_http_client,
+    get_environment_proxy_mounts,
+)
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text="ok")
+
+
+class TestHttpClientSettings:
+    """Test settings validation."""
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+    def test_http2_requires_h2(self) -> None:
+        with pytest.raises(ValidationError, match="h2"):
+            HttpClientSettings(http2=True)
+
+    def test_orchestrator_settings_accepts_http_client(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        from mixseek.config.schema import OrchestratorSettings
+
+        settings = OrchestratorSettings(workspace_path=tmp_path, http_client={"max_connections": 10})
+        assert settings.http_client.max_connections == 10
+
+
+class TestLoopLocalTransport:
+    """Test per-event-loop connection pools."""
+
+    def test_pool_per_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A client reused across asyncio.run() calls gets a fresh pool per loop."""
+        monkeypatch.setattr(httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(_ok))
+        client = create_pooled_http_client(HttpClientSettings())
+        transport = client._transport
+        assert isinstance(transport, LoopLocalTransport)
+
+        async def fetch_twice() -> list[httpx.AsyncBaseTransport]:
+            await client.get("https://example.invalid/")
+            await client.get("https://example.invalid/")
+            return list(transport._transports.values())
+
+        first = asyncio.run(fetch_twice())
+        second = asyncio.run(fetch_twice())
+
+        assert len(first) == 1
+        assert first[0] not in second
+
+    async def test_pool_limits_applied(self) -> None:
+        transport = LoopLocalTransport(
+            HttpClientSettings(max_connections=3, max_keepalive_connections=1, keepalive_expiry_seconds=2.0)
+        )
+        pool = transport._transport()._pool
+
+        assert pool._max_connections == 3
+        assert pool._max_keepalive_connections == 1
+        assert pool._keepalive_expiry == 2.0
+        await transport.aclose()
+        assert transport.pool_count == 0
+
+
+class TestEnvironmentProxies:
+    """Test that environment proxies are honored with the custom transport."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_proxy_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+
+    def test_https_proxy_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Requests go through HTTPS_PROXY unless the host matches NO_PROXY."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost,.direct.example")
+        proxies: list[str | None] = []
+
+        def fake_transport(**kwargs: object) -> httpx.MockTransport:
+            proxies.append(kwargs.get("proxy"))  # type: ignore[arg-type]
+            return httpx.MockTransport(_ok)
+
+        monkeypatch.setattr(httpx, "AsyncHTTPTransport", fake_transport)
+        client = create_pooled_http_client(HttpClientSettings())
+
+        async def fetch(url: str) -> None:
+            await client.get(url)
+
+        asyncio.run(fetch("https://api.example.invalid/"))
+        assert proxies == ["http://proxy.internal:3128"]
+
+        asyncio.run(fetch("https://api.direct.example/"))
+        assert proxies[-1] is None
+
+    def test_no_proxy_without_environment(self) -> None:
+        assert get_environment_proxy_mounts() == {}
+
+    def test_no_proxy_wildcard_disables_proxies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "*")
+        assert get_environment_proxy_mounts() == {}
@@ -5,8 +5,10 @@ MixSeek-Core Framework integration.
 """
 
 import asyncio
+import threading
+from dataclasses import replace
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -17,7 +19,9 @@ from mixseek.framework.integration_hooks import (
     IntegrationManager,
     LoggingIntegrationHook,
     MetricsIntegrationHook,
+    OverflowPolicy,
     WebhookIntegrationHook,
+    WebhookPayloadFormat,
     emit_agent_created_event,
     emit_execution_completed_event,
     get_integration_manager,
@@ -308,60 +312,207 @@ class TestWebhookIntegrationHook:
         assert hook.is_interested_in(IntegrationEventType.AGENT_CREATED) is True
         assert hook.is_interested_in(IntegrationEventType.EXECUTION_COMPLETED) is False
 
-    @pytest.mark.asyncio
-    async def test_handle_event_success(self, sample_event: IntegrationEvent) -> None:
-        """Test successful webhook event handling."""
+    @staticmethod
+    def _mock_session(status: int = 200, post_side_effect: Exception | None = None) -> MagicMock:
+        """Create a mock aiohttp session whose post() is an async context manager."""
         mock_response = Mock()
-        mock_response.status = 200
+        mock_response.status = status
+        session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
+        if post_side_effect is not None:
+            session.post.side_effect = post_side_effect
+        else:
+            session.post.return_value.__aenter__.return_value = mock_response
+        return session
+
+    @pytest.mark.asyncio
+    async def test_handle_event_batches_events(self, sample_event: IntegrationEvent) -> None:
+        """Events are sent as one batch over a single reused session."""
+        session = self._mock_session()
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
+        with patch("aiohttp.ClientSession", return_value=session) as mock_session_class:
+            hook = WebhookIntegrationHook(
+                "http://example.com/webhook", batch_size=3, payload_format=WebhookPayloadFormat.BATCH
+            )
+            for _ in range(3):
+                await hook.handle_event(sample_event)
+
+            session.post.assert_called_once()
+            assert len(session.post.call_args.kwargs["json"]["events"]) == 3
+            assert hook.get_stats() == {"delivered": 3, "dropped": 0, "failed_posts": 0, "pending": 0}
 
-            hook = WebhookIntegrationHook("http://example.com/webhook")
             await hook.handle_event(sample_event)
+            await hook.close()
 
-            # Verify POST was called
-            mock_session.return_value.__aenter__.return_value.post.assert_called_once()
+            # Remaining event is flushed on close, session is created only once
+            assert session.post.call_count == 2
+            mock_session_class.assert_called_once()
+            session.close.assert_awaited_once()
+            assert hook.delivered == 4
 
     @pytest.mark.asyncio
-    async def test_handle_event_http_error(self, sample_event: IntegrationEvent) -> None:
-        """Test webhook handling with HTTP error."""
-        mock_response = Mock()
-        mock_response.status = 500
+    async def test_default_payload_is_single_event(self, sample_event: IntegrationEvent) -> None:
+        """By default each event is POSTed as its own object (original payload format)."""
+        session = self._mock_session()
+
+        with patch("aiohttp.ClientSession", return_value=session):
+            hook = WebhookIntegrationHook("http://example.com/webhook", batch_size=10)
+            await hook.handle_event(sample_event)
+
+            session.post.assert_called_once()
+            body = session.post.call_args.kwargs["json"]
+            assert body["event_type"] == sample_event.event_type.value
+            assert body["agent_name"] == sample_event.agent_name
+            assert "events" not in body
+            await hook.close()
+
+    @pytest.mark.asyncio
+    async def test_handle_event_flushes_after_interval(self, sample_event: IntegrationEvent) -> None:
+        """A partial batch is sent after flush_interval_seconds."""
+        session = self._mock_session()
+
+        with patch("aiohttp.ClientSession", return_value=session):
+            hook = WebhookIntegrationHook(
+                "http://example.com/webhook",
+                batch_size=10,
+                flush_interval_seconds=0.01,
+                payload_format=WebhookPayloadFormat.BATCH,
+            )
+            await hook.handle_event(sample_event)
+            session.post.assert_not_called()
+
+            await asyncio.sleep(0.05)
 
-        # Mock the session context managers properly
-        mock_session = AsyncMock()
-        mock_post_response = AsyncMock()
-        mock_post_response.__aenter__.return_value = mock_response
-        mock_session.post.return_value = mock_post_response
+            session.post.assert_called_once()
+            assert hook.delivered == 1
+            await hook.close()
+
+    @pytest.mark.asyncio
+    async def test_handle_event_http_error(self, sample_event: IntegrationEvent) -> None:
+        """HTTP errors are retried, then the batch is kept in the buffer."""
+        session = self._mock_session(status=500)
 
         with (
-            patch("aiohttp.ClientSession") as mock_session_class,
+            patch("aiohttp.ClientSession", return_value=session),
             patch("mixseek.framework.integration_hooks.logger") as mock_logger,
         ):
-            mock_session_class.return_value.__aenter__.return_value = mock_session
-
-            hook = WebhookIntegrationHook("http://example.com/webhook")
+            hook = WebhookIntegrationHook(
+                "http://example.com/webhook", batch_size=1, max_retries=2, retry_backoff_seconds=0
+            )
             await hook.handle_event(sample_event)
 
-            # The mocking is complex - for now, verify that some logging occurred
-            # Either warning or error should have been called
-            assert mock_logger.method_calls, "Expected some logger calls but none occurred"
+            assert session.post.call_count == 3
+            assert mock_logger.warning.call_count == 3
+            assert hook.get_stats() == {"delivered": 0, "dropped": 0, "failed_posts": 3, "pending": 1}
 
     @pytest.mark.asyncio
     async def test_handle_event_connection_error(self, sample_event: IntegrationEvent) -> None:
         """Test webhook handling with connection error."""
+        session = self._mock_session(post_side_effect=Exception("Connection failed"))
+
         with (
-            patch("aiohttp.ClientSession") as mock_session,
+            patch("aiohttp.ClientSession", return_value=session),
             patch("mixseek.framework.integration_hooks.logger") as mock_logger,
         ):
-            mock_session.return_value.__aenter__.return_value.post.side_effect = Exception("Connection failed")
-
-            hook = WebhookIntegrationHook("http://example.com/webhook")
+            hook = WebhookIntegrationHook("http://example.com/webhook", batch_size=1, max_retries=0)
             await hook.handle_event(sample_event)
 
             # Verify error was logged
             mock_logger.error.assert_called_once()
+            assert hook.get_stats()["pending"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_events_retried_on_next_flush(self, sample_event: IntegrationEvent) -> None:
+        """Events kept after a failed flush are delivered once the webhook recovers."""
+        session = self._mock_session(post_side_effect=Exception("Connection failed"))
+
+        with patch("aiohttp.ClientSession", return_value=session):
+            hook = WebhookIntegrationHook("http://example.com/webhook", batch_size=1, max_retries=0)
+            await hook.handle_event(sample_event)
+            assert hook.delivered == 0
+
+            recovered = self._mock_session()
+            session.post.side_effect = None
+            session.post.return_value = recovered.post.return_value
+            await hook.flush()
+
+            assert hook.get_stats() == {"delivered": 1, "dropped": 0, "failed_posts": 1, "pending": 0}
+
+    @pytest.mark.asyncio
+    async def test_buffer_overflow_drops_oldest(self, sample_event: IntegrationEvent) -> None:
+        """When the buffer is full, the oldest events are dropped and counted."""
+        session = self._mock_session(post_side_effect=Exception("Connection failed"))
+
+        with (
+            patch("aiohttp.ClientSession", return_value=session),
+            patch("mixseek.framework.integration_hooks.logger"),
+        ):
+            hook = WebhookIntegrationHook(
+                "http://example.com/webhook",
+                batch_size=2,
+                max_buffer_size=3,
+                max_retries=0,
+                payload_format=WebhookPayloadFormat.BATCH,
+            )
+            for _ in range(4):
+                await hook.handle_event(sample_event)
+
+            stats = hook.get_stats()
+            assert stats["pending"] == 3
+            assert stats["dropped"] == 1
+
+            await hook.close()
+            # Undeliverable events are counted as dropped on close
+            assert hook.get_stats()["dropped"] == 4
+            assert hook.get_stats()["pending"] == 0
+
+    def test_loop_change_closes_stale_session(self, sample_event: IntegrationEvent) -> None:
+        """A session left on a stopped loop is released and buffered events move to the new loop."""
+        stale = self._mock_session(post_side_effect=Exception("Connection failed"))
+        connector = stale.connector
+        fresh = self._mock_session()
+        hook = WebhookIntegrationHook("http://example.com/webhook", batch_size=1, max_retries=0)
+
+        with (
+            patch("aiohttp.ClientSession", side_effect=[stale, fresh]),
+            patch("mixseek.framework.integration_hooks.logger") as mock_logger,
+        ):
+            asyncio.run(hook.handle_event(sample_event))
+            assert hook.get_stats()["pending"] == 1
+
+            asyncio.run(hook.flush())
+
+        stale.detach.assert_called_once()
+        connector._close.assert_called_once()
+        mock_logger.warning.assert_called_once()
+        assert "carrying over 1 buffered" in mock_logger.warning.call_args.args[0]
+        fresh.post.assert_called_once()
+        assert hook.get_stats()["pending"] == 0
+
+    def test_loop_change_closes_session_on_running_loop(self, sample_event: IntegrationEvent) -> None:
+        """A session of a loop still running in another thread is closed on that loop."""
+        stale = self._mock_session()
+        fresh = self._mock_session()
+        hook = WebhookIntegrationHook("http://example.com/webhook", batch_size=1)
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+        thread.start()
+
+        try:
+            with patch("aiohttp.ClientSession", side_effect=[stale, fresh]):
+                asyncio.run_coroutine_threadsafe(hook.handle_event(sample_event), old_loop).result(timeout=5)
+                asyncio.run(hook.handle_event(sample_event))
+
+            # Runs after the close scheduled on the old loop
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), old_loop).result(timeout=5)
+            stale.close.assert_awaited_once()
+            stale.detach.assert_not_called()
+            assert hook.delivered == 2
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(timeout=5)
+            old_loop.close()
 
 
 class TestCustomIntegrationHook:
@@ -435,7 +586,8 @@ class TestIntegrationManager:
 
         assert len(manager.hooks) == 0
         assert manager.is_processing is False
-        assert manager._processor_task is None
+        assert manager.overflow_policy is OverflowPolicy.DROP_OLDEST
+        assert manager.get_queue_stats() == []
 
     def test_register_and_unregister_hook(self) -> None:
         """Test hook registration and unregistration."""
@@ -549,6 +701,135 @@ class TestIntegrationManager:
         # Cleanup
         await manager.stop_processing()
 
+    @pytest.mark.asyncio
+    async def test_slow_hook_does_not_stall_other_hooks(self, sample_event: IntegrationEvent) -> None:
+        """Each hook has its own worker, so a slow hook only delays its own events."""
+        manager = IntegrationManager()
+        release = asyncio.Event()
+
+        async def slow_handler(event: IntegrationEvent) -> None:
+            await release.wait()
+
+        fast_handler = Mock()
+        manager.register_hook(CustomIntegrationHook(slow_handler, async_handler=True))
+        manager.register_hook(CustomIntegrationHook(fast_handler, async_handler=False))
+
+        await manager.emit_event(sample_event)
+        await manager.emit_event(sample_event)
+        await asyncio.sleep(0.05)
+
+        assert fast_handler.call_count == 2
+        slow_stats, fast_stats = manager.get_queue_stats()
+        assert slow_stats.processed == 0
+        assert fast_stats.processed == 2
+
+        release.set()
+        assert await manager.flush(timeout=1.0) is True
+        assert manager.get_queue_stats()[0].processed == 2
+
+        await manager.stop_processing()
+        assert manager.is_processing is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("policy", "expected_delivered"),
+        [
+            (OverflowPolicy.DROP_OLDEST, ["1", "3", "4"]),
+            (OverflowPolicy.DROP_NEWEST, ["1", "2", "3"]),
+        ],
+    )
+    async def test_overflow_policy_drops_events(
+        self, policy: OverflowPolicy, expected_delivered: list[str], sample_event: IntegrationEvent
+    ) -> None:
+        """Dropping policies keep the queue bounded without blocking the emitter."""
+        manager = IntegrationManager(max_queue_size=2, overflow_policy=policy)
+        release = asyncio.Event()
+        delivered: list[str] = []
+
+        async def handler(event: IntegrationEvent) -> None:
+            await release.wait()
+            delivered.append(event.agent_name)
+
+        manager.register_hook(CustomIntegrationHook(handler, async_handler=True))
+
+        await manager.emit_event(replace(sample_event, agent_name="1"))
+        await asyncio.sleep(0)  # worker takes event 1
+        for name in ["2", "3", "4"]:
+            await manager.emit_event(replace(sample_event, agent_name=name))
+
+        stats = manager.get_queue_stats()[0]
+        assert stats.queue_size == 2
+        assert stats.dropped == 1
+
+        release.set()
+        assert await manager.flush(timeout=1.0) is True
+        assert delivered == expected_delivered
+
+        await manager.stop_processing()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_space(self, sample_event: IntegrationEvent) -> None:
+        """BLOCK policy makes emit_event wait until the hook's queue has room."""
+        manager = IntegrationManager(max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+        release = asyncio.Event()
+
+        async def handler(event: IntegrationEvent) -> None:
+            await release.wait()
+
+        manager.register_hook(CustomIntegrationHook(handler, async_handler=True))
+        await manager.emit_event(sample_event)
+        await asyncio.sleep(0)
+        await manager.emit_event(sample_event)
+
+        blocked = asyncio.create_task(manager.emit_event(sample_event))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        assert await manager.flush(timeout=1.0) is True
+        assert manager.get_queue_stats()[0].dropped == 0
+
+        await manager.stop_processing()
+
+    @pytest.mark.asyncio
+    async def test_flush_timeout_and_lag_metrics(self, sample_event: IntegrationEvent) -> None:
+        """flush() reports timeouts and workers record queue lag."""
+        manager = IntegrationManager()
+
+        async def handler(event: IntegrationEvent) -> None:
+            await asyncio.sleep(0.05)
+
+        manager.register_hook(CustomIntegrationHook(handler, async_handler=True))
+        await manager.emit_event(sample_event)
+        await manager.emit_event(sample_event)
+
+        assert await manager.flush(timeout=0.01) is False
+        assert await manager.flush(timeout=1.0) is True
+
+        stats = manager.get_queue_stats()[0]
+        assert stats.processed == 2
+        # The second event waited for the first one to be handled
+        assert stats.max_lag_seconds >= 0.04
+
+        await manager.stop_processing()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_and_closes_hooks(self, sample_event: IntegrationEvent) -> None:
+        """shutdown() handles queued events, stops workers and closes hooks."""
+        manager = IntegrationManager()
+        handler = Mock()
+        hook = CustomIntegrationHook(handler, async_handler=False)
+        manager.register_hook(hook)
+
+        await manager.emit_event(sample_event)
+        with patch.object(hook, "close", new_callable=AsyncMock) as mock_close:
+            assert await manager.shutdown(timeout=1.0) is True
+
+        handler.assert_called_once_with(sample_event)
+        mock_close.assert_awaited_once()
+        assert manager.is_processing is False
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
@@ -0,0 +1,189 @@
+"""Unit tests for the push-based progress channel."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from mixseek.core.progress import ProgressBus, ProgressEvent, ProgressLogReader, progress_log_path
+
+EXECUTION_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def _event(team_id: str, current_round: int = 1, status: str = "running", **kwargs: str) -> ProgressEvent:
+    return ProgressEvent(
+        execution_id=kwargs.pop("execution_id", EXECUTION_ID),
+        team_id=team_id,
+        team_name=f"Team {team_id}",
+        status=status,
+        current_round=current_round,
+        total_rounds=3,
+        updated_at="2025-01-01T00:00:00+00:00",
+        **kwargs,
+    )
+
+
+class TestProgressEvent:
+    """Test serialization."""
+
+    def test_round_trip(self) -> None:
+        event = _event("team-a", status="failed", error_message="boom")
+        assert ProgressEvent.from_dict(event.to_dict()) == event
+
+    def test_error_message_omitted_when_unset(self) -> None:
+        assert "error_message" not in _event("team-a").to_dict()
+
+
+class TestProgressBus:
+    """Test snapshots, subscriptions and waiting."""
+
+    def test_snapshot_keeps_latest_event_per_team(self) -> None:
+        bus = ProgressBus()
+        bus.publish(_event("team-a", 1))
+        bus.publish(_event("team-b", 1))
+        bus.publish(_event("team-a", 2))
+        bus.publish(_event("team-c", 1, execution_id="other"))
+
+        snapshot = {event.team_id: event.current_round for event in bus.snapshot(EXECUTION_ID)}
+
+        assert snapshot == {"team-a": 2, "team-b": 1}
+        assert bus.version(EXECUTION_ID) == 3
+
+    def test_subscribers_receive_events_until_unsubscribed(self) -> None:
+        bus = ProgressBus()
+        received: list[ProgressEvent] = []
+
+        unsubscribe = bus.subscribe(received.append)
+        bus.publish(_event("team-a", 1))
+        unsubscribe()
+        bus.publish(_event("team-a", 2))
+
+        assert [event.current_round for event in received] == [1]
+
+    def test_failing_subscriber_does_not_affect_publisher(self) -> None:
+        bus = ProgressBus()
+        received: list[ProgressEvent] = []
+
+        def broken(event: ProgressEvent) -> None:
+            raise RuntimeError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(received.append)
+        bus.publish(_event("team-a"))
+
+        assert len(received) == 1
+
+    def test_wait_for_update_wakes_on_publish(self) -> None:
+        bus = ProgressBus()
+        timer = threading.Timer(0.05, bus.publish, args=(_event("team-a"),))
+        timer.start()
+
+        version = bus.wait_for_update(EXECUTION_ID, 0, timeout=5.0)
+        timer.join()
+
+        assert version == 1
+
+    def test_wait_for_update_times_out(self) -> None:
+        bus = ProgressBus()
+        bus.publish(_event("team-a"))
+
+        assert bus.wait_for_update(EXECUTION_ID, 1, timeout=0.01) == 1
+
+    def test_clear_forgets_snapshot_and_wakes_waiters(self) -> None:
+        bus = ProgressBus()
+        bus.publish(_event("team-a"))
+        timer = threading.Timer(0.05, bus.clear, args=(EXECUTION_ID,))
+        timer.start()
+
+        version = bus.wait_for_update(EXECUTION_ID, 1, timeout=5.0)
+        timer.join()
+
+        assert version == 0
+        assert bus.snapshot(EXECUTION_ID) == []
+
+    @pytest.mark.asyncio
+    async def test_stream_delivers_events_from_other_threads(self) -> None:
+        bus = ProgressBus()
+
+        async def consume() -> list[int]:
+            rounds = []
+            async for event in bus.stream(EXECUTION_ID):
+                rounds.append(event.current_round)
+                if event.is_terminal:
+                    return rounds
+            return rounds
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+
+        def publish() -> None:
+            bus.publish(_event("team-a", 1, execution_id="other"))
+            bus.publish(_event("team-a", 1))
+            bus.publish(_event("team-a", 2, status="completed"))
+
+        await asyncio.to_thread(publish)
+
+        assert await asyncio.wait_for(consumer, timeout=5.0) == [1, 2]
+
+    def test_publish_appends_to_event_log(self, tmp_path: Path) -> None:
+        bus = ProgressBus()
+        log_path = progress_log_path(tmp_path, EXECUTION_ID)
+
+        bus.publish(_event("team-a", 1), log_path=log_path)
+        bus.publish(_event("team-a", 2), log_path=log_path)
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["current_round"] for line in lines] == [1, 2]
+
+    def test_event_log_is_written_outside_the_lock(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        bus = ProgressBus()
+        snapshots: list[list[ProgressEvent]] = []
+
+        def slow_append(log_path: Path, event: ProgressEvent) -> None:
+            # Another thread can read the snapshot while the event log is being written
+            reader = threading.Thread(target=lambda: snapshots.append(bus.snapshot(EXECUTION_ID)))
+            reader.start()
+            reader.join(timeout=1.0)
+            assert not reader.is_alive()
+
+        monkeypatch.setattr(ProgressBus, "_append", staticmethod(slow_append))
+        bus.publish(_event("team-a"), log_path=progress_log_path(tmp_path, EXECUTION_ID))
+
+        assert [[e.team_id for e in events] for events in snapshots] == [["team-a"]]
+
+
+class TestProgressLogReader:
+    """Test incremental reading of the event log."""
+
+    def test_reads_only_appended_events(self, tmp_path: Path) -> None:
+        log_path = progress_log_path(tmp_path, EXECUTION_ID)
+        bus = ProgressBus()
+        reader = ProgressLogReader(log_path)
+
+        assert reader.read_new() == []
+
+        bus.publish(_event("team-a", 1), log_path=log_path)
+        bus.publish(_event("team-b", 1), log_path=log_path)
+        assert len(reader.read_new()) == 2
+
+        bus.publish(_event("team-a", 2, status="completed"), log_path=log_path)
+        assert [event.current_round for event in reader.read_new()] == [2]
+
+        snapshot = {event.team_id: event.status for event in reader.snapshot()}
+        assert snapshot == {"team-a": "completed", "team-b": "running"}
+
+    def test_partial_and_invalid_lines(self, tmp_path: Path) -> None:
+        log_path = progress_log_path(tmp_path, EXECUTION_ID)
+        log_path.parent.mkdir()
+        line = json.dumps(_event("team-a").to_dict())
+        log_path.write_text("not json\n" + line[:10], encoding="utf-8")
+        reader = ProgressLogReader(log_path)
+
+        assert reader.read_new() == []
+
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(line[10:] + "\n")
+
+        assert [event.team_id for event in reader.read_new()] == ["team-a"]
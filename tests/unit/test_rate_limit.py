@@ -0,0 +1,172 @@
+"""Unit tests for process-wide LLM rate limiting."""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from mixseek.config.schema import OrchestratorSettings
+from mixseek.core.auth import (
+    RateLimitedModel,
+    RateLimitRule,
+    configure_rate_limits,
+    create_authenticated_model,
+    get_rate_limit_stats,
+)
+from mixseek.core.rate_limit import LLMRateLimiter, _TokenBucket, get_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits() -> Iterator[None]:
+    """Ensure each test starts and ends without rate limit rules."""
+    configure_rate_limits([])
+    yield
+    configure_rate_limits([])
+
+
+class TestRateLimitRule:
+    """Test rule parsing and matching."""
+
+    def test_pattern_matching(self) -> None:
+        rule = RateLimitRule(model="google-gla:*", requests_per_minute=10)
+        assert rule.matches("google-gla:gemini-2.5-flash")
+        assert not rule.matches("openai:gpt-4o")
+
+    def test_invalid_backoff_range(self) -> None:
+        with pytest.raises(ValidationError):
+            RateLimitRule(model="*", backoff_initial_seconds=10, backoff_max_seconds=1)
+
+    def test_first_matching_rule_wins(self) -> None:
+        configure_rate_limits(
+            [
+                {"model": "openai:gpt-4o", "max_in_flight": 1},
+                {"model": "openai:*", "max_in_flight": 5},
+            ]
+        )
+        limiter = get_rate_limiter("openai:gpt-4o")
+        assert limiter is not None
+        assert limiter.rule.max_in_flight == 1
+        other = get_rate_limiter("openai:gpt-4o-mini")
+        assert other is not None
+        assert other.rule.max_in_flight == 5
+        assert get_rate_limiter("anthropic:claude-sonnet-4-5") is None
+
+    def test_orchestrator_settings_accepts_rate_limits(self, tmp_path: Path) -> None:
+        settings = OrchestratorSettings(
+            workspace_path=tmp_path,
+            rate_limits=[{"model": "google-gla:*", "requests_per_minute": 60, "max_in_flight": 4}],
+        )
+        assert settings.rate_limits[0].model == "google-gla:*"
+        assert settings.rate_limits[0].max_in_flight == 4
+
+
+class TestTokenBucket:
+    """Test token bucket refill and debt behavior."""
+
+    def test_delay_when_empty(self) -> None:
+        bucket = _TokenBucket(60)  # 1 token/sec
+        now = bucket.updated_at
+        bucket.consume(60, now)
+        assert bucket.delay_until(1, now) == pytest.approx(1.0)
+        assert bucket.delay_until(1, now + 1.0) == pytest.approx(0.0)
+
+    def test_debt_blocks_until_repaid(self) -> None:
+        bucket = _TokenBucket(600)  # 10 tokens/sec
+        now = bucket.updated_at
+        bucket.consume(700, now)  # 100 tokens in debt
+        assert bucket.delay_until(0, now) == pytest.approx(10.0)
+
+
+class TestRateLimitedModel:
+    """Test request wrapping, concurrency limits and 429 backoff."""
+
+    def test_create_authenticated_model_wraps_matching_models(self) -> None:
+        assert not isinstance(create_authenticated_model("openai:gpt-4o"), RateLimitedModel)
+
+        configure_rate_limits([RateLimitRule(model="openai:*", max_in_flight=2)])
+        model = create_authenticated_model("openai:gpt-4o")
+        assert isinstance(model, RateLimitedModel)
+        assert model.limiter is get_rate_limiter("openai:gpt-4o")
+
+    async def test_max_in_flight_is_shared_across_agents(self) -> None:
+        active = 0
+        peak = 0
+
+        async def slow_response(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return ModelResponse(parts=[TextPart("ok")], usage=RequestUsage(input_tokens=3, output_tokens=2))
+
+        limiter = LLMRateLimiter(RateLimitRule(model="*", max_in_flight=2))
+        agents = [Agent(RateLimitedModel(FunctionModel(slow_response), limiter)) for _ in range(6)]
+
+        await asyncio.gather(*[agent.run("hello") for agent in agents])
+
+        assert peak == 2
+        assert limiter.stats.requests == 6
+        assert limiter.stats.tokens_used == 30
+        assert limiter.stats.throttled_requests > 0
+        assert limiter.stats.total_wait_seconds > 0
+
+    async def test_http_429_backs_off_and_retries(self) -> None:
+        calls = 0
+
+        async def flaky_response(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ModelHTTPError(status_code=429, model_name="function")
+            return ModelResponse(parts=[TextPart("ok")])
+
+        limiter = LLMRateLimiter(RateLimitRule(model="*", backoff_initial_seconds=0.01, backoff_max_seconds=0.05))
+        agent = Agent(RateLimitedModel(FunctionModel(flaky_response), limiter))
+
+        result = await agent.run("hello")
+
+        assert result.output == "ok"
+        assert calls == 2
+        assert limiter.stats.rate_limited_responses == 1
+        assert limiter.stats.max_wait_seconds >= 0.005
+
+    async def test_http_429_raises_after_max_retries(self) -> None:
+        async def always_limited(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            raise ModelHTTPError(status_code=429, model_name="function")
+
+        limiter = LLMRateLimiter(
+            RateLimitRule(model="*", max_retries_on_429=1, backoff_initial_seconds=0.01, backoff_max_seconds=0.01)
+        )
+        agent = Agent(RateLimitedModel(FunctionModel(always_limited), limiter))
+
+        with pytest.raises(ModelHTTPError):
+            await agent.run("hello")
+        assert limiter.stats.rate_limited_responses == 2
+
+    async def test_non_429_errors_are_not_retried(self) -> None:
+        calls = 0
+
+        async def server_error(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            nonlocal calls
+            calls += 1
+            raise ModelHTTPError(status_code=500, model_name="function")
+
+        limiter = LLMRateLimiter(RateLimitRule(model="*"))
+        agent = Agent(RateLimitedModel(FunctionModel(server_error), limiter))
+
+        with pytest.raises(ModelHTTPError):
+            await agent.run("hello")
+        assert calls == 1
+        assert limiter.stats.rate_limited_responses == 0
+
+    def test_stats_keyed_by_rule_pattern(self) -> None:
+        configure_rate_limits([{"model": "google-gla:*", "requests_per_minute": 60}])
+        assert list(get_rate_limit_stats()) == ["google-gla:*"]
@@ -0,0 +1,227 @@
+"""Unit tests for the content-addressed LLM response cache."""
+
+import itertools
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from mixseek.config.schema import EvaluatorSettings, JudgmentSettings, PromptBuilderSettings
+from mixseek.core.response_cache import (
+    ResponseCache,
+    ResponseCacheSettings,
+    configure_response_cache,
+    get_response_cache,
+)
+from mixseek.evaluator.evaluator import Evaluator
+from mixseek.evaluator.llm_client import evaluate_with_llm
+from mixseek.evaluator.metrics.base import BaseLLMEvaluation
+from mixseek.models.evaluation_request import EvaluationRequest
+from mixseek.round_controller.judgment_client import JudgmentClient
+from mixseek.round_controller.models import ImprovementJudgment
+
+
+class _Score(BaseModel):
+    score: float
+    comment: str
+
+
+@pytest.fixture
+def enabled_cache(tmp_path: Path) -> Iterator[ResponseCache]:
+    cache = configure_response_cache(ResponseCacheSettings(enabled=True), tmp_path)
+    assert cache is not None
+    yield cache
+    configure_response_cache(None, tmp_path)
+
+
+class TestResponseCache:
+    """Test storage, expiry and eviction."""
+
+    def test_key_ignores_dict_order_and_includes_schema(self) -> None:
+        key = ResponseCache.make_key("evaluator", {"temperature": 0.0, "seed": 1}, _Score)
+
+        assert key == ResponseCache.make_key("evaluator", {"seed": 1, "temperature": 0.0}, _Score)
+        assert key != ResponseCache.make_key("evaluator", {"seed": 1, "temperature": 0.0}, ImprovementJudgment)
+        assert key != ResponseCache.make_key("evaluator", {"seed": 2, "temperature": 0.0}, _Score)
+
+    def test_key_masks_rendered_current_datetime(self) -> None:
+        prompt = "---\n現在日時: {}\n---\n# 概要"
+        key = ResponseCache.make_key("evaluator", prompt.format("2025-11-19T12:34:56.789012+00:00"))
+
+        assert key == ResponseCache.make_key("evaluator", prompt.format("2025-11-20T21:00:01.000002+09:00"))
+        assert key != ResponseCache.make_key("evaluator", prompt.format("2025-11-19"))
+
+    def test_get_and_put_count_hits_and_misses(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "cache.db")
+
+        assert cache.get("k") is None
+        cache.put("k", "openai:gpt-4o", '{"score": 1}')
+
+        assert cache.get("k") == '{"score": 1}'
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_event_loop(self, tmp_path: Path) -> None:
+        """aget/aput run the SQLite queries in a worker thread (lock waits never block the loop)."""
+        cache = ResponseCache(tmp_path / "cache.db")
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        original_get, original_put = cache._get, cache._put
+
+        def record_get(key: str, now: float) -> str | None:
+            threads.append(threading.get_ident())
+            return original_get(key, now)
+
+        def record_put(key: str, model: str, response: str, now: float) -> None:
+            threads.append(threading.get_ident())
+            original_put(key, model, response, now)
+
+        with patch.object(cache, "_get", side_effect=record_get), patch.object(cache, "_put", side_effect=record_put):
+            await cache.aput("k", "openai:gpt-4o", "v")
+            assert await cache.aget("k") == "v"
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    def test_entries_persist_across_instances(self, tmp_path: Path) -> None:
+        ResponseCache(tmp_path / "cache.db").put("k", "openai:gpt-4o", "v")
+
+        assert ResponseCache(tmp_path / "cache.db").get("k") == "v"
+
+    def test_expired_entries_are_misses(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=60)
+        with patch("mixseek.core.response_cache.time.time", return_value=1000.0):
+            cache.put("k", "openai:gpt-4o", "v")
+        with patch("mixseek.core.response_cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "cache.db", max_entries=2)
+        for now, key in [(1.0, "a"), (2.0, "b")]:
+            with patch("mixseek.core.response_cache.time.time", return_value=now):
+                cache.put(key, "openai:gpt-4o", key)
+        with patch("mixseek.core.response_cache.time.time", return_value=3.0):
+            cache.get("a")
+        with patch("mixseek.core.response_cache.time.time", return_value=4.0):
+            cache.put("c", "openai:gpt-4o", "c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get("c") == "c"
+        assert cache.stats.evictions == 1
+
+    def test_only_deterministic_requests_are_cached_by_default(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "cache.db")
+
+        assert cache.should_cache(0.0, None)
+        assert cache.should_cache(0.7, 42)
+        assert not cache.should_cache(0.7, None)
+
+
+class TestConfigureResponseCache:
+    """Test process-wide configuration."""
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        assert configure_response_cache({}, tmp_path) is None
+        assert get_response_cache() is None
+
+    def test_relative_path_resolved_against_workspace(self, tmp_path: Path) -> None:
+        cache = configure_response_cache({"enabled": True, "path": "llm.db"}, tmp_path)
+        try:
+            assert cache is get_response_cache()
+            assert cache is not None
+            assert cache.path == tmp_path / "llm.db"
+            assert configure_response_cache({"enabled": True, "path": "llm.db"}, tmp_path) is cache
+        finally:
+            configure_response_cache(None, tmp_path)
+
+        assert get_response_cache() is None
+
+
+class TestCachedCalls:
+    """Test cache integration in evaluator and judgment calls."""
+
+    @patch("mixseek.evaluator.llm_client.create_authenticated_model")
+    @patch("mixseek.evaluator.llm_client.Agent")
+    async def test_evaluate_with_llm_replays_deterministic_calls(
+        self, mock_agent_class: MagicMock, mock_create_model: MagicMock, enabled_cache: ResponseCache
+    ) -> None:
+        mock_result = MagicMock()
+        mock_result.output = _Score(score=80.0, comment="ok")
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        kwargs = {"instruction": "judge", "model": "openai:gpt-4o", "response_model": _Score}
+
+        first = await evaluate_with_llm(user_prompt="same", **kwargs)
+        second = await evaluate_with_llm(user_prompt="same", **kwargs)
+        await evaluate_with_llm(user_prompt="other", **kwargs)
+
+        assert first == second == _Score(score=80.0, comment="ok")
+        assert mock_agent_class.return_value.run.await_count == 2
+        assert enabled_cache.stats.hits == 1
+
+    @patch("mixseek.evaluator.llm_client.create_authenticated_model")
+    @patch("mixseek.evaluator.llm_client.Agent")
+    async def test_evaluate_with_llm_skips_nondeterministic_calls(
+        self, mock_agent_class: MagicMock, mock_create_model: MagicMock, enabled_cache: ResponseCache
+    ) -> None:
+        mock_result = MagicMock()
+        mock_result.output = _Score(score=80.0, comment="ok")
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        kwargs = {"instruction": "judge", "model": "openai:gpt-4o", "response_model": _Score, "temperature": 0.7}
+
+        await evaluate_with_llm(user_prompt="same", **kwargs)
+        await evaluate_with_llm(user_prompt="same", **kwargs)
+
+        assert mock_agent_class.return_value.run.await_count == 2
+        assert len(enabled_cache) == 0
+
+    @patch("mixseek.round_controller.judgment_client.create_authenticated_model")
+    @patch("mixseek.round_controller.judgment_client.Agent")
+    async def test_judgment_replays_across_clients(
+        self, mock_agent_class: MagicMock, mock_create_model: MagicMock, enabled_cache: ResponseCache
+    ) -> None:
+        judgment = ImprovementJudgment(should_continue=False, reasoning="plateau", confidence_score=0.9)
+        mock_result = MagicMock()
+        mock_result.output = judgment
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        settings = JudgmentSettings(temperature=0.0)
+
+        first = await JudgmentClient(settings).judge_improvement_prospects("history")
+        second = await JudgmentClient(settings).judge_improvement_prospects("history")
+
+        assert first == second == judgment
+        assert mock_agent_class.return_value.run.await_count == 1
+
+    @patch("mixseek.prompt_builder.builder.get_current_datetime_with_timezone")
+    @patch("mixseek.evaluator.llm_client.create_authenticated_model")
+    @patch("mixseek.evaluator.llm_client.Agent")
+    async def test_evaluator_replays_with_default_prompt_templates(
+        self,
+        mock_agent_class: MagicMock,
+        mock_create_model: MagicMock,
+        mock_datetime: MagicMock,
+        enabled_cache: ResponseCache,
+    ) -> None:
+        """Re-evaluating the same submission later hits although the prompt embeds current_datetime."""
+        times = itertools.count()
+        mock_datetime.side_effect = lambda: f"2025-11-19T12:34:{next(times):02d}.789012+00:00"
+        mock_result = MagicMock()
+        mock_result.output = BaseLLMEvaluation(score=80.0, evaluator_comment="ok")
+        mock_agent_class.return_value.run = AsyncMock(return_value=mock_result)
+        evaluator = Evaluator(settings=EvaluatorSettings(), prompt_builder_settings=PromptBuilderSettings())
+        request = EvaluationRequest(user_query="What is Python?", submission="A programming language.")
+
+        first = await evaluator.evaluate(request)
+        second = await evaluator.evaluate(request)
+
+        run = mock_agent_class.return_value.run
+        assert run.await_count == len(first.metrics) == 3
+        assert "現在日時: 2025-11-19T12:34:" in run.await_args_list[0].args[0]
+        assert enabled_cache.stats.hits == 3
+        assert [m.score for m in second.metrics] == [m.score for m in first.metrics]